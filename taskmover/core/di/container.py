@@ -111,6 +111,11 @@ class ServiceContainer(IServiceContainer):
         except ServiceNotRegisteredException:
             return False
 
+    def has_instance(self, interface: type[T], name: str | None = None) -> bool:
+        """Check if a singleton has already been created, without creating it"""
+        with self._lock:
+            return self._get_singleton_key(interface, name) in self._singletons
+
     def create_scope(self) -> IServiceScope:
         """Create a new service scope"""
         return ServiceScope(self)
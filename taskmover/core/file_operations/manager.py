@@ -18,6 +18,9 @@ import hashlib
 from concurrent.futures import ThreadPoolExecutor
 
 from ..logging import get_logger
+from ..logging.interfaces import LogLevel
+from ..logging.metrics import get_metrics
+from ..logging.tracing import get_tracer
 from . import (
     IFileOperationManager, IFileOperationProvider, IBackupManager,
     OperationType, OperationStatus, OperationResult, OperationProgress,
@@ -161,6 +164,13 @@ class FileOperationManager(IFileOperationManager):
             )
         
         finally:
+            get_tracer().record_complete(
+                f"file_operations.{operation.operation_type.value}",
+                time.time() - start_time,
+                operation_id=operation_id,
+                success=bool(operation.success),
+            )
+            
             # Cleanup progress callbacks
             if operation_id in self._progress_callbacks:
                 for queue in self._progress_callbacks[operation_id]:
@@ -275,6 +285,18 @@ class LocalFileOperationProvider(IFileOperationProvider):
     
     def __init__(self):
         self._logger = get_logger("file_operations.local_provider")
+        self._metrics = get_metrics()
+    
+    def _record(self, operation: str, duration: float, size_bytes: int, **attributes) -> None:
+        """Record a per-file operation as metrics; only a sample is logged."""
+        name = f"file_operations.{operation}"
+        duration_ms = duration * 1000
+        self._metrics.record(name, duration_ms)
+        if size_bytes:
+            self._metrics.counter(f"{name}.bytes").inc(size_bytes)
+        if self._metrics.should_sample(name):
+            attributes["size_bytes"] = size_bytes
+            self._metrics.emit(self._logger, LogLevel.DEBUG, name, duration_ms, attributes)
     
     async def copy_file(self, source: Path, destination: Path, 
                        preserve_metadata: bool = True) -> OperationResult:
@@ -283,8 +305,6 @@ class LocalFileOperationProvider(IFileOperationProvider):
         start_time = time.time()
         
         try:
-            self._logger.debug(f"Copying file {source} to {destination}", extra={"operation_id": operation_id})
-            
             # Ensure destination directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
             
@@ -298,16 +318,8 @@ class LocalFileOperationProvider(IFileOperationProvider):
             
             duration = time.time() - start_time
             
-            self._logger.info(
-                f"File copied successfully in {duration:.2f}s",
-                extra={
-                    "operation_id": operation_id,
-                    "source": str(source),
-                    "destination": str(destination),
-                    "size_bytes": file_size,
-                    "duration": duration
-                }
-            )
+            self._record("copy", duration, file_size,
+                         source=source, destination=destination)
             
             return OperationResult(
                 operation_id=operation_id,
@@ -351,8 +363,6 @@ class LocalFileOperationProvider(IFileOperationProvider):
         start_time = time.time()
         
         try:
-            self._logger.debug(f"Moving file {source} to {destination}", extra={"operation_id": operation_id})
-            
             # Ensure destination directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
             
@@ -365,16 +375,8 @@ class LocalFileOperationProvider(IFileOperationProvider):
             
             duration = time.time() - start_time
             
-            self._logger.info(
-                f"File moved successfully in {duration:.2f}s",
-                extra={
-                    "operation_id": operation_id,
-                    "source": str(source),
-                    "destination": str(destination),
-                    "size_bytes": file_size,
-                    "duration": duration
-                }
-            )
+            self._record("move", duration, file_size,
+                         source=source, destination=destination)
             
             return OperationResult(
                 operation_id=operation_id,
@@ -418,8 +420,6 @@ class LocalFileOperationProvider(IFileOperationProvider):
         start_time = time.time()
         
         try:
-            self._logger.debug(f"Deleting file {file_path}", extra={"operation_id": operation_id})
-            
             file_size = file_path.stat().st_size if file_path.exists() else 0
             
             if use_recycle_bin:
@@ -439,16 +439,8 @@ class LocalFileOperationProvider(IFileOperationProvider):
             
             duration = time.time() - start_time
             
-            self._logger.info(
-                f"File deleted successfully in {duration:.2f}s",
-                extra={
-                    "operation_id": operation_id,
-                    "file_path": str(file_path),
-                    "size_bytes": file_size,
-                    "use_recycle_bin": use_recycle_bin,
-                    "duration": duration
-                }
-            )
+            self._record("delete", duration, file_size,
+                         file_path=file_path, use_recycle_bin=use_recycle_bin)
             
             return OperationResult(
                 operation_id=operation_id,
@@ -491,21 +483,12 @@ class LocalFileOperationProvider(IFileOperationProvider):
         start_time = time.time()
         
         try:
-            self._logger.debug(f"Creating directory {directory_path}", extra={"operation_id": operation_id})
-            
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(None, directory_path.mkdir, parents, True)
             
             duration = time.time() - start_time
             
-            self._logger.info(
-                f"Directory created successfully in {duration:.2f}s",
-                extra={
-                    "operation_id": operation_id,
-                    "directory_path": str(directory_path),
-                    "duration": duration
-                }
-            )
+            self._record("create_directory", duration, 0, directory_path=directory_path)
             
             return OperationResult(
                 operation_id=operation_id,
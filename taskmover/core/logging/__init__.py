@@ -16,9 +16,13 @@ Usage:
 """
 
 from .config import LoggingConfig
+from .dispatch import BackpressurePolicy, LogDispatcher
 from .formatters import ComponentFormatter, ConsoleFormatter, FileFormatter
 from .handlers import CleanupHandler, ColoredConsoleHandler, RotatingFileHandler
+from .log_store import IndexedLogHandler, LogStore
 from .manager import LoggerManager, get_component_logger, get_logger, log_context, ComponentLogger
+from .metrics import MetricsRegistry, get_metrics
+from .tracing import Tracer, get_tracer, traced
 
 __all__ = [
     "LoggerManager",
@@ -33,6 +37,15 @@ __all__ = [
     "ColoredConsoleHandler",
     "RotatingFileHandler",
     "CleanupHandler",
+    "IndexedLogHandler",
+    "LogStore",
+    "LogDispatcher",
+    "BackpressurePolicy",
+    "MetricsRegistry",
+    "get_metrics",
+    "Tracer",
+    "get_tracer",
+    "traced",
 ]
 
 __version__ = "1.0.0"
@@ -10,7 +10,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
 
 # Import LogLevel from interfaces to maintain consistency
 from .interfaces import LogLevel
@@ -35,6 +34,18 @@ class FileConfig:
     path: str = "logs/taskmover.log"
     rotation: FileRotationConfig = field(default_factory=FileRotationConfig)
     format: str = "detailed"  # detailed, compact, json
+    buffer_size: str = "64KB"  # Write buffer before flushing ("0B" writes through)
+    flush_interval: float = 1.0  # Max seconds a buffered line waits for disk
+
+
+@dataclass
+class LogStoreConfig:
+    """Indexed JSON-lines log store configuration"""
+
+    enabled: bool = False
+    path: str = "logs/store"
+    segment_size: str = "8MB"  # Size before a new segment is started
+    max_segments: int = 0  # Oldest segments are deleted beyond this count (0 keeps all)
 
 
 @dataclass
@@ -53,9 +64,13 @@ class LoggingConfig:
     level: LogLevel = LogLevel.INFO
     console: ConsoleConfig = field(default_factory=ConsoleConfig)
     file: FileConfig = field(default_factory=FileConfig)
+    store: LogStoreConfig = field(default_factory=LogStoreConfig)
     components: dict[str, LogLevel] = field(default_factory=dict)
     session_tracking: bool = True
     performance_monitoring: bool = False
+    async_dispatch: bool = True  # Hand records to a background dispatcher thread
+    dispatch_queue_size: int = 10000  # Records queued before backpressure applies
+    backpressure: str = "drop_debug"  # block, drop_debug or sample
 
 
 class ConfigurationLoader:
@@ -96,6 +111,9 @@ class ConfigurationLoader:
         for path in config_paths:
             if path.exists():
                 try:
+                    # Imported here so logging stays cheap to import without a config file
+                    import yaml
+
                     with open(path, encoding="utf-8") as f:
                         config_data = yaml.safe_load(f) or {}
                     break
@@ -126,6 +144,17 @@ class ConfigurationLoader:
             path=file_data.get("path", "logs/taskmover.log"),
             rotation=rotation_config,
             format=file_data.get("format", "detailed"),
+            buffer_size=file_data.get("buffer_size", "64KB"),
+            flush_interval=file_data.get("flush_interval", 1.0),
+        )
+
+        # Parse log store config
+        store_data = data.get("store", {})
+        store_config = LogStoreConfig(
+            enabled=store_data.get("enabled", False),
+            path=store_data.get("path", "logs/store"),
+            segment_size=store_data.get("segment_size", "8MB"),
+            max_segments=store_data.get("max_segments", 0),
         )
 
         # Parse console config
@@ -151,9 +180,13 @@ class ConfigurationLoader:
             level=self._parse_level(data.get("level", "INFO")),
             console=console_config,
             file=file_config,
+            store=store_config,
             components=components,
             session_tracking=data.get("session_tracking", True),
             performance_monitoring=data.get("performance_monitoring", False),
+            async_dispatch=data.get("async_dispatch", True),
+            dispatch_queue_size=data.get("dispatch_queue_size", 10000),
+            backpressure=data.get("backpressure", "drop_debug"),
         )
 
     def _apply_environment_overrides(self):
@@ -204,6 +237,14 @@ class ConfigurationLoader:
             )
             self._config.file.rotation.max_size = "10MB"
 
+        if not self._validate_size_format(self._config.file.buffer_size):
+            print(f"Warning: Invalid buffer_size format: {self._config.file.buffer_size}")
+            self._config.file.buffer_size = "64KB"
+
+        if not self._validate_size_format(self._config.store.segment_size):
+            print(f"Warning: Invalid segment_size format: {self._config.store.segment_size}")
+            self._config.store.segment_size = "8MB"
+
     def _validate_size_format(self, size_str: str) -> bool:
         """Validate size format (e.g., '10MB', '1GB')"""
         import re
@@ -239,6 +280,8 @@ class ConfigurationLoader:
                     "enabled": True,
                     "path": "logs/taskmover.log",
                     "format": "detailed",
+                    "buffer_size": "64KB",
+                    "flush_interval": 1.0,
                     "rotation": {
                         "max_size": "10MB",
                         "backup_count": 5,
@@ -247,6 +290,12 @@ class ConfigurationLoader:
                         "cleanup_schedule": "daily",
                     },
                 },
+                "store": {
+                    "enabled": False,
+                    "path": "logs/store",
+                    "segment_size": "8MB",
+                    "max_segments": 0,
+                },
                 "components": {
                     "ui": "INFO",
                     "core": "INFO",
@@ -255,9 +304,14 @@ class ConfigurationLoader:
                 },
                 "session_tracking": True,
                 "performance_monitoring": False,
+                "async_dispatch": True,
+                "dispatch_queue_size": 10000,
+                "backpressure": "drop_debug",
             }
         }
 
+        import yaml
+
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w", encoding="utf-8") as f:
             yaml.dump(default_config, f, default_flow_style=False, indent=2)
@@ -0,0 +1,203 @@
+"""
+Log Dispatch Pipeline
+
+Moves handler I/O off the logging thread. Callers append records to a
+bounded queue and return; a single dispatcher thread drains the queue in
+batches and hands each batch to a snapshot of the current handlers.
+
+The queue is a ``collections.deque`` whose append and popleft are atomic,
+so the common publish path takes no lock. When the queue is full a
+backpressure policy decides between blocking the caller, dropping DEBUG
+records first, or keeping a sample of low-severity records.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from enum import Enum
+
+from .interfaces import ILogHandler, LogLevel, LogRecord
+
+
+class BackpressurePolicy(Enum):
+    """What publishers do when the dispatch queue is full"""
+
+    BLOCK = "block"  # Wait for the dispatcher to make room
+    DROP_DEBUG = "drop_debug"  # Drop DEBUG, then INFO; block for WARNING and above
+    SAMPLE = "sample"  # Keep one in N records below WARNING; block for the rest
+
+    @classmethod
+    def parse(cls, value: "str | BackpressurePolicy") -> "BackpressurePolicy":
+        """Parse a policy name, defaulting to DROP_DEBUG"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            return cls.DROP_DEBUG
+
+
+class LogDispatcher:
+    """Single-consumer background dispatcher for log records"""
+
+    def __init__(
+        self,
+        handlers: Callable[[], Sequence[ILogHandler]],
+        queue_size: int = 10000,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_DEBUG,
+        batch_size: int = 256,
+        sample_every: int = 10,
+    ):
+        self._handlers = handlers
+        self.queue_size = max(1, queue_size)
+        self.policy = policy
+        self.batch_size = max(1, batch_size)
+        self.sample_every = max(1, sample_every)
+
+        self._queue: deque[LogRecord] = deque()
+        self._wakeup = threading.Event()
+        self._space = threading.Condition()
+        self._drained = threading.Condition()
+        self._busy = False
+        self._stopping = False
+        self._dropped = 0
+        self._reported_dropped = 0
+        self._sampled = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="LogDispatcher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped by the backpressure policy"""
+        return self._dropped
+
+    @property
+    def running(self) -> bool:
+        """Whether the dispatcher thread accepts records"""
+        return not self._stopping and self._thread.is_alive()
+
+    def publish(self, record: LogRecord) -> None:
+        """Queue a record for dispatch; never performs handler I/O"""
+        if len(self._queue) >= self.queue_size and not self._admit(record):
+            self._dropped += 1
+            return
+
+        self._queue.append(record)
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every queued record has been handed to the handlers"""
+        if threading.current_thread() is self._thread:
+            return False
+        self._wakeup.set()
+        with self._drained:
+            return self._drained.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the dispatcher after draining the queue"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        # Anything published during shutdown is delivered synchronously
+        self._dispatch_pending()
+        with self._space:
+            self._space.notify_all()
+
+    def _admit(self, record: LogRecord) -> bool:
+        """Apply the backpressure policy to a record arriving at a full queue"""
+        if self.policy == BackpressurePolicy.DROP_DEBUG:
+            if record.level.value <= LogLevel.DEBUG.value:
+                return False
+            # INFO may use a second queue's worth of headroom before dropping
+            if record.level.value < LogLevel.WARNING.value:
+                return len(self._queue) < self.queue_size * 2
+        elif self.policy == BackpressurePolicy.SAMPLE:
+            if record.level.value < LogLevel.WARNING.value:
+                self._sampled += 1
+                return self._sampled % self.sample_every == 0 and self._wait_for_space()
+
+        return self._wait_for_space()
+
+    def _wait_for_space(self) -> bool:
+        """Block the publisher until the queue has room"""
+        if threading.current_thread() is self._thread:
+            # A handler logging from the dispatcher must not deadlock on itself
+            return True
+        self._wakeup.set()
+        with self._space:
+            while len(self._queue) >= self.queue_size and not self._stopping:
+                self._space.wait(0.05)
+        return True
+
+    def _run(self) -> None:
+        """Dispatcher loop: sleep until woken, then drain in batches"""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self._dispatch_pending()
+            if self._stopping and not self._queue:
+                break
+
+    def _dispatch_pending(self) -> None:
+        """Drain the queue, handing batches to a handler snapshot"""
+        self._busy = True
+        try:
+            while True:
+                batch = []
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.popleft())
+                except IndexError:
+                    pass
+
+                if not batch:
+                    break
+
+                self._report_dropped(batch)
+                self._deliver(batch)
+                with self._space:
+                    self._space.notify_all()
+        finally:
+            self._busy = False
+            with self._drained:
+                self._drained.notify_all()
+
+    def _deliver(self, batch: list[LogRecord]) -> None:
+        """Send one batch to every handler"""
+        for handler in self._handlers():
+            try:
+                handle_batch = getattr(handler, "handle_batch", None)
+                if handle_batch is not None:
+                    handle_batch(batch)
+                else:
+                    for record in batch:
+                        handler.handle(record)
+            except Exception as e:
+                # Prevent logging errors from breaking the application
+                print(f"Handler error: {e}")
+
+    def _report_dropped(self, batch: list[LogRecord]) -> None:
+        """Append a warning record when records were dropped since the last report"""
+        dropped = self._dropped
+        if dropped == self._reported_dropped:
+            return
+        count = dropped - self._reported_dropped
+        self._reported_dropped = dropped
+        batch.append(
+            LogRecord(
+                timestamp=datetime.now(),
+                level=LogLevel.WARNING,
+                component="logging.dispatch",
+                message=f"Dropped {count} log records under backpressure "
+                f"({self.policy.value}, queue_size={self.queue_size})",
+            )
+        )
+
@@ -5,17 +5,20 @@ Provides various handlers for different output destinations including console
 with colors, rotating files with cleanup, and async handlers for performance.
 """
 
+import atexit
 import gzip
 import os
+import shutil
 import sys
 import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from queue import Empty, Queue
-from typing import TextIO
+from typing import BinaryIO, TextIO
+from weakref import WeakSet
 
 from .exceptions import (
     CompressionError,
@@ -27,6 +30,18 @@ from .formatters import ConsoleFormatter, FileFormatter, create_formatter
 from .interfaces import ILogFormatter, ILogHandler, LogLevel, LogRecord
 
 
+# Buffered file handlers flushed when the interpreter exits
+_buffered_handlers: "WeakSet[RotatingFileHandler]" = WeakSet()
+
+
+def _flush_buffered_handlers() -> None:
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+atexit.register(_flush_buffered_handlers)
+
+
 class BaseHandler(ILogHandler):
     """Base handler with common functionality"""
 
@@ -51,6 +66,22 @@ class BaseHandler(ILogHandler):
             # Prevent handler errors from breaking the application
             self._handle_error(record, e)
 
+    def handle_batch(self, records: list[LogRecord]) -> None:
+        """Handle several records under a single lock acquisition"""
+        if self._closed:
+            return
+
+        with self._lock:
+            for record in records:
+                if self._closed:
+                    return
+                if record.level.value < self.level.value:
+                    continue
+                try:
+                    self._emit(record)
+                except Exception as e:
+                    self._handle_error(record, e)
+
     def _emit(self, record: LogRecord) -> None:
         """Emit log record - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement _emit")
@@ -142,7 +173,15 @@ class ColoredConsoleHandler(BaseHandler):
 
 
 class RotatingFileHandler(BaseHandler):
-    """File handler with size and time-based rotation"""
+    """
+    File handler with size and time-based rotation.
+
+    Lines are encoded once and collected in a write buffer that is flushed
+    when it reaches ``buffer_size`` bytes, when ``flush_interval`` seconds
+    have passed, or immediately for records at or above ``flush_level``.
+    A ``buffer_size`` of 0 writes every line through. Rotated files are
+    compressed on a background thread so logging never waits on gzip.
+    """
 
     def __init__(
         self,
@@ -152,6 +191,9 @@ class RotatingFileHandler(BaseHandler):
         rotation_time: str | None = None,
         compression: bool = True,
         encoding: str = "utf-8",
+        buffer_size: int = 0,
+        flush_interval: float = 1.0,
+        flush_level: LogLevel = LogLevel.ERROR,
         **kwargs,
     ):
         self.filename = Path(filename)
@@ -160,15 +202,27 @@ class RotatingFileHandler(BaseHandler):
         self.rotation_time = rotation_time  # 'midnight', 'hourly', etc.
         self.compression = compression
         self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
 
         # Create directory if it doesn't exist
         self.filename.parent.mkdir(parents=True, exist_ok=True)
 
-        # Current file handle
-        self._file: TextIO | None = None
+        # Current file handle; sizes count bytes handed to the file
+        self._file: BinaryIO | None = None
         self._current_size = 0
         self._last_rotation = datetime.now()
 
+        # Write buffer
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._last_flush = time.monotonic()
+
+        # Background compression of rotated files
+        self._compressor: ThreadPoolExecutor | None = None
+        self._pending_compression: Future | None = None
+
         # Create file formatter
         formatter = FileFormatter(
             detailed=True,
@@ -180,14 +234,22 @@ class RotatingFileHandler(BaseHandler):
         super().__init__(formatter=formatter, **kwargs)  # Open initial file
         self._open_file()
 
+        # Periodic flusher so buffered lines reach disk while idle
+        self._flusher_stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if self.buffer_size > 0:
+            _buffered_handlers.add(self)
+            if self.flush_interval > 0:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="LogFileFlusher", daemon=True
+                )
+                self._flusher.start()
+
     def _open_file(self) -> None:
         """Open log file for writing"""
         try:
-            self._file = open(self.filename, "a", encoding=self.encoding)
-            if self.filename.exists():
-                self._current_size = self.filename.stat().st_size
-            else:
-                self._current_size = 0
+            self._file = open(self.filename, "ab")
+            self._current_size = self._file.tell()
 
         except PermissionError as e:
             raise PermissionError(
@@ -201,23 +263,54 @@ class RotatingFileHandler(BaseHandler):
             if self._should_rotate():
                 self._rotate()
 
-            # Write to file
-            if self._file:
-                message = self.formatter.format(record)
-                line = message + "\n"
-                self._file.write(line)
-                self._file.flush()
-                self._current_size += len(line.encode(self.encoding))
+            data = (self.formatter.format(record) + "\n").encode(self.encoding)
+            self._buffer.append(data)
+            self._buffer_bytes += len(data)
+
+            if (
+                self._buffer_bytes >= self.buffer_size
+                or record.level.value >= self.flush_level.value
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_buffer()
 
         except Exception as e:
             raise HandlerError(
                 f"Failed to write to file: {e}", component="file_handler"
             ) from e
 
+    def flush(self) -> None:
+        """Write buffered lines to disk"""
+        try:
+            with self._lock:
+                if not self._closed:
+                    self._flush_buffer()
+        except Exception as e:
+            self._handle_error(None, e)
+
+    def _flush_buffer(self) -> None:
+        """Write the buffer to the file; caller must hold the lock"""
+        self._last_flush = time.monotonic()
+        if not self._buffer or not self._file:
+            return
+
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_bytes = 0
+        self._file.write(data)
+        self._file.flush()
+        self._current_size += len(data)
+
+    def _flush_loop(self) -> None:
+        """Background loop flushing the buffer every flush_interval"""
+        while not self._flusher_stop.wait(self.flush_interval):
+            if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
     def _should_rotate(self) -> bool:
         """Check if file should be rotated"""
         # Size-based rotation
-        if self._current_size >= self.max_size:
+        if self._current_size + self._buffer_bytes >= self.max_size:
             return True
 
         # Time-based rotation
@@ -231,12 +324,16 @@ class RotatingFileHandler(BaseHandler):
         return False
 
     def _rotate(self) -> None:
-        """Rotate log files"""
+        """Rotate log files, compressing the newest backup in the background"""
         try:
+            self._flush_buffer()
             if self._file:
                 self._file.close()
                 self._file = None
 
+            # Backups are renamed below; the previous compression must be done
+            self._wait_for_compression()
+
             # Rename existing backup files
             for i in range(self.backup_count - 1, 0, -1):
                 old_backup = self._get_backup_filename(i)
@@ -252,11 +349,15 @@ class RotatingFileHandler(BaseHandler):
                 backup_file = self._get_backup_filename(1)
                 if backup_file.exists():
                     backup_file.unlink()
-                self.filename.rename(backup_file)
 
-                # Compress backup if enabled
                 if self.compression:
-                    self._compress_file(backup_file)  # Open new file
+                    uncompressed = self.filename.parent / f"{self.filename.name}.1"
+                    self.filename.rename(uncompressed)
+                    self._schedule_compression(uncompressed)
+                else:
+                    self.filename.rename(backup_file)
+
+            # Open new file
             self._open_file()
             self._last_rotation = datetime.now()
 
@@ -272,15 +373,40 @@ class RotatingFileHandler(BaseHandler):
         else:
             return self.filename.parent / f"{self.filename.name}.{index}"
 
+    def _schedule_compression(self, file_path: Path) -> None:
+        """Compress a rotated file on the background compressor thread"""
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="log_compressor"
+            )
+        self._pending_compression = self._compressor.submit(
+            self._compress_in_background, file_path
+        )
+
+    def _compress_in_background(self, file_path: Path) -> None:
+        """Background task wrapper reporting compression errors"""
+        try:
+            self._compress_file(file_path)
+        except Exception as e:
+            self._handle_error(None, e)
+
+    def _wait_for_compression(self) -> None:
+        """Block until the pending background compression finishes"""
+        if self._pending_compression is not None:
+            self._pending_compression.result()
+            self._pending_compression = None
+
     def _compress_file(self, file_path: Path) -> None:
         """Compress log file using gzip"""
         try:
             compressed_path = file_path.with_suffix(file_path.suffix + ".gz")
+            temp_path = compressed_path.with_suffix(".gz.tmp")
 
             with open(file_path, "rb") as f_in:
-                with gzip.open(compressed_path, "wb") as f_out:
-                    f_out.writelines(f_in)  # Remove uncompressed file
-            file_path.unlink()
+                with gzip.open(temp_path, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+            os.replace(temp_path, compressed_path)
+            file_path.unlink()  # Remove uncompressed file
 
         except Exception as e:
             raise CompressionError(
@@ -288,11 +414,25 @@ class RotatingFileHandler(BaseHandler):
             ) from e
 
     def close(self) -> None:
-        """Close file handler"""
-        super().close()
-        if self._file:
-            self._file.close()
-            self._file = None
+        """Flush, close the file and wait for background compression"""
+        self._flusher_stop.set()
+        if self._flusher and self._flusher.is_alive():
+            self._flusher.join(timeout=5.0)
+
+        with self._lock:
+            try:
+                self._flush_buffer()
+            except Exception as e:
+                self._handle_error(None, e)
+            self._closed = True
+            if self._file:
+                self._file.close()
+                self._file = None
+
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+            self._pending_compression = None
 
 
 class AsyncHandler(BaseHandler):
@@ -0,0 +1,475 @@
+"""
+Indexed Log Store
+
+Structured log sink that writes JSON-lines segments, each with a small
+sidecar index, plus a query API that reads only what a query can match.
+
+A segment is ``segment-<seq>.jsonl``; its sidecar ``segment-<seq>.idx``
+records the segment's time range, the components seen, a bitmap of the
+levels present, the byte offset of every line per operation_id and a
+sparse time-to-offset table. Queries skip segments whose index cannot
+match, seek straight to an operation's lines, and start time-range scans
+at the nearest indexed offset.
+
+Sidecars are written when a segment is sealed and on ``flush()``. Lines
+written after the last sidecar update (the active segment, or a segment
+left behind by a crash) are scanned from the indexed size onwards, so
+queries never miss records.
+
+Usage:
+    from taskmover.core.logging.log_store import LogStore
+
+    store = LogStore("logs/store")
+    for entry in store.query(operation_id=op_id):
+        print(entry["time"], entry["message"])
+"""
+
+import bisect
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .handlers import BaseHandler
+from .interfaces import LogLevel, LogRecord
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+
+# One bit per level so a segment's levels fit in a single integer
+LEVEL_BITS: dict[LogLevel, int] = {level: 1 << i for i, level in enumerate(LogLevel)}
+
+# Records may reach the store slightly out of timestamp order
+ORDER_SLACK_SECONDS = 1.0
+
+_SEGMENT_RE = re.compile(rf"^{SEGMENT_PREFIX}(\d+){re.escape(SEGMENT_SUFFIX)}$")
+
+
+def level_mask(levels: Iterable[LogLevel]) -> int:
+    """Bitmap of the given levels"""
+    mask = 0
+    for level in levels:
+        mask |= LEVEL_BITS[LogLevel(level)]
+    return mask
+
+
+@dataclass
+class SegmentIndex:
+    """Sidecar index describing one segment"""
+
+    segment: str
+    start: float | None = None
+    end: float | None = None
+    count: int = 0
+    size: int = 0
+    level_mask: int = 0
+    components: set[str] = field(default_factory=set)
+    operations: dict[str, list[int]] = field(default_factory=dict)
+    time_marks: list[tuple[float, int]] = field(default_factory=list)
+    sealed: bool = False
+
+    def add(self, timestamp: float, level: LogLevel, component: str,
+            operation_id: str | None, offset: int, length: int, mark_every: int) -> None:
+        """Index a line written at ``offset``"""
+        if self.start is None or timestamp < self.start:
+            self.start = timestamp
+        if self.end is None or timestamp > self.end:
+            self.end = timestamp
+        if self.count % mark_every == 0:
+            self.time_marks.append((timestamp, offset))
+        self.count += 1
+        self.size = offset + length
+        self.level_mask |= LEVEL_BITS[level]
+        self.components.add(component)
+        if operation_id:
+            self.operations.setdefault(operation_id, []).append(offset)
+
+    def may_contain(self, start: float | None, end: float | None,
+                    component: str | None, mask: int | None) -> bool:
+        """Whether the indexed lines can match the filters"""
+        if self.count == 0:
+            return False
+        if start is not None and self.end is not None and self.end < start:
+            return False
+        if end is not None and self.start is not None and self.start > end:
+            return False
+        if mask is not None and not self.level_mask & mask:
+            return False
+        if component is not None and not any(
+            _component_matches(c, component) for c in self.components
+        ):
+            return False
+        return True
+
+    def seek_offset(self, start: float | None) -> int:
+        """Offset of the last time mark at or before ``start``"""
+        if start is None or not self.time_marks:
+            return 0
+        position = bisect.bisect_right([mark[0] for mark in self.time_marks],
+                                       start - ORDER_SLACK_SECONDS)
+        return self.time_marks[position - 1][1] if position else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "segment": self.segment,
+            "start": self.start,
+            "end": self.end,
+            "count": self.count,
+            "size": self.size,
+            "level_mask": self.level_mask,
+            "components": sorted(self.components),
+            "operations": self.operations,
+            "time_marks": self.time_marks,
+            "sealed": self.sealed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SegmentIndex":
+        return cls(
+            segment=data["segment"],
+            start=data.get("start"),
+            end=data.get("end"),
+            count=data.get("count", 0),
+            size=data.get("size", 0),
+            level_mask=data.get("level_mask", 0),
+            components=set(data.get("components", ())),
+            operations={k: list(v) for k, v in data.get("operations", {}).items()},
+            time_marks=[(mark[0], mark[1]) for mark in data.get("time_marks", ())],
+            sealed=data.get("sealed", False),
+        )
+
+
+class IndexedLogHandler(BaseHandler):
+    """
+    Handler writing JSON-lines segments with sidecar indexes.
+
+    A new segment starts when the current one reaches ``segment_size``
+    bytes and on every start-up; with ``max_segments`` set, the oldest
+    segments are deleted beyond that count. Lines are buffered up to
+    ``buffer_size`` bytes and written immediately for records at or above
+    ``flush_level``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_size: int = 8 * 1024 * 1024,
+        max_segments: int = 0,
+        buffer_size: int = 64 * 1024,
+        flush_level: LogLevel = LogLevel.ERROR,
+        mark_every: int = 256,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.mark_every = max(1, mark_every)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._file = None
+        self._index: SegmentIndex | None = None
+        self._sequence = max((seq for seq, _ in _list_segments(self.directory)), default=0)
+        self._open_segment()
+
+    @property
+    def current_segment(self) -> Path | None:
+        """Path of the segment being written"""
+        return self.directory / self._index.segment if self._index else None
+
+    def _open_segment(self) -> None:
+        self._sequence += 1
+        name = f"{SEGMENT_PREFIX}{self._sequence:08d}{SEGMENT_SUFFIX}"
+        self._file = open(self.directory / name, "ab")
+        self._index = SegmentIndex(segment=name)
+
+    def _emit(self, record: LogRecord) -> None:
+        operation_id = _operation_id(record)
+        timestamp = record.timestamp.timestamp()
+        data = (json.dumps(_entry(record, timestamp, operation_id),
+                           ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+        index = self._index
+        if index.size and index.size + len(data) > self.segment_size:
+            self._seal_segment()
+            self._enforce_retention(reserve=1)
+            self._open_segment()
+            index = self._index
+
+        index.add(timestamp, record.level, record.component, operation_id,
+                  index.size, len(data), self.mark_every)
+        self._buffer.append(data)
+        self._buffer_bytes += len(data)
+
+        if self._buffer_bytes >= self.buffer_size or record.level.value >= self.flush_level.value:
+            self._write_buffer()
+
+    def flush(self) -> None:
+        """Write buffered lines and the active segment's sidecar"""
+        try:
+            with self._lock:
+                if not self._closed:
+                    self._write_buffer()
+                    _write_index(self.directory, self._index)
+        except Exception as e:
+            self._handle_error(None, e)
+
+    def _write_buffer(self) -> None:
+        """Write buffered lines; caller must hold the lock"""
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_bytes = 0
+        self._file.write(data)
+        self._file.flush()
+
+    def _seal_segment(self) -> None:
+        """Finish the current segment and write its final sidecar"""
+        self._write_buffer()
+        self._file.close()
+        if self._index.count == 0:
+            (self.directory / self._index.segment).unlink(missing_ok=True)
+            return
+        self._index.sealed = True
+        _write_index(self.directory, self._index)
+
+    def _enforce_retention(self, reserve: int = 0) -> None:
+        """Delete the oldest segments beyond max_segments, keeping ``reserve`` slots free"""
+        if self.max_segments <= 0:
+            return
+        segments = _list_segments(self.directory)
+        for _, path in segments[: max(0, len(segments) + reserve - self.max_segments)]:
+            try:
+                path.unlink()
+                _index_path(path).unlink(missing_ok=True)
+            except OSError as e:
+                self._handle_error(None, e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._seal_segment()
+                self._enforce_retention()
+            except Exception as e:
+                self._handle_error(None, e)
+            self._closed = True
+
+
+class LogStore:
+    """Read-side query API over a directory of indexed segments"""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self._indexes: dict[str, tuple[int, SegmentIndex]] = {}
+
+    def segments(self) -> list[tuple[Path, SegmentIndex]]:
+        """Every segment with its index, oldest first"""
+        result = []
+        for _, path in _list_segments(self.directory):
+            result.append((path, self._load_index(path)))
+        return result
+
+    def query(
+        self,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        component: str | None = None,
+        operation_id: str | None = None,
+        min_level: LogLevel | None = None,
+        levels: Iterable[LogLevel] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield matching entries oldest first.
+
+        ``component`` also matches its sub-components ("patterns" matches
+        "patterns.matcher"). ``min_level`` and ``levels`` combine.
+        """
+        start_ts = _to_epoch(start)
+        end_ts = _to_epoch(end)
+        mask = None
+        if min_level is not None:
+            mask = level_mask(level for level in LogLevel if level >= min_level)
+        if levels is not None:
+            mask = (mask if mask is not None else -1) & level_mask(levels)
+
+        def matches(entry: dict[str, Any]) -> bool:
+            ts = entry.get("ts", 0.0)
+            if start_ts is not None and ts < start_ts:
+                return False
+            if end_ts is not None and ts > end_ts:
+                return False
+            if component is not None and not _component_matches(entry.get("component", ""), component):
+                return False
+            if operation_id is not None and entry.get("operation_id") != operation_id:
+                return False
+            if mask is not None:
+                level = LogLevel.__members__.get(entry.get("level", ""))
+                if level is None or not LEVEL_BITS[level] & mask:
+                    return False
+            return True
+
+        remaining = limit
+        for path, index in self.segments():
+            for entry in self._scan_segment(path, index, start_ts, end_ts, component,
+                                            operation_id, mask):
+                if not matches(entry):
+                    continue
+                yield entry
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+
+    def operation(self, operation_id: str) -> list[dict[str, Any]]:
+        """All entries logged for one operation"""
+        return list(self.query(operation_id=operation_id))
+
+    def _scan_segment(self, path: Path, index: SegmentIndex, start: float | None,
+                      end: float | None, component: str | None,
+                      operation_id: str | None, mask: int | None) -> Iterator[dict[str, Any]]:
+        """Candidate entries of one segment: indexed lines, then any unindexed tail"""
+        try:
+            with open(path, "rb") as f:
+                if index.may_contain(start, end, component, mask):
+                    if operation_id is not None:
+                        for offset in index.operations.get(operation_id, ()):
+                            f.seek(offset)
+                            entry = _parse_line(f.readline())
+                            if entry is not None:
+                                yield entry
+                    else:
+                        f.seek(index.seek_offset(start))
+                        while f.tell() < index.size:
+                            line = f.readline()
+                            if not line:
+                                break
+                            entry = _parse_line(line)
+                            if entry is None:
+                                continue
+                            if end is not None and entry.get("ts", 0.0) > end + ORDER_SLACK_SECONDS:
+                                break
+                            yield entry
+
+                # Lines written after the sidecar was last saved
+                f.seek(index.size)
+                for line in f:
+                    entry = _parse_line(line)
+                    if entry is not None:
+                        yield entry
+        except FileNotFoundError:
+            # Removed by retention while the query was running
+            return
+
+    def _load_index(self, path: Path) -> SegmentIndex:
+        index_path = _index_path(path)
+        try:
+            mtime = index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return SegmentIndex(segment=path.name)
+
+        cached = self._indexes.get(path.name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = SegmentIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            # Corrupt sidecar: treat the whole segment as unindexed
+            index = SegmentIndex(segment=path.name)
+        self._indexes[path.name] = (mtime, index)
+        return index
+
+
+def _entry(record: LogRecord, timestamp: float, operation_id: str | None) -> dict[str, Any]:
+    """JSON-lines representation of a record"""
+    entry: dict[str, Any] = {
+        "ts": timestamp,
+        "time": record.timestamp.isoformat(timespec="milliseconds"),
+        "level": record.level.name,
+        "component": record.component,
+        "message": record.message,
+    }
+    if operation_id:
+        entry["operation_id"] = operation_id
+    context = record.context
+    if context:
+        entry["session_id"] = context.session_id
+        if context.correlation_id:
+            entry["correlation_id"] = context.correlation_id
+        if context.extra_data:
+            entry["context"] = context.extra_data
+    if record.exception:
+        entry["exception"] = {
+            "type": type(record.exception).__name__,
+            "message": str(record.exception),
+        }
+    if record.extra_data:
+        entry["extra"] = record.extra_data
+    return entry
+
+
+def _operation_id(record: LogRecord) -> str | None:
+    if record.context and record.context.operation_id:
+        return record.context.operation_id
+    if record.extra_data:
+        operation_id = record.extra_data.get("operation_id")
+        if operation_id:
+            return str(operation_id)
+    return None
+
+
+def _component_matches(candidate: str, component: str) -> bool:
+    return candidate == component or candidate.startswith(component + ".")
+
+
+def _to_epoch(value: datetime | float | None) -> float | None:
+    if value is None or isinstance(value, int | float):
+        return value
+    return value.timestamp()
+
+
+def _parse_line(line: bytes) -> dict[str, Any] | None:
+    try:
+        return json.loads(line)
+    except ValueError:
+        # Torn final line from a crash
+        return None
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_suffix(INDEX_SUFFIX)
+
+
+def _list_segments(directory: Path) -> list[tuple[int, Path]]:
+    segments = []
+    try:
+        for path in directory.iterdir():
+            match = _SEGMENT_RE.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+    except FileNotFoundError:
+        return []
+    segments.sort()
+    return segments
+
+
+def _write_index(directory: Path, index: SegmentIndex) -> None:
+    """Write a sidecar atomically so readers never see a partial index"""
+    path = _index_path(directory / index.segment)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(index.to_dict(), f, separators=(",", ":"))
+    os.replace(temp_path, path)
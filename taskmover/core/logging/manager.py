@@ -5,6 +5,7 @@ Thread-safe singleton that manages loggers, configuration, and context for the e
 Provides centralized logging coordination and component-based logger creation.
 """
 
+import atexit
 import threading
 import uuid
 from contextlib import contextmanager
@@ -12,7 +13,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from .config import LoggingConfig, get_config
+from .config import LoggingConfig, LogStoreConfig, get_config
+from .dispatch import BackpressurePolicy, LogDispatcher
+from .metrics import LazyMessage, get_metrics
+from .tracing import get_tracer
 from .interfaces import (
     IContextManager,
     ILogger,
@@ -51,9 +55,9 @@ class PerformanceTracker(IPerformanceTracker):
     def log_performance(
         self, operation_name: str, duration: float, **kwargs: Any
     ) -> None:
-        """Log performance metrics"""
-        # This will be implemented when we have the full logger
-        pass
+        """Record an operation duration as metrics and, when tracing, as a span"""
+        get_metrics().record(operation_name, duration * 1000)
+        get_tracer().record_complete(operation_name, duration, **kwargs)
 
 
 class ContextManager(IContextManager):
@@ -95,7 +99,7 @@ class ComponentLogger(ILogger):
         self.manager = manager
         self._level = LogLevel.INFO
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str | LazyMessage, **kwargs: Any) -> None:
         """Log debug message"""
         self.log(LogLevel.DEBUG, message, **kwargs)
 
@@ -115,11 +119,14 @@ class ComponentLogger(ILogger):
         """Log critical message"""
         self.log(LogLevel.CRITICAL, message, **kwargs)
 
-    def log(self, level: LogLevel, message: str, **kwargs: Any) -> None:
-        """Log message at specified level"""
+    def log(self, level: LogLevel, message: str | LazyMessage, **kwargs: Any) -> None:
+        """Log message at specified level; callable messages are built only if enabled"""
         if not self.is_enabled_for(level):
             return
 
+        if callable(message):
+            message = message()
+
         # Create log record
         record = LogRecord(
             timestamp=datetime.now(),
@@ -145,7 +152,14 @@ class ComponentLogger(ILogger):
 
 
 class LoggerManager(ILoggerManager):
-    """Thread-safe singleton logger manager"""
+    """
+    Thread-safe singleton logger manager.
+
+    Records are published to a LogDispatcher whose thread performs all
+    handler I/O, so logging threads never wait on console or file writes.
+    Handlers are read from an immutable snapshot that is replaced whenever
+    the handler set changes.
+    """
 
     _instance: Optional["LoggerManager"] = None
     _lock = threading.Lock()
@@ -169,6 +183,8 @@ class LoggerManager(ILoggerManager):
 
         self._loggers: dict[str, ComponentLogger] = {}
         self._handlers: set[ILogHandler] = set()
+        self._handler_snapshot: tuple[ILogHandler, ...] = ()
+        self._dispatcher: LogDispatcher | None = None
         self._config: LoggingConfig | None = None
         self._context: LogContext | None = None
         self._performance_tracker = PerformanceTracker()
@@ -176,6 +192,7 @@ class LoggerManager(ILoggerManager):
         self._logger_lock = threading.RLock()
         self._handler_lock = threading.Lock()
         self._initialized = True
+        atexit.register(self._stop_dispatcher)
 
         # Load initial configuration
         try:
@@ -194,6 +211,9 @@ class LoggerManager(ILoggerManager):
         """Configure logging system"""
         self._config = config
 
+        # Deliver everything queued for the old handlers before replacing them
+        self._stop_dispatcher()
+
         # Clear existing handlers
         with self._handler_lock:
             for handler in self._handlers:
@@ -229,6 +249,8 @@ class LoggerManager(ILoggerManager):
                     max_size=max_size,
                     backup_count=config.file.rotation.backup_count,
                     compression=config.file.rotation.compression_enabled,
+                    buffer_size=self._parse_size_string(config.file.buffer_size, default=0),
+                    flush_interval=self._parse_interval(config.file.flush_interval),
                     level=config.level,
                 )
                 self._handlers.add(file_handler)
@@ -243,20 +265,47 @@ class LoggerManager(ILoggerManager):
                     )
                     self._handlers.add(cleanup_handler)
 
-            print(
-                f"Logging configured: level={config.level.value}, "
-                f"console={config.console.enabled}, file={config.file.enabled}"
+            # Create indexed log store if enabled
+            store = getattr(config, "store", None)
+            if isinstance(store, LogStoreConfig) and store.enabled:
+                from .log_store import IndexedLogHandler
+
+                self._handlers.add(
+                    IndexedLogHandler(
+                        directory=store.path,
+                        segment_size=self._parse_size_string(store.segment_size,
+                                                             default=8 * 1024 * 1024),
+                        max_segments=store.max_segments,
+                        level=config.level,
+                    )
+                )
+
+            self._refresh_handler_snapshot()
+
+        if config.async_dispatch:
+            self._dispatcher = LogDispatcher(
+                handlers=lambda: self._handler_snapshot,
+                queue_size=config.dispatch_queue_size,
+                policy=BackpressurePolicy.parse(config.backpressure),
             )
 
-    def _parse_size_string(self, size_str: str) -> int:
+        print(
+            f"Logging configured: level={config.level.value}, "
+            f"console={config.console.enabled}, file={config.file.enabled}"
+        )
+
+    def _parse_size_string(self, size_str: str, default: int = 10 * 1024 * 1024) -> int:
         """Parse size string like '10MB' to bytes"""
         import re
 
+        if not isinstance(size_str, str):
+            return default
+
         size_str = size_str.upper().strip()
         match = re.match(r"^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$", size_str)
 
         if not match:
-            return 10 * 1024 * 1024  # Default 10MB
+            return default
 
         number, unit = match.groups()
         number = float(number)
@@ -271,8 +320,16 @@ class LoggerManager(ILoggerManager):
 
         return int(number * multipliers.get(unit, 1))
 
+    def _parse_interval(self, value: Any, default: float = 1.0) -> float:
+        """Parse a non-negative interval in seconds"""
+        if isinstance(value, (int, float)) and value >= 0:
+            return float(value)
+        return default
+
     def shutdown(self) -> None:
         """Shutdown logging system"""
+        self._stop_dispatcher()
+
         with self._handler_lock:
             for handler in self._handlers:
                 try:
@@ -280,6 +337,7 @@ class LoggerManager(ILoggerManager):
                 except Exception:
                     pass
             self._handlers.clear()
+            self._refresh_handler_snapshot()
 
         with self._logger_lock:
             self._loggers.clear()
@@ -302,25 +360,57 @@ class LoggerManager(ILoggerManager):
         """Add log handler"""
         with self._handler_lock:
             self._handlers.add(handler)
+            self._refresh_handler_snapshot()
 
     def remove_handler(self, handler: ILogHandler) -> None:
         """Remove log handler"""
+        # Records already queued for this handler are delivered first
+        self.flush()
         with self._handler_lock:
             self._handlers.discard(handler)
+            self._refresh_handler_snapshot()
             try:
                 handler.close()
             except Exception:
                 pass
 
-    def _handle_record(self, record: LogRecord) -> None:
-        """Handle log record by sending to all handlers"""
-        with self._handler_lock:
-            for handler in self._handlers:
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued records have been handed to the handlers"""
+        dispatcher = self._dispatcher
+        if dispatcher is not None:
+            dispatcher.flush(timeout)
+        for handler in self._handler_snapshot:
+            flush = getattr(handler, "flush", None)
+            if callable(flush):
                 try:
-                    handler.handle(record)
-                except Exception as e:
-                    # Prevent logging errors from breaking the application
-                    print(f"Handler error: {e}")
+                    flush()
+                except Exception:
+                    pass
+
+    def _refresh_handler_snapshot(self) -> None:
+        """Publish a new immutable handler snapshot; caller holds _handler_lock"""
+        self._handler_snapshot = tuple(self._handlers)
+
+    def _stop_dispatcher(self) -> None:
+        """Drain and stop the dispatcher thread"""
+        dispatcher = self._dispatcher
+        self._dispatcher = None
+        if dispatcher is not None:
+            dispatcher.close()
+
+    def _handle_record(self, record: LogRecord) -> None:
+        """Publish a record to the dispatcher, or handle it inline without one"""
+        dispatcher = self._dispatcher
+        if dispatcher is not None and dispatcher.running:
+            dispatcher.publish(record)
+            return
+
+        for handler in self._handler_snapshot:
+            try:
+                handler.handle(record)
+            except Exception as e:
+                # Prevent logging errors from breaking the application
+                print(f"Handler error: {e}")
 
     def _get_component_level(self, component: str) -> LogLevel:
         """Get effective log level for component"""
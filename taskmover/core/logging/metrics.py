@@ -0,0 +1,283 @@
+"""
+Hot-Path Metrics
+
+Counters, histograms and sampled spans for code that runs once per file
+or once per pattern evaluation. Recording a metric is a dictionary lookup
+and an addition under a short lock; nothing is formatted or written unless
+a sampled span is emitted to a logger that is enabled for its level.
+
+Usage:
+    from taskmover.core.logging.metrics import get_metrics
+
+    metrics = get_metrics()
+    metrics.counter("file_operations.moved").inc()
+    with metrics.span("patterns.matcher.match", logger=logger, files=len(paths)):
+        ...
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .interfaces import ILogger, LogLevel
+
+# Default histogram bucket upper bounds (milliseconds, roughly x2.5 steps)
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0,
+    100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 30000.0,
+)
+
+# Log message built only after the level check passes
+LazyMessage = Callable[[], str]
+
+
+class Counter:
+    """Monotonic thread-safe counter"""
+
+    __slots__ = ("name", "_value", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the counter"""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        """Current counter value"""
+        return self._value
+
+    def reset(self) -> None:
+        """Reset the counter to zero"""
+        with self._lock:
+            self._value = 0
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max"""
+
+    __slots__ = ("name", "_bounds", "_buckets", "_count", "_sum", "_min", "_max", "_lock")
+
+    def __init__(self, name: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.name = name
+        self._bounds = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._reset_unlocked()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation"""
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        """Number of observations"""
+        return self._count
+
+    def percentile(self, fraction: float) -> float:
+        """Approximate a percentile from bucket upper bounds"""
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+            target = max(1, int(round(fraction * self._count)))
+            seen = 0
+            for index, bucket_count in enumerate(self._buckets):
+                seen += bucket_count
+                if seen >= target:
+                    if index < len(self._bounds):
+                        return min(self._bounds[index], self._max)
+                    return self._max
+            return self._max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time summary"""
+        with self._lock:
+            count = self._count
+            total = self._sum
+            minimum = self._min if count else 0.0
+            maximum = self._max if count else 0.0
+        return {
+            "count": count,
+            "sum": round(total, 4),
+            "min": round(minimum, 4),
+            "max": round(maximum, 4),
+            "mean": round(total / count, 4) if count else 0.0,
+            "p50": round(self.percentile(0.50), 4),
+            "p95": round(self.percentile(0.95), 4),
+            "p99": round(self.percentile(0.99), 4),
+        }
+
+    def reset(self) -> None:
+        """Drop all observations"""
+        with self._lock:
+            self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._buckets = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+
+class Span:
+    """
+    Timed section recorded into a histogram.
+
+    Every span is counted and timed; only every ``sample_every``-th span of
+    a name is emitted to the logger, and its message is built only then.
+    """
+
+    __slots__ = ("_registry", "name", "_logger", "_level", "_attributes", "_start", "duration_ms")
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        logger: ILogger | None,
+        level: LogLevel,
+        attributes: dict[str, Any],
+    ):
+        self._registry = registry
+        self.name = name
+        self._logger = logger
+        self._level = level
+        self._attributes = attributes
+        self._start = 0.0
+        self.duration_ms = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute reported if the span is sampled"""
+        self._attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        self._registry.record(self.name, self.duration_ms, failed=exc_type is not None)
+
+        if exc_type is not None:
+            self._attributes["error"] = exc_val
+        if self._logger is not None and self._registry.should_sample(self.name):
+            self._registry.emit(self._logger, self._level, self.name,
+                                self.duration_ms, self._attributes)
+
+
+class MetricsRegistry:
+    """Named counters and histograms with sampled span emission"""
+
+    def __init__(self, sample_every: int = 1000):
+        self._counters: dict[str, Counter] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._samplers: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self.sample_every = max(1, sample_every)
+
+    def counter(self, name: str) -> Counter:
+        """Get or create a counter"""
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter(name))
+        return counter
+
+    def histogram(self, name: str) -> Histogram:
+        """Get or create a histogram"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram(name))
+        return histogram
+
+    def record(self, name: str, duration_ms: float, failed: bool = False) -> None:
+        """Record a completed operation: its count, failures and duration"""
+        self.counter(f"{name}.calls").inc()
+        if failed:
+            self.counter(f"{name}.errors").inc()
+        self.histogram(f"{name}.duration_ms").observe(duration_ms)
+
+    def span(
+        self,
+        name: str,
+        logger: ILogger | None = None,
+        level: LogLevel = LogLevel.DEBUG,
+        **attributes: Any,
+    ) -> Span:
+        """Time a block of code; see Span"""
+        return Span(self, name, logger, level, attributes)
+
+    def should_sample(self, name: str) -> bool:
+        """Return True for the first and then every sample_every-th event of a name"""
+        sampler = self._samplers.get(name)
+        if sampler is None:
+            with self._lock:
+                sampler = self._samplers.setdefault(name, Counter(name))
+        with sampler._lock:
+            sampler._value += 1
+            return (sampler._value - 1) % self.sample_every == 0
+
+    def emit(
+        self,
+        logger: ILogger,
+        level: LogLevel,
+        name: str,
+        duration_ms: float,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        """Log a sampled event, formatting it only if the logger is enabled"""
+        if not logger.is_enabled_for(level):
+            return
+        logger.log(
+            level,
+            lambda: format_event(name, duration_ms, attributes),
+            extra_data={"metric": name, "duration_ms": round(duration_ms, 3),
+                        **(attributes or {})},
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current value of every metric"""
+        with self._lock:
+            counters = list(self._counters.values())
+            histograms = list(self._histograms.values())
+        return {
+            "counters": {c.name: c.value for c in counters},
+            "histograms": {h.name: h.snapshot() for h in histograms},
+        }
+
+    def reset(self) -> None:
+        """Reset every metric"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._samplers.clear()
+
+
+def format_event(name: str, duration_ms: float | None, attributes: dict[str, Any] | None) -> str:
+    """Format a metric event as a single log line"""
+    message = name if duration_ms is None else f"{name} took {duration_ms:.2f}ms"
+    if attributes:
+        message += " - " + ", ".join(f"{k}={v}" for k, v in attributes.items())
+    return message
+
+# Process-wide registry
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry"""
+    return _registry
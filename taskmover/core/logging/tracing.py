@@ -0,0 +1,342 @@
+"""
+Span Tracing
+
+Lightweight nested spans for finding where a slow run spends its time.
+Completed spans are kept in per-thread ring buffers; when a thread exits
+its buffer is folded into one shared ring of retired spans, so memory
+stays bounded however many threads come and go. Spans can be exported
+as Chrome trace-event JSON (Perfetto, chrome://tracing) or as a
+speedscope evented profile.
+
+Tracing is off unless enabled with ``get_tracer().enable()`` or the
+``TASKMOVER_TRACE`` environment variable; while off, ``span()`` returns a
+shared no-op object so instrumented code pays one attribute check.
+
+Usage:
+    from taskmover.core.logging.tracing import get_tracer
+
+    tracer = get_tracer()
+    with tracer.span("rule.execute", rule=rule.name) as span:
+        with tracer.span("rule.scan"):
+            ...
+        span.set_attribute("files", len(files))
+
+    tracer.export_chrome_trace("trace.json")
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Nesting depth follows the execution context so asyncio tasks nest correctly
+_depth: ContextVar[int] = ContextVar("taskmover_trace_depth", default=0)
+
+
+@dataclass
+class SpanEvent:
+    """A completed span"""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    depth: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def end_ns(self) -> int:
+        """Span end on the perf_counter_ns clock"""
+        return self.start_ns + self.duration_ns
+
+
+class _NoopSpan:
+    """Shared span used while tracing is disabled"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class TraceSpan:
+    """Active span; records a SpanEvent into the thread's buffer on exit"""
+
+    __slots__ = ("_tracer", "name", "attributes", "_start_ns", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self._start_ns = 0
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span"""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "TraceSpan":
+        depth = _depth.get()
+        self._token = _depth.set(depth + 1)
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        end_ns = time.perf_counter_ns()
+        _depth.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = repr(exc_val)
+        self._tracer._record(
+            SpanEvent(
+                name=self.name,
+                start_ns=self._start_ns,
+                duration_ns=end_ns - self._start_ns,
+                thread_id=threading.get_ident(),
+                depth=_depth.get(),
+                attributes=self.attributes,
+            )
+        )
+
+
+class _ThreadBuffer:
+    """Holder of a thread's span buffer; collected with the thread's locals"""
+
+    __slots__ = ("events", "__weakref__")
+
+    def __init__(self, events: deque[SpanEvent]):
+        self.events = events
+
+
+class Tracer:
+    """Span recorder with per-thread ring buffers"""
+
+    # Names kept for threads that have exited
+    MAX_RETIRED_THREAD_NAMES = 1024
+
+    def __init__(self, buffer_size: int = 65536, enabled: bool = False):
+        self.buffer_size = buffer_size
+        self.enabled = enabled
+        self._local = threading.local()
+        self._buffers: dict[int, deque[SpanEvent]] = {}
+        self._retired: deque[SpanEvent] = deque(maxlen=buffer_size)
+        self._thread_names: dict[int, str] = {}
+        self._retired_names: OrderedDict[int, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_wall_us = time.time_ns() // 1000
+
+    def enable(self) -> None:
+        """Start recording spans"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans; recorded spans are kept"""
+        self.enabled = False
+
+    def span(self, name: str, **attributes: Any) -> "TraceSpan | _NoopSpan":
+        """Open a span; use as a context manager"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return TraceSpan(self, name, attributes)
+
+    def record_complete(self, name: str, duration_seconds: float, **attributes: Any) -> None:
+        """Record a span that was timed elsewhere and ended now"""
+        if not self.enabled:
+            return
+        duration_ns = int(duration_seconds * 1_000_000_000)
+        self._record(
+            SpanEvent(
+                name=name,
+                start_ns=time.perf_counter_ns() - duration_ns,
+                duration_ns=duration_ns,
+                thread_id=threading.get_ident(),
+                depth=_depth.get(),
+                attributes=attributes,
+            )
+        )
+
+    def events(self) -> list[SpanEvent]:
+        """All buffered spans ordered by start time"""
+        with self._lock:
+            buffers = [list(buffer) for buffer in self._buffers.values()]
+            buffers.append(list(self._retired))
+        events = [event for buffer in buffers for event in buffer]
+        events.sort(key=lambda e: (e.start_ns, -e.duration_ns))
+        return events
+
+    def clear(self) -> None:
+        """Drop all buffered spans"""
+        with self._lock:
+            for buffer in self._buffers.values():
+                buffer.clear()
+            self._retired.clear()
+            self._retired_names.clear()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace-event document of complete ("X") events"""
+        pid = os.getpid()
+        trace_events: list[dict[str, Any]] = []
+
+        with self._lock:
+            thread_names = {**self._retired_names, **self._thread_names}
+        for tid, thread_name in thread_names.items():
+            trace_events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": thread_name},
+            })
+
+        for event in self.events():
+            trace_events.append({
+                "name": event.name,
+                "cat": event.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": self._to_us(event.start_ns),
+                "dur": event.duration_ns / 1000,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": {k: _json_safe(v) for k, v in event.attributes.items()},
+            })
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "TaskMover trace") -> dict[str, Any]:
+        """Build a speedscope evented profile with one profile per thread"""
+        frames: list[dict[str, str]] = []
+        frame_index: dict[str, int] = {}
+        by_thread: dict[int, list[SpanEvent]] = {}
+        for event in self.events():
+            by_thread.setdefault(event.thread_id, []).append(event)
+            if event.name not in frame_index:
+                frame_index[event.name] = len(frames)
+                frames.append({"name": event.name})
+
+        with self._lock:
+            thread_names = {**self._retired_names, **self._thread_names}
+
+        profiles = []
+        for tid, events in by_thread.items():
+            # Opens sort outer-first, closes inner-first, closes before opens
+            markers = []
+            for event in events:
+                frame = frame_index[event.name]
+                markers.append((event.start_ns, 1, -event.end_ns, "O", frame))
+                markers.append((event.end_ns, 0, -event.start_ns, "C", frame))
+            markers.sort()
+            profiles.append({
+                "type": "evented",
+                "name": thread_names.get(tid, str(tid)),
+                "unit": "microseconds",
+                "startValue": self._to_us(markers[0][0]),
+                "endValue": self._to_us(markers[-1][0]),
+                "events": [
+                    {"type": kind, "frame": frame, "at": self._to_us(at)}
+                    for at, _, _, kind, frame in markers
+                ],
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": name,
+            "exporter": "taskmover",
+        }
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """Write a Chrome trace-event JSON file"""
+        return _write_json(Path(path), self.to_chrome_trace())
+
+    def export_speedscope(self, path: str | Path) -> Path:
+        """Write a speedscope JSON file"""
+        return _write_json(Path(path), self.to_speedscope())
+
+    def _record(self, event: SpanEvent) -> None:
+        """Append a completed span to the current thread's ring buffer"""
+        holder = getattr(self._local, "buffer", None)
+        if holder is None:
+            holder = self._local.buffer = _ThreadBuffer(deque(maxlen=self.buffer_size))
+            with self._lock:
+                self._buffers[id(holder.events)] = holder.events
+                self._thread_names[event.thread_id] = threading.current_thread().name
+            # The holder dies with the thread's locals
+            weakref.finalize(holder, _retire_buffer, weakref.ref(self), holder.events, event.thread_id)
+        holder.events.append(event)
+
+    def _retire(self, events: deque[SpanEvent], thread_id: int) -> None:
+        """Fold the buffer of an exited thread into the shared retired ring"""
+        with self._lock:
+            if self._buffers.pop(id(events), None) is None:
+                return
+            self._retired.extend(events)
+            name = self._thread_names.pop(thread_id, None)
+            if name is not None:
+                self._retired_names[thread_id] = name
+                self._retired_names.move_to_end(thread_id)
+                while len(self._retired_names) > self.MAX_RETIRED_THREAD_NAMES:
+                    self._retired_names.popitem(last=False)
+
+    def _to_us(self, perf_ns: int) -> float:
+        """Convert a perf_counter_ns reading to wall-clock microseconds"""
+        return self._origin_wall_us + (perf_ns - self._origin_ns) / 1000
+
+
+def traced(name: str | None = None) -> Callable:
+    """Decorator wrapping a function call in a span"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _retire_buffer(tracer_ref: "weakref.ref[Tracer]", events: deque[SpanEvent], thread_id: int) -> None:
+    tracer = tracer_ref()
+    if tracer is not None:
+        tracer._retire(events, thread_id)
+
+
+def _json_safe(value: Any) -> Any:
+    """Keep JSON scalars, stringify everything else"""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
+
+
+def _write_json(path: Path, document: dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f)
+    return path
+
+
+# Process-wide tracer
+_tracer = Tracer(enabled=os.getenv("TASKMOVER_TRACE", "").lower() in ("1", "true", "yes", "on"))
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Any
 
 from .interfaces import ILogger, LogLevel
+from .tracing import get_tracer
 
 
 class PerformanceTimer:
@@ -32,13 +33,18 @@ class PerformanceTimer:
         self.log_level = log_level
         self.start_time: float | None = None
         self.end_time: float | None = None
+        self._span = None
 
     def __enter__(self):
+        self._span = get_tracer().span(self.operation_name)
+        self._span.__enter__()
         self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.end_time = time.perf_counter()
+        if self._span is not None:
+            self._span.__exit__(exc_type, exc_val, exc_tb)
         if self.start_time is not None:
             duration_ms = (self.end_time - self.start_time) * 1000
         else:
@@ -5,24 +5,68 @@ Unified API for the TaskMover Pattern System providing high-level
 operations and service orchestration.
 """
 
+import importlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from uuid import UUID
 import time
 
-from .interfaces import BasePatternService
+from .interfaces import (
+    BasePatternService, ICacheManager, IPatternMatcher, IPatternParser, IPatternRepository,
+    IPatternValidator, ISuggestionEngine, ITokenResolver, IWorkspaceAnalyzer
+)
 from .models import Pattern, PatternGroup, MatchResult, ValidationResult, ParsedPattern
 from .exceptions import PatternSystemError, PatternNotFoundError
+from ..di import ServiceContainer, ServiceLifetime
+from ..logging.interfaces import LogLevel
+from ..logging.metrics import format_event, get_metrics
+from ..logging.tracing import get_tracer
 
-# Import concrete implementations
-from .parsing.intelligent_parser import IntelligentPatternParser
-from .parsing.token_resolver import TokenResolver
-from .matching.unified_matcher import UnifiedPatternMatcher
-from .storage.repository import PatternRepository
-from .storage.cache_manager import MultiLevelCacheManager
-from .suggestions.suggestion_engine import PatternSuggestionEngine, WorkspaceAnalyzer
-from .validation.pattern_validator import PatternValidator
-from ..conflict_resolution import ConflictManager
+if TYPE_CHECKING:
+    from .parsing.intelligent_parser import IntelligentPatternParser
+    from .parsing.token_resolver import TokenResolver
+    from .matching.unified_matcher import UnifiedPatternMatcher
+    from .matching.preview import PatternPreviewRunner
+    from .storage.repository import PatternRepository
+    from .storage.cache_manager import MultiLevelCacheManager
+    from .storage.sharded_cache import ShardedCacheManager
+    from .storage.tinylfu_cache import WTinyLfuCacheManager
+    from .suggestions.suggestion_engine import PatternSuggestionEngine, WorkspaceAnalyzer
+    from .validation.pattern_validator import PatternValidator
+    from ..conflict_resolution import ConflictManager
+
+
+# Concrete implementations are imported when a component is first built.
+# They stay reachable as module attributes, so patching them here replaces
+# what PatternSystem constructs.
+_LAZY_IMPORTS = {
+    'IntelligentPatternParser': '.parsing.intelligent_parser',
+    'TokenResolver': '.parsing.token_resolver',
+    'UnifiedPatternMatcher': '.matching.unified_matcher',
+    'PatternRepository': '.storage.repository',
+    'SQLitePatternRepository': '.storage.sqlite_repository',
+    'MultiLevelCacheManager': '.storage.cache_manager',
+    'ShardedCacheManager': '.storage.sharded_cache',
+    'WTinyLfuCacheManager': '.storage.tinylfu_cache',
+    'PatternSuggestionEngine': '.suggestions.suggestion_engine',
+    'WorkspaceAnalyzer': '.suggestions.suggestion_engine',
+    'PatternValidator': '.validation.pattern_validator',
+    'ConflictManager': '..conflict_resolution',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _implementation(name: str) -> Any:
+    """Look up a lazily imported implementation, honouring patched attributes."""
+    return globals()[name] if name in globals() else __getattr__(name)
 
 
 class PatternSystem(BasePatternService):
@@ -31,14 +75,32 @@ class PatternSystem(BasePatternService):
     
     This is the primary interface for pattern management, matching, and analysis
     in the TaskMover application.
+    
+    ``initialize()`` registers the components in a ``ServiceContainer`` and
+    only opens the repository; the parser, matcher, cache, analyzer,
+    suggestion engine, validator and conflict manager are built on first use.
     """
     
+    # Components built through the container on first use
+    _COMPONENT_INTERFACES = {
+        'cache_manager': ICacheManager,
+        'token_resolver': ITokenResolver,
+        'parser': IPatternParser,
+        'repository': IPatternRepository,
+        'matcher': IPatternMatcher,
+        'workspace_analyzer': IWorkspaceAnalyzer,
+        'suggestion_engine': ISuggestionEngine,
+        'validator': IPatternValidator,
+    }
+    
     def __init__(self, 
                  storage_path: Optional[Path] = None,
-                 cache_settings: Optional[Dict[str, Any]] = None):
+                 cache_settings: Optional[Dict[str, Any]] = None,
+                 storage_backend: str = "yaml"):
         # Initialize logging like BasePatternComponent
         from taskmover.core.logging import get_logger
         self._logger = get_logger("patterns.pattern_system")
+        self._metrics = get_metrics()
         self._component_name = "pattern_system"
         
         super().__init__("pattern_system")
@@ -46,17 +108,10 @@ class PatternSystem(BasePatternService):
         # Configuration
         self._storage_path = storage_path or Path.cwd() / "patterns"
         self._cache_settings = cache_settings or {}
+        self._storage_backend = storage_backend.lower()
         
-        # Core components (will be initialized in initialize())
-        self._parser: Optional[IntelligentPatternParser] = None
-        self._token_resolver: Optional[TokenResolver] = None
-        self._matcher: Optional[UnifiedPatternMatcher] = None
-        self._repository: Optional[PatternRepository] = None
-        self._cache_manager: Optional[MultiLevelCacheManager] = None
-        self._suggestion_engine: Optional[PatternSuggestionEngine] = None
-        self._workspace_analyzer: Optional[WorkspaceAnalyzer] = None
-        self._validator: Optional[PatternValidator] = None
-        self._conflict_manager: Optional[ConflictManager] = None
+        # Core components, built on first use once initialize() has run
+        self._components: Optional[ServiceContainer] = None
         
         # State
         self._initialized = False
@@ -64,13 +119,11 @@ class PatternSystem(BasePatternService):
         self._logger.info("PatternSystem created")
     
     def _log_operation(self, operation: str, **kwargs) -> None:
-        """Log an operation with context."""
-        if kwargs:
-            extra_info = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            message = f"{self._component_name} operation: {operation} - {extra_info}"
-        else:
-            message = f"{self._component_name} operation: {operation}"
-        self._logger.info(message)
+        """Count an operation; details are logged at DEBUG only when enabled."""
+        self._metrics.counter(f"{self._component_name}.{operation}").inc()
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(format_event(f"{self._component_name} operation: {operation}",
+                                            None, kwargs))
     
     def _log_error(self, error: Exception, operation: str, **kwargs) -> None:
         """Log an error with context."""
@@ -81,12 +134,13 @@ class PatternSystem(BasePatternService):
         self._logger.error(message)
     
     def _log_performance(self, operation: str, duration_ms: float, **kwargs) -> None:
-        """Log performance metrics."""
-        message = f"{self._component_name} performance: {operation} took {duration_ms:.2f}ms"
-        if kwargs:
-            extra_info = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            message += f" - {extra_info}"
-        self._logger.info(message)
+        """Record an operation duration; a sample is logged at DEBUG."""
+        name = f"{self._component_name}.{operation}"
+        self._metrics.record(name, duration_ms)
+        if self._metrics.should_sample(name):
+            self._metrics.emit(self._logger, LogLevel.DEBUG,
+                               f"{self._component_name} performance: {operation}",
+                               duration_ms, kwargs)
     
     def initialize(self) -> None:
         """Initialize all pattern system components."""
@@ -97,22 +151,17 @@ class PatternSystem(BasePatternService):
                 self._logger.warning("Pattern system already initialized")
                 return
             
-            # Initialize components in dependency order
-            self._initialize_cache_manager()
-            self._initialize_conflict_manager()
-            self._initialize_token_resolver()
-            self._initialize_parser()
-            self._initialize_repository()
-            self._initialize_matcher()
-            self._initialize_workspace_analyzer()
-            self._initialize_suggestion_engine()
-            self._initialize_validator()
+            self._register_components()
+            
+            # Storage errors surface here rather than on first use
+            self._components.resolve(IPatternRepository)
             
             self._initialized = True
             
             self._logger.info("Pattern system initialized successfully")
             
         except Exception as e:
+            self._components = None
             self._log_error(e, "initialize_system")
             raise PatternSystemError(f"Failed to initialize pattern system: {e}")
     
@@ -124,10 +173,12 @@ class PatternSystem(BasePatternService):
             if not self._initialized:
                 return
             
-            # Shutdown components in reverse order
-            if self._cache_manager:
-                self._cache_manager.shutdown()
+            # Only components that were actually built need shutting down
+            cache_manager = self._built(ICacheManager)
+            if cache_manager:
+                cache_manager.shutdown()
             
+            self._components = None
             self._initialized = False
             
             self._logger.info("Pattern system shutdown complete")
@@ -188,6 +239,7 @@ class PatternSystem(BasePatternService):
             if not self._repository:
                 raise PatternSystemError("Repository not initialized")
             self._repository.save(pattern)
+            self._index_pattern(pattern)
             
             self._logger.info(f"Created pattern: {pattern.name} ({pattern.id})")
             
@@ -227,6 +279,7 @@ class PatternSystem(BasePatternService):
             if not self._repository:
                 raise PatternSystemError("Repository not initialized")
             self._repository.save(pattern)
+            self._index_pattern(pattern)
             
             self._logger.info(f"Added pattern: {pattern.name} ({pattern.id})")
             
@@ -292,8 +345,9 @@ class PatternSystem(BasePatternService):
             # Update in repository
             self._repository.save(pattern)
             
-            # Clear cache for this pattern
-            self._invalidate_pattern_cache(pattern)
+            # Drop cached results for this pattern only
+            self._invalidate_pattern_cache(pattern.id)
+            self._index_pattern(pattern)
             
             self._logger.info(f"Updated pattern: {pattern.name} ({pattern.id})")
             
@@ -322,6 +376,10 @@ class PatternSystem(BasePatternService):
             success = self._repository.delete(pattern_id)
             
             if success:
+                self._invalidate_pattern_cache(pattern_id)
+                suggestion_engine = self._built(ISuggestionEngine)
+                if suggestion_engine:
+                    suggestion_engine.pattern_deleted(pattern_id)
                 self._logger.info(f"Deleted pattern: {pattern_id}")
             
             return success
@@ -370,13 +428,15 @@ class PatternSystem(BasePatternService):
     
     def match_pattern(self, 
                      pattern: Union[Pattern, str], 
-                     file_paths: List[Path]) -> MatchResult:
+                     file_paths: List[Path],
+                     cache_tags: Optional[List[str]] = None) -> MatchResult:
         """
         Execute pattern matching against file paths.
         
         Args:
             pattern: Pattern object or expression string
             file_paths: List of file paths to match against
+            cache_tags: Extra dependency tags for the cached result
             
         Returns:
             MatchResult with matched files and metadata
@@ -396,7 +456,15 @@ class PatternSystem(BasePatternService):
             else:
                 pattern_obj = pattern
             
-            return self._matcher.match(pattern_obj, file_paths)
+            with get_tracer().span("patterns.match", files=len(file_paths)):
+                result = self._matcher.match(pattern_obj, file_paths, cache_tags)
+            
+            # Usage stats changed; keep completion ranking in step
+            suggestion_engine = self._built(ISuggestionEngine)
+            if suggestion_engine and pattern_obj is pattern:
+                suggestion_engine.pattern_used(pattern_obj)
+            
+            return result
             
         except Exception as e:
             pattern_id = str(pattern.id) if isinstance(pattern, Pattern) else pattern
@@ -550,40 +618,58 @@ class PatternSystem(BasePatternService):
             self._log_error(e, "get_completions", partial_input=partial_input)
             return []
     
-    def analyze_workspace(self, workspace_path: Path) -> Dict:
+    def analyze_workspace(self, workspace_path: Path, file_budget: Optional[int] = None,
+                          time_budget: Optional[float] = None) -> Dict:
         """
         Analyze workspace structure and files.
         
         Args:
             workspace_path: Path to workspace to analyze
+            file_budget: Stop after stat-ing this many files and extrapolate
+            time_budget: Stop walking after this many seconds and extrapolate
             
         Returns:
-            Dictionary with workspace analysis results
+            Dictionary with workspace analysis results (cached per workspace)
         """
         try:
             self._ensure_initialized()
-            return self._workspace_analyzer.analyze(workspace_path)
+            return self._workspace_analyzer.analyze(workspace_path, file_budget=file_budget,
+                                                    time_budget=time_budget)
             
         except Exception as e:
             self._log_error(e, "analyze_workspace", workspace_path=str(workspace_path))
             return {}
-    
+
+    def create_preview_runner(self) -> "PatternPreviewRunner":
+        """
+        Create a runner for test runs of pattern drafts against a folder.
+
+        The runner shares this system's parser and matcher, so test runs
+        are evaluated exactly like rules and repeated runs hit the match cache.
+        """
+        self._ensure_initialized()
+        from .matching.preview import PatternPreviewRunner
+        return PatternPreviewRunner(parser=self._parser, matcher=self._matcher)
+
     # System Management API
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get pattern system status and statistics."""
         try:
+            # Components are built lazily, so only built ones are present
+            components = {
+                name: self._built(interface) is not None
+                for name, interface in self._COMPONENT_INTERFACES.items()
+            }
             status = {
                 'initialized': self._initialized,
                 'storage_path': str(self._storage_path),
                 'components': {
-                    'parser': self._parser is not None,
-                    'matcher': self._matcher is not None,
-                    'repository': self._repository is not None,
-                    'cache_manager': self._cache_manager is not None,
-                    'suggestion_engine': self._suggestion_engine is not None,
-                    'validator': self._validator is not None
-                }
+                    name: components[name]
+                    for name in ('parser', 'matcher', 'repository', 'cache_manager',
+                                 'suggestion_engine', 'validator')
+                },
+                'loaded_components': [name for name, present in components.items() if present]
             }
             
             if self._initialized:
@@ -591,8 +677,9 @@ class PatternSystem(BasePatternService):
                 status['repository_stats'] = self._repository.get_statistics()
                 
                 # Add cache statistics
-                if self._cache_manager:
-                    status['cache_stats'] = self._cache_manager.get_stats()
+                cache_manager = self._built(ICacheManager)
+                if cache_manager:
+                    status['cache_stats'] = cache_manager.get_stats()
             
             return status
             
@@ -603,8 +690,9 @@ class PatternSystem(BasePatternService):
     def clear_cache(self) -> None:
         """Clear all caches."""
         try:
-            if self._cache_manager:
-                self._cache_manager.clear()
+            cache_manager = self._built(ICacheManager)
+            if cache_manager:
+                cache_manager.clear()
             self._logger.info("Pattern system cache cleared")
             
         except Exception as e:
@@ -639,85 +727,197 @@ class PatternSystem(BasePatternService):
         if not self._initialized:
             raise PatternSystemError("Pattern system not initialized. Call initialize() first.")
     
-    def _initialize_cache_manager(self) -> None:
-        """Initialize the cache manager."""
+    def _register_components(self) -> None:
+        """Register component factories; nothing is built until resolved."""
+        container = ServiceContainer()
+        for name, interface in self._COMPONENT_INTERFACES.items():
+            container.register(interface, factory=getattr(self, f"_create_{name}"),
+                               lifetime=ServiceLifetime.SINGLETON)
+        # The conflict manager has no protocol; it is keyed by its class
+        container.register(_implementation('ConflictManager'), factory=self._create_conflict_manager,
+                           lifetime=ServiceLifetime.SINGLETON)
+        self._components = container
+    
+    def _component(self, interface: type) -> Any:
+        """Resolve a component, building it on first use."""
+        if self._components is None:
+            return None
+        return self._components.resolve(interface)
+    
+    def _built(self, interface: type) -> Any:
+        """Return a component only if it has already been built."""
+        if self._components is None or not self._components.has_instance(interface):
+            return None
+        return self._components.resolve(interface)
+    
+    @property
+    def _cache_manager(self) -> Optional[Union["MultiLevelCacheManager", "ShardedCacheManager",
+                                               "WTinyLfuCacheManager"]]:
+        return self._component(ICacheManager)
+    
+    @property
+    def _conflict_manager(self) -> Optional["ConflictManager"]:
+        if self._components is None:
+            return None
+        return self._components.resolve(_implementation('ConflictManager'))
+    
+    @property
+    def _token_resolver(self) -> Optional["TokenResolver"]:
+        return self._component(ITokenResolver)
+    
+    @property
+    def _parser(self) -> Optional["IntelligentPatternParser"]:
+        return self._component(IPatternParser)
+    
+    @property
+    def _repository(self) -> Optional["PatternRepository"]:
+        return self._component(IPatternRepository)
+    
+    @property
+    def _matcher(self) -> Optional["UnifiedPatternMatcher"]:
+        return self._component(IPatternMatcher)
+    
+    @property
+    def _workspace_analyzer(self) -> Optional["WorkspaceAnalyzer"]:
+        return self._component(IWorkspaceAnalyzer)
+    
+    @property
+    def _suggestion_engine(self) -> Optional["PatternSuggestionEngine"]:
+        return self._component(ISuggestionEngine)
+    
+    @property
+    def _validator(self) -> Optional["PatternValidator"]:
+        return self._component(IPatternValidator)
+    
+    def _create_cache_manager(self):
+        """Create the cache manager."""
         try:
             cache_config = self._cache_settings.copy()
+            cache_type = cache_config.pop('cache_type', 'multilevel')
             cache_config.setdefault('max_memory_entries', 1000)
             cache_config.setdefault('default_ttl_seconds', 300)
             
-            self._cache_manager = MultiLevelCacheManager(**cache_config)
+            if cache_type == 'sharded':
+                # Low-contention cache for multi-threaded matching
+                return _implementation('ShardedCacheManager')(**cache_config)
+            elif cache_type == 'tinylfu':
+                # Frequency and cost aware admission for mixed workloads
+                return _implementation('WTinyLfuCacheManager')(**cache_config)
+            return _implementation('MultiLevelCacheManager')(**cache_config)
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize cache manager: {e}")
     
-    def _initialize_conflict_manager(self) -> None:
-        """Initialize the conflict resolution manager."""
+    def _create_conflict_manager(self):
+        """Create the conflict resolution manager."""
         try:
             conflict_storage_path = self._storage_path / "conflicts"
-            self._conflict_manager = ConflictManager(conflict_storage_path)
+            return _implementation('ConflictManager')(conflict_storage_path)
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize conflict manager: {e}")
     
-    def _initialize_token_resolver(self) -> None:
-        """Initialize the token resolver."""
+    def _create_token_resolver(self):
+        """Create the token resolver."""
         try:
-            self._token_resolver = TokenResolver()
+            return _implementation('TokenResolver')()
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize token resolver: {e}")
     
-    def _initialize_parser(self) -> None:
-        """Initialize the intelligent parser."""
+    def _create_parser(self):
+        """Create the intelligent parser."""
         try:
-            self._parser = IntelligentPatternParser(self._token_resolver)
+            return _implementation('IntelligentPatternParser')(self._token_resolver)
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize parser: {e}")
     
-    def _initialize_repository(self) -> None:
-        """Initialize the pattern repository."""
+    def _create_repository(self):
+        """Create the pattern repository."""
         try:
-            self._repository = PatternRepository(self._storage_path)
+            if self._storage_backend == 'sqlite':
+                # Indexed lookups and per-row writes for large pattern libraries
+                return _implementation('SQLitePatternRepository')(self._storage_path)
+            return _implementation('PatternRepository')(self._storage_path)
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize repository: {e}")
     
-    def _initialize_matcher(self) -> None:
-        """Initialize the unified matcher."""
+    def _create_matcher(self):
+        """Create the unified matcher."""
         try:
-            self._matcher = UnifiedPatternMatcher(
+            return _implementation('UnifiedPatternMatcher')(
                 cache_manager=self._cache_manager,
                 conflict_manager=self._conflict_manager
             )
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize matcher: {e}")
     
-    def _initialize_workspace_analyzer(self) -> None:
-        """Initialize the workspace analyzer."""
+    def _create_workspace_analyzer(self):
+        """Create the workspace analyzer."""
         try:
-            self._workspace_analyzer = WorkspaceAnalyzer()
+            return _implementation('WorkspaceAnalyzer')()
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize workspace analyzer: {e}")
     
-    def _initialize_suggestion_engine(self) -> None:
-        """Initialize the suggestion engine."""
+    def _create_suggestion_engine(self):
+        """Create the suggestion engine."""
         try:
-            self._suggestion_engine = PatternSuggestionEngine(
-                workspace_analyzer=self._workspace_analyzer
+            return _implementation('PatternSuggestionEngine')(
+                workspace_analyzer=self._workspace_analyzer,
+                token_resolver=self._token_resolver,
+                pattern_source=lambda: self._repository.list_patterns()
             )
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize suggestion engine: {e}")
     
-    def _initialize_validator(self) -> None:
-        """Initialize the pattern validator."""
+    def _create_validator(self):
+        """Create the pattern validator."""
         try:
-            self._validator = PatternValidator(self._parser)
+            return _implementation('PatternValidator')(self._parser)
         except Exception as e:
             raise PatternSystemError(f"Failed to initialize validator: {e}")
     
-    def _invalidate_pattern_cache(self, pattern: Pattern) -> None:
-        """Invalidate cache entries related to a pattern."""
-        if self._cache_manager:
-            # In a real implementation, this would invalidate specific cache entries
-            # For now, we'll clear the entire cache to be safe
-            self._cache_manager.clear()
+    def _index_pattern(self, pattern: Pattern) -> None:
+        """Refresh a saved pattern in the completion index if it was built."""
+        suggestion_engine = self._built(ISuggestionEngine)
+        if suggestion_engine:
+            suggestion_engine.pattern_saved(pattern)
+    
+    def _invalidate_pattern_cache(self, pattern_id: UUID) -> None:
+        """Invalidate cache entries computed from a pattern."""
+        matcher = self._built(IPatternMatcher)
+        if matcher:
+            matcher.invalidate_pattern(pattern_id)
+    
+    def invalidate_rule_cache(self, rule_id: Union[UUID, str]) -> int:
+        """
+        Invalidate cached match results computed on behalf of a rule.
+        
+        Args:
+            rule_id: ID of the edited or deleted rule
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        matcher = self._built(IPatternMatcher)
+        if not matcher:
+            return 0
+        return matcher.invalidate_rule(rule_id)
+    
+    def notify_directory_changed(self, directory: Path) -> int:
+        """
+        Invalidate cached match results affected by a filesystem change.
+        
+        Intended to be called by file watchers and by operations that move
+        files, so unrelated cached results stay warm.
+        
+        Args:
+            directory: Directory whose contents changed
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        matcher = self._built(IPatternMatcher)
+        if not matcher:
+            return 0
+        return matcher.invalidate_directory(directory)
     
     # Conflict Resolution API Methods
     
@@ -763,15 +963,17 @@ class PatternSystem(BasePatternService):
 
 
 def create_pattern_system(storage_path: Optional[Path] = None, 
-                         cache_settings: Optional[Dict[str, Any]] = None) -> PatternSystem:
+                         cache_settings: Optional[Dict[str, Any]] = None,
+                         storage_backend: str = "yaml") -> PatternSystem:
     """
     Create and return a new PatternSystem instance.
     
     Args:
         storage_path: Optional storage path for patterns
         cache_settings: Optional cache configuration
+        storage_backend: "yaml" (default) or "sqlite"
         
     Returns:
         PatternSystem instance ready for initialization
     """
-    return PatternSystem(storage_path, cache_settings)
+    return PatternSystem(storage_path, cache_settings, storage_backend)
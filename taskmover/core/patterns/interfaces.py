@@ -6,12 +6,14 @@ the unified pattern system components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Protocol, Dict, Union, TYPE_CHECKING
+from typing import Any, Iterable, List, Optional, Protocol, Dict, Union, TYPE_CHECKING
 from pathlib import Path
 from datetime import datetime
 from uuid import UUID
 
 from .exceptions import PatternSystemError
+from ..logging.interfaces import LogLevel
+from ..logging.metrics import format_event
 
 # Forward declarations to avoid circular imports
 if TYPE_CHECKING:
@@ -72,19 +74,32 @@ class ICacheManager(Protocol):
         """Retrieve value from cache."""
         ...
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Store value in cache with optional TTL."""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
+        """Store value in cache with optional TTL and dependency tags."""
         ...
     
     def invalidate(self, key: str) -> None:
         """Remove value from cache."""
         ...
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove all values carrying any of the tags; return the count removed."""
+        ...
+    
     def clear(self) -> None:
         """Clear all cache entries."""
         ...
 
 
+class ICacheSizeAware(Protocol):
+    """Protocol for values that report their own cache memory footprint."""
+
+    def estimate_cache_size(self) -> int:
+        """Return the estimated retained size of this value in bytes."""
+        ...
+
+
 class ISuggestionEngine(Protocol):
     """Protocol for pattern suggestion implementations."""
     
@@ -100,8 +115,9 @@ class ISuggestionEngine(Protocol):
 class IWorkspaceAnalyzer(Protocol):
     """Protocol for workspace analysis implementations."""
     
-    def analyze(self, workspace_path: Path) -> Dict[str, Any]:
-        """Analyze workspace and return file pattern insights."""
+    def analyze(self, workspace_path: Path, file_budget: Optional[int] = None,
+                time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """Analyze workspace and return file pattern insights, optionally within a budget."""
         ...
     
     def get_common_extensions(self, workspace_path: Path) -> List[str]:
@@ -182,18 +198,18 @@ class BasePatternComponent(ABC):
     
     def __init__(self, component_name: str):
         from taskmover.core.logging import get_logger
+        from taskmover.core.logging.metrics import get_metrics
         self._logger = get_logger(f"patterns.{component_name}")
+        self._metrics = get_metrics()
         self._component_name = component_name
         self._logger.debug(f"Initializing {component_name} component")
     
     def _log_operation(self, operation: str, **kwargs) -> None:
-        """Log an operation with context."""
-        if kwargs:
-            extra_info = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            message = f"{self._component_name} operation: {operation} - {extra_info}"
-        else:
-            message = f"{self._component_name} operation: {operation}"
-        self._logger.info(message)
+        """Count an operation; details are logged at DEBUG only when enabled."""
+        self._metrics.counter(f"{self._component_name}.{operation}").inc()
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(format_event(f"{self._component_name} operation: {operation}",
+                                            None, kwargs))
     
     def _log_error(self, error: Exception, operation: str, **kwargs) -> None:
         """Log an error with context."""
@@ -204,9 +220,10 @@ class BasePatternComponent(ABC):
         self._logger.error(message)
     
     def _log_performance(self, operation: str, duration_ms: float, **kwargs) -> None:
-        """Log performance metrics."""
-        message = f"{self._component_name} performance: {operation} took {duration_ms:.2f}ms"
-        if kwargs:
-            extra_info = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            message += f" - {extra_info}"
-        self._logger.info(message)
+        """Record an operation duration; a sample is logged at DEBUG."""
+        name = f"{self._component_name}.{operation}"
+        self._metrics.record(name, duration_ms)
+        if self._metrics.should_sample(name):
+            self._metrics.emit(self._logger, LogLevel.DEBUG,
+                               f"{self._component_name} performance: {operation}",
+                               duration_ms, kwargs)
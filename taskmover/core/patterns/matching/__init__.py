@@ -6,7 +6,17 @@ with intelligent optimization and caching.
 """
 
 from .unified_matcher import UnifiedPatternMatcher
+from .estimation import MatchEstimate, MatchEstimator, WorkspaceSample, compile_draft, wilson_interval
+from .preview import PatternPreview, PatternPreviewRunner, PreviewRow
 
 __all__ = [
-    "UnifiedPatternMatcher"
+    "UnifiedPatternMatcher",
+    "MatchEstimator",
+    "MatchEstimate",
+    "WorkspaceSample",
+    "compile_draft",
+    "wilson_interval",
+    "PatternPreviewRunner",
+    "PatternPreview",
+    "PreviewRow"
 ]
@@ -0,0 +1,410 @@
+"""
+Live Match Estimation
+
+Estimates how many files in a workspace a pattern draft matches by
+running it against a reservoir sample of the workspace instead of the
+whole tree. The sample is collected on a background thread and
+published progressively, so estimates are available within milliseconds
+of selecting a workspace even when the walk takes minutes.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from ..interfaces import BasePatternComponent, IPatternMatcher, IPatternParser
+from ..models import Pattern
+
+
+# z-score for the 95% confidence interval
+_Z_95 = 1.96
+
+
+@dataclass
+class MatchEstimate:
+    """Extrapolated match count for a pattern draft."""
+    pattern: str
+    estimated: int
+    lower: int
+    upper: int
+    sample_matches: int
+    sample_size: int
+    population: int
+    complete: bool
+    elapsed_ms: float
+    error: Optional[str] = None
+
+    @property
+    def exact(self) -> bool:
+        """True if every file of a fully walked workspace was checked."""
+        return self.complete and self.sample_size == self.population
+
+
+def wilson_interval(matches: int, sample_size: int, population: int,
+                    z: float = _Z_95) -> Tuple[float, float]:
+    """
+    Wilson score interval for a sampled proportion.
+
+    Applies the finite population correction, so the interval collapses
+    to the observed proportion when the sample is the whole population.
+    """
+    if sample_size <= 0:
+        return 0.0, 1.0
+
+    p = matches / sample_size
+    fpc = 1.0
+    if population > 1 and population >= sample_size:
+        fpc = (population - sample_size) / (population - 1)
+    if fpc <= 0:
+        return p, p
+
+    # Finite population correction expressed as a larger effective sample
+    n = sample_size / fpc
+    z2 = z * z
+    denominator = 1 + z2 / n
+    centre = (p + z2 / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def compile_draft(parser: IPatternParser, expression: str) -> Pattern:
+    """
+    Compile an unsaved pattern expression for matching.
+
+    Raises:
+        ValueError: If the expression does not validate
+    """
+    parsed = parser.parse(expression)
+    if parsed.validation_result is not None and not parsed.validation_result.is_valid:
+        raise ValueError("; ".join(parsed.validation_result.errors) or "Invalid pattern")
+    return Pattern(name="draft", user_expression=expression,
+                   compiled_query=parsed.compiled_query,
+                   pattern_complexity=parsed.complexity,
+                   pattern_type=parsed.pattern_type,
+                   referenced_groups=set(parsed.referenced_groups))
+
+
+class WorkspaceSample:
+    """
+    Reservoir sample of the files under a workspace root.
+
+    ``start()`` walks the tree on a daemon thread using reservoir
+    sampling (Algorithm L, which draws random numbers only for the files
+    it keeps), publishing the reservoir once it first fills and then
+    every ``publish_interval`` seconds. A finished sample older than ``max_age`` seconds is
+    re-walked in the background on the next ``snapshot()`` while the old
+    one keeps being served.
+    """
+
+    def __init__(self, root: Path, capacity: int = 2000, include_hidden: bool = False,
+                 recursive: bool = True, max_age: float = 300.0,
+                 publish_interval: float = 0.1,
+                 on_update: Optional[Callable[[], None]] = None,
+                 seed: Optional[int] = None):
+        self.root = Path(root)
+        self.capacity = capacity
+        self.include_hidden = include_hidden
+        self.recursive = recursive
+        self.max_age = max_age
+        self.publish_interval = publish_interval
+        self._on_update = on_update
+        self._random = random.Random(seed)
+
+        self._lock = threading.Lock()
+        self._published: Tuple[List[Path], int, bool] = ([], 0, False)
+        self._published_at = 0.0
+        self._first_publish = threading.Event()
+        self._completed = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start (or restart) the background walk."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.refresh, name="workspace-sample", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Abandon a running walk."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """True while the background walk is in progress."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None, complete: bool = False) -> bool:
+        """Wait until a first sample (or, with ``complete``, a full walk) is published."""
+        return (self._completed if complete else self._first_publish).wait(timeout)
+
+    def snapshot(self) -> Tuple[List[Path], int, bool]:
+        """
+        Current sample.
+
+        Returns:
+            (sampled paths, files seen so far, whether the walk finished)
+        """
+        with self._lock:
+            published = self._published
+            stale = published[2] and time.monotonic() - self._published_at > self.max_age
+        if stale:
+            self.start()
+        return published
+
+    def refresh(self) -> None:
+        """Walk the workspace and replace the published sample."""
+        capacity = self.capacity
+        rand = self._random
+        reservoir: List[Path] = []
+        seen = 0
+
+        # Algorithm L state: index of the next file that enters the reservoir
+        weight = math.exp(math.log(rand.random()) / capacity)
+        next_index = capacity + int(math.log(rand.random()) / math.log(1 - weight))
+        last_publish = time.monotonic()
+
+        for path in self._walk():
+            if seen < capacity:
+                reservoir.append(path)
+            elif seen == next_index:
+                reservoir[rand.randrange(capacity)] = path
+                weight *= math.exp(math.log(rand.random()) / capacity)
+                next_index += int(math.log(rand.random()) / math.log(1 - weight)) + 1
+            seen += 1
+
+            # Publish as soon as the reservoir first fills, then periodically
+            if seen == capacity or (seen & 0xFF == 0 and
+                                    time.monotonic() - last_publish >= self.publish_interval):
+                self._publish(list(reservoir), seen, False)
+                last_publish = time.monotonic()
+
+        if not self._stop.is_set():
+            self._publish(reservoir, seen, True)
+
+    def _publish(self, paths: List[Path], seen: int, complete: bool) -> None:
+        with self._lock:
+            self._published = (paths, seen, complete)
+            self._published_at = time.monotonic()
+        self._first_publish.set()
+        if complete:
+            self._completed.set()
+        if self._on_update is not None:
+            self._on_update()
+
+    def _walk(self):
+        stack = [str(self.root)]
+        while stack and not self._stop.is_set():
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not self.include_hidden and entry.name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.recursive:
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                yield Path(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+
+class MatchEstimator(BasePatternComponent):
+    """
+    Debounced background match estimation for pattern drafts.
+
+    ``submit()`` may be called on every keystroke: requests are debounced
+    on a worker thread, a newer request cancels an older one (also while
+    it is being evaluated), and only the latest estimate is delivered.
+    Callbacks run on the worker thread.
+    """
+
+    def __init__(self, parser: Optional[IPatternParser] = None,
+                 matcher: Optional[IPatternMatcher] = None,
+                 sample_capacity: int = 2000, debounce_delay: float = 0.03,
+                 chunk_size: int = 256):
+        super().__init__("match_estimator")
+
+        if parser is None:
+            from ..parsing import IntelligentPatternParser
+            parser = IntelligentPatternParser()
+        if matcher is None:
+            from .unified_matcher import UnifiedPatternMatcher
+            matcher = UnifiedPatternMatcher()
+
+        self._parser = parser
+        self._matcher = matcher
+        self.sample_capacity = sample_capacity
+        self.debounce_delay = debounce_delay
+        self.chunk_size = chunk_size
+
+        self._sample: Optional[WorkspaceSample] = None
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._pending: Optional[Tuple[int, str, Callable[[MatchEstimate], None], float]] = None
+        self._last_request: Optional[Tuple[str, Callable[[MatchEstimate], None]]] = None
+        self._worker: Optional[threading.Thread] = None
+        self._busy = False
+        self._closed = False
+
+    def set_workspace(self, root: Optional[Path], include_hidden: bool = False,
+                      recursive: bool = True) -> None:
+        """Sample a new workspace (or none); the previous sample is dropped."""
+        if self._sample is not None:
+            self._sample.stop()
+            self._sample = None
+        if root is None:
+            return
+
+        self._sample = WorkspaceSample(root, capacity=self.sample_capacity,
+                                       include_hidden=include_hidden, recursive=recursive,
+                                       on_update=self._on_sample_update)
+        self._sample.start()
+
+    @property
+    def sample(self) -> Optional[WorkspaceSample]:
+        return self._sample
+
+    def submit(self, pattern: str, callback: Callable[[MatchEstimate], None]) -> int:
+        """
+        Request an estimate; supersedes any earlier request.
+
+        Returns:
+            Request generation, usable with ``is_current``
+        """
+        with self._condition:
+            self._generation += 1
+            due = time.monotonic() + self.debounce_delay
+            self._pending = (self._generation, pattern, callback, due)
+            self._last_request = (pattern, callback)
+            self._ensure_worker()
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Drop pending and running requests."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._last_request = None
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    @property
+    def idle(self) -> bool:
+        """
+        True when no estimate is pending or running and the sample walk
+        has finished, so no further estimates will be delivered until the
+        next ``submit``.
+        """
+        with self._condition:
+            if self._pending is not None or self._busy:
+                return False
+        return self._sample is None or not self._sample.running
+
+    def estimate(self, pattern: str, generation: Optional[int] = None) -> Optional[MatchEstimate]:
+        """
+        Estimate matches synchronously against the current sample.
+
+        Returns:
+            The estimate, or None if a newer request superseded ``generation``
+        """
+        start = time.perf_counter()
+        paths, population, complete = self._sample.snapshot() if self._sample else ([], 0, False)
+
+        try:
+            draft = self._compile(pattern)
+        except Exception as e:
+            return MatchEstimate(pattern, 0, 0, 0, 0, len(paths), population, complete,
+                                 (time.perf_counter() - start) * 1000, error=str(e))
+
+        matches = 0
+        for offset in range(0, len(paths), self.chunk_size):
+            if generation is not None and not self.is_current(generation):
+                return None
+            chunk = paths[offset:offset + self.chunk_size]
+            matches += len(self._matcher.match(draft, chunk).matched_files)
+
+        sample_size = len(paths)
+        if sample_size and sample_size == population:
+            estimated = lower = upper = matches
+        else:
+            low, high = wilson_interval(matches, sample_size, population)
+            scale = population / sample_size if sample_size else 0
+            estimated = round(matches * scale)
+            lower = max(matches, math.floor(low * population))
+            upper = math.ceil(high * population)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._log_performance("estimate", elapsed_ms, sample_size=sample_size)
+        return MatchEstimate(pattern, estimated, lower, upper, matches, sample_size,
+                             population, complete, elapsed_ms)
+
+    def close(self) -> None:
+        """Stop the worker and the sampler."""
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify()
+        if self._sample is not None:
+            self._sample.stop()
+
+    def _compile(self, expression: str) -> Pattern:
+        return compile_draft(self._parser, expression)
+
+    def _on_sample_update(self) -> None:
+        # Refine the latest draft as the sample grows
+        request = self._last_request
+        if request is not None:
+            self.submit(*request)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="match-estimator", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending is not None:
+                        wait = self._pending[3] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                generation, pattern, callback, _ = self._pending
+                self._pending = None
+                self._busy = True
+
+            try:
+                result = self.estimate(pattern, generation)
+                if result is not None and self.is_current(generation):
+                    try:
+                        callback(result)
+                    except Exception as e:
+                        self._log_error(e, "estimate_callback", pattern=pattern)
+            except Exception as e:
+                self._log_error(e, "estimate", pattern=pattern)
+            finally:
+                with self._condition:
+                    self._busy = False
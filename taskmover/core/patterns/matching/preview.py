@@ -0,0 +1,259 @@
+"""
+Pattern Test Runs
+
+Runs a pattern draft against a real folder and reports the first files
+it matches and the first it does not, each with the reason it failed.
+Files are evaluated in chunks through the pattern matcher, so results
+come from the same evaluator (and match cache) that rules use, and the
+run stops as soon as both lists are full instead of walking the whole
+folder. Progress is streamed after every chunk and a run can be
+cancelled at any time.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from ..interfaces import BasePatternComponent, IPatternMatcher, IPatternParser
+from .estimation import compile_draft
+
+
+@dataclass(frozen=True)
+class PreviewRow:
+    """One file of a test run."""
+    path: Path
+    matched: bool
+    size: int
+    modified: Optional[datetime]
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class PatternPreview:
+    """State of a test run, published after every evaluated chunk."""
+    pattern: str
+    matches: Tuple[PreviewRow, ...]
+    non_matches: Tuple[PreviewRow, ...]
+    files_checked: int
+    match_count: int
+    elapsed_ms: float
+    cache_hits: int = 0
+    chunks: int = 0
+    complete: bool = False
+    done: bool = False
+    error: Optional[str] = None
+    # Run generation from ``PatternPreviewRunner.submit``
+    generation: Optional[int] = None
+
+    @property
+    def cache_status(self) -> str:
+        """"cached", "fresh" or "partly cached" for the evaluated chunks."""
+        if self.chunks and self.cache_hits == self.chunks:
+            return "cached"
+        if self.cache_hits:
+            return "partly cached"
+        return "fresh"
+
+
+class PatternPreviewRunner(BasePatternComponent):
+    """
+    Cancellable test runs of pattern drafts.
+
+    ``run()`` evaluates synchronously; ``submit()`` runs on a daemon
+    thread and supersedes the previous run. Updates are delivered on the
+    thread doing the run.
+    """
+
+    def __init__(self, parser: Optional[IPatternParser] = None,
+                 matcher: Optional[IPatternMatcher] = None,
+                 chunk_size: int = 256):
+        super().__init__("pattern_preview")
+
+        if parser is None:
+            from ..parsing import IntelligentPatternParser
+            parser = IntelligentPatternParser()
+        if matcher is None:
+            from .unified_matcher import UnifiedPatternMatcher
+            matcher = UnifiedPatternMatcher()
+
+        self._parser = parser
+        self._matcher = matcher
+        self.chunk_size = chunk_size
+
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def run(self, pattern: str, root: Path, limit: int = 20,
+            include_hidden: bool = False, recursive: bool = True,
+            on_update: Optional[Callable[[PatternPreview], None]] = None,
+            generation: Optional[int] = None) -> Optional[PatternPreview]:
+        """
+        Test a pattern draft against the files under root.
+
+        Args:
+            pattern: Pattern expression
+            root: Folder to test against
+            limit: Matches and non-matches to collect before stopping
+            include_hidden: Include hidden files and folders
+            recursive: Descend into subfolders
+            on_update: Called with the progress after every chunk
+            generation: Run generation from ``submit``; the run stops
+                once it is superseded
+
+        Returns:
+            The final preview, or None if the run was cancelled
+        """
+        start = time.perf_counter()
+
+        def preview(**state) -> PatternPreview:
+            return PatternPreview(pattern=pattern, matches=tuple(matches),
+                                  non_matches=tuple(non_matches), files_checked=checked,
+                                  match_count=match_count,
+                                  elapsed_ms=(time.perf_counter() - start) * 1000,
+                                  cache_hits=cache_hits, chunks=chunks,
+                                  generation=generation, **state)
+
+        matches: List[PreviewRow] = []
+        non_matches: List[PreviewRow] = []
+        checked = match_count = cache_hits = chunks = 0
+
+        try:
+            draft = compile_draft(self._parser, pattern)
+        except Exception as e:
+            return self._finish(preview(done=True, error=str(e)), on_update)
+
+        try:
+            walk = self._walk(Path(root), include_hidden, recursive)
+            chunk: List[Path] = []
+            complete = False
+            while True:
+                path = next(walk, None)
+                if path is not None:
+                    chunk.append(path)
+                    if len(chunk) < self.chunk_size:
+                        continue
+                elif not chunk:
+                    complete = True
+                    break
+
+                if generation is not None and not self.is_current(generation):
+                    return None
+
+                result = self._matcher.match(draft, chunk)
+                matched = set(result.matched_files)
+                chunks += 1
+                cache_hits += bool(result.cache_hit)
+                checked += len(chunk)
+                match_count += len(matched)
+
+                for file_path in chunk:
+                    if file_path in matched:
+                        if len(matches) < limit:
+                            matches.append(self._row(file_path, True))
+                    elif len(non_matches) < limit:
+                        reason = self._matcher.explain_mismatch(draft, file_path) or "no match"
+                        non_matches.append(self._row(file_path, False, reason))
+                chunk = []
+
+                if path is None:
+                    complete = True
+                    break
+                if len(matches) >= limit and len(non_matches) >= limit:
+                    break
+                if on_update is not None:
+                    on_update(preview())
+        except Exception as e:
+            self._log_error(e, "run", pattern=pattern)
+            return self._finish(preview(done=True, error=str(e)), on_update)
+
+        if generation is not None and not self.is_current(generation):
+            return None
+
+        final = preview(complete=complete, done=True)
+        self._log_performance("run", final.elapsed_ms, files_checked=checked,
+                              cache_hits=cache_hits, chunks=chunks)
+        return self._finish(final, on_update)
+
+    def submit(self, pattern: str, root: Path,
+               on_update: Callable[[PatternPreview], None], **options) -> int:
+        """
+        Start a test run on a worker thread; supersedes any running one.
+
+        Args:
+            pattern: Pattern expression
+            root: Folder to test against
+            on_update: Called from the worker with progress and the final
+                preview (``done`` set); never called after a newer run started
+            **options: ``limit``, ``include_hidden`` and ``recursive`` of ``run``
+
+        Returns:
+            Run generation, usable with ``is_current``
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        def deliver(preview: PatternPreview) -> None:
+            if self.is_current(generation):
+                on_update(preview)
+
+        worker = threading.Thread(target=self.run, args=(pattern, root),
+                                  kwargs=dict(options, on_update=deliver, generation=generation),
+                                  name="pattern-preview", daemon=True)
+        worker.start()
+        return generation
+
+    def cancel(self) -> None:
+        """Stop the running test run."""
+        with self._lock:
+            self._generation += 1
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def close(self) -> None:
+        self.cancel()
+
+    def _finish(self, preview: PatternPreview,
+                on_update: Optional[Callable[[PatternPreview], None]]) -> PatternPreview:
+        if on_update is not None:
+            on_update(preview)
+        return preview
+
+    @staticmethod
+    def _row(file_path: Path, matched: bool, reason: str = "") -> PreviewRow:
+        try:
+            stat = file_path.stat()
+            size, modified = stat.st_size, datetime.fromtimestamp(stat.st_mtime)
+        except OSError:
+            size, modified = 0, None
+        return PreviewRow(file_path, matched, size, modified, reason)
+
+    @staticmethod
+    def _walk(root: Path, include_hidden: bool, recursive: bool) -> Iterator[Path]:
+        # Sorted, so repeated runs evaluate the same chunks and hit the cache
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirectories))
@@ -9,15 +9,24 @@ import fnmatch
 import re
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set
+from typing import Iterable, List, Optional, Dict, Any, Set, Union
+from uuid import UUID
 from datetime import datetime
 
 from ..interfaces import BasePatternComponent, IPatternMatcher, ICacheManager, IQueryExecutor
-from ..models import Pattern, MatchResult, FileMetadata, PatternType, SYSTEM_GROUPS
+from ..models import Pattern, MatchResult, CompactMatchResult, FileMetadata, PatternType, SYSTEM_GROUPS
 from ..exceptions import PatternMatchError, QueryExecutionError
+from ..storage.cache_tags import (
+    ancestor_directory_tags, directory_tag, pattern_tag, root_directory, rule_tag
+)
 from ...conflict_resolution import ConflictManager, ConflictType, ConflictScope, ConflictContext
 from ...conflict_resolution.models import ConflictItem
 from ...conflict_resolution.enums import ConflictSource
+from ...logging.utils import format_bytes
+
+
+# Globs that only select an extension, e.g. '*.pdf'
+_EXTENSION_GLOB = re.compile(r'^\*\.[^*?\[\]]+$')
 
 
 class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
@@ -47,13 +56,15 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
         
         self._logger.info("UnifiedPatternMatcher initialized")
     
-    def match(self, pattern: Pattern, file_paths: List[Path]) -> MatchResult:
+    def match(self, pattern: Pattern, file_paths: List[Path],
+              cache_tags: Optional[Iterable[str]] = None) -> MatchResult:
         """
         Execute pattern matching against a list of file paths.
         
         Args:
             pattern: The pattern to match against
             file_paths: List of file paths to check
+            cache_tags: Extra dependency tags (e.g. the owning rule) for the cached result
             
         Returns:
             MatchResult with matched files and performance metrics
@@ -71,11 +82,10 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
             
             # Check cache first
             cache_key = self._generate_cache_key(pattern, file_paths)
-            cached_result = self._get_cached_result(cache_key)
+            cached_result = self._get_cached_result(cache_key, file_paths)
             
             if cached_result:
-                self._logger.debug("Cache hit for pattern matching")
-                cached_result.cache_hit = True
+                self._metrics.counter(f"{self._component_name}.match.cache_hit").inc()
                 return cached_result
             
             # Perform matching based on pattern type
@@ -112,7 +122,7 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
             )
             
             # Cache the result
-            self._cache_result(cache_key, result)
+            self._cache_result(cache_key, result, file_paths, pattern, cache_tags)
             
             # Update pattern usage statistics
             pattern.update_usage_stats(execution_time_ms, cache_hit=False)
@@ -150,6 +160,101 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
                           file_path=str(file_path))
             return False
     
+    def explain_mismatch(self, pattern: Pattern, file_path: Path) -> Optional[str]:
+        """
+        Explain why a file does not match a pattern.
+        
+        Evaluates the same conditions as ``match`` and describes the
+        first one the file fails.
+        
+        Args:
+            pattern: The pattern to check
+            file_path: File that was not matched
+            
+        Returns:
+            Short reason such as "too small (500.0 KB)" or "wrong type (.jpg)",
+            or None if the file matches
+        """
+        pattern_type = pattern.pattern_type
+        
+        if pattern_type == PatternType.GROUP_REFERENCE:
+            group_name = next((f"@{group}" for group in pattern.referenced_groups), None)
+            group = SYSTEM_GROUPS.get(group_name)
+            if group is None:
+                return f"unknown group {group_name}" if group_name else "no group referenced"
+            if any(fnmatch.fnmatch(file_path.name, glob) for glob in group.system_patterns):
+                return None
+            return self._wrong_type(file_path)
+        
+        if pattern_type == PatternType.ADVANCED_QUERY:
+            metadata = self._get_file_metadata(file_path)
+            for condition in self._parse_basic_conditions(pattern.compiled_query.lower()):
+                if not self._evaluate_condition(condition, metadata):
+                    return self._describe_failed_condition(condition, metadata)
+            return None
+        
+        if pattern_type == PatternType.SHORTHAND:
+            return self._explain_shorthand(pattern.user_expression.lower(), file_path)
+        
+        if pattern_type == PatternType.ENHANCED_GLOB:
+            glob_pattern = self._enhanced_glob(pattern)
+            if glob_pattern is None:
+                return "pattern has no name condition"
+        else:
+            glob_pattern = pattern.user_expression
+        return self._explain_glob(glob_pattern, file_path)
+    
+    def _explain_glob(self, glob_pattern: str, file_path: Path) -> Optional[str]:
+        """Describe a failed name glob."""
+        if fnmatch.fnmatch(file_path.name, glob_pattern):
+            return None
+        if _EXTENSION_GLOB.match(glob_pattern):
+            return self._wrong_type(file_path)
+        return f"name doesn't match '{glob_pattern}'"
+    
+    @staticmethod
+    def _wrong_type(file_path: Path) -> str:
+        return f"wrong type ({file_path.suffix.lower() or 'no extension'})"
+    
+    def _describe_failed_condition(self, condition: Dict[str, Any], metadata: FileMetadata) -> str:
+        """Describe an advanced query condition the file failed."""
+        condition_type = condition['type']
+        
+        if condition_type == 'size':
+            size = format_bytes(metadata.size)
+            if condition['operator'] in ('>', '>='):
+                return f"too small ({size})"
+            if condition['operator'] in ('<', '<='):
+                return f"too large ({size})"
+            return f"size is {size}, not {format_bytes(condition['value'])}"
+        
+        if condition_type == 'extension':
+            return self._wrong_type(metadata.path)
+        
+        if condition_type == 'name_like':
+            glob_pattern = condition['pattern'].replace('%', '*').replace('_', '?')
+            return self._explain_glob(glob_pattern, metadata.path) or f"name doesn't match '{glob_pattern}'"
+        
+        return f"fails {condition_type} condition"
+    
+    def _explain_shorthand(self, shorthand: str, file_path: Path) -> Optional[str]:
+        """Describe a failed shorthand such as 'recent' or 'large'."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return "file not found"
+        
+        if shorthand == 'recent':
+            age_days = (datetime.now().timestamp() - stat.st_mtime) / 86400
+            return None if age_days <= 7 else f"too old ({age_days:.0f} days)"
+        if shorthand == 'large':
+            return None if stat.st_size > 100 * 1024 * 1024 else f"too small ({format_bytes(stat.st_size)})"
+        if shorthand == 'empty':
+            return None if stat.st_size == 0 else f"not empty ({format_bytes(stat.st_size)})"
+        if shorthand == 'hidden':
+            return None if file_path.name.startswith('.') else "not hidden"
+        return f"'{shorthand}' is not supported"
+    
     def _match_simple_glob(self, pattern: Pattern, file_paths: List[Path]) -> List[Path]:
         """Match simple glob patterns using fnmatch."""
         matched = []
@@ -167,19 +272,23 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
         # by the parser, so treat it like a simple glob
         matched = []
         
-        # Extract the pattern from the compiled query
-        # Format: "name LIKE 'pattern'"
-        if "LIKE '" in pattern.compiled_query:
-            query_pattern = pattern.compiled_query.split("LIKE '")[1].rstrip("'")
-            # Convert SQL LIKE pattern back to glob
-            glob_pattern = query_pattern.replace('%', '*').replace('_', '?')
-            
+        glob_pattern = self._enhanced_glob(pattern)
+        if glob_pattern is not None:
             for file_path in file_paths:
                 if fnmatch.fnmatch(file_path.name, glob_pattern):
                     matched.append(file_path)
         
         return matched
     
+    @staticmethod
+    def _enhanced_glob(pattern: Pattern) -> Optional[str]:
+        """Glob of an enhanced pattern's compiled "name LIKE 'pattern'" query."""
+        if "LIKE '" not in pattern.compiled_query:
+            return None
+        query_pattern = pattern.compiled_query.split("LIKE '")[1].rstrip("'")
+        # Convert SQL LIKE pattern back to glob
+        return query_pattern.replace('%', '*').replace('_', '?')
+    
     def _match_group_reference(self, pattern: Pattern, file_paths: List[Path]) -> List[Path]:
         """Match files against system group patterns."""
         matched = []
@@ -244,7 +353,7 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
                     matched.append(file_path)
                     
             except Exception as e:
-                self._logger.debug(f"Error evaluating {file_path}: {e}")
+                self._logger.debug(lambda: f"Error evaluating {file_path}: {e}")
                 continue
         
         return matched
@@ -289,7 +398,7 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
                     pass
                     
             except Exception as e:
-                self._logger.debug(f"Error checking {file_path} for shorthand {shorthand}: {e}")
+                self._logger.debug(lambda: f"Error checking {file_path} for shorthand {shorthand}: {e}")
                 continue
         
         return matched
@@ -311,7 +420,7 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
                 is_readonly=not os.access(file_path, os.W_OK) if hasattr(file_path, 'exists') and file_path.exists() else False
             )
         except Exception as e:
-            self._logger.debug(f"Error getting metadata for {file_path}: {e}")
+            self._logger.debug(lambda: f"Error getting metadata for {file_path}: {e}")
             # Return minimal metadata on error
             return FileMetadata(
                 path=file_path,
@@ -394,36 +503,57 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
     
     def _generate_cache_key(self, pattern: Pattern, file_paths: List[Path]) -> str:
         """Generate a cache key for the pattern and file list."""
-        # Create a hash of the pattern and file paths
+        # Create a hash of the pattern and file paths. The file order is part
+        # of the key because cached results reference files by position.
         import hashlib
         
         pattern_data = f"{pattern.compiled_query}:{pattern.pattern_type.value}"
-        files_data = ":".join(str(p) for p in sorted(file_paths))
+        files_data = ":".join(str(p) for p in file_paths)
         
         combined = f"{pattern_data}|{files_data}"
         return hashlib.md5(combined.encode(), usedforsecurity=False).hexdigest()
     
-    def _get_cached_result(self, cache_key: str) -> Optional[MatchResult]:
+    def _get_cached_result(self, cache_key: str, file_paths: List[Path]) -> Optional[MatchResult]:
         """Get cached result if available and valid."""
         if not self._cache_manager:
             return None
         
         try:
-            return self._cache_manager.get(cache_key)
+            cached = self._cache_manager.get(cache_key)
+            if isinstance(cached, CompactMatchResult):
+                return cached.expand(file_paths)
+            if cached is not None:
+                cached.cache_hit = True
+            return cached
         except Exception as e:
             self._logger.debug(f"Cache retrieval failed: {e}")
             return None
     
-    def _cache_result(self, cache_key: str, result: MatchResult) -> None:
-        """Cache the matching result."""
+    def _cache_result(self, cache_key: str, result: MatchResult, file_paths: List[Path],
+                      pattern: Pattern, cache_tags: Optional[Iterable[str]] = None) -> None:
+        """Cache the matching result as matched indices into the input list."""
         if not self._cache_manager:
             return
         
         try:
-            self._cache_manager.set(cache_key, result, self._cache_ttl_seconds)
+            compact = result.to_compact(file_paths)
+            if self._supports_tags():
+                tags = [pattern_tag(pattern.id)]
+                root = root_directory(file_paths)
+                if root is not None:
+                    tags.append(directory_tag(root))
+                if cache_tags:
+                    tags.extend(cache_tags)
+                self._cache_manager.set(cache_key, compact, self._cache_ttl_seconds, tags=tags)
+            else:
+                self._cache_manager.set(cache_key, compact, self._cache_ttl_seconds)
         except Exception as e:
             self._logger.debug(f"Cache storage failed: {e}")
     
+    def _supports_tags(self) -> bool:
+        """Check whether the cache manager implements tag invalidation."""
+        return callable(getattr(self._cache_manager, 'invalidate_tags', None))
+    
     def handle_pattern_conflicts(self, patterns: List[Pattern], file_paths: List[Path]) -> Dict[str, Any]:
         """
         Detect and handle conflicts between multiple patterns.
@@ -559,6 +689,65 @@ class UnifiedPatternMatcher(BasePatternComponent, IPatternMatcher):
         except Exception:
             return []
 
+    def invalidate_pattern(self, pattern_id: Union[UUID, str]) -> int:
+        """
+        Invalidate cached results computed from a pattern.
+        
+        Args:
+            pattern_id: ID of the edited or deleted pattern
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        return self._invalidate_tags([pattern_tag(pattern_id)])
+    
+    def invalidate_rule(self, rule_id: Union[UUID, str]) -> int:
+        """
+        Invalidate cached results computed on behalf of a rule.
+        
+        Args:
+            rule_id: ID of the edited or deleted rule
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        return self._invalidate_tags([rule_tag(rule_id)])
+    
+    def invalidate_directory(self, directory: Path) -> int:
+        """
+        Invalidate cached results affected by a change in a directory.
+        
+        Results rooted at the directory or any ancestor cover the change, and
+        results rooted below it are affected if it was moved or removed.
+        
+        Args:
+            directory: Directory whose contents changed
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        if not self._cache_manager:
+            return 0
+        
+        removed = self._invalidate_tags(ancestor_directory_tags(directory))
+        prefix_invalidate = getattr(self._cache_manager, 'invalidate_tag_prefix', None)
+        if callable(prefix_invalidate):
+            removed += prefix_invalidate(directory_tag(directory))
+        return removed
+    
+    def _invalidate_tags(self, tags: List[str]) -> int:
+        """Drop tagged entries, clearing everything if tags are unsupported."""
+        if not self._cache_manager:
+            return 0
+        
+        try:
+            if self._supports_tags():
+                return self._cache_manager.invalidate_tags(tags)
+            self._cache_manager.clear()
+        except Exception as e:
+            self._log_error(e, "cache_invalidation", tags=tags)
+        return 0
+    
     def invalidate_cache(self) -> None:
         """Invalidate all cached results."""
         if self._cache_manager:
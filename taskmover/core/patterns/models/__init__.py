@@ -5,6 +5,8 @@ Unified data models for the pattern system including Pattern, PatternGroup,
 and related supporting classes.
 """
 
+import sys
+from array import array
 from dataclasses import dataclass, field, fields, MISSING
 from datetime import datetime
 from enum import Enum
@@ -108,13 +110,119 @@ class MatchResult:
         """Get the first matched file path for test compatibility."""
         return self.matched_files[0] if self.matched_files else None
     
-    @file_path.setter  
+    @file_path.setter
     def file_path(self, value: Path):
         """Set the file path (for single file results)."""
         if isinstance(value, str):
             value = Path(value)
         self.matched_files = [value]
 
+    def estimate_cache_size(self) -> int:
+        """Estimate retained memory including every matched path."""
+        from ..storage.sizing import estimate_deep_size
+        return estimate_deep_size(self)
+
+    def to_compact(self, file_paths: List[Path]) -> "CompactMatchResult":
+        """
+        Build a compact cache representation of this result.
+
+        Matched files are stored as indices into ``file_paths``, the list
+        the result was computed from, instead of Path objects.
+
+        Args:
+            file_paths: Input file list the match was executed against
+
+        Returns:
+            CompactMatchResult referencing matches by position
+        """
+        indices = array('I')
+        matched = self.matched_files
+        match_count = len(matched)
+        position = 0
+
+        # Matches are an ordered subsequence of the input, so a single
+        # forward scan maps them to indices without building a lookup table
+        for index, candidate in enumerate(file_paths):
+            if position >= match_count:
+                break
+            current = matched[position]
+            if candidate is current or candidate == current:
+                indices.append(index)
+                position += 1
+
+        if position < match_count:
+            raise ValueError("Matched files are not an ordered subset of the input file list")
+
+        return CompactMatchResult(
+            matched_indices=indices,
+            total_files_checked=self.total_files_checked,
+            pattern_id=self.pattern_id,
+            confidence=self.confidence,
+            execution_time_ms=self.execution_time_ms,
+            performance_metrics=dict(self.performance_metrics),
+            errors=list(self.errors)
+        )
+
+
+class CompactMatchResult:
+    """
+    Memory-compact form of MatchResult used for caching.
+
+    Stores matched files as 4-byte indices into the input file list so a
+    cached result costs a few bytes per match instead of a Path object.
+    """
+
+    __slots__ = ('matched_indices', 'total_files_checked', 'pattern_id', 'confidence',
+                 'execution_time_ms', 'performance_metrics', 'errors')
+
+    def __init__(self,
+                 matched_indices: "array[int]",
+                 total_files_checked: int,
+                 pattern_id: Optional[UUID] = None,
+                 confidence: float = 1.0,
+                 execution_time_ms: float = 0.0,
+                 performance_metrics: Optional[Dict[str, Any]] = None,
+                 errors: Optional[List[str]] = None):
+        self.matched_indices = matched_indices
+        self.total_files_checked = total_files_checked
+        self.pattern_id = pattern_id
+        self.confidence = confidence
+        self.execution_time_ms = execution_time_ms
+        self.performance_metrics = performance_metrics or {}
+        self.errors = errors or []
+
+    def expand(self, file_paths: List[Path]) -> Optional[MatchResult]:
+        """
+        Rebuild a full MatchResult against the input file list.
+
+        Args:
+            file_paths: The same file list the result was compacted from
+
+        Returns:
+            MatchResult, or None if the file list does not fit the stored indices
+        """
+        if len(file_paths) != self.total_files_checked:
+            return None
+
+        return MatchResult(
+            matched_files=[file_paths[i] for i in self.matched_indices],
+            pattern_id=self.pattern_id,
+            confidence=self.confidence,
+            execution_time_ms=self.execution_time_ms,
+            total_files_checked=self.total_files_checked,
+            cache_hit=True,
+            performance_metrics=dict(self.performance_metrics),
+            errors=list(self.errors)
+        )
+
+    def estimate_cache_size(self) -> int:
+        """Return the retained size; the index buffer dominates and is exact."""
+        size = sys.getsizeof(self) + sys.getsizeof(self.matched_indices)
+        size += sys.getsizeof(self.performance_metrics) + sys.getsizeof(self.errors)
+        size += sum(sys.getsizeof(v) for v in self.performance_metrics.values())
+        size += sum(sys.getsizeof(e) for e in self.errors)
+        return size
+
 
 @dataclass
 class PatternUsageStats:
@@ -95,14 +95,15 @@ class IntelligentPatternParser(BasePatternComponent, IPatternParser):
         try:
             self._log_operation("parse", input_pattern=user_input)
             
-            # Input validation        if not user_input or not user_input.strip():
-            raise PatternSyntaxError("Empty pattern input", user_input)
+            # Input validation
+            if not user_input or not user_input.strip():
+                raise PatternSyntaxError("Empty pattern input", user_input)
             
             cleaned_input = user_input.strip()
             
             # Detect pattern type
             pattern_type = self._detect_pattern_type(cleaned_input)
-            self._logger.debug(f"Detected pattern type: {pattern_type}")
+            self._logger.debug(lambda: f"Detected pattern type: {pattern_type}")
             
             # Parse based on type
             if pattern_type == PatternType.GROUP_REFERENCE:
@@ -183,7 +184,7 @@ class IntelligentPatternParser(BasePatternComponent, IPatternParser):
                 performance_score=performance_score
             )
             
-            self._logger.debug(f"Validation result: valid={is_valid}, errors={len(errors)}, warnings={len(warnings)}")
+            self._logger.debug(lambda: f"Validation result: valid={is_valid}, errors={len(errors)}, warnings={len(warnings)}")
             
             return result
             
@@ -8,7 +8,7 @@ in pattern expressions.
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Pattern as RegexPattern
+from typing import Callable, Dict, List, Optional, Pattern as RegexPattern
 import re
 import getpass
 from pathlib import Path
@@ -64,6 +64,9 @@ class TokenResolver(BasePatternComponent, ITokenResolver):
         # Counter for sequential numbering
         self._counter = 0
         
+        # Notified with (name, description) on add and (name, None) on removal
+        self._listeners: List[Callable[[str, Optional[str]], None]] = []
+        
         self._logger.info(f"TokenResolver initialized with {len(self._token_providers)} built-in tokens")
     
     def resolve_tokens(self, pattern: str) -> str:
@@ -107,7 +110,7 @@ class TokenResolver(BasePatternComponent, ITokenResolver):
                     # Replace in pattern
                     resolved_pattern = resolved_pattern.replace(full_token, resolved_value)
                     
-                    self._logger.debug(f"Resolved token {full_token} -> {resolved_value}")
+                    self._logger.debug(lambda: f"Resolved token {full_token} -> {resolved_value}")
                     
                 except Exception as e:
                     self._log_error(e, "token_resolution", token=token_name)
@@ -168,6 +171,7 @@ class TokenResolver(BasePatternComponent, ITokenResolver):
         """Add a custom token definition."""
         self._custom_tokens[name.upper()] = value
         self._logger.info(f"Added custom token: ${name}")
+        self._notify(name.upper(), f'Custom token: {name.upper()}')
     
     def remove_custom_token(self, name: str) -> bool:
         """Remove a custom token definition."""
@@ -175,9 +179,21 @@ class TokenResolver(BasePatternComponent, ITokenResolver):
         if token_name in self._custom_tokens:
             del self._custom_tokens[token_name]
             self._logger.info(f"Removed custom token: ${name}")
+            self._notify(token_name, None)
             return True
         return False
     
+    def add_listener(self, listener: Callable[[str, Optional[str]], None]) -> None:
+        """Register a callback for custom token changes."""
+        self._listeners.append(listener)
+    
+    def _notify(self, token_name: str, description: Optional[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(token_name, description)
+            except Exception as e:
+                self._log_error(e, "token_listener", token=token_name)
+    
     def _resolve_single_token(self, token_name: str, token_args: str) -> str:
         """Resolve a single token to its value."""
         token_name = token_name.upper()
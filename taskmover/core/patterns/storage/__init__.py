@@ -5,13 +5,46 @@ Repository and caching system for persistent pattern storage
 with YAML/JSON serialization and performance optimization.
 """
 
-from .repository import PatternRepository, YamlSerializationProvider, JsonSerializationProvider
-from .cache_manager import MultiLevelCacheManager, SimpleCacheManager
+import importlib
+from typing import Any
+
+from .sizing import CacheSizer, estimate_deep_size
+from .cache_tags import pattern_tag, rule_tag, directory_tag
+
+# Repositories and caches pull in yaml and sqlite3; import them on first access
+_LAZY_IMPORTS = {
+    "PatternRepository": ".repository",
+    "YamlSerializationProvider": ".repository",
+    "JsonSerializationProvider": ".repository",
+    "SQLitePatternRepository": ".sqlite_repository",
+    "MultiLevelCacheManager": ".cache_manager",
+    "SimpleCacheManager": ".cache_manager",
+    "ShardedCacheManager": ".sharded_cache",
+    "WTinyLfuCacheManager": ".tinylfu_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PatternRepository",
+    "SQLitePatternRepository",
     "YamlSerializationProvider", 
     "JsonSerializationProvider",
     "MultiLevelCacheManager",
-    "SimpleCacheManager"
+    "SimpleCacheManager",
+    "ShardedCacheManager",
+    "WTinyLfuCacheManager",
+    "CacheSizer",
+    "estimate_deep_size",
+    "pattern_tag",
+    "rule_tag",
+    "directory_tag"
 ]
@@ -7,13 +7,15 @@ accessed data with TTL support and memory management.
 
 import time
 import threading
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, Optional, Set
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from ..interfaces import BasePatternComponent, ICacheManager
 from ..exceptions import CacheError
+from .sizing import CacheSizer
+from ...storage.cache import TagIndex
 
 
 @dataclass
@@ -36,14 +38,19 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
     - TTL (time-to-live) support
     - Cache statistics and monitoring
     - Thread-safe operations
-    - Memory usage tracking
+    - Memory usage tracking with deep, sampled value sizing
+    
+    Values are sized through a CacheSizer so that ``max_memory_mb`` bounds
+    the memory actually retained by cached values, not just their top-level
+    objects. Values larger than the whole memory budget are not cached.
     """
     
     def __init__(self, 
                  max_memory_entries: int = 1000,
                  default_ttl_seconds: int = 300,
                  cleanup_interval_seconds: int = 60,
-                 max_memory_mb: float = 50.0):
+                 max_memory_mb: float = 50.0,
+                 sizer: Optional[CacheSizer] = None):
         super().__init__("cache_manager")
         
         # Configuration
@@ -51,10 +58,14 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
         self._default_ttl_seconds = default_ttl_seconds
         self._cleanup_interval_seconds = cleanup_interval_seconds
         self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._sizer = sizer or CacheSizer()
         
         # Memory cache with ordered dict for LRU
         self._memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
         
+        # Reverse index for tag-based invalidation
+        self._tag_index = TagIndex()
+        
         # Thread safety
         self._lock = threading.RLock()
         
@@ -64,6 +75,7 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
             'misses': 0,
             'evictions': 0,
             'expired': 0,
+            'rejected': 0,
             'memory_usage_bytes': 0,
             'total_entries': 0
         }
@@ -116,7 +128,8 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
                 self._log_error(e, "cache_get", key=key)
                 return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
         """
         Store value in cache with optional TTL.
         
@@ -124,7 +137,11 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
+            tags: Dependency tags used by invalidate_tags()
         """
+        # Size outside the lock; deep sizing is the most expensive step
+        size_bytes = self._estimate_size(value)
+        
         with self._lock:
             try:
                 current_time = time.time()
@@ -135,8 +152,15 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
                 
                 expires_at = current_time + ttl if ttl > 0 else None
                 
-                # Estimate size
-                size_bytes = self._estimate_size(value)
+                # Remove existing entry first so it is not counted twice
+                if key in self._memory_cache:
+                    self._remove_entry(key)
+                
+                # A value larger than the whole budget would flush everything
+                # and still break the limit, so it is not cached at all
+                if size_bytes > self._max_memory_bytes:
+                    self._stats['rejected'] += 1
+                    return
                 
                 # Check if we need to make room
                 self._ensure_capacity(size_bytes)
@@ -149,18 +173,12 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
                     size_bytes=size_bytes
                 )
                 
-                # Remove existing entry if present
-                if key in self._memory_cache:
-                    old_entry = self._memory_cache[key]
-                    self._stats['memory_usage_bytes'] -= old_entry.size_bytes
-                
                 # Add new entry
                 self._memory_cache[key] = entry
+                self._tag_index.add(key, tags)
                 self._stats['memory_usage_bytes'] += size_bytes
                 self._stats['total_entries'] = len(self._memory_cache)
                 
-                self._logger.debug(f"Cached key '{key}' with {size_bytes} bytes, TTL: {ttl}s")
-                
             except Exception as e:
                 self._log_error(e, "cache_set", key=key)
     
@@ -175,22 +193,55 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
             try:
                 if key in self._memory_cache:
                     self._remove_entry(key)
-                    self._logger.debug(f"Invalidated cache key: {key}")
                 
             except Exception as e:
                 self._log_error(e, "cache_invalidate", key=key)
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the given tags.
+        
+        Args:
+            tags: Dependency tags to invalidate
+            
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = self._tag_index.keys_for(tags)
+            for key in keys:
+                self._remove_entry(key)
+        return len(keys)
+    
+    def invalidate_tag_prefix(self, prefix: str) -> int:
+        """
+        Remove every entry carrying a tag that starts with a prefix.
+        
+        Args:
+            prefix: Tag prefix, e.g. a directory tag covering its subtree
+            
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = self._tag_index.keys_for(self._tag_index.tags_with_prefix(prefix))
+            for key in keys:
+                self._remove_entry(key)
+        return len(keys)
+    
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             try:
                 self._memory_cache.clear()
+                self._tag_index.clear()
                 self._stats['memory_usage_bytes'] = 0
                 self._stats['total_entries'] = 0
-                self._logger.info("Cache cleared")
                 
             except Exception as e:
                 self._log_error(e, "cache_clear")
+        
+        self._logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -253,14 +304,14 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
                     self._remove_entry(key)
                     self._stats['expired'] += 1
                 
-                if expired_keys:
-                    self._logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-                
-                return len(expired_keys)
-                
             except Exception as e:
                 self._log_error(e, "cleanup_expired")
                 return 0
+        
+        if expired_keys:
+            self._logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        
+        return len(expired_keys)
     
     def shutdown(self) -> None:
         """Shutdown the cache manager and cleanup resources."""
@@ -294,26 +345,14 @@ class MultiLevelCacheManager(BasePatternComponent, ICacheManager):
         """Remove entry and update statistics."""
         if key in self._memory_cache:
             entry = self._memory_cache.pop(key)
+            self._tag_index.discard(key)
             self._stats['memory_usage_bytes'] -= entry.size_bytes
             self._stats['total_entries'] = len(self._memory_cache)
     
     def _estimate_size(self, value: Any) -> int:
-        """Estimate memory size of a value."""
+        """Estimate memory retained by a value, including referenced objects."""
         try:
-            import sys
-            
-            # Basic size estimation
-            if isinstance(value, str):
-                return sys.getsizeof(value)
-            elif isinstance(value, (list, tuple)):
-                return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
-            elif isinstance(value, dict):
-                return sys.getsizeof(value) + sum(
-                    sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
-                )
-            else:
-                return sys.getsizeof(value)
-                
+            return self._sizer.size_of(value)
         except Exception:
             # Fallback estimation
             return 1024  # 1KB default
@@ -347,6 +386,7 @@ class SimpleCacheManager(BasePatternComponent, ICacheManager):
         
         self._default_ttl_seconds = default_ttl_seconds
         self._cache: Dict[str, CacheEntry] = {}
+        self._tag_index = TagIndex()
         self._lock = threading.RLock()
         
         self._logger.info("SimpleCacheManager initialized")
@@ -363,11 +403,13 @@ class SimpleCacheManager(BasePatternComponent, ICacheManager):
             current_time = time.time()
             if entry.expires_at and current_time > entry.expires_at:
                 del self._cache[key]
+                self._tag_index.discard(key)
                 return None
             
             return entry.value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
         """Store value in cache."""
         with self._lock:
             current_time = time.time()
@@ -382,13 +424,30 @@ class SimpleCacheManager(BasePatternComponent, ICacheManager):
                 created_at=current_time,
                 expires_at=expires_at
             )
+            self._tag_index.add(key, tags)
     
     def invalidate(self, key: str) -> None:
         """Remove value from cache."""
         with self._lock:
             self._cache.pop(key, None)
+            self._tag_index.discard(key)
+    
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry carrying any of the given tags."""
+        with self._lock:
+            keys = self._tag_index.keys_for(tags)
+            for key in keys:
+                self._cache.pop(key, None)
+                self._tag_index.discard(key)
+        return len(keys)
+    
+    def invalidate_tag_prefix(self, prefix: str) -> int:
+        """Remove every entry carrying a tag that starts with a prefix."""
+        with self._lock:
+            return self.invalidate_tags(self._tag_index.tags_with_prefix(prefix))
     
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._tag_index.clear()
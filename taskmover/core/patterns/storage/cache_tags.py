@@ -0,0 +1,65 @@
+"""
+Pattern Cache Tags
+
+Naming helpers for the tags attached to cached pattern results so that
+pattern edits, rule edits and directory changes can invalidate only the
+entries that depend on them.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+from uuid import UUID
+
+
+PATTERN_TAG_PREFIX = "pattern:"
+RULE_TAG_PREFIX = "rule:"
+DIRECTORY_TAG_PREFIX = "dir:"
+
+
+def pattern_tag(pattern_id: Union[UUID, str]) -> str:
+    """Tag for results computed from a pattern."""
+    return f"{PATTERN_TAG_PREFIX}{pattern_id}"
+
+
+def rule_tag(rule_id: Union[UUID, str]) -> str:
+    """Tag for results computed on behalf of a rule."""
+    return f"{RULE_TAG_PREFIX}{rule_id}"
+
+
+def directory_tag(directory: Union[Path, str]) -> str:
+    """
+    Tag for results computed over files below a root directory.
+
+    The normalised path always ends with a separator so that prefix
+    lookups for ``/data/a`` never match ``/data/ab``.
+    """
+    normalized = os.path.normcase(os.path.abspath(str(directory)))
+    if not normalized.endswith(os.sep):
+        normalized += os.sep
+    return f"{DIRECTORY_TAG_PREFIX}{normalized}"
+
+
+def ancestor_directory_tags(directory: Union[Path, str]) -> List[str]:
+    """Tags of a directory and every directory above it."""
+    path = Path(os.path.abspath(str(directory)))
+    return [directory_tag(path)] + [directory_tag(parent) for parent in path.parents]
+
+
+def root_directory(file_paths: List[Path]) -> Optional[Path]:
+    """
+    Find the deepest directory containing every file in a list.
+
+    Path ordering compares components, so the common prefix of the lowest
+    and highest path is the common prefix of the whole list.
+    """
+    if not file_paths:
+        return None
+
+    try:
+        lowest = min(file_paths)
+        highest = max(file_paths)
+        return Path(os.path.commonpath([str(lowest.parent), str(highest.parent)]))
+    except (ValueError, TypeError):
+        # Mixed drives or relative/absolute mixes have no common root
+        return None
@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Any
 from uuid import UUID
 from datetime import datetime
 
+from ...storage.snapshot import StartupSnapshot, dump_yaml, load_yaml
 from ..interfaces import BasePatternComponent, IPatternRepository, ISerializationProvider
 from ..models import Pattern, PatternGroup, PatternStatus, SYSTEM_GROUPS
 from ..exceptions import PatternStorageError, PatternNotFoundError
@@ -22,12 +23,15 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
     Repository for pattern storage and retrieval.
     
     Supports YAML and JSON formats with automatic backup and migration.
+    Parsed files are cached in a binary startup snapshot that is used
+    instead of the source files while they are unchanged.
     """
     
     def __init__(self, 
         storage_path: Path,
         serialization_provider: Optional[ISerializationProvider] = None,
-        format: str = "yaml"):
+        format: str = "yaml",
+        use_snapshot: bool = True):
         super().__init__("pattern_repository")
         
         self._storage_path = Path(storage_path)
@@ -38,6 +42,10 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
         self._patterns_file = self._storage_path / f"patterns.{self._format}"
         self._groups_file = self._storage_path / f"groups.{self._format}"
         self._backup_dir = self._storage_path / "backups"
+        self._snapshot = StartupSnapshot(
+            self._storage_path / "patterns.snapshot",
+            [self._patterns_file, self._groups_file]
+        ) if use_snapshot else None
         
         # In-memory caches for performance
         self._patterns_cache: Dict[UUID, Pattern] = {}
@@ -94,10 +102,10 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
         try:
             pattern = self._patterns_cache.get(pattern_id)
             if pattern:
-                self._log_operation("get_pattern", pattern_id=str(pattern_id), found=True)
+                self._metrics.counter(f"{self._component_name}.get_pattern.hit").inc()
                 return pattern
             else:
-                self._log_operation("get_pattern", pattern_id=str(pattern_id), found=False)
+                self._metrics.counter(f"{self._component_name}.get_pattern.miss").inc()
                 return None
                 
         except Exception as e:
@@ -325,7 +333,7 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
             # Write backup
             with open(backup_file, 'w', encoding='utf-8') as f:
                 if self._format == 'yaml':
-                    yaml.dump(backup_data, f, default_flow_style=False, allow_unicode=True)
+                    dump_yaml(backup_data, f, default_flow_style=False, allow_unicode=True)
                 else:
                     json.dump(backup_data, f, indent=2, ensure_ascii=False, default=str)
             
@@ -347,7 +355,7 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
             # Load backup data
             with open(backup_file, 'r', encoding='utf-8') as f:
                 if backup_file.suffix.lower() == '.yaml':
-                    backup_data = yaml.safe_load(f)
+                    backup_data = load_yaml(f)
                 else:
                     backup_data = json.load(f)
             
@@ -404,43 +412,29 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
                 json.dump(empty_data, f, indent=2)
     
     def _load_data(self) -> None:
-        """Load patterns and groups from storage."""
+        """Load patterns and groups from the startup snapshot or storage files."""
         try:
-            # Load patterns
-            if self._patterns_file.exists():
-                with open(self._patterns_file, 'r', encoding='utf-8') as f:
-                    if self._format == 'yaml':
-                        data = yaml.safe_load(f) or []
-                    else:
-                        data = json.load(f) or []
-                    
-                    # Handle both list and dict formats
-                    if isinstance(data, dict):
-                        patterns_data = data.get('patterns', [])
-                    else:
-                        patterns_data = data
-                    
-                    for pattern_data in patterns_data:
-                        pattern = self._dict_to_pattern(pattern_data)
-                        self._patterns_cache[pattern.id] = pattern
-            
-            # Load groups
-            if self._groups_file.exists():
-                with open(self._groups_file, 'r', encoding='utf-8') as f:
-                    if self._format == 'yaml':
-                        data = yaml.safe_load(f) or []
-                    else:
-                        data = json.load(f) or []
-                    
-                    # Handle both list and dict formats
-                    if isinstance(data, dict):
-                        groups_data = data.get('groups', [])
-                    else:
-                        groups_data = data
-                    
-                    for group_data in groups_data:
-                        group = self._dict_to_group(group_data)
-                        self._groups_cache[group.id] = group
+            data = self._snapshot.load() if self._snapshot else None
+            
+            if data is None:
+                # Fingerprint before reading so a concurrent edit invalidates the snapshot
+                fingerprints = self._snapshot.fingerprint() if self._snapshot else None
+                data = {
+                    'patterns': self._read_records(self._patterns_file, 'patterns'),
+                    'groups': self._read_records(self._groups_file, 'groups')
+                }
+                if fingerprints is not None:
+                    self._snapshot.save(data, fingerprints)
+            else:
+                self._logger.debug(f"Loaded patterns from snapshot {self._snapshot.snapshot_file.name}")
+            
+            for pattern_data in data['patterns']:
+                pattern = self._dict_to_pattern(pattern_data)
+                self._patterns_cache[pattern.id] = pattern
+            
+            for group_data in data['groups']:
+                group = self._dict_to_group(group_data)
+                self._groups_cache[group.id] = group
             
             self._logger.debug(f"Loaded {len(self._patterns_cache)} patterns and {len(self._groups_cache)} groups")
             
@@ -450,6 +444,35 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
             self._patterns_cache.clear()
             self._groups_cache.clear()
     
+    def _read_records(self, file_path: Path, key: str) -> List[Dict[str, Any]]:
+        """Read a list of records from a storage file."""
+        if not file_path.exists():
+            return []
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if self._format == 'yaml':
+                data = load_yaml(f) or []
+            else:
+                data = json.load(f) or []
+        
+        # Handle both list and dict formats
+        if isinstance(data, dict):
+            return data.get(key, [])
+        return data
+    
+    def _refresh_snapshot(self, patterns_data: Optional[List[Dict[str, Any]]] = None,
+                          groups_data: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Rewrite the startup snapshot after the storage files changed."""
+        if self._snapshot is None:
+            return
+        if patterns_data is None:
+            patterns_data = [self._pattern_to_dict(p) for p in self._patterns_cache.values()]
+        if groups_data is None:
+            groups_data = [self._group_to_dict(g) for g in self._groups_cache.values()]
+        if not self._snapshot.save({'patterns': patterns_data, 'groups': groups_data}):
+            # A stale snapshot must never outlive the files it mirrors
+            self._snapshot.invalidate()
+    
     def _persist_patterns(self) -> None:
         """Persist patterns to storage."""
         try:
@@ -457,11 +480,12 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
             
             with open(self._patterns_file, 'w', encoding='utf-8') as f:
                 if self._format == 'yaml':
-                    yaml.dump(patterns_data, f, default_flow_style=False, allow_unicode=True)
+                    dump_yaml(patterns_data, f, default_flow_style=False, allow_unicode=True)
                 else:
                     json.dump(patterns_data, f, indent=2, ensure_ascii=False, default=str)
             
             self._cache_dirty = False
+            self._refresh_snapshot(patterns_data=patterns_data)
             
         except Exception as e:
             raise PatternStorageError(f"Failed to persist patterns: {e}", "persist_patterns")
@@ -473,10 +497,12 @@ class PatternRepository(BasePatternComponent, IPatternRepository):
             
             with open(self._groups_file, 'w', encoding='utf-8') as f:
                 if self._format == 'yaml':
-                    yaml.dump(groups_data, f, default_flow_style=False, allow_unicode=True)
+                    dump_yaml(groups_data, f, default_flow_style=False, allow_unicode=True)
                 else:
                     json.dump(groups_data, f, indent=2, ensure_ascii=False, default=str)
             
+            self._refresh_snapshot(groups_data=groups_data)
+            
         except Exception as e:
             raise PatternStorageError(f"Failed to persist groups: {e}", "persist_groups")
     
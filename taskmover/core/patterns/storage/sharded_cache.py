@@ -0,0 +1,415 @@
+"""
+Sharded Cache Manager
+
+Low-contention cache for concurrent pattern matching. Keys are spread
+over independently locked LRU segments so worker threads only contend
+when they touch the same shard.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..interfaces import BasePatternComponent, ICacheManager
+from .cache_manager import CacheEntry
+from .sizing import CacheSizer
+from ...storage.cache import TagIndex
+
+
+class _SharedBudget:
+    """Entry and memory limits shared by all shards, with its own lock."""
+
+    __slots__ = ('lock', 'max_entries', 'max_bytes', 'entries', 'bytes')
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = 0
+        self.bytes = 0
+
+    @property
+    def over(self) -> bool:
+        return self.entries > self.max_entries or self.bytes > self.max_bytes
+
+    def reserve(self, size_bytes: int, force: bool = False) -> bool:
+        """Take room for one entry if it fits (or unconditionally with ``force``)."""
+        with self.lock:
+            if not force and (self.entries + 1 > self.max_entries or
+                              self.bytes + size_bytes > self.max_bytes):
+                return False
+            self.entries += 1
+            self.bytes += size_bytes
+            return True
+
+    def release(self, count: int, size_bytes: int) -> None:
+        with self.lock:
+            self.entries -= count
+            self.bytes -= size_bytes
+
+
+class _CacheShard:
+    """Single LRU segment with its own lock and statistics counters."""
+
+    __slots__ = ('lock', 'entries', 'tag_index', 'budget', 'share_entries', 'share_bytes',
+                 'memory_bytes', 'hits', 'misses', 'evictions', 'expired', 'rejected')
+
+    def __init__(self, budget: _SharedBudget, share_entries: int, share_bytes: int):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.tag_index = TagIndex()
+        self.budget = budget
+        self.share_entries = share_entries
+        self.share_bytes = share_bytes
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        self.rejected = 0
+
+    def get(self, key: str, now: float) -> Tuple[bool, Any]:
+        """Return (found, value) for a key; caller must hold the lock."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        if entry.expires_at and now > entry.expires_at:
+            self._remove(key)
+            self.expired += 1
+            self.misses += 1
+            return False, None
+
+        entry.hit_count += 1
+        entry.last_accessed = now
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, entry.value
+
+    def set(self, key: str, entry: CacheEntry, tags: Optional[Iterable[str]] = None) -> bool:
+        """
+        Insert an entry, evicting LRU entries; caller must hold the lock.
+
+        The shard may grow past its share while the shared budget has
+        room. Once the budget is used up it evicts its own entries, and
+        an entry that keeps the shard within its share is admitted even
+        if other shards have borrowed the room; their ``trim()`` then
+        reclaims it from them.
+        """
+        if key in self.entries:
+            self._remove(key)
+
+        if entry.size_bytes > self.budget.max_bytes:
+            self.rejected += 1
+            return False
+
+        while not self.budget.reserve(entry.size_bytes):
+            if (len(self.entries) + 1 <= self.share_entries and
+                    self.memory_bytes + entry.size_bytes <= self.share_bytes):
+                self.budget.reserve(entry.size_bytes, force=True)
+                break
+            if not self.entries:
+                self.rejected += 1
+                return False
+            self._evict()
+
+        self.entries[key] = entry
+        self.tag_index.add(key, tags)
+        self.memory_bytes += entry.size_bytes
+        return True
+
+    def remove(self, key: str) -> bool:
+        """Remove a key if present; caller must hold the lock."""
+        if key in self.entries:
+            self._remove(key)
+            return True
+        return False
+
+    def remove_tagged(self, tags: Iterable[str]) -> int:
+        """Remove entries carrying any of the tags; caller must hold the lock."""
+        keys = self.tag_index.keys_for(tags)
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries; caller must hold the lock."""
+        self.budget.release(len(self.entries), self.memory_bytes)
+        self.entries.clear()
+        self.tag_index.clear()
+        self.memory_bytes = 0
+
+    def over_share(self) -> bool:
+        """Whether the shard holds more than its share; caller must hold the lock."""
+        return len(self.entries) > self.share_entries or self.memory_bytes > self.share_bytes
+
+    def trim(self) -> None:
+        """Evict while over both the shared budget and this shard's share; caller must hold the lock."""
+        while self.entries and self.budget.over and self.over_share():
+            self._evict()
+
+    def cleanup_expired(self, now: float) -> int:
+        """Remove expired entries; caller must hold the lock."""
+        expired_keys = [key for key, entry in self.entries.items()
+                        if entry.expires_at and now > entry.expires_at]
+        for key in expired_keys:
+            self._remove(key)
+        self.expired += len(expired_keys)
+        return len(expired_keys)
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key)
+        self.tag_index.discard(key)
+        self.memory_bytes -= entry.size_bytes
+        self.budget.release(1, entry.size_bytes)
+
+    def _evict(self) -> None:
+        evicted_key, evicted = self.entries.popitem(last=False)
+        self.tag_index.discard(evicted_key)
+        self.memory_bytes -= evicted.size_bytes
+        self.budget.release(1, evicted.size_bytes)
+        self.evictions += 1
+
+
+class ShardedCacheManager(BasePatternComponent, ICacheManager):
+    """
+    Sharded LRU cache manager with TTL support.
+
+    Drop-in ICacheManager replacement for MultiLevelCacheManager when the
+    cache is shared between worker threads.
+
+    Features:
+    - N independently locked LRU segments selected by key hash
+    - Entry and memory limits shared across segments; a busy segment may
+      use more than an even share while the total allows
+    - Per-shard statistics counters merged on read
+    - No logging or value sizing while a shard lock is held
+    """
+
+    def __init__(self,
+                 shard_count: int = 16,
+                 max_memory_entries: int = 1000,
+                 default_ttl_seconds: int = 300,
+                 cleanup_interval_seconds: int = 60,
+                 max_memory_mb: float = 50.0,
+                 sizer: Optional[CacheSizer] = None):
+        super().__init__("sharded_cache")
+
+        # Round up to a power of two so shard selection is a mask
+        shard_count = max(1, shard_count)
+        shard_count = 1 << (shard_count - 1).bit_length()
+
+        self._shard_count = shard_count
+        self._shard_mask = shard_count - 1
+        self._max_memory_entries = max_memory_entries
+        self._default_ttl_seconds = default_ttl_seconds
+        self._cleanup_interval_seconds = cleanup_interval_seconds
+        self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._sizer = sizer or CacheSizer()
+
+        self._budget = _SharedBudget(max_memory_entries, self._max_memory_bytes)
+        share_entries = max(1, max_memory_entries // shard_count)
+        share_bytes = self._max_memory_bytes // shard_count
+        self._shards: List[_CacheShard] = [
+            _CacheShard(self._budget, share_entries, share_bytes) for _ in range(shard_count)
+        ]
+
+        # Cleanup thread
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+        self._start_cleanup_thread()
+
+        self._logger.info(f"ShardedCacheManager initialized with {shard_count} shards, "
+                          f"{max_memory_entries} max entries")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        shard = self._shard_for(key)
+        now = time.time()
+        with shard.lock:
+            _, value = shard.get(key, now)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
+        """
+        Store value in cache with optional TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default if None)
+            tags: Dependency tags used by invalidate_tags()
+        """
+        try:
+            size_bytes = self._sizer.size_of(value)
+        except Exception:
+            size_bytes = 1024
+
+        if ttl is None:
+            ttl = self._default_ttl_seconds
+        now = time.time()
+        entry = CacheEntry(
+            value=value,
+            created_at=now,
+            expires_at=now + ttl if ttl > 0 else None,
+            last_accessed=now,
+            size_bytes=size_bytes
+        )
+
+        shard = self._shard_for(key)
+        with shard.lock:
+            stored = shard.set(key, entry, tags)
+
+        if not stored:
+            self._logger.debug(f"Cache entry {key} ({size_bytes} bytes) rejected: "
+                               f"the cache is full or the entry exceeds its memory limit")
+        elif self._budget.over:
+            self._reclaim()
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove value from cache.
+
+        Args:
+            key: Cache key to remove
+        """
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the given tags.
+
+        Args:
+            tags: Dependency tags to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        tags = list(tags)
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.remove_tagged(tags)
+        return removed
+
+    def invalidate_tag_prefix(self, prefix: str) -> int:
+        """
+        Remove every entry carrying a tag that starts with a prefix.
+
+        Args:
+            prefix: Tag prefix, e.g. a directory tag covering its subtree
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.remove_tagged(shard.tag_index.tags_with_prefix(prefix))
+        return removed
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+        self._logger.info("Cache cleared")
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries."""
+        now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.cleanup_expired(now)
+
+        if removed:
+            self._logger.debug(f"Cleaned up {removed} expired cache entries")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics merged across all shards."""
+        totals = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expired': 0,
+            'rejected': 0,
+            'memory_usage_bytes': 0,
+            'total_entries': 0
+        }
+        for shard in self._shards:
+            # Counter reads are individually atomic; a slightly stale merged
+            # view is acceptable for statistics and avoids taking every lock
+            totals['hits'] += shard.hits
+            totals['misses'] += shard.misses
+            totals['evictions'] += shard.evictions
+            totals['expired'] += shard.expired
+            totals['rejected'] += shard.rejected
+            totals['memory_usage_bytes'] += shard.memory_bytes
+            totals['total_entries'] += len(shard.entries)
+
+        total_requests = totals['hits'] + totals['misses']
+        hit_rate = (totals['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            **totals,
+            'shard_count': self._shard_count,
+            'hit_rate_percent': round(hit_rate, 2),
+            'total_requests': total_requests,
+            'memory_usage_mb': round(totals['memory_usage_bytes'] / (1024 * 1024), 2),
+            'memory_utilization_percent': round(
+                totals['memory_usage_bytes'] / self._max_memory_bytes * 100, 2
+            ) if self._max_memory_bytes > 0 else 0
+        }
+
+    def shutdown(self) -> None:
+        """Shutdown the cache manager and cleanup resources."""
+        try:
+            self._shutdown_event.set()
+
+            if self._cleanup_thread and self._cleanup_thread.is_alive():
+                self._cleanup_thread.join(timeout=5.0)
+
+            self.clear()
+            self._logger.info("Sharded cache manager shutdown complete")
+
+        except Exception as e:
+            self._log_error(e, "shutdown")
+
+    def _reclaim(self) -> None:
+        """Trim shards holding more than their share until the shared budget fits."""
+        for shard in self._shards:
+            if not self._budget.over:
+                break
+            with shard.lock:
+                shard.trim()
+
+    def _shard_for(self, key: str) -> _CacheShard:
+        """Select the shard owning a key."""
+        return self._shards[hash(key) & self._shard_mask]
+
+    def _start_cleanup_thread(self) -> None:
+        """Start the background cleanup thread."""
+        def cleanup_worker():
+            while not self._shutdown_event.wait(self._cleanup_interval_seconds):
+                try:
+                    self.cleanup_expired()
+                except Exception as e:
+                    self._log_error(e, "cleanup_worker")
+
+        self._cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+        self._cleanup_thread.start()
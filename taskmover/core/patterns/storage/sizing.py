@@ -0,0 +1,171 @@
+"""
+Cache Value Sizing
+
+Memory footprint estimation for cached values. Values may report their
+own size through the ``ICacheSizeAware`` protocol, callers may register
+per-type sizers, and everything else falls back to a sampled deep-size
+walk whose cost is bounded regardless of how large the value is.
+"""
+
+import sys
+from collections import deque
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Set
+
+
+# Types whose getsizeof() already covers everything they own
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), Enum, range)
+
+# Fallback for objects that refuse to report a size
+_DEFAULT_OBJECT_SIZE = 64
+
+
+def estimate_deep_size(value: Any, sample_size: int = 32, max_depth: int = 6) -> int:
+    """
+    Estimate the retained size of a value including the objects it references.
+
+    Containers larger than ``sample_size`` are sized from an evenly spaced
+    sample of their items and extrapolated, so the cost of an estimate is
+    bounded by ``sample_size ** max_depth`` objects in the worst case and is
+    usually far lower.
+
+    Args:
+        value: Object to size
+        sample_size: Maximum number of items inspected per container
+        max_depth: Maximum reference depth followed
+
+    Returns:
+        Estimated size in bytes
+    """
+    return _deep_size(value, 0, set(), max(1, sample_size), max_depth)
+
+
+def _deep_size(obj: Any, depth: int, seen: Set[int], sample_size: int, max_depth: int) -> int:
+    """Recursive worker for estimate_deep_size."""
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    seen.add(obj_id)
+
+    size = sys.getsizeof(obj, _DEFAULT_OBJECT_SIZE)
+    if depth >= max_depth or isinstance(obj, _ATOMIC_TYPES):
+        return size
+
+    depth += 1
+    if isinstance(obj, dict):
+        size += _sampled_size(obj.items(), len(obj), depth, seen, sample_size, max_depth,
+                              pairs=True)
+    elif isinstance(obj, (list, tuple, deque)):
+        size += _sampled_size(obj, len(obj), depth, seen, sample_size, max_depth)
+    elif isinstance(obj, (set, frozenset)):
+        size += _sampled_size(obj, len(obj), depth, seen, sample_size, max_depth)
+    else:
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is not None:
+            size += _deep_size(attributes, depth, seen, sample_size, max_depth)
+        for slot in _iter_slots(type(obj)):
+            attr_value = getattr(obj, slot, None)
+            if attr_value is not None:
+                size += _deep_size(attr_value, depth, seen, sample_size, max_depth)
+
+    return size
+
+
+def _sampled_size(items: Any, count: int, depth: int, seen: Set[int],
+                  sample_size: int, max_depth: int, pairs: bool = False) -> int:
+    """Size container items, extrapolating from a sample for large containers."""
+    if count == 0:
+        return 0
+
+    if count <= sample_size:
+        sample = list(items)
+    elif isinstance(items, (list, tuple)):
+        step = count / sample_size
+        sample = [items[int(i * step)] for i in range(sample_size)]
+    else:
+        sample = list(islice(items, sample_size))
+
+    total = 0
+    for item in sample:
+        if pairs:
+            # dict items: size key and value, not the transient tuple
+            total += _deep_size(item[0], depth, seen, sample_size, max_depth)
+            total += _deep_size(item[1], depth, seen, sample_size, max_depth)
+        else:
+            total += _deep_size(item, depth, seen, sample_size, max_depth)
+
+    if len(sample) < count:
+        total = int(total * count / len(sample))
+    return total
+
+
+def _iter_slots(cls: type):
+    """Yield slot names declared anywhere in a class hierarchy."""
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot not in ("__dict__", "__weakref__"):
+                yield slot
+
+
+class CacheSizer:
+    """
+    Pluggable memory estimator for cache values.
+
+    Resolution order:
+    1. ``value.estimate_cache_size()`` for values implementing ICacheSizeAware
+    2. A sizer registered for the value's type (or one of its base classes)
+    3. Sampled deep-size estimation
+    """
+
+    def __init__(self, sample_size: int = 32, max_depth: int = 6):
+        self._sample_size = sample_size
+        self._max_depth = max_depth
+        self._sizers: Dict[type, Callable[[Any], int]] = {}
+
+    def register(self, value_type: type, sizer: Callable[[Any], int]) -> None:
+        """
+        Register a sizing function for a value type.
+
+        Args:
+            value_type: Type the sizer applies to (subclasses included)
+            sizer: Callable returning the size in bytes of a value
+        """
+        self._sizers[value_type] = sizer
+
+    def unregister(self, value_type: type) -> None:
+        """Remove a previously registered sizing function."""
+        self._sizers.pop(value_type, None)
+
+    def size_of(self, value: Any) -> int:
+        """
+        Estimate the memory retained by a cached value.
+
+        Args:
+            value: Value to size
+
+        Returns:
+            Estimated size in bytes
+        """
+        self_sizer = getattr(value, "estimate_cache_size", None)
+        if callable(self_sizer):
+            return int(self_sizer())
+
+        sizer = self._find_sizer(type(value))
+        if sizer is not None:
+            return int(sizer(value))
+
+        return estimate_deep_size(value, self._sample_size, self._max_depth)
+
+    def _find_sizer(self, value_type: type) -> Optional[Callable[[Any], int]]:
+        """Find the most specific registered sizer for a type."""
+        if not self._sizers:
+            return None
+        for klass in value_type.__mro__:
+            sizer = self._sizers.get(klass)
+            if sizer is not None:
+                return sizer
+        return None
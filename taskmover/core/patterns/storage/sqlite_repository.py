@@ -0,0 +1,521 @@
+"""
+SQLite Pattern Repository
+
+Pattern storage on ``storage.backends.SQLiteBackend`` with indexed
+columns for name, status, group, category and tags, and a trigram FTS
+index for search. Each save is a single-row upsert.
+
+Patterns are materialized on demand into an identity map, so repeated
+lookups return the same objects as the file-backed repository does.
+YAML remains the import/export format through ``backup()`` and
+``restore()``, and existing ``patterns.yaml``/``groups.yaml`` files are
+imported the first time the database is created.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+from datetime import datetime
+
+from ...storage import StorageBackend, StorageConfig
+from ...storage.backends import SQLiteBackend
+from ..interfaces import ISerializationProvider
+from ..models import Pattern, PatternGroup, PatternStatus, SYSTEM_GROUPS
+from ..exceptions import PatternStorageError
+from .repository import PatternRepository
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS patterns (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        status TEXT NOT NULL,
+        category TEXT,
+        group_id TEXT,
+        pattern_type TEXT,
+        complexity TEXT,
+        modified_date TEXT,
+        search_text TEXT NOT NULL,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_patterns_name ON patterns (name)",
+    "CREATE INDEX IF NOT EXISTS idx_patterns_status ON patterns (status)",
+    "CREATE INDEX IF NOT EXISTS idx_patterns_group ON patterns (group_id)",
+    "CREATE INDEX IF NOT EXISTS idx_patterns_category ON patterns (category)",
+    """CREATE TABLE IF NOT EXISTS pattern_tags (
+        tag TEXT NOT NULL,
+        pattern_id TEXT NOT NULL,
+        PRIMARY KEY (tag, pattern_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_pattern_tags_pattern ON pattern_tags (pattern_id)",
+    """CREATE TABLE IF NOT EXISTS pattern_groups (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    )""",
+]
+
+# Search index rows share the rowid of their pattern row, so saves and
+# deletes replace one index row by rowid instead of scanning the index
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS patterns_fts USING fts5("
+    "search_text, tokenize='trigram')"
+)
+
+# Filters with an indexed column; other keys are checked in Python only
+_FILTER_COLUMNS = {
+    'status': 'status',
+    'category': 'category',
+    'pattern_type': 'pattern_type',
+    'complexity': 'complexity',
+}
+
+# Trigram FTS cannot match fewer than three characters
+_MIN_FTS_QUERY = 3
+
+
+class SQLitePatternRepository(PatternRepository):
+    """
+    SQLite-backed pattern repository.
+
+    Behaves like ``PatternRepository``; lookups by name, filters, tag
+    filters and search run against indexes instead of scanning every
+    pattern.
+    """
+
+    def __init__(self,
+        storage_path: Path,
+        serialization_provider: Optional[ISerializationProvider] = None,
+        database_name: str = "patterns.db"):
+        self._database_path = Path(storage_path) / database_name
+        self._backend = SQLiteBackend()
+        self._fts_enabled = False
+        super().__init__(storage_path, serialization_provider, format="yaml", use_snapshot=False)
+
+    def save(self, pattern: Pattern) -> None:
+        """
+        Save a pattern to storage.
+
+        Args:
+            pattern: Pattern to save
+
+        Raises:
+            PatternStorageError: If save operation fails
+        """
+        try:
+            self._log_operation("save_pattern", pattern_id=str(pattern.id), pattern_name=pattern.name)
+
+            # Update modified timestamp
+            pattern.modified_date = datetime.utcnow()
+
+            with self._backend.transaction() as cursor:
+                self._upsert_pattern(cursor, pattern)
+
+            self._patterns_cache[pattern.id] = pattern
+
+            self._logger.info(f"Pattern saved: {pattern.name} ({pattern.id})")
+
+        except Exception as e:
+            self._log_error(e, "save_pattern", pattern_id=str(pattern.id))
+            raise PatternStorageError(f"Failed to save pattern {pattern.id}: {e}", "save")
+
+    def get(self, pattern_id: UUID) -> Optional[Pattern]:
+        """
+        Retrieve a pattern by ID.
+
+        Args:
+            pattern_id: UUID of the pattern to retrieve
+
+        Returns:
+            Pattern if found, None otherwise
+        """
+        try:
+            pattern = self._patterns_cache.get(pattern_id)
+            if pattern is None:
+                rows = self._backend.execute_sql(
+                    "SELECT id, data FROM patterns WHERE id = ?", [str(pattern_id)]
+                )
+                pattern = self._materialize(rows)[0] if rows else None
+
+            if pattern:
+                self._metrics.counter(f"{self._component_name}.get_pattern.hit").inc()
+                return pattern
+            else:
+                self._metrics.counter(f"{self._component_name}.get_pattern.miss").inc()
+                return None
+
+        except Exception as e:
+            self._log_error(e, "get_pattern", pattern_id=str(pattern_id))
+            return None
+
+    def get_by_name(self, name: str) -> Optional[Pattern]:
+        """
+        Retrieve a pattern by name.
+
+        Args:
+            name: Name of the pattern to retrieve
+
+        Returns:
+            Pattern if found, None otherwise
+        """
+        try:
+            rows = self._backend.execute_sql(
+                "SELECT id, data FROM patterns WHERE name = ? ORDER BY rowid LIMIT 1", [name]
+            )
+            return self._materialize(rows)[0] if rows else None
+
+        except Exception as e:
+            self._log_error(e, "get_by_name", pattern_name=name)
+            return None
+
+    def list_patterns(self, filters: Optional[Dict[str, Any]] = None) -> List[Pattern]:
+        """
+        List patterns with optional filtering.
+
+        Args:
+            filters: Optional dictionary of filters to apply
+
+        Returns:
+            List of patterns matching the filters
+        """
+        try:
+            self._log_operation("list_patterns", filter_count=len(filters) if filters else 0)
+
+            conditions: List[str] = []
+            params: List[Any] = []
+            for key, value in (filters or {}).items():
+                if key in _FILTER_COLUMNS and isinstance(value, str):
+                    conditions.append(f"{_FILTER_COLUMNS[key]} = ?")
+                    params.append(value)
+                elif key == 'group_id' and value is None:
+                    conditions.append("group_id IS NULL")
+                elif key == 'group_id' and isinstance(value, UUID):
+                    conditions.append("group_id = ?")
+                    params.append(str(value))
+                elif key == 'tags' and isinstance(value, (list, tuple, set)):
+                    tags = [tag for tag in value if isinstance(tag, str)]
+                    conditions.append(
+                        "id IN (SELECT pattern_id FROM pattern_tags WHERE tag IN "
+                        f"({', '.join('?' for _ in tags)}))"
+                    )
+                    params.extend(tags)
+
+            sql = "SELECT id, data FROM patterns"
+            if conditions:
+                sql += f" WHERE {' AND '.join(conditions)}"
+            sql += " ORDER BY rowid"
+
+            patterns = self._materialize(self._backend.execute_sql(sql, params))
+
+            if not filters:
+                return patterns
+
+            # Indexes narrow the candidates; the exact checks stay in one place
+            filtered_patterns = [p for p in patterns if self._matches_filters(p, filters)]
+
+            self._logger.debug(f"Listed {len(filtered_patterns)} patterns after filtering")
+            return filtered_patterns
+
+        except Exception as e:
+            self._log_error(e, "list_patterns")
+            return []
+
+    def search_patterns(self, query: str) -> List[Pattern]:
+        """
+        Search patterns by name, description, or expression.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of patterns matching the search query
+        """
+        try:
+            self._log_operation("search_patterns", query=query)
+
+            query_lower = query.lower()
+            if self._fts_enabled and len(query_lower) >= _MIN_FTS_QUERY:
+                rows = self._backend.execute_sql(
+                    "SELECT p.id, p.data FROM patterns p WHERE p.rowid IN "
+                    "(SELECT rowid FROM patterns_fts WHERE patterns_fts MATCH ?) "
+                    "ORDER BY p.rowid",
+                    [_fts_phrase(query_lower)]
+                )
+            else:
+                rows = self._backend.execute_sql(
+                    "SELECT id, data FROM patterns WHERE instr(search_text, ?) > 0 ORDER BY rowid",
+                    [query_lower]
+                )
+
+            matching_patterns = [
+                pattern for pattern in self._materialize(rows)
+                if (query_lower in pattern.name.lower() or
+                    query_lower in pattern.description.lower() or
+                    query_lower in pattern.user_expression.lower() or
+                    any(query_lower in tag.lower() for tag in pattern.tags))
+            ]
+
+            self._logger.debug(f"Found {len(matching_patterns)} patterns matching '{query}'")
+            return matching_patterns
+
+        except Exception as e:
+            self._log_error(e, "search_patterns", query=query)
+            return []
+
+    def delete(self, pattern_id: UUID) -> bool:
+        """
+        Delete a pattern by ID.
+
+        Args:
+            pattern_id: UUID of the pattern to delete
+
+        Returns:
+            True if pattern was deleted, False if not found
+
+        Raises:
+            PatternStorageError: If delete operation fails
+        """
+        try:
+            self._log_operation("delete_pattern", pattern_id=str(pattern_id))
+
+            with self._backend.transaction() as cursor:
+                deleted = self._delete_pattern_rows(cursor, str(pattern_id))
+
+            pattern = self._patterns_cache.pop(pattern_id, None)
+            if not deleted:
+                return False
+
+            name = pattern.name if pattern else pattern_id
+            self._logger.info(f"Pattern deleted: {name} ({pattern_id})")
+            return True
+
+        except Exception as e:
+            self._log_error(e, "delete_pattern", pattern_id=str(pattern_id))
+            raise PatternStorageError(f"Failed to delete pattern {pattern_id}: {e}", "delete")
+
+    def delete_group(self, group_id: UUID) -> bool:
+        """Delete a pattern group."""
+        try:
+            if group_id not in self._groups_cache:
+                return False
+
+            # Move patterns in the group to the default group (None)
+            rows = self._backend.execute_sql(
+                "SELECT id, data FROM patterns WHERE group_id = ?", [str(group_id)]
+            )
+            patterns_in_group = self._materialize(rows)
+            if patterns_in_group:
+                with self._backend.transaction() as cursor:
+                    for pattern in patterns_in_group:
+                        pattern.group_id = None
+                        pattern.modified_date = datetime.utcnow()
+                        self._upsert_pattern(cursor, pattern)
+
+            # Remove group
+            group = self._groups_cache.pop(group_id)
+            self._persist_groups()
+
+            self._logger.info(f"Group deleted: {group.name} ({group_id})")
+            return True
+
+        except Exception as e:
+            self._log_error(e, "delete_group", group_id=str(group_id))
+            raise PatternStorageError(f"Failed to delete group {group_id}: {e}", "delete_group")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get repository statistics."""
+        try:
+            row = self._backend.execute_sql(
+                "SELECT COUNT(*) AS total, "
+                "COALESCE(SUM(status = ?), 0) AS active, "
+                "MAX(modified_date) AS last_modified FROM patterns",
+                [PatternStatus.ACTIVE.value]
+            )[0]
+
+            return {
+                'total_patterns': row['total'],
+                'active_patterns': row['active'],
+                'inactive_patterns': row['total'] - row['active'],
+                'total_groups': len(self._groups_cache),
+                'system_groups': len(SYSTEM_GROUPS),
+                'storage_path': str(self._storage_path),
+                'storage_format': 'sqlite',
+                'last_modified': row['last_modified'] or datetime.utcnow().isoformat()
+            }
+
+        except Exception as e:
+            self._log_error(e, "get_statistics")
+            return {}
+
+    def backup(self) -> Path:
+        """Export all pattern data to a YAML backup file."""
+        try:
+            self._load_all()
+        except Exception as e:
+            self._log_error(e, "backup")
+            raise PatternStorageError(f"Failed to create backup: {e}", "backup")
+        return super().backup()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._backend.disconnect()
+
+    def _initialize_storage(self) -> None:
+        """Open the database and create the schema."""
+        try:
+            self._storage_path.mkdir(parents=True, exist_ok=True)
+
+            self._backend.connect(StorageConfig(
+                backend=StorageBackend.SQLITE,
+                connection_string=str(self._database_path)
+            ))
+
+            with self._backend.transaction() as cursor:
+                for statement in _SCHEMA:
+                    cursor.execute(statement)
+
+            self._fts_enabled = self._backend.supports_trigram_fts()
+            if self._fts_enabled:
+                self._create_search_index()
+
+            self._logger.debug(f"Storage initialized at {self._database_path}")
+
+        except Exception as e:
+            raise PatternStorageError(f"Failed to initialize storage: {e}", "initialize")
+
+    def _create_search_index(self) -> None:
+        """Create the FTS index, rebuilding one keyed by the old ``pattern_id`` column."""
+        with self._backend.transaction() as cursor:
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(patterns_fts)")]
+            if columns == ['search_text']:
+                return
+            if columns:
+                cursor.execute("DROP TABLE patterns_fts")
+            cursor.execute(_FTS_SCHEMA)
+            cursor.execute(
+                "INSERT INTO patterns_fts (rowid, search_text) "
+                "SELECT rowid, search_text FROM patterns"
+            )
+
+    def _load_data(self) -> None:
+        """Load groups; import YAML files into a new database."""
+        try:
+            count = self._backend.execute_sql("SELECT COUNT(*) AS n FROM patterns")[0]['n']
+            if count == 0 and (self._patterns_file.exists() or self._groups_file.exists()):
+                # The parent loader reads the YAML files into the caches
+                super()._load_data()
+                if self._patterns_cache or self._groups_cache:
+                    self._persist_patterns()
+                    self._persist_groups()
+                    self._logger.info(
+                        f"Imported {len(self._patterns_cache)} patterns from {self._patterns_file.name}"
+                    )
+                return
+
+            for row in self._backend.execute_sql("SELECT data FROM pattern_groups ORDER BY rowid"):
+                group = self._dict_to_group(json.loads(row['data']))
+                self._groups_cache[group.id] = group
+
+        except Exception as e:
+            self._log_error(e, "load_data")
+            self._patterns_cache.clear()
+            self._groups_cache.clear()
+
+    def _persist_patterns(self) -> None:
+        """Replace stored patterns with the cached set (used by restore and import)."""
+        try:
+            with self._backend.transaction() as cursor:
+                cursor.execute("DELETE FROM patterns")
+                cursor.execute("DELETE FROM pattern_tags")
+                if self._fts_enabled:
+                    cursor.execute("DELETE FROM patterns_fts")
+                for pattern in self._patterns_cache.values():
+                    self._upsert_pattern(cursor, pattern)
+            self._cache_dirty = False
+
+        except Exception as e:
+            raise PatternStorageError(f"Failed to persist patterns: {e}", "persist_patterns")
+
+    def _persist_groups(self) -> None:
+        """Replace stored groups with the cached set."""
+        try:
+            with self._backend.transaction() as cursor:
+                cursor.execute("DELETE FROM pattern_groups")
+                cursor.executemany(
+                    "INSERT INTO pattern_groups (id, data) VALUES (?, ?)",
+                    [(str(g.id), json.dumps(self._group_to_dict(g), default=str))
+                     for g in self._groups_cache.values()]
+                )
+
+        except Exception as e:
+            raise PatternStorageError(f"Failed to persist groups: {e}", "persist_groups")
+
+    def _upsert_pattern(self, cursor, pattern: Pattern) -> None:
+        """Write one pattern row with its tag and search index entries."""
+        pattern_id = str(pattern.id)
+        search_text = _search_text(
+            [pattern.name, pattern.description, pattern.user_expression, *pattern.tags]
+        )
+        cursor.execute(
+            """INSERT INTO patterns (id, name, status, category, group_id, pattern_type,
+                                     complexity, modified_date, search_text, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   name = excluded.name, status = excluded.status,
+                   category = excluded.category, group_id = excluded.group_id,
+                   pattern_type = excluded.pattern_type, complexity = excluded.complexity,
+                   modified_date = excluded.modified_date,
+                   search_text = excluded.search_text, data = excluded.data""",
+            (
+                pattern_id, pattern.name, pattern.status.value, pattern.category,
+                str(pattern.group_id) if pattern.group_id else None,
+                pattern.pattern_type.value, pattern.pattern_complexity.value,
+                pattern.modified_date.isoformat(), search_text,
+                json.dumps(self._pattern_to_dict(pattern), default=str),
+            )
+        )
+        cursor.execute("DELETE FROM pattern_tags WHERE pattern_id = ?", (pattern_id,))
+        cursor.executemany(
+            "INSERT OR IGNORE INTO pattern_tags (tag, pattern_id) VALUES (?, ?)",
+            [(tag, pattern_id) for tag in pattern.tags]
+        )
+        if self._fts_enabled:
+            cursor.execute(
+                "INSERT OR REPLACE INTO patterns_fts (rowid, search_text) "
+                "SELECT rowid, search_text FROM patterns WHERE id = ?",
+                (pattern_id,)
+            )
+
+    def _delete_pattern_rows(self, cursor, pattern_id: str) -> bool:
+        row = cursor.execute("SELECT rowid FROM patterns WHERE id = ?", (pattern_id,)).fetchone()
+        cursor.execute("DELETE FROM pattern_tags WHERE pattern_id = ?", (pattern_id,))
+        if row is None:
+            return False
+        cursor.execute("DELETE FROM patterns WHERE rowid = ?", (row[0],))
+        if self._fts_enabled:
+            cursor.execute("DELETE FROM patterns_fts WHERE rowid = ?", (row[0],))
+        return True
+
+    def _materialize(self, rows: Iterable[Dict[str, Any]]) -> List[Pattern]:
+        """Map rows to patterns through the identity map."""
+        patterns = []
+        for row in rows:
+            pattern_id = UUID(row['id'])
+            pattern = self._patterns_cache.get(pattern_id)
+            if pattern is None:
+                pattern = self._dict_to_pattern(json.loads(row['data']))
+                self._patterns_cache[pattern_id] = pattern
+            patterns.append(pattern)
+        return patterns
+
+    def _load_all(self) -> None:
+        self._materialize(self._backend.execute_sql("SELECT id, data FROM patterns ORDER BY rowid"))
+
+
+def _search_text(values: Iterable[str]) -> str:
+    """Lower-cased searchable fields; the separator keeps matches within one field."""
+    return "\n".join(value.lower() for value in values if value)
+
+
+def _fts_phrase(query: str) -> str:
+    """Quote a query as a single FTS5 phrase."""
+    return '"' + query.replace('"', '""') + '"'
@@ -0,0 +1,401 @@
+"""
+Cost-aware W-TinyLFU Cache Manager
+
+Admission-controlled cache for pattern results. New entries enter a small
+LRU window; when they leave it they must beat the main region's eviction
+victims on estimated frequency times recomputation cost before they are
+admitted. One large one-off match therefore cannot flush the small, hot
+entries that pattern previews keep hitting.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..interfaces import BasePatternComponent, ICacheManager
+from ...storage.cache import FrequencySketch, TagIndex
+from .cache_manager import CacheEntry
+from .sizing import CacheSizer
+
+
+# Recomputation cost assumed for values that do not record one
+DEFAULT_COST_MS = 1.0
+
+
+class _Region:
+    """LRU-ordered set of entries with byte accounting."""
+
+    __slots__ = ('entries', 'memory_bytes', 'tag_index')
+
+    def __init__(self, tag_index: TagIndex):
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.memory_bytes = 0
+        self.tag_index = tag_index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, key: str, entry: CacheEntry) -> None:
+        self.entries[key] = entry
+        self.memory_bytes += entry.size_bytes
+
+    def pop(self, key: str, keep_tags: bool = False) -> CacheEntry:
+        entry = self.entries.pop(key)
+        self.memory_bytes -= entry.size_bytes
+        if not keep_tags:
+            self.tag_index.discard(key)
+        return entry
+
+    def pop_lru(self, keep_tags: bool = False) -> Tuple[str, CacheEntry]:
+        key, entry = self.entries.popitem(last=False)
+        self.memory_bytes -= entry.size_bytes
+        if not keep_tags:
+            self.tag_index.discard(key)
+        return key, entry
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.memory_bytes = 0
+
+
+class WTinyLfuCacheManager(BasePatternComponent, ICacheManager):
+    """
+    Cache manager with a W-TinyLFU admission policy and cost-aware eviction.
+
+    Layout:
+    - Window LRU (``window_percent`` of the budget) absorbs new entries
+    - Main region split into probation (20%) and protected (80%) segments
+    - A frequency sketch estimates recent popularity of every key seen
+
+    An entry leaving the window is admitted to the main region only if its
+    expected benefit, ``frequency * cost``, exceeds the combined benefit of
+    the main-region victims that would have to be evicted to make room.
+    Cost is the ``execution_time_ms`` recorded on the cached value.
+    """
+
+    def __init__(self,
+                 max_memory_entries: int = 1000,
+                 default_ttl_seconds: int = 300,
+                 cleanup_interval_seconds: int = 60,
+                 max_memory_mb: float = 50.0,
+                 window_percent: float = 1.0,
+                 sizer: Optional[CacheSizer] = None):
+        super().__init__("tinylfu_cache")
+
+        self._max_memory_entries = max(2, max_memory_entries)
+        self._default_ttl_seconds = default_ttl_seconds
+        self._cleanup_interval_seconds = cleanup_interval_seconds
+        self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._sizer = sizer or CacheSizer()
+
+        # Budget split between window and main regions
+        window_fraction = min(max(window_percent, 0.0), 50.0) / 100
+        self._window_max_entries = max(1, int(self._max_memory_entries * window_fraction))
+        self._window_max_bytes = max(1, int(self._max_memory_bytes * window_fraction))
+        self._main_max_entries = self._max_memory_entries - self._window_max_entries
+        self._main_max_bytes = self._max_memory_bytes - self._window_max_bytes
+        self._protected_max_bytes = int(self._main_max_bytes * 0.8)
+        self._protected_max_entries = int(self._main_max_entries * 0.8)
+
+        self._tag_index = TagIndex()
+        self._window = _Region(self._tag_index)
+        self._probation = _Region(self._tag_index)
+        self._protected = _Region(self._tag_index)
+        self._sketch = FrequencySketch(self._max_memory_entries)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expired': 0,
+            'admissions': 0,
+            'rejected': 0
+        }
+
+        # Cleanup thread
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+        self._start_cleanup_thread()
+
+        self._logger.info(f"WTinyLfuCacheManager initialized with {max_memory_entries} max entries")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        now = time.time()
+        with self._lock:
+            self._sketch.increment(key)
+            region = self._region_of(key)
+            if region is None:
+                self._stats['misses'] += 1
+                return None
+
+            entry = region.entries[key]
+            if entry.expires_at and now > entry.expires_at:
+                region.pop(key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            entry.hit_count += 1
+            entry.last_accessed = now
+
+            if region is self._probation:
+                # Second hit in the main region: promote to protected
+                self._probation.pop(key, keep_tags=True)
+                self._protected.add(key, entry)
+                self._demote_protected_overflow()
+            else:
+                region.entries.move_to_end(key)
+
+            self._stats['hits'] += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
+        """
+        Store value in cache with optional TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default if None)
+            tags: Dependency tags used by invalidate_tags()
+        """
+        try:
+            size_bytes = self._sizer.size_of(value)
+        except Exception:
+            size_bytes = 1024
+
+        if ttl is None:
+            ttl = self._default_ttl_seconds
+        now = time.time()
+        entry = CacheEntry(
+            value=value,
+            created_at=now,
+            expires_at=now + ttl if ttl > 0 else None,
+            last_accessed=now,
+            size_bytes=size_bytes
+        )
+
+        with self._lock:
+            self._sketch.increment(key)
+
+            # Updates replace the entry in place and keep its segment
+            region = self._region_of(key)
+            if region is not None:
+                region.pop(key)
+                region.add(key, entry)
+                self._tag_index.add(key, tags)
+                self._enforce_main_limits()
+                return
+
+            if size_bytes > self._main_max_bytes:
+                self._stats['rejected'] += 1
+                return
+
+            self._window.add(key, entry)
+            self._tag_index.add(key, tags)
+            while self._window.entries and (len(self._window) > self._window_max_entries or
+                                            self._window.memory_bytes > self._window_max_bytes):
+                candidate_key, candidate = self._window.pop_lru(keep_tags=True)
+                self._admit(candidate_key, candidate)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove value from cache.
+
+        Args:
+            key: Cache key to remove
+        """
+        with self._lock:
+            region = self._region_of(key)
+            if region is not None:
+                region.pop(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the given tags.
+
+        Args:
+            tags: Dependency tags to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._remove_keys(self._tag_index.keys_for(tags))
+
+    def invalidate_tag_prefix(self, prefix: str) -> int:
+        """
+        Remove every entry carrying a tag that starts with a prefix.
+
+        Args:
+            prefix: Tag prefix, e.g. a directory tag covering its subtree
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._remove_keys(
+                self._tag_index.keys_for(self._tag_index.tags_with_prefix(prefix)))
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._tag_index.clear()
+            self._sketch.clear()
+        self._logger.info("Cache cleared")
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for region in (self._window, self._probation, self._protected):
+                expired_keys = [key for key, entry in region.entries.items()
+                                if entry.expires_at and now > entry.expires_at]
+                for key in expired_keys:
+                    region.pop(key)
+                removed += len(expired_keys)
+            self._stats['expired'] += removed
+
+        if removed:
+            self._logger.debug(f"Cleaned up {removed} expired cache entries")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            memory_bytes = (self._window.memory_bytes + self._probation.memory_bytes +
+                            self._protected.memory_bytes)
+            stats['memory_usage_bytes'] = memory_bytes
+            stats['total_entries'] = len(self._window) + len(self._probation) + len(self._protected)
+            stats['window_entries'] = len(self._window)
+            stats['probation_entries'] = len(self._probation)
+            stats['protected_entries'] = len(self._protected)
+
+        total_requests = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+        stats.update({
+            'hit_rate_percent': round(hit_rate, 2),
+            'total_requests': total_requests,
+            'memory_usage_mb': round(memory_bytes / (1024 * 1024), 2),
+            'memory_utilization_percent': round(
+                memory_bytes / self._max_memory_bytes * 100, 2
+            ) if self._max_memory_bytes > 0 else 0
+        })
+        return stats
+
+    def shutdown(self) -> None:
+        """Shutdown the cache manager and cleanup resources."""
+        try:
+            self._shutdown_event.set()
+
+            if self._cleanup_thread and self._cleanup_thread.is_alive():
+                self._cleanup_thread.join(timeout=5.0)
+
+            self.clear()
+            self._logger.info("TinyLFU cache manager shutdown complete")
+
+        except Exception as e:
+            self._log_error(e, "shutdown")
+
+    def _remove_keys(self, keys: Iterable[str]) -> int:
+        """Remove keys from whichever region holds them."""
+        removed = 0
+        for key in keys:
+            region = self._region_of(key)
+            if region is not None:
+                region.pop(key)
+                removed += 1
+        return removed
+
+    def _region_of(self, key: str) -> Optional[_Region]:
+        """Find the region holding a key."""
+        for region in (self._window, self._protected, self._probation):
+            if key in region.entries:
+                return region
+        return None
+
+    def _benefit(self, key: str, entry: CacheEntry) -> float:
+        """Expected recomputation time saved by keeping an entry."""
+        cost = getattr(entry.value, 'execution_time_ms', None) or DEFAULT_COST_MS
+        return max(cost, DEFAULT_COST_MS) * max(self._sketch.estimate(key), 1)
+
+    def _admit(self, candidate_key: str, candidate: CacheEntry) -> None:
+        """Admit a window evictee into the main region or drop it."""
+        main_entries = len(self._probation) + len(self._protected)
+        main_bytes = self._probation.memory_bytes + self._protected.memory_bytes
+
+        # Collect the victims that would make room, cheapest segment first
+        victims: List[Tuple[_Region, str]] = []
+        victims_benefit = 0.0
+        freed_entries = 0
+        freed_bytes = 0
+        for region in (self._probation, self._protected):
+            for key, entry in region.entries.items():
+                if (main_entries - freed_entries < self._main_max_entries and
+                        main_bytes - freed_bytes + candidate.size_bytes <= self._main_max_bytes):
+                    break
+                victims.append((region, key))
+                victims_benefit += self._benefit(key, entry)
+                freed_entries += 1
+                freed_bytes += entry.size_bytes
+
+        if victims and self._benefit(candidate_key, candidate) <= victims_benefit:
+            self._tag_index.discard(candidate_key)
+            self._stats['rejected'] += 1
+            self._stats['evictions'] += 1
+            return
+
+        for region, key in victims:
+            region.pop(key)
+        self._stats['evictions'] += len(victims)
+        self._probation.add(candidate_key, candidate)
+        self._stats['admissions'] += 1
+
+    def _demote_protected_overflow(self) -> None:
+        """Move protected LRU entries back to probation when over budget."""
+        while self._protected.entries and (
+                len(self._protected) > self._protected_max_entries or
+                self._protected.memory_bytes > self._protected_max_bytes):
+            key, entry = self._protected.pop_lru(keep_tags=True)
+            self._probation.add(key, entry)
+
+    def _enforce_main_limits(self) -> None:
+        """Evict from the main region after an in-place update grew it."""
+        self._demote_protected_overflow()
+        while self._probation.entries and (
+                len(self._probation) + len(self._protected) > self._main_max_entries or
+                self._probation.memory_bytes + self._protected.memory_bytes > self._main_max_bytes):
+            self._probation.pop_lru()
+            self._stats['evictions'] += 1
+        while self._window.entries and self._window.memory_bytes > self._window_max_bytes:
+            self._window.pop_lru()
+            self._stats['evictions'] += 1
+
+    def _start_cleanup_thread(self) -> None:
+        """Start the background cleanup thread."""
+        def cleanup_worker():
+            while not self._shutdown_event.wait(self._cleanup_interval_seconds):
+                try:
+                    self.cleanup_expired()
+                except Exception as e:
+                    self._log_error(e, "cleanup_worker")
+
+        self._cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+        self._cleanup_thread.start()
@@ -5,9 +5,13 @@ Intelligent suggestion engine that provides context-aware pattern
 recommendations based on workspace analysis and usage patterns.
 """
 
+from .completion_index import Completion, CompletionIndex, CompletionTrie
 from .suggestion_engine import PatternSuggestionEngine, WorkspaceAnalyzer
 
 __all__ = [
+    "Completion",
+    "CompletionIndex",
+    "CompletionTrie",
     "PatternSuggestionEngine",
     "WorkspaceAnalyzer"
 ]
@@ -0,0 +1,428 @@
+"""
+Completion Index
+
+Prefix index behind ``PatternSuggestionEngine.get_completions``. Tokens,
+groups, keywords, saved patterns and workspace extensions are kept in
+radix tries whose nodes cache their best-ranked entries, so a completion
+is a walk down the typed prefix plus a read of that cache. Updates only
+invalidate the caches on the path of the changed key.
+"""
+
+import gc
+import heapq
+import math
+import re
+import threading
+from itertools import islice
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ..interfaces import BasePatternComponent, ITokenResolver
+from ..models import Pattern, SYSTEM_GROUPS
+
+
+@dataclass(frozen=True)
+class Completion:
+    """One completion candidate."""
+    text: str
+    kind: str
+    weight: float = 0.0
+    description: str = ""
+
+
+def _rank(completion: Completion) -> Tuple[float, str]:
+    # Highest weight first, then alphabetical
+    return -completion.weight, completion.text
+
+
+class _Node:
+    __slots__ = ('label', 'children', 'entries', 'top')
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.children: Dict[str, "_Node"] = {}
+        self.entries: Dict[Hashable, Completion] = {}
+        self.top: Optional[List[Completion]] = None
+
+
+class CompletionTrie:
+    """
+    Radix trie mapping case-insensitive keys to ranked completions.
+
+    Each node caches the ``cache_size`` best entries below it; inserts and
+    removals reset the caches on their path and lookups rebuild them on
+    demand. Several entries may share a key, distinguished by entry id.
+    """
+
+    def __init__(self, cache_size: int = 32):
+        self.cache_size = cache_size
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, key: str, entry_id: Hashable, completion: Completion) -> None:
+        """Add or replace the entry ``entry_id`` under ``key``."""
+        key = key.lower()
+        node = self._root
+        node.top = None
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                child = _Node(key[i:])
+                node.children[key[i]] = child
+                node = child
+                break
+
+            label = child.label
+            if key.startswith(label, i):
+                common = len(label)
+            else:
+                common = 1
+                limit = min(len(label), len(key) - i)
+                while common < limit and label[common] == key[i + common]:
+                    common += 1
+            if common < len(label):
+                # Split the edge at the first mismatch
+                middle = _Node(label[:common])
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+
+            node = child
+            node.top = None
+            i += common
+
+        node.top = None
+        if entry_id not in node.entries:
+            self._size += 1
+        node.entries[entry_id] = completion
+
+    def remove(self, key: str, entry_id: Hashable) -> bool:
+        """Remove ``entry_id`` from ``key``; returns False if it was not there."""
+        key = key.lower()
+        path = [self._root]
+        node = self._root
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None or not key.startswith(child.label, i):
+                return False
+            node = child
+            path.append(node)
+            i += len(node.label)
+
+        if node.entries.pop(entry_id, None) is None:
+            return False
+        self._size -= 1
+
+        for item in path:
+            item.top = None
+
+        # Prune empty leaves and merge single-child chains
+        for depth in range(len(path) - 1, 0, -1):
+            current, parent = path[depth], path[depth - 1]
+            if current.entries:
+                break
+            if not current.children:
+                del parent.children[current.label[0]]
+                continue
+            if len(current.children) == 1:
+                (only,) = current.children.values()
+                only.label = current.label + only.label
+                parent.children[current.label[0]] = only
+            break
+        return True
+
+    def complete(self, prefix: str, limit: int) -> List[Completion]:
+        """Best-ranked completions whose key starts with ``prefix``."""
+        node = self._find(prefix.lower())
+        if node is None:
+            return []
+        if limit <= self.cache_size:
+            return self._top(node)[:limit]
+        return heapq.nsmallest(limit, self._collect(node), key=_rank)
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None
+            remaining = prefix[i:]
+            if child.label.startswith(remaining):
+                return child
+            if not remaining.startswith(child.label):
+                return None
+            node = child
+            i += len(child.label)
+        return node
+
+    def _top(self, node: _Node) -> List[Completion]:
+        if node.top is None:
+            # Child caches are already ranked, so a lazy merge reads only
+            # the first ``cache_size`` of them
+            ranked = [sorted(node.entries.values(), key=_rank)]
+            ranked.extend(self._top(child) for child in node.children.values())
+            node.top = list(islice(heapq.merge(*ranked, key=_rank), self.cache_size))
+        return node.top
+
+    def _collect(self, node: _Node) -> Iterable[Completion]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield from current.entries.values()
+            stack.extend(current.children.values())
+
+
+# Base weights: usage adds to these, so popular entries rise within a kind
+_OPERATOR_WEIGHT = 1.5
+_CONDITION_WEIGHT = 1.2
+_FUNCTION_WEIGHT = 1.0
+_TOKEN_WEIGHT = 1.0
+_GROUP_WEIGHT = 1.0
+_PATTERN_WEIGHT = 2.0
+
+# Keyword completions end with the space or parenthesis that follows them
+_KEYWORDS = {
+    'AND ': (_OPERATOR_WEIGHT, 'Both conditions must match'),
+    'OR ': (_OPERATOR_WEIGHT, 'Either condition may match'),
+    'NOT ': (_OPERATOR_WEIGHT, 'Condition must not match'),
+    'size > ': (_CONDITION_WEIGHT, 'Files larger than a size'),
+    'size < ': (_CONDITION_WEIGHT, 'Files smaller than a size'),
+    'modified > ': (_CONDITION_WEIGHT, 'Files modified after a date'),
+    'created > ': (_CONDITION_WEIGHT, 'Files created after a date'),
+    'name LIKE ': (_CONDITION_WEIGHT, 'Name matches a wildcard'),
+    'contains(': (_FUNCTION_WEIGHT, 'Name contains text'),
+    'startswith(': (_FUNCTION_WEIGHT, 'Name starts with text'),
+    'endswith(': (_FUNCTION_WEIGHT, 'Name ends with text'),
+    'matches(': (_FUNCTION_WEIGHT, 'Name matches a regular expression'),
+    'DATE_SUB(': (_FUNCTION_WEIGHT, 'Date arithmetic'),
+    'DATE_ADD(': (_FUNCTION_WEIGHT, 'Date arithmetic')
+}
+
+_TOKEN_REFERENCE = re.compile(r'\$([A-Za-z_]+)')
+_GROUP_REFERENCE = re.compile(r'@([A-Za-z_]+)')
+
+# What is being typed at the end of the input
+_TRAILING_TOKEN = re.compile(r'\$([A-Za-z_]*)$')
+_TRAILING_GROUP = re.compile(r'@([A-Za-z_]*)$')
+_TRAILING_EXTENSION = re.compile(r'\*?\.([A-Za-z0-9_]*)$')
+_TRAILING_WORD = re.compile(r'(?:^|(?<=[\s(]))([A-Za-z_]*)$')
+_OPEN_CALL = re.compile(r'[A-Za-z_]\($')
+
+
+class CompletionIndex(BasePatternComponent):
+    """
+    Incrementally maintained completion index for pattern input.
+
+    Entries are ranked by usage: tokens and groups by how often the saved
+    patterns that reference them were used, patterns by their own
+    ``usage_stats``, extensions by how many workspace files have them.
+    """
+
+    def __init__(self, token_resolver: Optional[ITokenResolver] = None, limit: int = 10):
+        super().__init__("completion_index")
+        self.limit = limit
+
+        self._lock = threading.RLock()
+        self._tokens = CompletionTrie()
+        self._groups = CompletionTrie()
+        self._keywords = CompletionTrie()
+        self._patterns = CompletionTrie()
+        self._extensions = CompletionTrie()
+
+        self._token_descriptions: Dict[str, str] = {}
+        self._group_descriptions: Dict[str, str] = {}
+        # Usage contributed by each saved pattern, so updates can be undone
+        self._pattern_keys: Dict[UUID, Tuple[str, str]] = {}
+        self._pattern_refs: Dict[UUID, Tuple[Set[str], Set[str], float]] = {}
+        self._token_usage: Dict[str, float] = {}
+        self._group_usage: Dict[str, float] = {}
+        self._extension_keys: Set[str] = set()
+
+        for keyword, (weight, description) in _KEYWORDS.items():
+            self._keywords.insert(keyword, keyword, Completion(keyword, 'keyword', weight, description))
+
+        if token_resolver is not None:
+            tokens = token_resolver.get_available_tokens()
+        else:
+            tokens = {name: "" for name in ('DATE', 'TIME', 'DATETIME', 'USER', 'YEAR', 'MONTH', 'DAY',
+                                            'HOUR', 'MINUTE', 'HOSTNAME', 'PROJECT', 'RANDOM', 'UUID')}
+        for name, description in tokens.items():
+            self.set_token(name, description)
+
+        for group_name, group in SYSTEM_GROUPS.items():
+            self._group_descriptions[group_name[1:].lower()] = group.description
+            self._index_group(group_name[1:].lower())
+
+    # Sources
+
+    def set_token(self, name: str, description: str = "") -> None:
+        """Add or update a token (without the ``$``)."""
+        name = name.upper()
+        with self._lock:
+            self._token_descriptions[name] = description
+            self._index_token(name)
+
+    def remove_token(self, name: str) -> None:
+        """Stop offering a token."""
+        name = name.upper()
+        with self._lock:
+            if self._token_descriptions.pop(name, None) is not None:
+                self._tokens.remove(name, name)
+
+    def add_pattern(self, pattern: Pattern) -> None:
+        """Add a saved pattern or refresh it after an edit or use."""
+        with self._lock:
+            self._unindex_pattern(pattern.id)
+
+            expression = pattern.user_expression or ""
+            if not expression:
+                return
+            usage = pattern.usage_stats.usage_count if pattern.usage_stats else 0
+            weight = _PATTERN_WEIGHT + math.log1p(usage)
+            completion = Completion(expression, 'pattern', weight, pattern.name)
+
+            name_key = (pattern.name or "").lower()
+            self._patterns.insert(expression, (pattern.id, 'expression'), completion)
+            if name_key:
+                self._patterns.insert(name_key, (pattern.id, 'name'), completion)
+            self._pattern_keys[pattern.id] = (expression, name_key)
+
+            tokens = {token.upper() for token in _TOKEN_REFERENCE.findall(expression)}
+            groups = {group.lower() for group in _GROUP_REFERENCE.findall(expression)}
+            contribution = 1.0 + usage
+            self._pattern_refs[pattern.id] = (tokens, groups, contribution)
+            for token in tokens:
+                self._token_usage[token] = self._token_usage.get(token, 0.0) + contribution
+                self._index_token(token)
+            for group in groups:
+                self._group_usage[group] = self._group_usage.get(group, 0.0) + contribution
+                self._index_group(group)
+
+    def update_usage(self, pattern: Pattern) -> None:
+        """Re-rank a pattern after it was used; unknown patterns are ignored."""
+        with self._lock:
+            if pattern.id in self._pattern_keys:
+                self.add_pattern(pattern)
+
+    def remove_pattern(self, pattern_id: UUID) -> None:
+        """Forget a deleted pattern."""
+        with self._lock:
+            self._unindex_pattern(pattern_id)
+
+    def load_patterns(self, patterns: Iterable[Pattern]) -> int:
+        """Index existing patterns; returns how many were added."""
+        count = 0
+        # The trie allocates only acyclic nodes; collector passes over the
+        # growing heap would otherwise dominate a bulk load
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with self._lock:
+                for pattern in patterns:
+                    self.add_pattern(pattern)
+                    count += 1
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return count
+
+    def set_extensions(self, extensions: Iterable[Tuple[str, int]]) -> None:
+        """Replace the workspace extensions with (extension, file count) pairs."""
+        with self._lock:
+            for extension in self._extension_keys:
+                self._extensions.remove(extension, extension)
+            self._extension_keys = set()
+            for extension, count in extensions:
+                extension = extension.lower().lstrip('.')
+                if extension:
+                    self._extensions.insert(extension, extension,
+                                            Completion(extension, 'extension', math.log1p(count)))
+                    self._extension_keys.add(extension)
+
+    # Lookup
+
+    def complete(self, partial_input: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Complete the expression being typed.
+
+        Returns:
+            Full replacement strings for ``partial_input``, best first
+        """
+        limit = limit or self.limit
+        with self._lock:
+            match = _TRAILING_TOKEN.search(partial_input)
+            if match:
+                return self._replace(partial_input, match.start(1),
+                                     self._tokens.complete(match.group(1), limit))
+
+            match = _TRAILING_GROUP.search(partial_input)
+            if match:
+                return self._replace(partial_input, match.start(1),
+                                     self._groups.complete(match.group(1), limit))
+
+            match = _TRAILING_EXTENSION.search(partial_input)
+            if match:
+                return self._replace(partial_input, match.start(1),
+                                     self._extensions.complete(match.group(1), limit))
+
+            completions: List[str] = []
+            stripped = partial_input.strip()
+            if stripped and ' ' not in stripped:
+                # A single word may be the start of a saved pattern
+                completions.extend(c.text for c in self._patterns.complete(stripped, limit))
+
+            match = _TRAILING_WORD.search(partial_input)
+            if match and (match.group(1) or partial_input.endswith(' ')):
+                keywords = self._keywords.complete(match.group(1), limit)
+                completions.extend(self._replace(partial_input, match.start(1), keywords))
+
+            if _OPEN_CALL.search(partial_input):
+                # Open the string argument of a function call
+                completions.append(partial_input + '"')
+
+            return list(dict.fromkeys(completions))[:limit]
+
+    @staticmethod
+    def _replace(partial_input: str, start: int, completions: List[Completion]) -> List[str]:
+        head = partial_input[:start]
+        return [head + completion.text for completion in completions]
+
+    # Internals
+
+    def _index_token(self, name: str) -> None:
+        if name not in self._token_descriptions:
+            return
+        weight = _TOKEN_WEIGHT + math.log1p(self._token_usage.get(name, 0.0))
+        self._tokens.insert(name, name, Completion(name, 'token', weight, self._token_descriptions[name]))
+
+    def _index_group(self, name: str) -> None:
+        if name not in self._group_descriptions:
+            return
+        weight = _GROUP_WEIGHT + math.log1p(self._group_usage.get(name, 0.0))
+        self._groups.insert(name, name, Completion(name, 'group', weight, self._group_descriptions[name]))
+
+    def _unindex_pattern(self, pattern_id: UUID) -> None:
+        keys = self._pattern_keys.pop(pattern_id, None)
+        if keys is not None:
+            expression, name_key = keys
+            self._patterns.remove(expression, (pattern_id, 'expression'))
+            if name_key:
+                self._patterns.remove(name_key, (pattern_id, 'name'))
+
+        refs = self._pattern_refs.pop(pattern_id, None)
+        if refs is not None:
+            tokens, groups, contribution = refs
+            for token in tokens:
+                self._token_usage[token] -= contribution
+                self._index_token(token)
+            for group in groups:
+                self._group_usage[group] -= contribution
+                self._index_group(group)
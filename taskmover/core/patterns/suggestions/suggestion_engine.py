@@ -5,16 +5,22 @@ Provides intelligent pattern suggestions based on workspace analysis,
 user patterns, and common file organization structures.
 """
 
+import math
 import os
-import re
-from collections import Counter, defaultdict
+import random
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime
+from uuid import UUID
 
-from ..interfaces import BasePatternComponent, ISuggestionEngine, IWorkspaceAnalyzer
+from ..interfaces import BasePatternComponent, ISuggestionEngine, ITokenResolver, IWorkspaceAnalyzer
 from ..models import Pattern, PatternType, SYSTEM_GROUPS
 from ..exceptions import SuggestionError
+from .columns import FileColumns, aggregate
+from .completion_index import CompletionIndex
 
 
 class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
@@ -25,11 +31,26 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
     contextually relevant pattern suggestions.
     """
     
-    def __init__(self, workspace_analyzer: Optional[IWorkspaceAnalyzer] = None):
+    def __init__(self, workspace_analyzer: Optional[IWorkspaceAnalyzer] = None,
+                 file_budget: Optional[int] = 20000, time_budget: Optional[float] = 0.2,
+                 token_resolver: Optional[ITokenResolver] = None,
+                 pattern_source: Optional[Callable[[], Iterable[Pattern]]] = None):
         super().__init__("suggestion_engine")
         
         self._workspace_analyzer = workspace_analyzer or WorkspaceAnalyzer()
         
+        # Completion index over tokens, groups, keywords, saved patterns and extensions
+        self._token_resolver = token_resolver
+        self._completion_index = CompletionIndex(token_resolver)
+        self._pattern_source = pattern_source
+        self._patterns_loaded = pattern_source is None
+        if token_resolver is not None and hasattr(token_resolver, 'add_listener'):
+            token_resolver.add_listener(self._on_token_changed)
+        
+        # Bound the workspace walk so suggestions stay interactive on huge trees
+        self._file_budget = file_budget
+        self._time_budget = time_budget
+        
         # Common pattern templates
         self._pattern_templates = {
             'extension': '*.{ext}',
@@ -77,7 +98,10 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
             suggestions = []
             
             # Analyze workspace
-            workspace_analysis = self._workspace_analyzer.analyze(workspace_path)
+            workspace_analysis = self._workspace_analyzer.analyze(
+                workspace_path, file_budget=self._file_budget, time_budget=self._time_budget
+            )
+            self._completion_index.set_extensions(workspace_analysis.get('common_extensions', []))
             
             # Generate different types of suggestions
             suggestions.extend(self._suggest_based_on_files(workspace_analysis))
@@ -110,31 +134,11 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
             partial_input: Partial pattern input
             
         Returns:
-            List of completion strings
+            List of completion strings, best first
         """
         try:
-            self._log_operation("get_completions", partial_input=partial_input)
-            
-            completions = []
-            
-            # Token completions
-            if '$' in partial_input:
-                completions.extend(self._get_token_completions(partial_input))
-            
-            # Group reference completions
-            if '@' in partial_input:
-                completions.extend(self._get_group_completions(partial_input))
-            
-            # Operator completions
-            if any(op in partial_input.lower() for op in ['and', 'or', 'not']):
-                completions.extend(self._get_operator_completions(partial_input))
-            
-            # Function completions
-            if '(' in partial_input:
-                completions.extend(self._get_function_completions(partial_input))
-            
-            # Remove duplicates and sort
-            completions = sorted(set(completions))
+            self._ensure_patterns_loaded()
+            completions = self._completion_index.complete(partial_input)
             
             self._logger.debug(f"Generated {len(completions)} completions")
             
@@ -144,6 +148,43 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
             self._log_error(e, "get_completions", partial_input=partial_input)
             return []
     
+    @property
+    def completion_index(self) -> CompletionIndex:
+        return self._completion_index
+    
+    def pattern_saved(self, pattern: Pattern) -> None:
+        """Add or refresh a saved pattern in the completion index."""
+        if self._patterns_loaded:
+            self._completion_index.add_pattern(pattern)
+    
+    def pattern_used(self, pattern: Pattern) -> None:
+        """Re-rank a saved pattern after its usage stats changed."""
+        self._completion_index.update_usage(pattern)
+    
+    def pattern_deleted(self, pattern_id: UUID) -> None:
+        """Drop a deleted pattern from the completion index."""
+        self._completion_index.remove_pattern(pattern_id)
+    
+    def _ensure_patterns_loaded(self) -> None:
+        # Saved patterns are indexed on first use, then kept current incrementally
+        if self._patterns_loaded:
+            return
+        self._patterns_loaded = True
+        if self._pattern_source is not None:
+            count = self._completion_index.load_patterns(self._pattern_source())
+            self._logger.debug(f"Indexed {count} saved patterns for completion")
+    
+    def _on_token_changed(self, name: str, description: Optional[str]) -> None:
+        if description is not None:
+            self._completion_index.set_token(name, description)
+            return
+        # A removed custom token may have shadowed a built-in one
+        builtin = self._token_resolver.get_available_tokens().get(name)
+        if builtin is not None:
+            self._completion_index.set_token(name, builtin)
+        else:
+            self._completion_index.remove_token(name)
+    
     def _suggest_based_on_files(self, analysis: Dict) -> List[Dict]:
         """Generate suggestions based on actual files in workspace."""
         suggestions = []
@@ -191,8 +232,6 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
         if not partial_input:
             return suggestions
         
-        partial_lower = partial_input.lower()
-        
         # Complete file extensions
         if partial_input.startswith('*.'):
             ext_part = partial_input[2:]
@@ -357,84 +396,6 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
         
         return suggestions
     
-    def _get_token_completions(self, partial_input: str) -> List[str]:
-        """Get token completion suggestions."""
-        completions = []
-        
-        # Find the token being typed
-        token_match = re.search(r'\$([A-Z_]*)$', partial_input)
-        if token_match:
-            token_prefix = token_match.group(1)
-            
-            available_tokens = [
-                'DATE', 'TIME', 'DATETIME', 'USER', 'YEAR', 'MONTH', 'DAY',
-                'HOUR', 'MINUTE', 'HOSTNAME', 'PROJECT', 'RANDOM', 'UUID'
-            ]
-            
-            for token in available_tokens:
-                if token.startswith(token_prefix):
-                    completion = partial_input.replace(f'${token_prefix}', f'${token}')
-                    completions.append(completion)
-        
-        return completions
-    
-    def _get_group_completions(self, partial_input: str) -> List[str]:
-        """Get group reference completion suggestions."""
-        completions = []
-        
-        # Find the group being typed
-        group_match = re.search(r'@([a-z_]*)$', partial_input, re.IGNORECASE)
-        if group_match:
-            group_prefix = group_match.group(1).lower()
-            
-            for group_name in SYSTEM_GROUPS.keys():
-                clean_name = group_name[1:]  # Remove @ prefix
-                if clean_name.startswith(group_prefix):
-                    completion = partial_input.replace(f'@{group_prefix}', group_name)
-                    completions.append(completion)
-        
-        return completions
-    
-    def _get_operator_completions(self, partial_input: str) -> List[str]:
-        """Get operator completion suggestions."""
-        completions = []
-        
-        operators = ['AND', 'OR', 'NOT']
-        conditions = ['size >', 'size <', 'modified >', 'created >', 'name LIKE']
-        
-        # Add space before operators if needed
-        for op in operators:
-            if partial_input.endswith(' '):
-                completions.append(partial_input + op + ' ')
-        
-        # Add common conditions
-        for condition in conditions:
-            if partial_input.endswith(' '):
-                completions.append(partial_input + condition + ' ')
-        
-        return completions
-    
-    def _get_function_completions(self, partial_input: str) -> List[str]:
-        """Get function completion suggestions."""
-        completions = []
-        
-        functions = [
-            'contains(',
-            'startswith(',
-            'endswith(',
-            'matches(',
-            'DATE_SUB(',
-            'DATE_ADD('
-        ]
-        
-        for func in functions:
-            if '(' in partial_input and not partial_input.endswith(')'):
-                # Inside function call
-                if 'contains(' in partial_input and not partial_input.endswith('"'):
-                    completions.append(partial_input + '"')
-        
-        return completions
-    
     def _filter_suggestions(self, suggestions: List[Dict], partial_input: str) -> List[Dict]:
         """Filter suggestions based on relevance and partial input."""
         if not partial_input:
@@ -484,15 +445,56 @@ class PatternSuggestionEngine(BasePatternComponent, ISuggestionEngine):
         return suggestions
 
 
+class _DirectoryListing:
+    """Cached scan of one directory, valid while its mtime is unchanged."""
+    
+    __slots__ = ('mtime_ns', 'columns', 'subdirs', 'summary')
+    
+    def __init__(self, mtime_ns: int, columns: FileColumns, subdirs: List[str]):
+        self.mtime_ns = mtime_ns
+        self.columns = columns
+        self.subdirs = subdirs
+        self.summary: Optional[Dict] = None
+
+
+class _WorkspaceCache:
+    """Directory listings and the last analysis for one workspace root."""
+    
+    def __init__(self):
+        self.listings: Dict[str, _DirectoryListing] = {}
+        self.created_at = time.monotonic()
+        self.analysis: Optional[Dict] = None
+        self.analyzed_at = 0.0
+        self.complete = False
+
+
 class WorkspaceAnalyzer(BasePatternComponent, IWorkspaceAnalyzer):
     """
     Analyzes workspace structure to understand file patterns.
     
     Provides insights into file types, sizes, dates, and organization
     to help generate better pattern suggestions.
+    
+    Results are cached per root for ``cache_ttl`` seconds. After that the
+    tree is re-walked incrementally: a directory whose mtime is unchanged
+    reuses its cached listing instead of stat-ing every file. Since
+    editing a file in place does not touch its directory, all listings
+    are dropped after ``rescan_interval`` seconds.
+    
+    With a file or time budget, half of the budget goes to the walk. If
+    the walk cannot finish, the rest is spent on random root-to-leaf
+    probes (Knuth's tree size estimator) and the counts are estimated
+    from those. Listings from budgeted calls stay cached, so repeated
+    calls gradually complete the walk.
     """
     
-    def __init__(self):
+    # Minimum number of probes behind a sampled estimate
+    MIN_PROBES = 30
+    # Probes after which sampling stops regardless of the budget
+    MAX_PROBES = 10000
+    
+    def __init__(self, cache_ttl: float = 30.0, rescan_interval: float = 600.0,
+                 max_cached_roots: int = 8):
         super().__init__("workspace_analyzer")
         
         self._ignore_patterns = {
@@ -500,17 +502,30 @@ class WorkspaceAnalyzer(BasePatternComponent, IWorkspaceAnalyzer):
             '.vscode', '.idea', '.vs', 'target', 'build', 'dist'
         }
         
+        self.cache_ttl = cache_ttl
+        self.rescan_interval = rescan_interval
+        self.max_cached_roots = max_cached_roots
+        self._caches: "OrderedDict[str, _WorkspaceCache]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._random = random.Random()
+        
         self._logger.info("WorkspaceAnalyzer initialized")
     
-    def analyze(self, workspace_path: Path) -> Dict:
+    def analyze(self, workspace_path: Path, file_budget: Optional[int] = None,
+                time_budget: Optional[float] = None) -> Dict:
         """
         Analyze workspace and return file pattern insights.
         
         Args:
             workspace_path: Path to workspace to analyze
+            file_budget: Maximum number of files to stat in this call
+            time_budget: Maximum seconds to spend walking in this call
             
         Returns:
-            Dictionary with analysis results
+            Dictionary with analysis results. If the budget did not allow
+            a full walk, ``sampled`` is True, counts are estimates and
+            ``total_files_margin`` is the 95% error margin of
+            ``total_files``.
         """
         try:
             self._log_operation("analyze_workspace", workspace_path=str(workspace_path))
@@ -518,47 +533,42 @@ class WorkspaceAnalyzer(BasePatternComponent, IWorkspaceAnalyzer):
             if not workspace_path.exists() or not workspace_path.is_dir():
                 return {}
             
-            analysis = {
-                'total_files': 0,
-                'total_size': 0,
-                'common_extensions': [],
-                'common_directories': [],
-                'size_distribution': {},
-                'date_distribution': {},
-                'large_files_count': 0,
-                'empty_files_count': 0,
-                'hidden_files_count': 0,
-                'average_file_size': 0,
-                'newest_file_date': None,
-                'oldest_file_date': None
-            }
-            
-            # Collect file information
-            file_info = self._collect_file_info(workspace_path)
-            
-            # Analyze extensions
-            analysis['common_extensions'] = self._analyze_extensions(file_info)
-            
-            # Analyze directories
-            analysis['common_directories'] = self._analyze_directories(file_info)
-            
-            # Analyze sizes
-            analysis.update(self._analyze_sizes(file_info))
+            budgeted = file_budget is not None or time_budget is not None
             
-            # Analyze dates
-            analysis.update(self._analyze_dates(file_info))
-            
-            # Calculate totals
-            analysis['total_files'] = len(file_info)
-            analysis['total_size'] = sum(info['size'] for info in file_info)
-            analysis['average_file_size'] = (
-                analysis['total_size'] / analysis['total_files']
-                if analysis['total_files'] > 0 else 0
-            )
+            with self._lock:
+                cache = self._cache_for(workspace_path)
+                start = time.monotonic()
+                if (cache.analysis is not None and start - cache.analyzed_at < self.cache_ttl
+                        and (cache.complete or budgeted)):
+                    self._metrics.counter(f"{self._component_name}.analyze.cache_hit").inc()
+                    return dict(cache.analysis)
+                
+                deadline = start + time_budget if time_budget is not None else None
+                walk_budget = file_budget // 2 if file_budget is not None else None
+                walk_deadline = start + time_budget / 2 if time_budget is not None else None
+                
+                # Collect file information
+                columns, complete, stats = self._walk(workspace_path, cache, walk_budget, walk_deadline)
+                
+                if not complete:
+                    remaining = file_budget - stats if file_budget is not None else None
+                    analysis, spent = self._estimate_analysis(workspace_path, cache, remaining, deadline)
+                    if remaining is None or spent < remaining:
+                        # Probes stopped finding unlisted directories before the
+                        # budget ran out; the listings may now cover the whole tree
+                        columns, complete, _ = self._walk(
+                            workspace_path, cache,
+                            remaining - spent if remaining is not None else None, deadline)
+                if complete:
+                    analysis = self._build_analysis(columns)
+                
+                cache.analysis = analysis
+                cache.analyzed_at = time.monotonic()
+                cache.complete = complete
             
             self._logger.debug(f"Analyzed {analysis['total_files']} files in workspace")
             
-            return analysis
+            return dict(analysis)
             
         except Exception as e:
             self._log_error(e, "analyze_workspace", workspace_path=str(workspace_path))
@@ -573,106 +583,280 @@ class WorkspaceAnalyzer(BasePatternComponent, IWorkspaceAnalyzer):
             self._log_error(e, "get_common_extensions")
             return []
     
-    def _collect_file_info(self, workspace_path: Path) -> List[Dict]:
-        """Collect information about all files in workspace."""
-        file_info = []
+    def invalidate(self, workspace_path: Optional[Path] = None) -> None:
+        """Drop cached results for one root, or for all roots."""
+        with self._lock:
+            if workspace_path is None:
+                self._caches.clear()
+            else:
+                self._caches.pop(str(Path(workspace_path).resolve()), None)
+    
+    def _cache_for(self, workspace_path: Path) -> _WorkspaceCache:
+        key = str(workspace_path.resolve())
+        cache = self._caches.get(key)
+        if cache is None or time.monotonic() - cache.created_at > self.rescan_interval:
+            cache = self._caches[key] = _WorkspaceCache()
+        self._caches.move_to_end(key)
+        while len(self._caches) > self.max_cached_roots:
+            self._caches.popitem(last=False)
+        return cache
+    
+    def _build_analysis(self, columns: List[FileColumns]) -> Dict:
+        stats = aggregate(columns, ignore_directories=self._ignore_patterns)
+        
+        analysis = {
+            'total_files': stats['files'],
+            'total_size': stats['size'],
+            'common_extensions': self._analyze_extensions(stats),
+            'common_directories': self._analyze_directories(stats),
+            'size_distribution': {},
+            'date_distribution': {},
+            'large_files_count': 0,
+            'empty_files_count': 0,
+            'hidden_files_count': stats['hidden'],
+            'average_file_size': stats['size'] / stats['files'] if stats['files'] else 0,
+            'newest_file_date': None,
+            'oldest_file_date': None,
+            'sampled': False
+        }
         
-        try:
-            for root, dirs, files in os.walk(workspace_path):
-                # Skip ignored directories
-                dirs[:] = [d for d in dirs if d not in self._ignore_patterns]
+        # Analyze sizes
+        analysis.update(self._analyze_sizes(stats))
+        
+        # Analyze dates
+        analysis.update(self._analyze_dates(stats))
+        
+        return analysis
+    
+    def _estimate_analysis(self, workspace_path: Path, cache: _WorkspaceCache,
+                           file_budget: Optional[int],
+                           deadline: Optional[float]) -> Tuple[Dict, int]:
+        """
+        Estimate the analysis from random root-to-leaf probes.
+        
+        A probe descends from the root into a random subdirectory at each
+        level. A directory reached after choosing among b1, b2, ... bk
+        subdirectories stands for b1 * b2 * ... * bk directories like it,
+        so weighting its counts by that product and averaging over probes
+        gives unbiased estimates of every count in the analysis.
+        
+        Probing stops once the budget is spent, after ``MIN_PROBES``
+        probes in a row that only reached cached directories (the rest of
+        the budget cannot be spent on probes), or after ``MAX_PROBES``.
+        
+        Returns:
+            (estimated analysis, files stat-ed)
+        """
+        totals = Counter()
+        extensions = Counter()
+        directories = Counter()
+        size_distribution = Counter()
+        date_distribution = Counter()
+        file_estimates: List[float] = []
+        newest = oldest = None
+        stats = 0
+        stalled = 0
+        
+        while True:
+            probe_start = stats
+            weight = 1
+            probe_files = 0.0
+            directory = str(workspace_path)
+            
+            while directory is not None:
+                listing, stat_count = self._list_directory(directory, cache)
+                stats += stat_count
+                if listing is None:
+                    break
+                
+                summary = self._summarize(listing)
+                probe_files += weight * summary['files']
+                for key in ('files', 'size', 'empty', 'hidden'):
+                    totals[key] += weight * summary[key]
+                for counter, key in ((extensions, 'extensions'), (directories, 'directories'),
+                                     (size_distribution, 'size_buckets'),
+                                     (date_distribution, 'recency')):
+                    for name, count in summary[key].items():
+                        counter[name] += weight * count
+                if summary['newest'] is not None:
+                    newest = max(newest or summary['newest'], summary['newest'])
+                    oldest = min(oldest or summary['oldest'], summary['oldest'])
                 
-                for file in files:
-                    file_path = Path(root) / file
-                    
+                if not listing.subdirs:
+                    break
+                weight *= len(listing.subdirs)
+                directory = self._random.choice(listing.subdirs)
+            
+            file_estimates.append(probe_files)
+            stalled = stalled + 1 if stats == probe_start else 0
+            
+            if len(file_estimates) < self.MIN_PROBES:
+                continue
+            out_of_budget = ((file_budget is not None and stats >= file_budget) or
+                             (deadline is not None and time.monotonic() >= deadline))
+            if (out_of_budget or stalled >= self.MIN_PROBES
+                    or len(file_estimates) >= self.MAX_PROBES):
+                break
+        
+        probes = len(file_estimates)
+        
+        def estimate(value: float) -> int:
+            return round(value / probes)
+        
+        total_files = estimate(totals['files'])
+        total_size = estimate(totals['size'])
+        mean = totals['files'] / probes
+        variance = sum((value - mean) ** 2 for value in file_estimates) / (probes - 1)
+        
+        analysis = {
+            'total_files': total_files,
+            'total_size': total_size,
+            'common_extensions': [(name, estimate(count)) for name, count in extensions.most_common(20)],
+            'common_directories': [(name, estimate(count)) for name, count in directories.most_common(10)],
+            'size_distribution': {name: estimate(size_distribution[name])
+                                  for name in ('tiny', 'small', 'medium', 'large')},
+            'date_distribution': {name: estimate(date_distribution[name])
+                                  for name in ('last_week', 'last_month', 'last_year')},
+            'large_files_count': estimate(size_distribution['large']),
+            'empty_files_count': estimate(totals['empty']),
+            'hidden_files_count': estimate(totals['hidden']),
+            'recent_files_count': estimate(date_distribution['last_week']),
+            'average_file_size': total_size / total_files if total_files > 0 else 0,
+            'newest_file_date': self._isoformat(newest),
+            'oldest_file_date': self._isoformat(oldest),
+            'sampled': True,
+            'probes': probes,
+            'total_files_margin': round(1.96 * math.sqrt(variance / probes))
+        }
+        return analysis, stats
+    
+    def _summarize(self, listing: _DirectoryListing) -> Dict:
+        """Per-directory statistics used by sampled estimates."""
+        if listing.summary is None:
+            listing.summary = aggregate([listing.columns], ignore_directories=self._ignore_patterns)
+        return listing.summary
+    
+    def _walk(self, workspace_path: Path, cache: _WorkspaceCache, file_budget: Optional[int],
+              deadline: Optional[float]) -> Tuple[List[FileColumns], bool, int]:
+        """
+        Walk the workspace, reusing cached listings of unchanged directories.
+        
+        Returns:
+            (per-directory file columns, whether the walk finished, files stat-ed)
+        """
+        columns: List[FileColumns] = []
+        stat_count = 0
+        pending = [str(workspace_path)]
+        seen_directories: Set[str] = set()
+        
+        while pending:
+            if ((file_budget is not None and stat_count >= file_budget) or
+                    (deadline is not None and time.monotonic() >= deadline)):
+                return columns, False, stat_count
+            
+            directory = pending.pop()
+            seen_directories.add(directory)
+            
+            listing, stats = self._list_directory(directory, cache)
+            if listing is None:
+                continue
+            
+            stat_count += stats
+            columns.append(listing.columns)
+            pending.extend(listing.subdirs)
+        
+        # Forget listings of directories that no longer exist
+        for directory in list(cache.listings):
+            if directory not in seen_directories:
+                del cache.listings[directory]
+        
+        return columns, True, stat_count
+    
+    def _list_directory(self, directory: str,
+                        cache: _WorkspaceCache) -> Tuple[Optional[_DirectoryListing], int]:
+        """
+        List a directory, from the cache if its mtime is unchanged.
+        
+        Returns:
+            (listing or None if unreadable, number of files stat-ed)
+        """
+        try:
+            # Taken before scanning, so a change during the scan is caught next time
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            cache.listings.pop(directory, None)
+            return None, 0
+        
+        cached = cache.listings.get(directory)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached, 0
+        
+        columns = FileColumns(os.path.basename(directory))
+        subdirs = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     try:
-                        stat = file_path.stat()
-                        
-                        info = {
-                            'path': file_path,
-                            'name': file,
-                            'extension': file_path.suffix.lower().lstrip('.'),
-                            'directory': Path(root).name,
-                            'size': stat.st_size,
-                            'modified': datetime.fromtimestamp(stat.st_mtime),
-                            'created': datetime.fromtimestamp(stat.st_ctime),
-                            'is_hidden': file.startswith('.'),
-                            'is_empty': stat.st_size == 0
-                        }
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip ignored directories
+                            if entry.name not in self._ignore_patterns:
+                                subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
                         
-                        file_info.append(info)
+                        stat = entry.stat()
+                        columns.append(entry.name, stat.st_size, stat.st_mtime_ns)
                         
                     except (OSError, PermissionError):
                         # Skip files we can't access
                         continue
-                        
-        except Exception as e:
-            self._logger.debug(f"Error collecting file info: {e}")
+        except OSError as e:
+            self._logger.debug(f"Error listing {directory}: {e}")
+            return None, 0
         
-        return file_info
+        listing = _DirectoryListing(mtime_ns, columns, subdirs)
+        cache.listings[directory] = listing
+        return listing, len(columns)
     
-    def _analyze_extensions(self, file_info: List[Dict]) -> List[Tuple[str, int]]:
-        """Analyze file extensions and return most common ones."""
-        extension_counts = Counter()
-        
-        for info in file_info:
-            ext = info['extension']
-            if ext:  # Skip files without extensions
-                extension_counts[ext] += 1
-        
-        return extension_counts.most_common(20)
+    def _collect_file_info(self, workspace_path: Path) -> List[FileColumns]:
+        """Collect per-directory file columns for the whole workspace."""
+        with self._lock:
+            columns, _, _ = self._walk(workspace_path, self._cache_for(workspace_path), None, None)
+        return columns
     
-    def _analyze_directories(self, file_info: List[Dict]) -> List[Tuple[str, int]]:
-        """Analyze directory names and return most common ones."""
-        directory_counts = Counter()
-        
-        for info in file_info:
-            directory = info['directory']
-            if directory and directory not in self._ignore_patterns:
-                directory_counts[directory] += 1
-        
-        return directory_counts.most_common(10)
+    def _analyze_extensions(self, stats: Dict) -> List[Tuple[str, int]]:
+        """Return the most common file extensions."""
+        return stats['extensions'].most_common(20)
+    
+    def _analyze_directories(self, stats: Dict) -> List[Tuple[str, int]]:
+        """Return the most common directory names."""
+        return stats['directories'].most_common(10)
     
-    def _analyze_sizes(self, file_info: List[Dict]) -> Dict:
+    def _analyze_sizes(self, stats: Dict) -> Dict:
         """Analyze file size distribution."""
-        sizes = [info['size'] for info in file_info]
-        
-        large_files = sum(1 for size in sizes if size > 100 * 1024 * 1024)  # > 100MB
-        empty_files = sum(1 for size in sizes if size == 0)
-        
-        size_ranges = {
-            'tiny': sum(1 for size in sizes if 0 < size <= 1024),  # 0-1KB
-            'small': sum(1 for size in sizes if 1024 < size <= 1024 * 1024),  # 1KB-1MB
-            'medium': sum(1 for size in sizes if 1024 * 1024 < size <= 100 * 1024 * 1024),  # 1MB-100MB
-            'large': large_files  # > 100MB
-        }
-        
         return {
-            'large_files_count': large_files,
-            'empty_files_count': empty_files,
-            'size_distribution': size_ranges
+            'large_files_count': stats['size_buckets']['large'],
+            'empty_files_count': stats['empty'],
+            'size_distribution': dict(stats['size_buckets']),
+            'size_percentiles': dict(stats['percentiles'])
         }
     
-    def _analyze_dates(self, file_info: List[Dict]) -> Dict:
+    def _analyze_dates(self, stats: Dict) -> Dict:
         """Analyze file date distribution."""
-        if not file_info:
+        if not stats['files']:
             return {}
         
-        modified_dates = [info['modified'] for info in file_info]
-        created_dates = [info['created'] for info in file_info]
-        
-        now = datetime.now()
-        recent_cutoff = now - timedelta(days=7)
-        
-        recent_files = sum(1 for date in modified_dates if date > recent_cutoff)
-        
         return {
-            'newest_file_date': max(modified_dates).isoformat(),
-            'oldest_file_date': min(modified_dates).isoformat(),
-            'recent_files_count': recent_files,
-            'date_distribution': {
-                'last_week': recent_files,
-                'last_month': sum(1 for date in modified_dates if date > now - timedelta(days=30)),
-                'last_year': sum(1 for date in modified_dates if date > now - timedelta(days=365))
-            }
+            'newest_file_date': self._isoformat(stats['newest']),
+            'oldest_file_date': self._isoformat(stats['oldest']),
+            'recent_files_count': stats['recency']['last_week'],
+            'date_distribution': dict(stats['recency'])
         }
+    
+    @staticmethod
+    def _isoformat(timestamp_us: Optional[int]) -> Optional[str]:
+        if timestamp_us is None:
+            return None
+        return datetime.fromtimestamp(timestamp_us / 1_000_000).isoformat()
@@ -8,17 +8,20 @@ Integrates with pattern system and conflict resolution.
 import shutil
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, Hashable, Iterable, List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from ..patterns.interfaces import BasePatternComponent
 from ..patterns import PatternSystem
+from ..patterns.storage.cache_tags import rule_tag
+from ..logging.tracing import get_tracer
 from ..conflict_resolution import ConflictManager, ConflictType, ConflictScope, ConflictContext
 from ..conflict_resolution.models import ConflictItem
 from ..conflict_resolution.enums import ConflictSource
+from ..file_operations import OperationProgress
 from .models import Rule, RuleExecutionResult, RuleConflictInfo, RuleValidationResult, RuleStatus, ErrorHandlingBehavior, FileOperationResult
-from .storage import RuleRepository
-from .validation import RuleValidator
+from .storage import RuleRepository, SQLiteRuleRepository
+from .validation import RuleValidator, ValidationCache
 from .exceptions import RuleSystemError, RuleNotFoundError, RuleValidationError, RuleExecutionError, DestinationNotFoundError
 
 
@@ -33,13 +36,19 @@ class RuleService(BasePatternComponent):
     def __init__(self, 
                  pattern_system: PatternSystem,
                  conflict_manager: ConflictManager,
-                 storage_path: Path):
+                 storage_path: Path,
+                 storage_backend: str = "yaml"):
         super().__init__("rule_service")
         
         self._pattern_system = pattern_system
         self._conflict_manager = conflict_manager
-        self._repository = RuleRepository(storage_path)
+        if storage_backend.lower() == "sqlite":
+            self._repository = SQLiteRuleRepository(storage_path)
+        else:
+            self._repository = RuleRepository(storage_path)
         self._validator = RuleValidator(pattern_system)
+        self._validation_cache = ValidationCache(self._validator.validate_rule, pattern_system.get_pattern)
+        self._tracer = get_tracer()
         
         # Default error handling behavior (user configurable)
         self._default_error_handling = ErrorHandlingBehavior.CONTINUE_ON_RECOVERABLE
@@ -165,6 +174,8 @@ class RuleService(BasePatternComponent):
             
             # Update in repository
             self._repository.save(rule)
+            self._pattern_system.invalidate_rule_cache(rule.id)
+            self._validation_cache.invalidate(rule.id)
             
             self._logger.info(f"Updated rule: {rule.name} ({rule.id})")
             
@@ -190,6 +201,8 @@ class RuleService(BasePatternComponent):
             success = self._repository.delete(rule_id)
             
             if success:
+                self._pattern_system.invalidate_rule_cache(rule_id)
+                self._validation_cache.invalidate(rule_id)
                 self._logger.info(f"Deleted rule: {rule_id}")
             
             return success
@@ -235,7 +248,8 @@ class RuleService(BasePatternComponent):
     def execute_rule(self, 
                     rule_id: UUID, 
                     source_directory: Path,
-                    dry_run: bool = False) -> RuleExecutionResult:
+                    dry_run: bool = False,
+                    progress_callback: Optional[Callable[[OperationProgress], None]] = None) -> RuleExecutionResult:
         """
         Execute a single rule against a source directory.
         
@@ -243,6 +257,8 @@ class RuleService(BasePatternComponent):
             rule_id: ID of rule to execute
             source_directory: Directory to scan for files
             dry_run: If True, simulate execution without moving files
+            progress_callback: Called on the executing thread after each
+                matched file is processed
             
         Returns:
             RuleExecutionResult with execution details
@@ -279,67 +295,94 @@ class RuleService(BasePatternComponent):
             
             start_time = time.perf_counter()
             
-            try:
-                # Get pattern and find matching files
-                pattern = self._pattern_system.get_pattern(rule.pattern_id)
-                if not pattern:
-                    result.add_error(f"Pattern {rule.pattern_id} not found")
-                    result.complete(success=False)
-                    return result
-                
-                # Scan source directory for files
-                file_paths = list(source_directory.rglob("*"))
-                file_paths = [p for p in file_paths if p.is_file()]  # Only files, not directories
-                
-                # Match files against pattern
-                match_result = self._pattern_system.match_pattern(pattern, file_paths)
-                result.matched_files = match_result.matched_files
-                
-                if not result.matched_files:
-                    result.add_warning("No files matched the pattern")
+            with self._tracer.span("rule.execute", rule=rule.name, dry_run=dry_run):
+                try:
+                    # Get pattern and find matching files
+                    pattern = self._pattern_system.get_pattern(rule.pattern_id)
+                    if not pattern:
+                        result.add_error(f"Pattern {rule.pattern_id} not found")
+                        result.complete(success=False)
+                        return result
+                    
+                    # Scan source directory for files
+                    with self._tracer.span("rule.scan", directory=str(source_directory)) as span:
+                        entries = list(source_directory.rglob("*"))
+                        span.set_attribute("entries", len(entries))
+                    
+                    with self._tracer.span("rule.stat", entries=len(entries)) as span:
+                        file_paths = [p for p in entries if p.is_file()]  # Only files, not directories
+                        span.set_attribute("files", len(file_paths))
+                    
+                    # Match files against pattern
+                    with self._tracer.span("rule.match", files=len(file_paths)):
+                        match_result = self._pattern_system.match_pattern(
+                            pattern, file_paths, cache_tags=[rule_tag(rule.id)]
+                        )
+                    result.matched_files = match_result.matched_files
+                    
+                    if not result.matched_files:
+                        result.add_warning("No files matched the pattern")
+                        result.complete(success=True)
+                        return result
+                    
+                    # Execute file operations
+                    total_files = len(result.matched_files)
+                    with self._tracer.span("rule.move", files=total_files):
+                        for index, file_path in enumerate(result.matched_files, 1):
+                            operation_result = self._execute_file_move(
+                                file_path, 
+                                rule.destination_path, 
+                                dry_run,
+                                rule.error_handling
+                            )
+                            result.add_file_operation(operation_result)
+                            
+                            if progress_callback:
+                                elapsed = time.perf_counter() - start_time
+                                progress_callback(OperationProgress(
+                                    operation_id=str(rule.id),
+                                    total_bytes=0,
+                                    processed_bytes=0,
+                                    current_file=file_path,
+                                    files_processed=index,
+                                    total_files=total_files,
+                                    speed_bytes_per_second=0.0,
+                                    estimated_time_remaining=elapsed / index * (total_files - index)
+                                ))
+                            
+                            # Check if we should continue on error
+                            if not operation_result.success:
+                                if rule.error_handling == ErrorHandlingBehavior.STOP_ON_FIRST_ERROR:
+                                    result.add_error("Stopping execution due to error handling policy")
+                                    break
+                    
+                    # Update rule statistics
+                    if not dry_run:
+                        if result.files_moved:
+                            self._pattern_system.notify_directory_changed(source_directory)
+                            self._pattern_system.notify_directory_changed(rule.destination_path)
+                        rule.update_execution_stats(result.files_moved)
+                        self._repository.record_execution(rule)
+                    
+                    # Complete execution
                     result.complete(success=True)
+                    
+                    # Calculate execution time
+                    execution_time = (time.perf_counter() - start_time) * 1000
+                    result.execution_time_ms = execution_time
+                    
+                    self._log_performance("execute_rule", execution_time,
+                                        rule_name=rule.name,
+                                        files_matched=len(result.matched_files),
+                                        files_moved=result.files_moved,
+                                        dry_run=dry_run)
+                    
                     return result
-                
-                # Execute file operations
-                for file_path in result.matched_files:
-                    operation_result = self._execute_file_move(
-                        file_path, 
-                        rule.destination_path, 
-                        dry_run,
-                        rule.error_handling
-                    )
-                    result.add_file_operation(operation_result)
                     
-                    # Check if we should continue on error
-                    if not operation_result.success:
-                        if rule.error_handling == ErrorHandlingBehavior.STOP_ON_FIRST_ERROR:
-                            result.add_error("Stopping execution due to error handling policy")
-                            break
-                
-                # Update rule statistics
-                if not dry_run:
-                    rule.update_execution_stats(result.files_moved)
-                    self._repository.save(rule)
-                
-                # Complete execution
-                result.complete(success=True)
-                
-                # Calculate execution time
-                execution_time = (time.perf_counter() - start_time) * 1000
-                result.execution_time_ms = execution_time
-                
-                self._log_performance("execute_rule", execution_time,
-                                    rule_name=rule.name,
-                                    files_matched=len(result.matched_files),
-                                    files_moved=result.files_moved,
-                                    dry_run=dry_run)
-                
-                return result
-                
-            except Exception as e:
-                result.add_error(f"Execution failed: {e}")
-                result.complete(success=False)
-                raise RuleExecutionError(f"Rule execution failed: {e}", rule_id)
+                except Exception as e:
+                    result.add_error(f"Execution failed: {e}")
+                    result.complete(success=False)
+                    raise RuleExecutionError(f"Rule execution failed: {e}", rule_id)
                 
         except (RuleNotFoundError, RuleExecutionError, DestinationNotFoundError):
             raise
@@ -447,7 +490,8 @@ class RuleService(BasePatternComponent):
             # Check for conflicts
             if destination_path.exists():
                 # Use conflict resolution
-                conflict_result = self._resolve_file_conflict(source_path, destination_path)
+                with self._tracer.span("rule.conflict", file=source_path.name):
+                    conflict_result = self._resolve_file_conflict(source_path, destination_path)
                 
                 if conflict_result['resolved']:
                     destination_path = Path(conflict_result['final_destination'])
@@ -580,13 +624,51 @@ class RuleService(BasePatternComponent):
             RuleValidationResult with validation details
         """
         try:
-            return self._validator.validate_rule(rule)
+            return self._validation_cache.validate(rule, use_cache=False)
         except Exception as e:
             self._log_error(e, "validate_rule", rule_id=str(rule.id))
             result = RuleValidationResult(rule_id=rule.id, is_valid=False)
             result.add_error(f"Validation failed: {e}")
             return result
     
+    def get_cached_validation(self, rule: Rule) -> Optional[RuleValidationResult]:
+        """
+        Get the last validation result for a rule if it is still current.
+        
+        Args:
+            rule: Rule to look up
+            
+        Returns:
+            RuleValidationResult, or None if the rule or its pattern changed
+            since it was last validated
+        """
+        return self._validation_cache.get(rule)
+    
+    def validate_rules_async(self, rules: Iterable[Rule],
+                             callback: Callable[[RuleValidationResult], None],
+                             token: Hashable = None) -> Dict[UUID, RuleValidationResult]:
+        """
+        Validate rules in the background, reusing current results.
+        
+        Only rules whose ``modified_date`` or pattern changed since their
+        last validation are revalidated. Supersedes any earlier call with
+        the same token whose results are still outstanding.
+        
+        Args:
+            rules: Rules to validate
+            callback: Called from a worker thread with each new result
+            token: Identifies the caller, e.g. the view showing the results
+            
+        Returns:
+            Current cached results by rule ID; the remaining rules are
+            delivered to callback as they finish
+        """
+        return self._validation_cache.submit(rules, callback, token)
+    
+    def cancel_validation(self, token: Hashable = None) -> None:
+        """Stop delivering results of the last validate_rules_async call with token."""
+        self._validation_cache.cancel(token)
+    
     def detect_rule_conflicts(self, rules: Optional[List[Rule]] = None) -> List[RuleConflictInfo]:
         """
         Detect conflicts between rules.
@@ -623,6 +705,11 @@ class RuleService(BasePatternComponent):
             self._log_error(e, "get_rules_by_pattern", pattern_id=str(pattern_id))
             return []
     
+    def close(self) -> None:
+        """Stop background validation and flush pending rule and statistics writes."""
+        self._validation_cache.close()
+        self._repository.close()
+    
     # Settings
     
     def set_default_error_handling(self, behavior: ErrorHandlingBehavior) -> None:
@@ -1,11 +1,15 @@
 """
 Rule Storage Components
 
-Repository for persistent rule storage with YAML serialization.
+Repositories for persistent rule storage with YAML or SQLite backends.
 """
 
 from .repository import RuleRepository
+from .sqlite_repository import SQLiteRuleRepository
+from .stats_store import RuleStatsStore
 
 __all__ = [
-    "RuleRepository"
+    "RuleRepository",
+    "SQLiteRuleRepository",
+    "RuleStatsStore"
 ]
@@ -5,15 +5,21 @@ Handles storage, retrieval, and management of rules with
 YAML serialization and data persistence.
 """
 
+import shutil
+import threading
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from uuid import UUID
 from datetime import datetime
 
 from ...patterns.interfaces import BasePatternComponent
+from ...storage.snapshot import StartupSnapshot, YamlDumper, load_yaml
+from ...storage.write_behind import DebouncedFlush, atomic_write_text
 from ..models import Rule, RuleValidationResult
 from ..exceptions import RuleSystemError, RuleNotFoundError
+from .stats_store import RuleStatsStore
 
 
 class RuleRepository(BasePatternComponent):
@@ -21,22 +27,47 @@ class RuleRepository(BasePatternComponent):
     Repository for rule storage and retrieval.
     
     Uses YAML format for human-readable persistence with automatic backup.
+    Writes are coalesced: changes mark rules dirty and a debounced flush
+    rewrites the file at most once per ``flush_delay`` seconds through an
+    atomic rename. Backups are taken at most once per ``backup_interval``.
+    Execution statistics live in a separate ``RuleStatsStore``. The parsed
+    rules file is cached in a binary startup snapshot.
     """
     
-    def __init__(self, storage_path: Path):
+    def __init__(self, 
+                 storage_path: Path,
+                 flush_delay: float = 1.0,
+                 backup_interval: float = 300.0,
+                 max_backups: int = 10,
+                 use_snapshot: bool = True):
         super().__init__("rule_repository")
         
         self._storage_path = Path(storage_path)
         self._rules_file = self._storage_path / "rules.yaml"
         self._backup_dir = self._storage_path / "backups"
+        self._backup_interval = backup_interval
+        self._max_backups = max_backups
+        self._snapshot = StartupSnapshot(
+            self._storage_path / "rules.snapshot", [self._rules_file]
+        ) if use_snapshot else None
         
         # In-memory cache for performance
         self._rules_cache: Dict[UUID, Rule] = {}
         self._cache_dirty = False
         
+        # Write-behind state: serialized form of clean rules is reused
+        self._serialized: Dict[UUID, Dict[str, Any]] = {}
+        self._dirty_ids: Set[UUID] = set()
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._last_backup = 0.0
+        self._flusher = DebouncedFlush(self.flush, flush_delay, name="RuleRepositoryFlush")
+        
         # Ensure storage directory exists
         self._initialize_storage()
         
+        self._stats = RuleStatsStore(self._storage_path / "rule_stats.json", flush_delay)
+        
         # Load existing data
         self._load_rules()
         
@@ -51,28 +82,47 @@ class RuleRepository(BasePatternComponent):
             # Create empty rules file if it doesn't exist
             if not self._rules_file.exists():
                 self._rules_file.write_text("rules: []\n", encoding='utf-8')
+            
+            # Rate-limit backups across restarts using the newest backup
+            backups = list(self._backup_dir.glob("rules_backup_*.yaml"))
+            if backups:
+                self._last_backup = max(b.stat().st_mtime for b in backups)
                 
         except Exception as e:
             self._log_error(e, "initialize_storage")
             raise RuleSystemError(f"Failed to initialize rule storage: {e}")
     
     def _load_rules(self) -> None:
-        """Load rules from storage file."""
+        """Load rules from the startup snapshot or storage file."""
         try:
             if not self._rules_file.exists():
                 return
             
-            with open(self._rules_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            if not data or 'rules' not in data:
-                return
+            rules_data = self._snapshot.load() if self._snapshot else None
+            if rules_data is None:
+                # Fingerprint before reading so a concurrent edit invalidates the snapshot
+                fingerprints = self._snapshot.fingerprint() if self._snapshot else None
+                with open(self._rules_file, 'r', encoding='utf-8') as f:
+                    data = load_yaml(f)
+                
+                if not data or 'rules' not in data:
+                    return
+                
+                rules_data = data['rules'] or []
+                if fingerprints is not None:
+                    self._snapshot.save(rules_data, fingerprints)
             
             # Deserialize rules
-            for rule_data in data['rules']:
+            for rule_data in rules_data:
                 try:
                     rule = self._deserialize_rule(rule_data)
                     self._rules_cache[rule.id] = rule
+                    
+                    if self._stats.has(rule.id):
+                        self._stats.apply(rule)
+                    elif rule.execution_count or rule.last_executed:
+                        # Migrate statistics stored in older rules files
+                        self._stats.record(rule)
                 except Exception as e:
                     self._logger.warning(f"Failed to load rule: {e}")
                     
@@ -84,54 +134,99 @@ class RuleRepository(BasePatternComponent):
             # Don't raise - allow empty repository on load failure
             self._logger.warning(f"Failed to load rules, starting with empty repository: {e}")
     
-    def _persist_rules(self) -> None:
-        """Persist all rules to storage file."""
-        try:
-            # Create backup before saving
-            self._create_backup()
-            
-            # Serialize all rules
-            rules_data = []
-            for rule in self._rules_cache.values():
-                rules_data.append(self._serialize_rule(rule))
-            
-            data = {
-                'rules': rules_data,
-                'metadata': {
-                    'version': '1.0',
-                    'created': datetime.utcnow().isoformat(),
-                    'rule_count': len(rules_data)
-                }
+    def _mark_dirty(self, rule_id: UUID) -> None:
+        """Record a change and schedule a flush."""
+        with self._lock:
+            self._dirty_ids.add(rule_id)
+            self._serialized.pop(rule_id, None)
+            self._cache_dirty = True
+        self._flusher.schedule()
+    
+    def flush(self) -> None:
+        """
+        Write pending changes to the rules file.
+        
+        Raises:
+            RuleSystemError: If the file cannot be written
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._cache_dirty:
+                    return
+                
+                # Only rules changed since the last flush are re-serialized
+                rules_data = []
+                for rule_id, rule in self._rules_cache.items():
+                    serialized = self._serialized.get(rule_id)
+                    if serialized is None:
+                        serialized = self._serialize_rule(rule)
+                        self._serialized[rule_id] = serialized
+                    rules_data.append(serialized)
+                
+                flushed_ids = self._dirty_ids
+                self._dirty_ids = set()
+                self._cache_dirty = False
+            
+            try:
+                self._persist_rules(rules_data)
+                self._logger.debug(lambda: f"Persisted {len(rules_data)} rules to storage "
+                                           f"({len(flushed_ids)} changed)")
+            except Exception as e:
+                with self._lock:
+                    self._dirty_ids |= flushed_ids
+                    self._cache_dirty = True
+                self._log_error(e, "persist_rules")
+                raise RuleSystemError(f"Failed to persist rules: {e}")
+    
+    def close(self) -> None:
+        """Flush pending rule and statistics changes."""
+        self._flusher.flush_now()
+        self.flush()
+        self._stats.close()
+    
+    def _persist_rules(self, rules_data: List[Dict[str, Any]]) -> None:
+        """Persist serialized rules to storage file."""
+        # Create backup before saving
+        self._create_backup()
+        
+        data = {
+            'rules': rules_data,
+            'metadata': {
+                'version': '1.0',
+                'created': datetime.utcnow().isoformat(),
+                'rule_count': len(rules_data)
             }
-            
-            # Write to file
-            with open(self._rules_file, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
-            
-            self._cache_dirty = False
-            self._logger.debug(f"Persisted {len(rules_data)} rules to storage")
-            
-        except Exception as e:
-            self._log_error(e, "persist_rules")
-            raise RuleSystemError(f"Failed to persist rules: {e}")
+        }
+        
+        text = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False,
+                         sort_keys=False, indent=2)
+        atomic_write_text(self._rules_file, text)
+        
+        if self._snapshot is not None and not self._snapshot.save(rules_data):
+            # A stale snapshot must never outlive the file it mirrors
+            self._snapshot.invalidate()
     
     def _create_backup(self) -> None:
-        """Create a backup of the current rules file."""
+        """Create a backup of the current rules file, at most once per backup interval."""
         try:
             if not self._rules_file.exists():
                 return
             
+            now = time.time()
+            if now - self._last_backup < self._backup_interval:
+                return
+            
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             backup_file = self._backup_dir / f"rules_backup_{timestamp}.yaml"
             
             # Copy current file to backup
-            import shutil
             shutil.copy2(self._rules_file, backup_file)
+            self._last_backup = now
             
-            # Clean old backups (keep last 10)
+            # Clean old backups
             backups = sorted(self._backup_dir.glob("rules_backup_*.yaml"))
-            if len(backups) > 10:
-                for old_backup in backups[:-10]:
+            if len(backups) > self._max_backups:
+                for old_backup in backups[:-self._max_backups]:
                     old_backup.unlink()
                     
         except Exception as e:
@@ -150,10 +245,7 @@ class RuleRepository(BasePatternComponent):
             'error_handling': rule.error_handling.value,
             'created_date': rule.created_date.isoformat(),
             'modified_date': rule.modified_date.isoformat(),
-            'author': rule.author,
-            'last_executed': rule.last_executed.isoformat() if rule.last_executed else None,
-            'execution_count': rule.execution_count,
-            'files_processed': rule.files_processed
+            'author': rule.author
         }
     
     def _deserialize_rule(self, data: Dict[str, Any]) -> Rule:
@@ -193,12 +285,13 @@ class RuleRepository(BasePatternComponent):
             # Update modified timestamp
             rule.modified_date = datetime.utcnow()
             
-            # Add to cache
-            self._rules_cache[rule.id] = rule
-            self._cache_dirty = True
+            # Add to cache and schedule persistence
+            with self._lock:
+                self._rules_cache[rule.id] = rule
+            self._mark_dirty(rule.id)
             
-            # Persist to storage
-            self._persist_rules()
+            if rule.execution_count or rule.last_executed:
+                self._stats.record(rule)
             
             self._logger.info(f"Rule saved: {rule.name} ({rule.id})")
             
@@ -206,6 +299,15 @@ class RuleRepository(BasePatternComponent):
             self._log_error(e, "save_rule", rule_id=str(rule.id))
             raise RuleSystemError(f"Failed to save rule {rule.id}: {e}")
     
+    def record_execution(self, rule: Rule) -> None:
+        """
+        Persist a rule's execution statistics without rewriting the rules file.
+        
+        Args:
+            rule: Rule whose statistics were updated
+        """
+        self._stats.record(rule)
+    
     def get(self, rule_id: UUID) -> Optional[Rule]:
         """
         Retrieve a rule by ID.
@@ -219,10 +321,10 @@ class RuleRepository(BasePatternComponent):
         try:
             rule = self._rules_cache.get(rule_id)
             if rule:
-                self._log_operation("get_rule", rule_id=str(rule_id), found=True)
+                self._metrics.counter(f"{self._component_name}.get_rule.hit").inc()
                 return rule
             else:
-                self._log_operation("get_rule", rule_id=str(rule_id), found=False)
+                self._metrics.counter(f"{self._component_name}.get_rule.miss").inc()
                 return None
                 
         except Exception as e:
@@ -242,10 +344,12 @@ class RuleRepository(BasePatternComponent):
         try:
             self._log_operation("delete_rule", rule_id=str(rule_id))
             
-            if rule_id in self._rules_cache:
-                del self._rules_cache[rule_id]
-                self._cache_dirty = True
-                self._persist_rules()
+            with self._lock:
+                removed = self._rules_cache.pop(rule_id, None)
+            
+            if removed is not None:
+                self._mark_dirty(rule_id)
+                self._stats.remove(rule_id)
                 
                 self._logger.info(f"Rule deleted: {rule_id}")
                 return True
@@ -359,6 +463,7 @@ class RuleRepository(BasePatternComponent):
                 'active_rules': active_rules,
                 'inactive_rules': total_rules - active_rules,
                 'cache_dirty': self._cache_dirty,
+                'pending_writes': len(self._dirty_ids),
                 'storage_file': str(self._rules_file),
                 'storage_exists': self._rules_file.exists()
             }
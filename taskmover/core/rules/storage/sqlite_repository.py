@@ -0,0 +1,441 @@
+"""
+SQLite Rule Repository
+
+Rule storage on ``storage.backends.SQLiteBackend`` with indexed columns
+for name, pattern_id, enabled state and priority, and a trigram FTS index
+for search. Each save is a single-row upsert; execution statistics stay
+in the ``RuleStatsStore``.
+
+YAML remains the import/export format through ``export_yaml()`` and
+``import_yaml()``, and an existing ``rules.yaml`` is imported the first
+time the database is created.
+"""
+
+import json
+import yaml
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+from datetime import datetime
+
+from ...storage import StorageBackend, StorageConfig
+from ...storage.backends import SQLiteBackend
+from ...storage.snapshot import YamlDumper, load_yaml
+from ...storage.write_behind import atomic_write_text
+from ..models import Rule
+from ..exceptions import RuleSystemError
+from .repository import RuleRepository
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS rules (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        pattern_id TEXT NOT NULL,
+        is_enabled INTEGER NOT NULL,
+        priority INTEGER NOT NULL,
+        search_text TEXT NOT NULL,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_rules_name ON rules (name)",
+    "CREATE INDEX IF NOT EXISTS idx_rules_pattern ON rules (pattern_id, priority)",
+    "CREATE INDEX IF NOT EXISTS idx_rules_order ON rules (priority DESC, name)",
+    "CREATE INDEX IF NOT EXISTS idx_rules_enabled ON rules (is_enabled, priority DESC, name)",
+]
+
+# Search index rows share the rowid of their rule row, so saves and
+# deletes replace one index row by rowid instead of scanning the index
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS rules_fts USING fts5("
+    "search_text, tokenize='trigram')"
+)
+
+# Trigram FTS cannot match fewer than three characters
+_MIN_FTS_QUERY = 3
+
+
+class SQLiteRuleRepository(RuleRepository):
+    """
+    SQLite-backed rule repository.
+
+    Behaves like ``RuleRepository``; listing, search and lookups by
+    pattern run against indexes, and saves write one row immediately.
+    """
+
+    def __init__(self, storage_path: Path, database_name: str = "rules.db", **kwargs):
+        self._database_path = Path(storage_path) / database_name
+        self._backend = SQLiteBackend()
+        self._fts_enabled = False
+        kwargs.setdefault("use_snapshot", False)
+        super().__init__(storage_path, **kwargs)
+
+    def save(self, rule: Rule) -> None:
+        """
+        Save a rule to storage.
+
+        Args:
+            rule: Rule to save
+
+        Raises:
+            RuleSystemError: If save operation fails
+        """
+        try:
+            self._log_operation("save_rule", rule_id=str(rule.id), rule_name=rule.name)
+
+            # Update modified timestamp
+            rule.modified_date = datetime.utcnow()
+
+            with self._backend.transaction() as cursor:
+                self._upsert_rule(cursor, rule)
+
+            with self._lock:
+                self._rules_cache[rule.id] = rule
+
+            if rule.execution_count or rule.last_executed:
+                self._stats.record(rule)
+
+            self._logger.info(f"Rule saved: {rule.name} ({rule.id})")
+
+        except Exception as e:
+            self._log_error(e, "save_rule", rule_id=str(rule.id))
+            raise RuleSystemError(f"Failed to save rule {rule.id}: {e}")
+
+    def get(self, rule_id: UUID) -> Optional[Rule]:
+        """
+        Retrieve a rule by ID.
+
+        Args:
+            rule_id: UUID of the rule to retrieve
+
+        Returns:
+            Rule if found, None otherwise
+        """
+        try:
+            rule = self._rules_cache.get(rule_id)
+            if rule is None:
+                rows = self._backend.execute_sql(
+                    "SELECT id, data FROM rules WHERE id = ?", [str(rule_id)]
+                )
+                rule = self._materialize(rows)[0] if rows else None
+
+            if rule:
+                self._metrics.counter(f"{self._component_name}.get_rule.hit").inc()
+                return rule
+            else:
+                self._metrics.counter(f"{self._component_name}.get_rule.miss").inc()
+                return None
+
+        except Exception as e:
+            self._log_error(e, "get_rule", rule_id=str(rule_id))
+            return None
+
+    def delete(self, rule_id: UUID) -> bool:
+        """
+        Delete a rule from storage.
+
+        Args:
+            rule_id: UUID of the rule to delete
+
+        Returns:
+            True if rule was deleted, False if not found
+        """
+        try:
+            self._log_operation("delete_rule", rule_id=str(rule_id))
+
+            with self._backend.transaction() as cursor:
+                row = cursor.execute(
+                    "SELECT rowid FROM rules WHERE id = ?", (str(rule_id),)
+                ).fetchone()
+                deleted = row is not None
+                if deleted:
+                    cursor.execute("DELETE FROM rules WHERE rowid = ?", (row[0],))
+                    if self._fts_enabled:
+                        cursor.execute("DELETE FROM rules_fts WHERE rowid = ?", (row[0],))
+
+            with self._lock:
+                self._rules_cache.pop(rule_id, None)
+
+            if deleted:
+                self._stats.remove(rule_id)
+                self._logger.info(f"Rule deleted: {rule_id}")
+                return True
+            else:
+                self._logger.info(f"Rule not found for deletion: {rule_id}")
+                return False
+
+        except Exception as e:
+            self._log_error(e, "delete_rule", rule_id=str(rule_id))
+            raise RuleSystemError(f"Failed to delete rule {rule_id}: {e}")
+
+    def list_rules(self, active_only: bool = False) -> List[Rule]:
+        """
+        List all rules with optional filtering.
+
+        Args:
+            active_only: If True, only return enabled rules
+
+        Returns:
+            List of rules matching criteria
+        """
+        try:
+            sql = "SELECT id, data FROM rules"
+            if active_only:
+                sql += " WHERE is_enabled = 1"
+            sql += " ORDER BY priority DESC, name, rowid"
+            rules = self._materialize(self._backend.execute_sql(sql))
+
+            self._log_operation("list_rules",
+                              filtered_count=len(rules),
+                              active_only=active_only)
+
+            return rules
+
+        except Exception as e:
+            self._log_error(e, "list_rules")
+            return []
+
+    def search_rules(self, query: str) -> List[Rule]:
+        """
+        Search rules by name or description.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of rules matching the query
+        """
+        try:
+            query_lower = query.lower()
+            if self._fts_enabled and len(query_lower) >= _MIN_FTS_QUERY:
+                rows = self._backend.execute_sql(
+                    "SELECT id, data FROM rules WHERE rowid IN "
+                    "(SELECT rowid FROM rules_fts WHERE rules_fts MATCH ?) "
+                    "ORDER BY priority DESC, name, rowid",
+                    ['"' + query_lower.replace('"', '""') + '"']
+                )
+            else:
+                rows = self._backend.execute_sql(
+                    "SELECT id, data FROM rules WHERE instr(search_text, ?) > 0 "
+                    "ORDER BY priority DESC, name, rowid",
+                    [query_lower]
+                )
+
+            matched_rules = [
+                rule for rule in self._materialize(rows)
+                if (query_lower in rule.name.lower() or
+                    query_lower in rule.description.lower())
+            ]
+
+            self._log_operation("search_rules",
+                              query=query,
+                              results_count=len(matched_rules))
+
+            return matched_rules
+
+        except Exception as e:
+            self._log_error(e, "search_rules", query=query)
+            return []
+
+    def get_rules_by_pattern(self, pattern_id: UUID) -> List[Rule]:
+        """
+        Get all rules that use a specific pattern.
+
+        Args:
+            pattern_id: UUID of the pattern
+
+        Returns:
+            List of rules using the pattern
+        """
+        try:
+            matching_rules = self._materialize(self._backend.execute_sql(
+                "SELECT id, data FROM rules WHERE pattern_id = ? ORDER BY priority DESC, rowid",
+                [str(pattern_id)]
+            ))
+
+            self._log_operation("get_rules_by_pattern",
+                              pattern_id=str(pattern_id),
+                              rules_count=len(matching_rules))
+
+            return matching_rules
+
+        except Exception as e:
+            self._log_error(e, "get_rules_by_pattern", pattern_id=str(pattern_id))
+            return []
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get repository statistics."""
+        try:
+            row = self._backend.execute_sql(
+                "SELECT COUNT(*) AS total, COALESCE(SUM(is_enabled), 0) AS active FROM rules"
+            )[0]
+
+            return {
+                'total_rules': row['total'],
+                'active_rules': row['active'],
+                'inactive_rules': row['total'] - row['active'],
+                'cache_dirty': False,
+                'pending_writes': 0,
+                'storage_file': str(self._database_path),
+                'storage_exists': self._database_path.exists()
+            }
+
+        except Exception as e:
+            self._log_error(e, "get_statistics")
+            return {}
+
+    def export_yaml(self, path: Path) -> Path:
+        """
+        Export all rules in the ``rules.yaml`` format.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path of the written file
+        """
+        try:
+            rows = self._backend.execute_sql("SELECT data FROM rules ORDER BY rowid")
+            rules_data = [json.loads(row['data']) for row in rows]
+            data = {
+                'rules': rules_data,
+                'metadata': {
+                    'version': '1.0',
+                    'created': datetime.utcnow().isoformat(),
+                    'rule_count': len(rules_data)
+                }
+            }
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, yaml.dump(data, Dumper=YamlDumper, default_flow_style=False,
+                                              sort_keys=False, indent=2))
+            return path
+
+        except Exception as e:
+            self._log_error(e, "export_yaml", path=str(path))
+            raise RuleSystemError(f"Failed to export rules: {e}")
+
+    def import_yaml(self, path: Path) -> int:
+        """
+        Import rules from a ``rules.yaml`` file, replacing rules with the same ID.
+
+        Args:
+            path: Source file
+
+        Returns:
+            Number of rules imported
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = load_yaml(f) or {}
+
+            rules = []
+            for rule_data in data.get('rules') or []:
+                try:
+                    rules.append(self._deserialize_rule(rule_data))
+                except Exception as e:
+                    self._logger.warning(f"Failed to import rule: {e}")
+
+            with self._backend.transaction() as cursor:
+                for rule in rules:
+                    self._upsert_rule(cursor, rule)
+
+            with self._lock:
+                for rule in rules:
+                    self._rules_cache[rule.id] = rule
+                    if self._stats.has(rule.id):
+                        self._stats.apply(rule)
+                    elif rule.execution_count or rule.last_executed:
+                        self._stats.record(rule)
+
+            self._logger.info(f"Imported {len(rules)} rules from {path}")
+            return len(rules)
+
+        except Exception as e:
+            self._log_error(e, "import_yaml", path=str(path))
+            raise RuleSystemError(f"Failed to import rules: {e}")
+
+    def close(self) -> None:
+        """Flush statistics and close the database connection."""
+        super().close()
+        self._backend.disconnect()
+
+    def _initialize_storage(self) -> None:
+        """Open the database and create the schema."""
+        try:
+            self._storage_path.mkdir(parents=True, exist_ok=True)
+
+            self._backend.connect(StorageConfig(
+                backend=StorageBackend.SQLITE,
+                connection_string=str(self._database_path)
+            ))
+
+            with self._backend.transaction() as cursor:
+                for statement in _SCHEMA:
+                    cursor.execute(statement)
+
+            self._fts_enabled = self._backend.supports_trigram_fts()
+            if self._fts_enabled:
+                self._create_search_index()
+
+        except Exception as e:
+            self._log_error(e, "initialize_storage")
+            raise RuleSystemError(f"Failed to initialize rule storage: {e}")
+
+    def _create_search_index(self) -> None:
+        """Create the FTS index, rebuilding one keyed by the old ``rule_id`` column."""
+        with self._backend.transaction() as cursor:
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(rules_fts)")]
+            if columns == ['search_text']:
+                return
+            if columns:
+                cursor.execute("DROP TABLE rules_fts")
+            cursor.execute(_FTS_SCHEMA)
+            cursor.execute(
+                "INSERT INTO rules_fts (rowid, search_text) SELECT rowid, search_text FROM rules"
+            )
+
+    def _load_rules(self) -> None:
+        """Import an existing rules.yaml into a new database."""
+        try:
+            count = self._backend.execute_sql("SELECT COUNT(*) AS n FROM rules")[0]['n']
+            if count == 0 and self._rules_file.exists():
+                self.import_yaml(self._rules_file)
+        except Exception as e:
+            self._log_error(e, "load_rules")
+            self._logger.warning(f"Failed to import rules, starting with empty repository: {e}")
+
+    def _upsert_rule(self, cursor, rule: Rule) -> None:
+        """Write one rule row with its search index entry."""
+        rule_id = str(rule.id)
+        search_text = "\n".join(value.lower() for value in (rule.name, rule.description) if value)
+        cursor.execute(
+            """INSERT INTO rules (id, name, pattern_id, is_enabled, priority, search_text, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   name = excluded.name, pattern_id = excluded.pattern_id,
+                   is_enabled = excluded.is_enabled, priority = excluded.priority,
+                   search_text = excluded.search_text, data = excluded.data""",
+            (
+                rule_id, rule.name, str(rule.pattern_id), int(rule.is_enabled),
+                rule.priority, search_text, json.dumps(self._serialize_rule(rule)),
+            )
+        )
+        if self._fts_enabled:
+            cursor.execute(
+                "INSERT OR REPLACE INTO rules_fts (rowid, search_text) "
+                "SELECT rowid, search_text FROM rules WHERE id = ?",
+                (rule_id,)
+            )
+
+    def _materialize(self, rows: Iterable[Dict[str, Any]]) -> List[Rule]:
+        """Map rows to rules through the identity map."""
+        rules = []
+        with self._lock:
+            for row in rows:
+                rule_id = UUID(row['id'])
+                rule = self._rules_cache.get(rule_id)
+                if rule is None:
+                    rule = self._deserialize_rule(json.loads(row['data']))
+                    self._stats.apply(rule)
+                    self._rules_cache[rule_id] = rule
+                rules.append(rule)
+        return rules
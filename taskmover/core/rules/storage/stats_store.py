@@ -0,0 +1,112 @@
+"""
+Rule Execution Statistics Store
+
+Keeps per-rule execution counters in a small JSON file next to the rule
+definitions so that recording a run never rewrites ``rules.yaml``.
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from ...patterns.interfaces import BasePatternComponent
+from ...storage.write_behind import DebouncedFlush, atomic_write_text
+from ..models import Rule
+
+
+class RuleStatsStore(BasePatternComponent):
+    """
+    Write-behind store for rule execution statistics.
+
+    Updates are applied in memory and flushed at most once per
+    ``flush_delay`` seconds.
+    """
+
+    def __init__(self, stats_file: Path, flush_delay: float = 1.0):
+        super().__init__("rule_stats_store")
+
+        self._stats_file = Path(stats_file)
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._flusher = DebouncedFlush(self.flush, flush_delay, name="RuleStatsFlush")
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load statistics from the stats file."""
+        if not self._stats_file.exists():
+            return
+        try:
+            with open(self._stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._stats = data.get('rules', {})
+        except Exception as e:
+            self._logger.warning(f"Failed to load rule statistics, starting empty: {e}")
+
+    def has(self, rule_id: UUID) -> bool:
+        """Check whether statistics exist for a rule."""
+        return str(rule_id) in self._stats
+
+    def apply(self, rule: Rule) -> None:
+        """Copy stored statistics onto a rule."""
+        stats = self._stats.get(str(rule.id))
+        if not stats:
+            return
+        last_executed = stats.get('last_executed')
+        rule.last_executed = datetime.fromisoformat(last_executed) if last_executed else None
+        rule.execution_count = stats.get('execution_count', 0)
+        rule.files_processed = stats.get('files_processed', 0)
+
+    def record(self, rule: Rule) -> None:
+        """Store a rule's current statistics and schedule a flush."""
+        with self._lock:
+            self._stats[str(rule.id)] = {
+                'last_executed': rule.last_executed.isoformat() if rule.last_executed else None,
+                'execution_count': rule.execution_count,
+                'files_processed': rule.files_processed
+            }
+            self._dirty = True
+        self._flusher.schedule()
+
+    def remove(self, rule_id: UUID) -> None:
+        """Forget statistics for a deleted rule."""
+        with self._lock:
+            if self._stats.pop(str(rule_id), None) is None:
+                return
+            self._dirty = True
+        self._flusher.schedule()
+
+    def get(self, rule_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get stored statistics for a rule."""
+        stats = self._stats.get(str(rule_id))
+        return dict(stats) if stats else None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether statistics changed since the last flush."""
+        return self._dirty
+
+    def flush(self) -> None:
+        """Write statistics to disk if they changed."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                text = json.dumps({'rules': self._stats}, separators=(',', ':'))
+                self._dirty = False
+            try:
+                atomic_write_text(self._stats_file, text)
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                self._log_error(e, "flush_stats")
+
+    def close(self) -> None:
+        """Flush pending statistics."""
+        self._flusher.flush_now()
+        self.flush()
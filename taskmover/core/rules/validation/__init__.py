@@ -5,7 +5,9 @@ Validation logic for rules including conflict detection.
 """
 
 from .rule_validator import RuleValidator
+from .validation_cache import ValidationCache
 
 __all__ = [
-    "RuleValidator"
+    "RuleValidator",
+    "ValidationCache"
 ]
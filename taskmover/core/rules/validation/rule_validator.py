@@ -5,6 +5,7 @@ Comprehensive validation logic for rules including pattern conflicts,
 priority analysis, and reachability detection.
 """
 
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 from uuid import UUID
@@ -64,11 +65,11 @@ class RuleValidator(BasePatternComponent):
                 elif not rule.destination_path.is_dir():
                     result.add_error(f"Destination path is not a directory: {rule.destination_path}")
                 else:
-                    # Check if destination is writable
+                    # Check if destination is writable; a uniquely named probe
+                    # lets rules sharing a destination be validated concurrently
                     try:
-                        test_file = rule.destination_path / ".write_test"
-                        test_file.touch()
-                        test_file.unlink()
+                        with tempfile.TemporaryFile(prefix=".write_test", dir=rule.destination_path):
+                            pass
                     except Exception:
                         result.add_warning(f"Destination directory may not be writable: {rule.destination_path}")
             
@@ -0,0 +1,202 @@
+"""
+Rule Validation Cache
+
+Memoizes rule validation results so listing rules does not revalidate
+every rule each time. A result stays fresh while the rule's
+``modified_date`` and the version of the pattern it references are
+unchanged; stale rules are revalidated in batches on a worker pool and
+each result is delivered to a callback as soon as it is ready.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from ...patterns.interfaces import BasePatternComponent
+from ..models import Rule, RuleValidationResult
+
+
+class ValidationCache(BasePatternComponent):
+    """
+    Memoized, background rule validation.
+
+    Results are keyed by rule ID and stored with the fingerprint the rule
+    had when validation started, so a rule edited while it was being
+    validated is revalidated on the next lookup.
+
+    Background submissions are grouped by a caller token: a submission
+    supersedes only earlier ones with the same token, so callers never
+    cancel each other's deliveries.
+    """
+
+    # Rules validated per worker task
+    BATCH_SIZE = 64
+
+    def __init__(self, validate: Callable[[Rule], RuleValidationResult],
+                 pattern_lookup: Callable[[UUID], Any],
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            validate: Validates one rule; must not raise
+            pattern_lookup: Returns the pattern with an ID, or None
+            max_workers: Worker threads (defaults to min(4, CPU count))
+        """
+        super().__init__("rule_validation_cache")
+        self._validate = validate
+        self._pattern_lookup = pattern_lookup
+        self._max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: Dict[UUID, Tuple[Hashable, RuleValidationResult]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Current submission generation of each caller token
+        self._current: Dict[Hashable, int] = {}
+
+    def fingerprint(self, rule: Rule, patterns: Optional[Dict[UUID, Hashable]] = None) -> Hashable:
+        """
+        Key a validation result is valid for.
+
+        Args:
+            rule: Rule to fingerprint
+            patterns: Pattern versions already looked up, shared across a batch
+        """
+        if patterns is None:
+            patterns = {}
+        pattern_id = rule.pattern_id
+        if pattern_id not in patterns:
+            patterns[pattern_id] = self._pattern_version(pattern_id)
+        return rule.modified_date, patterns[pattern_id]
+
+    def get(self, rule: Rule) -> Optional[RuleValidationResult]:
+        """Return the cached result for rule if it is still fresh."""
+        return self._lookup(rule, self.fingerprint(rule))
+
+    def validate(self, rule: Rule, use_cache: bool = True) -> RuleValidationResult:
+        """
+        Validate rule on the calling thread.
+
+        Args:
+            rule: Rule to validate
+            use_cache: Return a fresh cached result instead of revalidating
+
+        Returns:
+            RuleValidationResult, which is also cached
+        """
+        key = self.fingerprint(rule)
+        if use_cache:
+            cached = self._lookup(rule, key)
+            if cached is not None:
+                return cached
+
+        result = self._validate(rule)
+        with self._lock:
+            self._results[rule.id] = (key, result)
+        return result
+
+    def submit(self, rules: Iterable[Rule],
+               callback: Callable[[RuleValidationResult], None],
+               token: Hashable = None) -> Dict[UUID, RuleValidationResult]:
+        """
+        Validate rules, revalidating only stale ones in the background.
+
+        Supersedes the previous submission with the same token: its
+        queued rules are dropped and its remaining results are not
+        delivered.
+
+        Args:
+            rules: Rules to validate
+            callback: Called from a worker thread with each revalidated result
+            token: Identifies the caller; submissions with other tokens
+                are unaffected
+
+        Returns:
+            Fresh cached results by rule ID; every other rule is delivered
+            to callback
+        """
+        patterns: Dict[UUID, Hashable] = {}
+        fresh: Dict[UUID, RuleValidationResult] = {}
+        stale: List[Tuple[Rule, Hashable]] = []
+
+        keyed = [(rule, self.fingerprint(rule, patterns)) for rule in rules]
+
+        with self._lock:
+            self._generation += 1
+            generation = self._current[token] = self._generation
+            for rule, key in keyed:
+                entry = self._results.get(rule.id)
+                if entry is not None and entry[0] == key:
+                    fresh[rule.id] = entry[1]
+                else:
+                    stale.append((rule, key))
+
+        self._log_operation("submit", rules=len(fresh) + len(stale), stale=len(stale))
+
+        if stale:
+            executor = self._ensure_executor()
+            for start in range(0, len(stale), self.BATCH_SIZE):
+                executor.submit(self._run_batch, token, generation,
+                                stale[start:start + self.BATCH_SIZE], callback)
+
+        return fresh
+
+    def cancel(self, token: Hashable = None) -> None:
+        """Drop queued validations of the last submission with token."""
+        with self._lock:
+            self._current.pop(token, None)
+
+    def invalidate(self, rule_id: Optional[UUID] = None) -> None:
+        """Forget the cached result for one rule, or for all rules."""
+        with self._lock:
+            if rule_id is None:
+                self._results.clear()
+            else:
+                self._results.pop(rule_id, None)
+
+    def close(self) -> None:
+        """Stop background validation."""
+        with self._lock:
+            self._current.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _lookup(self, rule: Rule, key: Hashable) -> Optional[RuleValidationResult]:
+        with self._lock:
+            entry = self._results.get(rule.id)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        return None
+
+    def _pattern_version(self, pattern_id: UUID) -> Hashable:
+        # Pattern.version is not bumped by every edit, modified_date is
+        pattern = self._pattern_lookup(pattern_id)
+        if pattern is None:
+            return None
+        return pattern.version, pattern.modified_date, pattern.is_valid
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix="rule_validation")
+        return self._executor
+
+    def _run_batch(self, token: Hashable, generation: int, batch: List[Tuple[Rule, Hashable]],
+                   callback: Callable[[RuleValidationResult], None]) -> None:
+        for rule, key in batch:
+            if self._current.get(token) != generation:
+                return
+
+            try:
+                result = self._validate(rule)
+            except Exception as e:
+                self._log_error(e, "validate_rule", rule_id=str(rule.id))
+                result = RuleValidationResult(rule_id=rule.id, is_valid=False)
+                result.add_error(f"Validation failed: {e}")
+
+            with self._lock:
+                self._results[rule.id] = (key, result)
+                current = self._current.get(token) == generation
+            if current:
+                callback(result)
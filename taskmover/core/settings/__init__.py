@@ -155,6 +155,10 @@ class ISettingStorage(ABC):
     def restore(self, scope: SettingScope, backup_id: str) -> bool:
         """Restore settings from backup"""
         pass
+    
+    def changed_scopes(self) -> List[SettingScope]:
+        """Scopes changed outside this storage since they were last loaded or saved"""
+        return []
 
 
 class ISettingChangeListener(ABC):
@@ -288,6 +292,7 @@ class ISettingManager(ABC):
 
 # Import concrete implementations
 from .manager import SettingManager
+from .snapshot import SettingSnapshot, SettingAccessor
 from .validator import SettingValidator, BasicSettingValidator
 from .storage import FileSettingStorage, MemorySettingStorage
 from .serializers import (
@@ -326,6 +331,8 @@ __all__ = [
     
     # Implementations
     "SettingManager",
+    "SettingSnapshot",
+    "SettingAccessor",
     "SettingValidator",
     "BasicSettingValidator",
     "FileSettingStorage",
@@ -6,10 +6,14 @@ validation, serialization, change tracking, and backup functionality.
 """
 
 import datetime
+import json
 import logging
 import threading
+from collections import deque
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Type, TypeVar
 
 from . import (
     SettingScope,
@@ -24,6 +28,8 @@ from . import (
     ISettingChangeListener,
     ISettingManager,
 )
+from .snapshot import SettingAccessor, SettingSnapshot, converter_for
+from ..storage.write_behind import DebouncedFlush, atomic_write_text
 
 T = TypeVar("T")
 
@@ -40,30 +46,65 @@ class SettingManager(ISettingManager):
     - Import/export functionality
     - Change notifications
     - Thread-safe operations
+    - Lock-free reads from an immutable snapshot
+    
+    Writes hold the lock and publish a new ``SettingSnapshot`` (copying
+    only the changed scopes); ``get`` reads the current snapshot.
+    
+    Changes mark their scope dirty and ``save()`` writes only dirty scopes.
+    With ``autosave_delay`` set, a debounced save runs at most once per
+    delay, so a burst of changes (e.g. dragging a slider) is one write.
+    The change history is a ring of the last ``history_limit`` changes.
     """
     
-    def __init__(self, storage: ISettingStorage, validator: ISettingValidator):
+    def __init__(self, storage: ISettingStorage, validator: ISettingValidator,
+                 autosave_delay: Optional[float] = None, history_limit: Optional[int] = 1000,
+                 history_file: Optional[Path] = None, autosave_max_wait: Optional[float] = 5.0):
         """
         Initialize the settings manager.
         
         Args:
             storage: Settings storage backend
             validator: Settings validator
+            autosave_delay: Save dirty scopes once no change was made for
+                this many seconds; None saves only when ``save()`` is called
+            history_limit: Changes kept in the history (None keeps all)
+            history_file: File the change history is saved to and loaded from
+            autosave_max_wait: Save at the latest this many seconds after
+                the first unsaved change, even if changes keep coming
         """
         self._storage = storage
         self._validator = validator
         self._settings: Dict[SettingScope, Dict[str, Any]] = {}
         self._definitions: Dict[str, SettingDefinition] = {}
-        self._change_history: List[SettingChange] = []
+        self._change_history: Deque[SettingChange] = deque(maxlen=history_limit)
         self._change_listeners: List[ISettingChangeListener] = []
         self._serializers: Dict[SettingFormat, ISettingSerializer] = {}
         self._lock = threading.RLock()
+        # Serializes saves, so an older copy never overwrites a newer one
+        self._save_lock = threading.Lock()
         self._logger = logging.getLogger(f"{__name__}.SettingManager")
         
         # Initialize default scopes
         for scope in SettingScope:
             self._settings[scope] = {}
         
+        self._defaults: Mapping[str, Any] = MappingProxyType({})
+        self._snapshot = SettingSnapshot.build(
+            0, {scope: MappingProxyType({}) for scope in SettingScope}, self._defaults
+        )
+        
+        # Write-behind state
+        self._dirty_scopes: Set[SettingScope] = set()
+        self._history_file = Path(history_file) if history_file is not None else None
+        self._history_dirty = False
+        self._flusher = DebouncedFlush(self.save, autosave_delay, name="SettingsFlush",
+                                       trailing=True, max_wait=autosave_max_wait) \
+            if autosave_delay is not None else None
+        
+        if self._history_file is not None:
+            self._load_history()
+        
         self._logger.info("SettingManager initialized")
     
     def register_serializer(self, format: SettingFormat, serializer: ISettingSerializer) -> None:
@@ -73,27 +114,35 @@ class SettingManager(ISettingManager):
             self._logger.debug(f"Registered serializer for format: {format.value}")
     
     def get(self, key: str, default: Optional[T] = None, scope: Optional[SettingScope] = None) -> T:
-        """Get a setting value with scope resolution."""
-        with self._lock:
-            # If no scope specified, search in order of precedence
-            if scope is None:
-                scopes_to_search = [SettingScope.USER, SettingScope.APPLICATION, SettingScope.SYSTEM]
-            else:
-                scopes_to_search = [scope]
-            
-            for search_scope in scopes_to_search:
-                if key in self._settings[search_scope]:
-                    value = self._settings[search_scope][key]
-                    self._logger.debug(f"Retrieved setting {key} = {value} from scope {search_scope.value}")
-                    return value
-            
-            # Return default if not found
+        """
+        Get a setting value with scope resolution.
+        
+        Without a scope, scopes are searched in order of precedence
+        (user, application, system, rule, UI, logging). Falls back to
+        ``default``, or to the definition default if ``default`` is None.
+        Reads the current snapshot, without locking.
+        """
+        return self._snapshot.get(key, default, scope)
+    
+    def snapshot(self) -> SettingSnapshot:
+        """Current immutable view of all settings."""
+        return self._snapshot
+    
+    def accessor(self, key: str, default: Optional[T] = None,
+                 convert: Optional[Callable[[Any], T]] = None) -> SettingAccessor[T]:
+        """
+        Create a typed, cached accessor for a setting.
+        
+        Args:
+            key: Setting key
+            default: Value when the setting is unset and has no definition default
+            convert: Conversion of the stored value; defaults to one matching
+                the definition type (e.g. ``int`` for integer settings)
+        """
+        if convert is None:
             definition = self._definitions.get(key)
-            if definition and default is None:
-                default = definition.default_value
-            
-            self._logger.debug(f"Setting {key} not found, returning default: {default}")
-            return default
+            convert = converter_for(definition.type) if definition else None
+        return SettingAccessor(self, key, default, convert)
     
     def set(self, key: str, value: Any, scope: Optional[SettingScope] = None, 
             source: Optional[str] = None) -> bool:
@@ -119,6 +168,7 @@ class SettingManager(ISettingManager):
                 
                 # Set the value
                 self._settings[scope][key] = final_value
+                self._publish_snapshot([scope])
                 
                 # Create change record
                 change = SettingChange(
@@ -128,7 +178,7 @@ class SettingManager(ISettingManager):
                     timestamp=datetime.datetime.now(),
                     source=source
                 )
-                self._change_history.append(change)
+                self._record_change(scope, change)
                 
                 # Notify listeners
                 self._notify_change_listeners(change)
@@ -151,6 +201,7 @@ class SettingManager(ISettingManager):
                         if key in self._settings[s]:
                             old_value = self._settings[s][key]
                             del self._settings[s][key]
+                            self._publish_snapshot([s])
                             
                             # Create change record
                             change = SettingChange(
@@ -160,7 +211,7 @@ class SettingManager(ISettingManager):
                                 timestamp=datetime.datetime.now(),
                                 source="delete"
                             )
-                            self._change_history.append(change)
+                            self._record_change(s, change)
                             self._notify_change_listeners(change)
                             deleted = True
                     
@@ -171,6 +222,7 @@ class SettingManager(ISettingManager):
                     if key in self._settings[scope]:
                         old_value = self._settings[scope][key]
                         del self._settings[scope][key]
+                        self._publish_snapshot([scope])
                         
                         # Create change record
                         change = SettingChange(
@@ -180,7 +232,7 @@ class SettingManager(ISettingManager):
                             timestamp=datetime.datetime.now(),
                             source="delete"
                         )
-                        self._change_history.append(change)
+                        self._record_change(scope, change)
                         self._notify_change_listeners(change)
                         
                         self._logger.info(f"Setting {key} deleted from scope {scope.value}")
@@ -193,28 +245,29 @@ class SettingManager(ISettingManager):
     
     def exists(self, key: str, scope: Optional[SettingScope] = None) -> bool:
         """Check if a setting exists."""
-        with self._lock:
-            if scope is None:
-                return any(key in self._settings[s] for s in SettingScope)
-            else:
-                return key in self._settings[scope]
+        snapshot = self._snapshot
+        if scope is None:
+            return key in snapshot.values
+        else:
+            return key in snapshot.scopes[scope]
     
     def get_all(self, scope: Optional[SettingScope] = None) -> Dict[str, Any]:
         """Get all settings for a scope."""
-        with self._lock:
-            if scope is None:
-                # Merge all scopes with precedence
-                result = {}
-                for s in reversed(list(SettingScope)):  # System < App < User
-                    result.update(self._settings[s])
-                return result
-            else:
-                return self._settings[scope].copy()
+        snapshot = self._snapshot
+        if scope is None:
+            # All scopes merged with precedence
+            return dict(snapshot.values)
+        else:
+            return dict(snapshot.scopes[scope])
     
     def register_definition(self, definition: SettingDefinition) -> None:
         """Register a setting definition."""
         with self._lock:
             self._definitions[definition.key] = definition
+            defaults = dict(self._defaults)
+            defaults[definition.key] = definition.default_value
+            self._defaults = MappingProxyType(defaults)
+            self._publish_snapshot([])
             self._logger.debug(f"Registered definition for setting: {definition.key}")
     
     def get_definition(self, key: str) -> Optional[SettingDefinition]:
@@ -303,6 +356,8 @@ class SettingManager(ISettingManager):
                 if not merge and scope is not None:
                     # Clear existing settings in scope
                     self._settings[scope].clear()
+                    self._publish_snapshot([scope])
+                    self._mark_dirty(scope)
                 
                 import_count = 0
                 for key, value in imported_settings.items():
@@ -397,58 +452,166 @@ class SettingManager(ISettingManager):
         """Reload settings from storage."""
         with self._lock:
             try:
-                if scope is None:
-                    # Reload all scopes
-                    for s in SettingScope:
-                        old_settings = self._settings[s].copy()
-                        self._settings[s] = self._storage.load(s)
-                        
-                        # Notify listeners
-                        for listener in self._change_listeners:
-                            listener.on_settings_loaded(s, self._settings[s])
-                        
-                        self._logger.debug(f"Reloaded {len(self._settings[s])} settings for scope {s.value}")
-                else:
-                    old_settings = self._settings[scope].copy()
-                    self._settings[scope] = self._storage.load(scope)
-                    
-                    # Notify listeners
-                    for listener in self._change_listeners:
-                        listener.on_settings_loaded(scope, self._settings[scope])
-                    
-                    self._logger.debug(f"Reloaded {len(self._settings[scope])} settings for scope {scope.value}")
+                self._load_scopes(list(SettingScope) if scope is None else [scope])
                 
             except Exception as e:
                 self._logger.error(f"Error reloading settings: {e}")
                 raise
     
-    def save(self, scope: Optional[SettingScope] = None) -> None:
-        """Save settings to storage."""
+    def reload_changed(self) -> List[SettingScope]:
+        """
+        Reload scopes whose stored settings changed outside this manager.
+        
+        Uses the storage's cheap change check (file modification time and
+        size for file storage). A scope with unsaved changes is kept as it
+        is and overwrites the external change on the next save.
+        
+        Returns:
+            Scopes that were reloaded
+        """
         with self._lock:
             try:
+                changed = self._storage.changed_scopes()
+                scopes = [s for s in changed if s not in self._dirty_scopes]
+                for s in changed:
+                    if s in self._dirty_scopes:
+                        self._logger.warning(f"Settings for scope {s.value} changed on disk "
+                                             f"but have unsaved changes; keeping them")
+                if scopes:
+                    self._load_scopes(scopes)
+                return scopes
+                
+            except Exception as e:
+                self._logger.error(f"Error reloading changed settings: {e}")
+                raise
+    
+    def save(self, scope: Optional[SettingScope] = None) -> None:
+        """
+        Save settings to storage.
+        
+        Without a scope, only scopes changed since they were last loaded
+        or saved are written, together with the change history. The
+        settings are copied under the lock and written without it, so
+        changes made meanwhile do not wait for the disk; they mark their
+        scope dirty again and are written by the next save.
+        """
+        with self._save_lock:
+            with self._lock:
                 if scope is None:
-                    # Save all scopes
-                    for s in SettingScope:
-                        self._storage.save(s, self._settings[s])
-                        
-                        # Notify listeners
-                        for listener in self._change_listeners:
-                            listener.on_settings_saved(s, self._settings[s])
-                        
-                        self._logger.debug(f"Saved {len(self._settings[s])} settings for scope {s.value}")
+                    scopes = [s for s in SettingScope if s in self._dirty_scopes]
                 else:
-                    self._storage.save(scope, self._settings[scope])
+                    scopes = [scope]
+                pending = [(s, dict(self._settings[s])) for s in scopes]
+                self._dirty_scopes.difference_update(scopes)
+                
+                history = None
+                if scope is None and self._history_dirty:
+                    history = self._history_text()
+                    self._history_dirty = False
+                listeners = list(self._change_listeners)
+            
+            saved = 0
+            try:
+                for s, settings in pending:
+                    self._storage.save(s, settings)
+                    saved += 1
                     
                     # Notify listeners
-                    for listener in self._change_listeners:
-                        listener.on_settings_saved(scope, self._settings[scope])
+                    for listener in listeners:
+                        listener.on_settings_saved(s, settings)
                     
-                    self._logger.debug(f"Saved {len(self._settings[scope])} settings for scope {scope.value}")
+                    self._logger.debug(f"Saved {len(settings)} settings for scope {s.value}")
+                
+                if history is not None:
+                    self._history_file.parent.mkdir(parents=True, exist_ok=True)
+                    atomic_write_text(self._history_file, history)
+                    history = None
                 
             except Exception as e:
+                with self._lock:
+                    # Unwritten scopes stay dirty for the next save
+                    self._dirty_scopes.update(s for s, _ in pending[saved:])
+                    if history is not None:
+                        self._history_dirty = True
                 self._logger.error(f"Error saving settings: {e}")
                 raise
     
+    @property
+    def dirty_scopes(self) -> FrozenSet[SettingScope]:
+        """Scopes with changes that have not been saved."""
+        with self._lock:
+            return frozenset(self._dirty_scopes)
+    
+    def close(self) -> None:
+        """Save pending changes and stop autosaving."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+        self.save()
+    
+    def _load_scopes(self, scopes: List[SettingScope]) -> None:
+        """Load scopes from storage and publish them together. Caller holds the lock."""
+        for s in scopes:
+            self._settings[s] = self._storage.load(s)
+            self._dirty_scopes.discard(s)
+        self._publish_snapshot(scopes)
+        
+        for s in scopes:
+            # Notify listeners
+            for listener in self._change_listeners:
+                listener.on_settings_loaded(s, self._settings[s])
+            
+            self._logger.debug(f"Reloaded {len(self._settings[s])} settings for scope {s.value}")
+    
+    def _record_change(self, scope: SettingScope, change: SettingChange) -> None:
+        """Add a change to the history and schedule saving its scope. Caller holds the lock."""
+        self._change_history.append(change)
+        self._history_dirty = self._history_file is not None
+        self._mark_dirty(scope)
+    
+    def _mark_dirty(self, scope: SettingScope) -> None:
+        """Record that a scope has unsaved changes. Caller holds the lock."""
+        self._dirty_scopes.add(scope)
+        if self._flusher is not None:
+            self._flusher.schedule()
+    
+    def _load_history(self) -> None:
+        """Load the change history saved by a previous session."""
+        try:
+            lines = self._history_file.read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self._logger.warning(f"Could not read settings history {self._history_file}: {e}")
+            return
+        
+        for line in lines:
+            try:
+                data = json.loads(line)
+                data['timestamp'] = datetime.datetime.fromisoformat(data['timestamp'])
+                self._change_history.append(SettingChange(**data))
+            except (ValueError, TypeError, KeyError) as e:
+                self._logger.debug(f"Skipping unreadable settings history entry: {e}")
+    
+    def _history_text(self) -> str:
+        """The change history ring as JSON lines. Caller holds the lock."""
+        lines = [
+            json.dumps({**asdict(change), 'timestamp': change.timestamp.isoformat()}, default=str)
+            for change in self._change_history
+        ]
+        return "".join(line + "\n" for line in lines)
+    
+    def _publish_snapshot(self, scopes: Iterable[SettingScope]) -> None:
+        """
+        Replace the snapshot after scopes changed. Caller holds the lock.
+        
+        Unchanged scopes are shared with the previous snapshot.
+        """
+        current = self._snapshot
+        scope_views = dict(current.scopes)
+        for scope in scopes:
+            scope_views[scope] = MappingProxyType(dict(self._settings[scope]))
+        self._snapshot = SettingSnapshot.build(current.version + 1, scope_views, self._defaults)
+    
     def _notify_change_listeners(self, change: SettingChange) -> None:
         """Notify all change listeners of a setting change."""
         for listener in self._change_listeners:
@@ -0,0 +1,156 @@
+"""
+Settings Snapshot
+
+Immutable, precomputed view of every settings scope merged by precedence
+on top of the definition defaults. SettingManager publishes a new
+snapshot whenever settings change, so reads are a single dict lookup on
+the current snapshot, without taking the manager's lock.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, TypeVar
+
+from . import SettingScope, SettingType
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Highest precedence first; matches SettingManager.get_all()
+SCOPE_PRECEDENCE = (
+    SettingScope.USER,
+    SettingScope.APPLICATION,
+    SettingScope.SYSTEM,
+    SettingScope.RULE,
+    SettingScope.UI,
+    SettingScope.LOGGING,
+)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SettingSnapshot:
+    """
+    Settings as of one change.
+
+    Attributes:
+        version: Incremented with every published snapshot
+        scopes: Read-only settings of each scope
+        values: Settings of all scopes merged by precedence
+        defaults: Definition default values
+        resolved: ``values`` over ``defaults``
+    """
+    version: int
+    scopes: Mapping[SettingScope, Mapping[str, Any]]
+    values: Mapping[str, Any]
+    defaults: Mapping[str, Any]
+    resolved: Mapping[str, Any]
+
+    @classmethod
+    def build(cls, version: int, scopes: Mapping[SettingScope, Mapping[str, Any]],
+              defaults: Mapping[str, Any]) -> "SettingSnapshot":
+        """Merge read-only scope mappings into a snapshot."""
+        values: Dict[str, Any] = {}
+        for scope in reversed(SCOPE_PRECEDENCE):
+            values.update(scopes[scope])
+        resolved = dict(defaults)
+        resolved.update(values)
+        return cls(version, MappingProxyType(dict(scopes)), MappingProxyType(values),
+                   defaults, MappingProxyType(resolved))
+
+    def get(self, key: str, default: Optional[T] = None,
+            scope: Optional[SettingScope] = None) -> T:
+        """Same lookup as ``SettingManager.get``."""
+        if scope is None:
+            if default is None:
+                return self.resolved.get(key)
+            return self.values.get(key, default)
+
+        value = self.scopes[scope].get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return self.defaults.get(key) if default is None else default
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "yes", "on", "1"):
+            return True
+        if lowered in ("false", "no", "off", "0", ""):
+            return False
+        raise ValueError(f"not a boolean: {value!r}")
+    return bool(value)
+
+
+_CONVERTERS: Dict[SettingType, Callable[[Any], Any]] = {
+    SettingType.STRING: str,
+    SettingType.INTEGER: int,
+    SettingType.FLOAT: float,
+    SettingType.BOOLEAN: _to_bool,
+    SettingType.LIST: list,
+    SettingType.DICT: dict,
+    SettingType.PATH: Path,
+}
+
+
+def converter_for(setting_type: Optional[SettingType]) -> Optional[Callable[[Any], Any]]:
+    """Conversion applied by accessors for a setting type, if any."""
+    return _CONVERTERS.get(setting_type)
+
+
+class SettingAccessor(Generic[T]):
+    """
+    Typed, cached read of one setting for code that reads it often.
+
+    The value is looked up and converted again only when the manager has
+    published a new snapshot since the last read. A value that cannot be
+    converted reads as the accessor's (or the definition's) default.
+    """
+
+    __slots__ = ("key", "_manager", "_default", "_convert", "_snapshot", "_value")
+
+    def __init__(self, manager: Any, key: str, default: Optional[T] = None,
+                 convert: Optional[Callable[[Any], T]] = None):
+        """
+        Args:
+            manager: SettingManager to read from
+            key: Setting key
+            default: Value when the setting is unset and has no definition default
+            convert: Conversion of the stored value, e.g. ``int``
+        """
+        self.key = key
+        self._manager = manager
+        self._default = default
+        self._convert = convert
+        self._snapshot: Optional[SettingSnapshot] = None
+        self._value: Any = None
+
+    def get(self) -> T:
+        """Current value of the setting."""
+        snapshot = self._manager.snapshot()
+        if snapshot is not self._snapshot:
+            # Value before snapshot, so a racing reader never pairs the
+            # new snapshot with the old value
+            self._value = self._resolve(snapshot)
+            self._snapshot = snapshot
+        return self._value
+
+    __call__ = get
+
+    def _resolve(self, snapshot: SettingSnapshot) -> T:
+        value = snapshot.get(self.key, self._default)
+        if value is None or self._convert is None:
+            return value
+        try:
+            return self._convert(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Setting {self.key} = {value!r} is not valid, using default: {e}")
+            return self._default if self._default is not None else snapshot.defaults.get(self.key)
+
+    def __repr__(self) -> str:
+        return f"SettingAccessor({self.key!r})"
@@ -11,11 +11,12 @@ import shutil
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from . import SettingScope, ISettingStorage
+from ..storage.write_behind import atomic_write_text
 
 
 class FileSettingStorage(ISettingStorage):
@@ -28,6 +29,7 @@ class FileSettingStorage(ISettingStorage):
     - Directory structure management
     - Thread-safe operations
     - Multiple format support
+    - Detection of files changed on disk (by modification time and size)
     """
     
     def __init__(self, base_path: Path, create_dirs: bool = True):
@@ -53,6 +55,9 @@ class FileSettingStorage(ISettingStorage):
             SettingScope.LOGGING: "logging_settings.yaml",
         }
         
+        # (mtime_ns, size) of each scope file when last loaded or saved
+        self._fingerprints: Dict[SettingScope, Optional[Tuple[int, int]]] = {}
+        
         # Create base directory if needed
         if self._create_dirs:
             self._base_path.mkdir(parents=True, exist_ok=True)
@@ -62,6 +67,14 @@ class FileSettingStorage(ISettingStorage):
         """Get the settings file path for a scope."""
         return self._base_path / self._scope_files[scope]
     
+    def _fingerprint(self, scope: SettingScope) -> Optional[Tuple[int, int]]:
+        """Modification time and size of a scope file, or None if it is missing."""
+        try:
+            stat = self._get_settings_file(scope).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
     def _get_backup_dir(self, scope: SettingScope) -> Path:
         """Get the backup directory for a scope."""
         backup_dir = self._base_path / "backups" / scope.value
@@ -71,6 +84,13 @@ class FileSettingStorage(ISettingStorage):
     
     def load(self, scope: SettingScope) -> Dict[str, Any]:
         """Load settings for a specific scope."""
+        with self._lock:
+            # Fingerprint before reading so a concurrent edit shows up as a change
+            self._fingerprints[scope] = self._fingerprint(scope)
+            return self._read(scope)
+    
+    def _read(self, scope: SettingScope) -> Dict[str, Any]:
+        """Read a scope file without recording it as loaded."""
         with self._lock:
             try:
                 settings_file = self._get_settings_file(scope)
@@ -102,26 +122,19 @@ class FileSettingStorage(ISettingStorage):
                 if self._create_dirs:
                     settings_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                # Atomic write using temporary file
-                temp_file = settings_file.with_suffix(settings_file.suffix + '.tmp')
+                if settings_file.suffix.lower() == '.json':
+                    text = json.dumps(settings, indent=2, ensure_ascii=False)
+                else:  # Default to YAML
+                    text = yaml.dump(settings, default_flow_style=False, allow_unicode=True)
                 
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    if settings_file.suffix.lower() == '.json':
-                        json.dump(settings, f, indent=2, ensure_ascii=False)
-                    else:  # Default to YAML
-                        yaml.dump(settings, f, default_flow_style=False, allow_unicode=True)
-                
-                # Atomic move
-                temp_file.replace(settings_file)
+                # Atomic write using temporary file
+                atomic_write_text(settings_file, text)
+                self._fingerprints[scope] = self._fingerprint(scope)
                 
                 self._logger.debug(f"Saved {len(settings)} settings for scope {scope.value}")
                 
             except Exception as e:
                 self._logger.error(f"Error saving settings for scope {scope.value}: {e}")
-                # Clean up temp file if it exists
-                temp_file = self._get_settings_file(scope).with_suffix('.tmp')
-                if temp_file.exists():
-                    temp_file.unlink()
                 raise
     
     def delete(self, scope: SettingScope, key: str) -> bool:
@@ -146,11 +159,22 @@ class FileSettingStorage(ISettingStorage):
     def exists(self, scope: SettingScope, key: str) -> bool:
         """Check if a setting exists."""
         try:
-            settings = self.load(scope)
+            settings = self._read(scope)
             return key in settings
         except Exception:
             return False
     
+    def changed_scopes(self) -> List[SettingScope]:
+        """
+        Scopes whose file changed on disk since it was last loaded or saved.
+        
+        Compares modification time and size only, so checking is cheap
+        enough to do on every window focus or timer tick.
+        """
+        with self._lock:
+            return [scope for scope, fingerprint in self._fingerprints.items()
+                    if self._fingerprint(scope) != fingerprint]
+    
     def backup(self, scope: SettingScope) -> str:
         """Create a backup of settings and return backup identifier."""
         with self._lock:
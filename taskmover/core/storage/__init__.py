@@ -13,7 +13,7 @@ Generic storage and persistence framework providing:
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Generic, Union
 from pathlib import Path
 from uuid import UUID
 from datetime import datetime
@@ -170,6 +170,38 @@ class IStorageBackend(ABC):
     def execute_sql(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Execute raw SQL"""
         pass
+    
+    @abstractmethod
+    def create_index(self, table_name: str, field: str) -> None:
+        """Declare a secondary index on a field"""
+        pass
+    
+    def insert_many(self, table_name: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert several rows and return how many were inserted"""
+        count = 0
+        for row in rows:
+            self.insert(table_name, row)
+            count += 1
+        return count
+    
+    def upsert_many(self, table_name: str, rows: Iterable[Dict[str, Any]], key: str = "id") -> int:
+        """Insert rows, updating existing entities with the same ``key`` value; return the row count"""
+        count = 0
+        for row in rows:
+            if key == 'id':
+                entity_id = row['id']
+            else:
+                existing = self.select(table_name, filters={key: row[key]}, limit=1)
+                entity_id = existing[0]['id'] if existing else None
+            changes = {k: v for k, v in row.items() if k not in ('id', key)}
+            if entity_id is None or not self.update(table_name, entity_id, changes):
+                self.insert(table_name, row)
+            count += 1
+        return count
+    
+    def delete_many(self, table_name: str, entity_ids: Iterable[Any]) -> int:
+        """Delete entities by ID and return how many were deleted"""
+        return sum(1 for entity_id in entity_ids if self.delete(table_name, entity_id))
 
 
 class ITransaction(ABC):
@@ -281,7 +313,7 @@ from .backends import FileSystemBackend, SQLiteBackend, MemoryBackend
 from .repository import BaseRepository
 from .transaction import Transaction, TransactionManager
 from .migration import MigrationManager, BaseMigration, CreateTableMigration, AddColumnMigration, DataMigration
-from .cache import MultiLevelCacheManager, LRUCache, FileCache
+from .cache import MultiLevelCacheManager, LRUCache, FileCache, FrequencySketch, PrefixIndex, TagIndex
 
 
 __all__ = [
@@ -315,4 +347,7 @@ __all__ = [
     "MultiLevelCacheManager",
     "LRUCache",
     "FileCache",
+    "FrequencySketch",
+    "PrefixIndex",
+    "TagIndex",
 ]
\ No newline at end of file
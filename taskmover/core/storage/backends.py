@@ -7,16 +7,19 @@ SQLite database, and in-memory storage.
 """
 
 import json
+import queue
 import sqlite3
 import threading
 import pickle
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 import logging
 
 from . import IStorageBackend, StorageConfig, StorageBackend
 from ..exceptions import StorageException
+from .indexing import SecondaryIndex, matches_filters, plan_candidates
 
 
 class FileSystemBackend(IStorageBackend):
@@ -28,14 +31,19 @@ class FileSystemBackend(IStorageBackend):
     - Atomic write operations
     - Backup support
     - Thread-safe operations
+    - Primary-key lookups and secondary indexes kept in sidecar files
     """
     
+    INDEX_DIR = "_indexes"
+    
     def __init__(self):
         self._config: Optional[StorageConfig] = None
         self._base_path: Optional[Path] = None
         self._lock = threading.RLock()
         self._logger = logging.getLogger(f"{__name__}.FileSystemBackend")
         self._connected = False
+        self._indexes: Dict[str, Dict[str, SecondaryIndex]] = {}
+        self._dirty_indexes: set = set()
     
     def connect(self, config: StorageConfig) -> None:
         """Connect to file system storage."""
@@ -54,6 +62,9 @@ class FileSystemBackend(IStorageBackend):
     
     def disconnect(self) -> None:
         """Disconnect from file system storage."""
+        if self._connected:
+            self.flush_indexes()
+        self._indexes.clear()
         self._connected = False
         self._config = None
         self._base_path = None
@@ -74,6 +85,39 @@ class FileSystemBackend(IStorageBackend):
             
             self._logger.debug(f"Created table {table_name}")
     
+    def create_index(self, table_name: str, field: str) -> None:
+        """
+        Declare a secondary index on a field.
+        
+        The index is built from the existing entities and stored as a
+        sidecar file under ``<table>/_indexes/``. A sidecar written before
+        the table directory last changed is rebuilt when first used.
+        """
+        self._ensure_connected()
+        
+        with self._lock:
+            table_dir = self._base_path / table_name
+            if not table_dir.exists():
+                self.create_table(table_name, {})
+            
+            indexes = self._table_indexes(table_name)
+            if field in indexes:
+                return
+            
+            indexes[field] = SecondaryIndex.build(field, self._read_entities(table_dir))
+            self._save_index(table_name, indexes[field])
+            self._logger.debug(f"Created index on {table_name}.{field}")
+    
+    def flush_indexes(self) -> None:
+        """Write index sidecars changed since the last flush."""
+        self._ensure_connected()
+        
+        with self._lock:
+            for table_name in list(self._dirty_indexes):
+                for index in self._indexes.get(table_name, {}).values():
+                    self._save_index(table_name, index)
+            self._dirty_indexes.clear()
+    
     def insert(self, table_name: str, data: Dict[str, Any]) -> Any:
         """Insert data into table (create JSON file)."""
         self._ensure_connected()
@@ -99,13 +143,19 @@ class FileSystemBackend(IStorageBackend):
                 json.dump(data, f, indent=2, default=str)
             
             temp_path.replace(file_path)
+            self._index_entity(table_name, entity_id, data)
             
             self._logger.debug(f"Inserted entity {entity_id} into {table_name}")
             return entity_id
     
     def select(self, table_name: str, filters: Optional[Dict[str, Any]] = None,
                order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Select data from table (read JSON files)."""
+        """
+        Select data from table (read JSON files).
+        
+        Filters on ``id`` and on indexed fields narrow the read to the
+        matching files; other filters need a scan of the table directory.
+        """
         self._ensure_connected()
         
         with self._lock:
@@ -113,26 +163,30 @@ class FileSystemBackend(IStorageBackend):
             if not table_dir.exists():
                 return []
             
+            candidates = plan_candidates(filters, self._table_indexes(table_name))
+            if candidates is None:
+                file_paths = (path for path in table_dir.glob("*.json")
+                              if not path.name.startswith("_"))  # Skip metadata files
+            else:
+                file_paths = (self._entity_path(table_dir, entity_id)
+                              for entity_id in sorted(candidates, key=str))
+                file_paths = (path for path in file_paths if path is not None and path.exists())
+            
             results = []
+            early_limit = limit if limit and limit > 0 and not order_by else None
             
-            # Read all JSON files in directory
-            for file_path in table_dir.glob("*.json"):
-                if file_path.name.startswith("_"):  # Skip metadata files
+            for file_path in file_paths:
+                data = self._read_entity(file_path)
+                if data is None:
                     continue
                 
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Apply filters
-                    if filters and not self._matches_filters(data, filters):
-                        continue
-                    
-                    results.append(data)
-                    
-                except (json.JSONDecodeError, IOError) as e:
-                    self._logger.warning(f"Failed to read {file_path}: {e}")
+                # Apply filters
+                if filters and not matches_filters(data, filters):
                     continue
+                
+                results.append(data)
+                if early_limit and len(results) >= early_limit:
+                    break
             
             # Apply ordering
             if order_by:
@@ -175,6 +229,7 @@ class FileSystemBackend(IStorageBackend):
                 json.dump(existing_data, f, indent=2, default=str)
             
             temp_path.replace(file_path)
+            self._index_entity(table_name, existing_data.get('id', entity_id), existing_data)
             
             self._logger.debug(f"Updated entity {entity_id} in {table_name}")
             return True
@@ -190,6 +245,10 @@ class FileSystemBackend(IStorageBackend):
             if not file_path.exists():
                 return False
             
+            if self._table_indexes(table_name):
+                data = self._read_entity(file_path) or {}
+                self._unindex_entity(table_name, data.get('id', entity_id))
+            
             # Create backup if enabled
             if self._config.backup_enabled:
                 backup_dir = table_dir / "_deleted"
@@ -213,36 +272,99 @@ class FileSystemBackend(IStorageBackend):
     
     def _matches_filters(self, data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
         """Check if data matches filters."""
-        for key, value in filters.items():
-            if key not in data:
-                return False
-            
-            data_value = data[key]
-            
-            # Handle different filter types
-            if isinstance(value, dict):
-                # Range filters like {'$gte': 10, '$lt': 20}
-                for op, filter_value in value.items():
-                    if op == '$gte' and not (data_value >= filter_value):
-                        return False
-                    elif op == '$gt' and not (data_value > filter_value):
-                        return False
-                    elif op == '$lte' and not (data_value <= filter_value):
-                        return False
-                    elif op == '$lt' and not (data_value < filter_value):
-                        return False
-                    elif op == '$ne' and data_value == filter_value:
-                        return False
-                    elif op == '$in' and data_value not in filter_value:
-                        return False
-                    elif op == '$nin' and data_value in filter_value:
-                        return False
+        return matches_filters(data, filters)
+    
+    def _entity_path(self, table_dir: Path, entity_id: Any) -> Optional[Path]:
+        """Path of an entity file, or None if the id cannot name a file."""
+        file_name = f"{entity_id}.json"
+        if file_name.startswith("_") or Path(file_name).name != file_name:
+            return None
+        return table_dir / file_name
+    
+    def _read_entity(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(file_path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self._logger.warning(f"Failed to read {file_path}: {e}")
+            return None
+    
+    def _read_entities(self, table_dir: Path) -> Iterable[Dict[str, Any]]:
+        for file_path in table_dir.glob("*.json"):
+            if file_path.name.startswith("_"):
+                continue
+            data = self._read_entity(file_path)
+            if data is not None:
+                yield data
+    
+    def _table_indexes(self, table_name: str) -> Dict[str, SecondaryIndex]:
+        """Indexes of a table, loading or rebuilding sidecars on first use."""
+        indexes = self._indexes.get(table_name)
+        if indexes is not None:
+            return indexes
+        
+        indexes = self._indexes[table_name] = {}
+        table_dir = self._base_path / table_name
+        index_dir = table_dir / self.INDEX_DIR
+        if not index_dir.is_dir():
+            return indexes
+        
+        table_mtime = table_dir.stat().st_mtime_ns
+        stale = []
+        for sidecar in index_dir.glob("*.json"):
+            try:
+                with open(sidecar, 'r') as f:
+                    payload = json.load(f)
+                index = SecondaryIndex.from_dict(payload)
+            except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+                self._logger.warning(f"Discarding index {sidecar}: {e}")
+                stale.append(sidecar.stem)
+                continue
+            
+            if payload.get('table_mtime_ns') == table_mtime:
+                indexes[index.field] = index
             else:
-                # Direct equality
-                if data_value != value:
-                    return False
+                stale.append(index.field)
         
-        return True
+        if stale:
+            # Table changed outside this backend since the sidecars were written
+            entities = list(self._read_entities(table_dir))
+            for field in stale:
+                indexes[field] = SecondaryIndex.build(field, entities)
+                self._save_index(table_name, indexes[field])
+        
+        return indexes
+    
+    def _save_index(self, table_name: str, index: SecondaryIndex) -> None:
+        table_dir = self._base_path / table_name
+        index_dir = table_dir / self.INDEX_DIR
+        index_dir.mkdir(exist_ok=True)
+        
+        payload = index.to_dict()
+        # Writes inside _indexes/ do not touch the table directory's mtime
+        payload['table_mtime_ns'] = table_dir.stat().st_mtime_ns
+        
+        sidecar = index_dir / f"{index.field}.json"
+        temp_path = index_dir / f"{index.field}.json.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(payload, f, default=str)
+        temp_path.replace(sidecar)
+    
+    def _index_entity(self, table_name: str, entity_id: Any, data: Dict[str, Any]) -> None:
+        indexes = self._table_indexes(table_name)
+        if not indexes:
+            return
+        for index in indexes.values():
+            index.add(entity_id, data)
+        self._dirty_indexes.add(table_name)
+    
+    def _unindex_entity(self, table_name: str, entity_id: Any) -> None:
+        indexes = self._table_indexes(table_name)
+        if not indexes:
+            return
+        for index in indexes.values():
+            index.remove(entity_id)
+        self._dirty_indexes.add(table_name)
 
 
 class SQLiteBackend(IStorageBackend):
@@ -253,16 +375,34 @@ class SQLiteBackend(IStorageBackend):
     - Relational database storage
     - SQL query support
     - Transaction support
-    - Connection pooling
+    - Connection pooling: up to ``pool_size`` connections shared between
+      threads; a thread reuses its connection for nested calls
+    - WAL journal mode so readers do not block the writer
+    - Bulk ``insert_many``/``upsert_many``/``delete_many`` in one transaction
     """
     
-    def __init__(self):
+    DEFAULT_POOL_SIZE = 4
+    
+    def __init__(self, journal_mode: str = "WAL", synchronous: str = "NORMAL",
+                 cached_statements: int = 256):
         self._config: Optional[StorageConfig] = None
         self._db_path: Optional[Path] = None
-        self._connection: Optional[sqlite3.Connection] = None
+        self._journal_mode = journal_mode
+        self._synchronous = synchronous
+        self._cached_statements = cached_statements
         self._lock = threading.RLock()
         self._logger = logging.getLogger(f"{__name__}.SQLiteBackend")
         self._connected = False
+        
+        # Connection pool: idle connections plus every connection opened
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._connections: List[sqlite3.Connection] = []
+        self._pool_size = self.DEFAULT_POOL_SIZE
+        self._local = threading.local()
+        
+        # Generated SQL per (operation, table, columns); sqlite3 caches the
+        # compiled statement for each distinct SQL string per connection
+        self._sql_cache: Dict[tuple, str] = {}
     
     def connect(self, config: StorageConfig) -> None:
         """Connect to SQLite database."""
@@ -276,22 +416,27 @@ class SQLiteBackend(IStorageBackend):
         if config.auto_create:
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Connect to database
-        self._connection = sqlite3.connect(
-            str(self._db_path),
-            timeout=config.timeout or 30,
-            check_same_thread=False
-        )
-        self._connection.row_factory = sqlite3.Row  # Enable dict-like access
+        # Every connection to ":memory:" is a separate database
+        in_memory = config.connection_string == ":memory:"
+        self._pool_size = 1 if in_memory else max(1, config.pool_size or self.DEFAULT_POOL_SIZE)
+        
+        # Open the first connection eagerly so connection errors surface here
+        connection = self._open_connection()
+        if not in_memory and self._journal_mode:
+            # journal_mode is stored in the database file
+            connection.execute(f"PRAGMA journal_mode={self._journal_mode}")
+        self._pool.put(connection)
         
         self._connected = True
         self._logger.info(f"Connected to SQLite database at {self._db_path}")
     
     def disconnect(self) -> None:
         """Disconnect from SQLite database."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+            self._pool = queue.LifoQueue()
         
         self._connected = False
         self._config = None
@@ -302,139 +447,325 @@ class SQLiteBackend(IStorageBackend):
         """Create table with schema."""
         self._ensure_connected()
         
-        with self._lock:
-            # Convert schema to SQL
-            columns = []
-            for field_name, field_def in schema.items():
-                column_def = f"{field_name} {field_def.get('type', 'TEXT')}"
-                
-                if field_def.get('primary_key'):
-                    column_def += " PRIMARY KEY"
-                if field_def.get('not_null'):
-                    column_def += " NOT NULL"
-                if 'default' in field_def:
-                    column_def += f" DEFAULT {field_def['default']}"
-                
-                columns.append(column_def)
-            
-            sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)})"
-            
-            cursor = self._connection.cursor()
-            cursor.execute(sql)
-            self._connection.commit()
-            
-            self._logger.debug(f"Created table {table_name}")
+        # Convert schema to SQL
+        columns = []
+        for field_name, field_def in schema.items():
+            column_def = f"{field_name} {field_def.get('type', 'TEXT')}"
+            
+            if field_def.get('primary_key'):
+                column_def += " PRIMARY KEY"
+            if field_def.get('not_null'):
+                column_def += " NOT NULL"
+            if 'default' in field_def:
+                column_def += f" DEFAULT {field_def['default']}"
+            
+            columns.append(column_def)
+        
+        sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)})"
+        
+        with self._connection() as connection:
+            connection.execute(sql)
+        
+        self._logger.debug(f"Created table {table_name}")
+    
+    def create_index(self, table_name: str, field: str) -> None:
+        """Create a SQLite index on a column."""
+        self._ensure_connected()
+        
+        sql = f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{field} ON {table_name} ({field})"
+        
+        with self._connection() as connection:
+            connection.execute(sql)
+        
+        self._logger.debug(f"Created index on {table_name}.{field}")
     
     def insert(self, table_name: str, data: Dict[str, Any]) -> Any:
         """Insert data into table."""
         self._ensure_connected()
         
-        with self._lock:
-            columns = list(data.keys())
-            placeholders = ', '.join(['?' for _ in columns])
-            values = list(data.values())
-            
-            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"  # nosec B608 - table_name is application-controlled
-            
-            cursor = self._connection.cursor()
-            cursor.execute(sql, values)
-            self._connection.commit()
-            
+        columns = tuple(data.keys())
+        sql = self._statement("insert", table_name, columns)
+        
+        with self._connection() as connection:
+            cursor = connection.execute(sql, tuple(data.values()))
             entity_id = cursor.lastrowid or data.get('id')
-            
-            self._logger.debug(f"Inserted entity {entity_id} into {table_name}")
-            return entity_id
+        
+        self._logger.debug(f"Inserted entity {entity_id} into {table_name}")
+        return entity_id
     
     def select(self, table_name: str, filters: Optional[Dict[str, Any]] = None,
                order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Select data from table."""
         self._ensure_connected()
         
-        with self._lock:
-            sql = f"SELECT * FROM {table_name}"  # nosec B608 - table_name is application-controlled
-            params = []
-            
-            # Add WHERE clause
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(f"{key} = ?")
-                    params.append(value)
-                sql += f" WHERE {' AND '.join(conditions)}"
-            
-            # Add ORDER BY clause
-            if order_by:
-                sql += f" ORDER BY {', '.join(order_by)}"
-            
-            # Add LIMIT clause
-            if limit:
-                sql += f" LIMIT {limit}"
-            
-            cursor = self._connection.cursor()
-            cursor.execute(sql, params)
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        sql = f"SELECT * FROM {table_name}"  # nosec B608 - table_name is application-controlled
+        params = []
+        
+        # Add WHERE clause
+        if filters:
+            conditions = []
+            for key, value in filters.items():
+                conditions.append(f"{key} = ?")
+                params.append(value)
+            sql += f" WHERE {' AND '.join(conditions)}"
+        
+        # Add ORDER BY clause
+        if order_by:
+            sql += f" ORDER BY {', '.join(order_by)}"
+        
+        # Add LIMIT clause
+        if limit:
+            sql += f" LIMIT {limit}"
+        
+        with self._connection() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
     
     def update(self, table_name: str, entity_id: Any, data: Dict[str, Any]) -> bool:
         """Update entity data."""
         self._ensure_connected()
         
-        with self._lock:
-            set_clauses = []
-            values = []
-            
-            for key, value in data.items():
-                set_clauses.append(f"{key} = ?")
-                values.append(value)
-            
-            values.append(entity_id)  # For WHERE clause
-            
-            sql = f"UPDATE {table_name} SET {', '.join(set_clauses)} WHERE id = ?"  # nosec B608 - table_name is application-controlled
-            
-            cursor = self._connection.cursor()
-            cursor.execute(sql, values)
-            self._connection.commit()
-            
-            affected_rows = cursor.rowcount
-            
-            self._logger.debug(f"Updated entity {entity_id} in {table_name}")
-            return affected_rows > 0
+        columns = tuple(data.keys())
+        sql = self._statement("update", table_name, columns)
+        
+        with self._connection() as connection:
+            affected_rows = connection.execute(sql, (*data.values(), entity_id)).rowcount
+        
+        self._logger.debug(f"Updated entity {entity_id} in {table_name}")
+        return affected_rows > 0
     
     def delete(self, table_name: str, entity_id: Any) -> bool:
         """Delete entity by ID."""
         self._ensure_connected()
         
-        with self._lock:
-            sql = f"DELETE FROM {table_name} WHERE id = ?"  # nosec B608 - table_name is application-controlled
-            
-            cursor = self._connection.cursor()
-            cursor.execute(sql, [entity_id])
-            self._connection.commit()
-            
-            affected_rows = cursor.rowcount
-            
-            self._logger.debug(f"Deleted entity {entity_id} from {table_name}")
-            return affected_rows > 0
+        sql = self._statement("delete", table_name, ("id",))
+        
+        with self._connection() as connection:
+            affected_rows = connection.execute(sql, (entity_id,)).rowcount
+        
+        self._logger.debug(f"Deleted entity {entity_id} from {table_name}")
+        return affected_rows > 0
+    
+    def insert_many(self, table_name: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert rows in a single transaction.
+        
+        Args:
+            table_name: Target table
+            rows: Rows sharing the same keys; may be a generator
+            
+        Returns:
+            Number of rows inserted
+        """
+        return self._execute_many("insert", table_name, rows)
+    
+    def upsert_many(self, table_name: str, rows: Iterable[Dict[str, Any]], key: str = "id") -> int:
+        """
+        Insert rows, updating existing rows with the same ``key``, in a single transaction.
+        
+        Args:
+            table_name: Target table
+            rows: Rows sharing the same keys; may be a generator
+            key: Column with a unique constraint identifying existing rows
+            
+        Returns:
+            Number of rows inserted or updated
+        """
+        return self._execute_many("upsert", table_name, rows, key)
+    
+    def delete_many(self, table_name: str, entity_ids: Iterable[Any]) -> int:
+        """
+        Delete entities by ID in a single transaction.
+        
+        Returns:
+            Number of rows deleted
+        """
+        self._ensure_connected()
+        
+        sql = self._statement("delete", table_name, ("id",))
+        with self.transaction() as cursor:
+            cursor.executemany(sql, ((entity_id,) for entity_id in entity_ids))
+            deleted = cursor.rowcount
+        
+        self._logger.debug(f"Deleted {deleted} entities from {table_name}")
+        return deleted
     
     def execute_sql(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Execute raw SQL."""
         self._ensure_connected()
         
-        with self._lock:
-            cursor = self._connection.cursor()
-            
+        with self._connection() as connection:
             if params:
-                cursor.execute(sql, params)
+                cursor = connection.execute(sql, params)
             else:
-                cursor.execute(sql)
+                cursor = connection.execute(sql)
             
-            if sql.strip().upper().startswith('SELECT'):
+            # Anything that yields rows (SELECT, WITH, PRAGMA) returns them
+            if cursor.description is not None:
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
-            else:
-                self._connection.commit()
-                return cursor.rowcount
+            return cursor.rowcount
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run several statements as a single transaction.
+        
+        Yields a cursor; commits when the block exits normally and rolls
+        back if it raises. The write lock is taken up front (BEGIN
+        IMMEDIATE) so concurrent writers wait instead of failing. A nested
+        call on the same thread joins the outer transaction.
+        """
+        self._ensure_connected()
+        
+        with self._connection() as connection:
+            cursor = connection.cursor()
+            if connection.in_transaction:
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+                return
+            
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                if connection.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+    
+    def supports_trigram_fts(self) -> bool:
+        """Check whether SQLite was built with FTS5 and the trigram tokenizer."""
+        self._ensure_connected()
+        
+        with self._connection() as connection:
+            try:
+                connection.execute(
+                    "CREATE VIRTUAL TABLE temp._fts_probe USING fts5(value, tokenize='trigram')"
+                )
+                connection.execute("DROP TABLE temp._fts_probe")
+                return True
+            except sqlite3.OperationalError:
+                return False
+    
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Get connection pool usage."""
+        with self._lock:
+            return {
+                'pool_size': self._pool_size,
+                'open_connections': len(self._connections),
+                'idle_connections': self._pool.qsize()
+            }
+    
+    def _execute_many(self, operation: str, table_name: str,
+                      rows: Iterable[Dict[str, Any]], key: str = "id") -> int:
+        """Run one INSERT/UPSERT statement for every row through executemany."""
+        self._ensure_connected()
+        
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return 0
+        
+        columns = tuple(first.keys())
+        sql = self._statement(operation, table_name, columns, key)
+        
+        def values():
+            yield tuple(first.values())
+            for row in iterator:
+                if row.keys() != first.keys():
+                    raise StorageException(
+                        f"{operation}_many rows must all have the columns {list(columns)}"
+                    )
+                yield tuple(row[column] for column in columns)
+        
+        with self.transaction() as cursor:
+            cursor.executemany(sql, values())
+            count = cursor.rowcount
+        
+        self._logger.debug(f"Bulk {operation} of {count} rows into {table_name}")
+        return count
+    
+    def _statement(self, operation: str, table_name: str, columns: tuple, key: str = "id") -> str:
+        """Build (once) the SQL for a generated statement."""
+        cache_key = (operation, table_name, columns, key)
+        sql = self._sql_cache.get(cache_key)
+        if sql is not None:
+            return sql
+        
+        column_list = ', '.join(columns)
+        placeholders = ', '.join('?' for _ in columns)
+        if operation == "insert":
+            sql = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"  # nosec B608 - table_name is application-controlled
+        elif operation == "upsert":
+            updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column != key)
+            conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+            sql = (f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders}) "  # nosec B608 - table_name is application-controlled
+                   f"ON CONFLICT({key}) {conflict}")
+        elif operation == "update":
+            assignments = ', '.join(f"{column} = ?" for column in columns)
+            sql = f"UPDATE {table_name} SET {assignments} WHERE id = ?"  # nosec B608 - table_name is application-controlled
+        elif operation == "delete":
+            sql = f"DELETE FROM {table_name} WHERE id = ?"  # nosec B608 - table_name is application-controlled
+        else:
+            raise StorageException(f"Unknown statement type: {operation}")
+        
+        self._sql_cache[cache_key] = sql
+        return sql
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new pooled connection."""
+        connection = sqlite3.connect(
+            str(self._db_path),
+            timeout=self._config.timeout or 30,
+            check_same_thread=False,
+            # Autocommit; multi-statement work goes through transaction()
+            isolation_level=None,
+            cached_statements=self._cached_statements
+        )
+        connection.row_factory = sqlite3.Row  # Enable dict-like access
+        if self._synchronous:
+            connection.execute(f"PRAGMA synchronous={self._synchronous}")
+        
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+    
+    @contextmanager
+    def _connection(self):
+        """Borrow a pooled connection; nested use on one thread shares it."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            yield connection
+            return
+        
+        connection = self._acquire()
+        self._local.connection = connection
+        try:
+            yield connection
+        finally:
+            self._local.connection = None
+            self._pool.put(connection)
+    
+    def _acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one, or wait for one to be returned."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if len(self._connections) < self._pool_size:
+                return self._open_connection()
+        
+        try:
+            return self._pool.get(timeout=self._config.timeout or 30)
+        except queue.Empty:
+            raise StorageException("Timed out waiting for a database connection")
     
     def _ensure_connected(self) -> None:
         """Ensure backend is connected."""
@@ -449,6 +780,7 @@ class MemoryBackend(IStorageBackend):
     Features:
     - Fast in-memory operations
     - Thread-safe operations
+    - Primary-key lookups and hash/sorted secondary indexes
     - No persistence (data lost on restart)
     """
     
@@ -456,6 +788,7 @@ class MemoryBackend(IStorageBackend):
         self._config: Optional[StorageConfig] = None
         self._tables: Dict[str, Dict[Any, Dict[str, Any]]] = {}
         self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[str, SecondaryIndex]] = {}
         self._lock = threading.RLock()
         self._logger = logging.getLogger(f"{__name__}.MemoryBackend")
         self._connected = False
@@ -474,6 +807,7 @@ class MemoryBackend(IStorageBackend):
         """Disconnect from memory storage."""
         self._tables.clear()
         self._schemas.clear()
+        self._indexes.clear()
         self._connected = False
         self._config = None
         self._logger.info("Disconnected from memory storage")
@@ -486,8 +820,28 @@ class MemoryBackend(IStorageBackend):
             self._tables[table_name] = {}
             self._schemas[table_name] = schema
             
+            # Keep declared indexes, now empty
+            indexes = self._indexes.get(table_name, {})
+            self._indexes[table_name] = {field: SecondaryIndex(field) for field in indexes}
+            
             self._logger.debug(f"Created table {table_name}")
     
+    def create_index(self, table_name: str, field: str) -> None:
+        """Declare a secondary index on a field, built from existing rows."""
+        self._ensure_connected()
+        
+        with self._lock:
+            if table_name not in self._tables:
+                self.create_table(table_name, {})
+            
+            indexes = self._indexes.setdefault(table_name, {})
+            if field not in indexes:
+                index = SecondaryIndex(field)
+                for entity_id, data in self._tables[table_name].items():
+                    index.add(entity_id, data)
+                indexes[field] = index
+                self._logger.debug(f"Created index on {table_name}.{field}")
+    
     def insert(self, table_name: str, data: Dict[str, Any]) -> Any:
         """Insert data into memory table."""
         self._ensure_connected()
@@ -505,24 +859,38 @@ class MemoryBackend(IStorageBackend):
             
             # Store data (deep copy to avoid reference issues)
             self._tables[table_name][entity_id] = data.copy()
+            for index in self._indexes.get(table_name, {}).values():
+                index.add(entity_id, data)
             
             self._logger.debug(f"Inserted entity {entity_id} into {table_name}")
             return entity_id
     
     def select(self, table_name: str, filters: Optional[Dict[str, Any]] = None,
                order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Select data from memory table."""
+        """
+        Select data from memory table.
+        
+        Filters on ``id`` and on indexed fields look rows up directly;
+        other filters scan the table.
+        """
         self._ensure_connected()
         
         with self._lock:
             if table_name not in self._tables:
                 return []
             
+            table = self._tables[table_name]
+            candidates = plan_candidates(filters, self._indexes.get(table_name, {}))
+            if candidates is None:
+                rows = table.values()
+            else:
+                rows = (table[entity_id] for entity_id in candidates if entity_id in table)
+            
             results = []
             
-            for entity_id, data in self._tables[table_name].items():
+            for data in rows:
                 # Apply filters
-                if filters and not self._matches_filters(data, filters):
+                if filters and not matches_filters(data, filters):
                     continue
                 
                 results.append(data.copy())
@@ -551,6 +919,8 @@ class MemoryBackend(IStorageBackend):
             # Update data
             self._tables[table_name][entity_id].update(data)
             self._tables[table_name][entity_id]['updated_at'] = datetime.now().isoformat()
+            for index in self._indexes.get(table_name, {}).values():
+                index.add(entity_id, self._tables[table_name][entity_id])
             
             self._logger.debug(f"Updated entity {entity_id} in {table_name}")
             return True
@@ -564,6 +934,8 @@ class MemoryBackend(IStorageBackend):
                 return False
             
             del self._tables[table_name][entity_id]
+            for index in self._indexes.get(table_name, {}).values():
+                index.remove(entity_id)
             
             self._logger.debug(f"Deleted entity {entity_id} from {table_name}")
             return True
@@ -581,7 +953,4 @@ class MemoryBackend(IStorageBackend):
     
     def _matches_filters(self, data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
         """Check if data matches filters."""
-        for key, value in filters.items():
-            if key not in data or data[key] != value:
-                return False
-        return True
\ No newline at end of file
+        return matches_filters(data, filters)
@@ -6,6 +6,8 @@ Provides hierarchical caching with LRU eviction, TTL support,
 and automatic invalidation for improved performance.
 """
 
+import bisect
+import fnmatch
 import logging
 import threading
 import time
@@ -58,6 +60,225 @@ class CacheStats:
         return (self.hits / total * 100) if total > 0 else 0.0
 
 
+class FrequencySketch:
+    """
+    Count-min sketch estimating how often keys were accessed recently.
+    
+    Uses a fixed number of 8-bit counters (capped at 15) regardless of how
+    many distinct keys are seen. All counters are halved after a sample of
+    ``10 * width`` increments so that old popularity fades and the sketch
+    tracks recent frequency, as in TinyLFU.
+    """
+    
+    _MAX_COUNT = 15
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    _HALVE_TABLE = bytes(i >> 1 for i in range(256))
+    
+    def __init__(self, capacity: int, depth: int = 4):
+        """
+        Initialize frequency sketch.
+        
+        Args:
+            capacity: Expected number of cached entries; sizes the counter rows
+            depth: Number of hash rows (at most 4)
+        """
+        width = 16
+        while width < capacity:
+            width <<= 1
+        
+        self._mask = width - 1
+        self._seeds = self._SEEDS[:max(1, min(depth, len(self._SEEDS)))]
+        self._rows = [bytearray(width) for _ in self._seeds]
+        self._sample_size = 10 * width
+        self._additions = 0
+    
+    def increment(self, key: Any) -> None:
+        """Record one access to a key."""
+        key_hash = hash(key)
+        added = False
+        for row, seed in zip(self._rows, self._seeds):
+            index = self._index(key_hash, seed)
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+                added = True
+        
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._age()
+    
+    def estimate(self, key: Any) -> int:
+        """Return the estimated recent access count of a key."""
+        key_hash = hash(key)
+        return min(row[self._index(key_hash, seed)] for row, seed in zip(self._rows, self._seeds))
+    
+    def clear(self) -> None:
+        """Reset all counters."""
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+    
+    def _index(self, key_hash: int, seed: int) -> int:
+        """Map a key hash to a counter index for one row."""
+        mixed = ((key_hash ^ seed) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return (mixed >> 32) & self._mask
+    
+    def _age(self) -> None:
+        """Halve every counter so that stale popularity decays."""
+        for row in self._rows:
+            row[:] = row.translate(self._HALVE_TABLE)
+        self._additions //= 2
+
+
+class PrefixIndex:
+    """
+    Set of strings answering prefix queries.
+    
+    Strings sharing a prefix are adjacent in sorted order, so finding
+    them is a binary search plus the matches, instead of a scan of every
+    string. Adds and removes are set operations; the sorted list is only
+    brought up to date by the next query, which merges the strings added
+    since in one pass. Not thread-safe.
+    """
+    
+    def __init__(self):
+        self._members: Set[str] = set()
+        self._sorted: List[str] = []
+        # Members not yet in the sorted list, and sorted strings no longer members
+        self._added: Set[str] = set()
+        self._removed: Set[str] = set()
+    
+    def __len__(self) -> int:
+        return len(self._members)
+    
+    def __contains__(self, item: str) -> bool:
+        return item in self._members
+    
+    def __iter__(self):
+        return iter(self._ordered())
+    
+    def add(self, item: str) -> None:
+        """Add a string if not already present."""
+        if item in self._members:
+            return
+        self._members.add(item)
+        if item in self._removed:
+            self._removed.discard(item)
+        else:
+            self._added.add(item)
+    
+    def discard(self, item: str) -> None:
+        """Remove a string if present."""
+        if item not in self._members:
+            return
+        self._members.discard(item)
+        if item in self._added:
+            self._added.discard(item)
+        else:
+            self._removed.add(item)
+    
+    def with_prefix(self, prefix: str) -> List[str]:
+        """Return all strings starting with a prefix, in sorted order."""
+        items = self._ordered()
+        start = bisect.bisect_left(items, prefix)
+        stop = start
+        while stop < len(items) and items[stop].startswith(prefix):
+            stop += 1
+        return items[start:stop]
+    
+    def retain(self, keep: Callable[[str], bool]) -> None:
+        """Remove every string for which ``keep`` is false."""
+        for item in [item for item in self._members if not keep(item)]:
+            self.discard(item)
+    
+    def clear(self) -> None:
+        """Remove all strings."""
+        self._members.clear()
+        self._sorted.clear()
+        self._added.clear()
+        self._removed.clear()
+    
+    def _ordered(self) -> List[str]:
+        """The members in sorted order, applying pending adds and removes."""
+        if self._removed:
+            self._sorted = [item for item in self._sorted if item not in self._removed]
+            self._removed.clear()
+        if self._added:
+            # Two sorted runs; sort() merges them in linear time
+            self._sorted.extend(sorted(self._added))
+            self._sorted.sort()
+            self._added.clear()
+        return self._sorted
+
+
+class TagIndex:
+    """
+    Reverse index from cache tags to the keys carrying them.
+    
+    Lets caches drop every entry that depends on something (a pattern, a
+    rule, a directory) without scanning all keys. Not thread-safe; callers
+    update it under the same lock that guards their entries.
+    """
+    
+    def __init__(self):
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._tags_by_key: Dict[str, frozenset] = {}
+        self._tags = PrefixIndex()
+    
+    def __len__(self) -> int:
+        return len(self._tags_by_key)
+    
+    def add(self, key: str, tags: Optional[Any]) -> None:
+        """Associate a key with tags, replacing any previous tags."""
+        self.discard(key)
+        if not tags:
+            return
+        
+        tag_set = frozenset(tags)
+        self._tags_by_key[key] = tag_set
+        for tag in tag_set:
+            keys = self._keys_by_tag.get(tag)
+            if keys is None:
+                keys = self._keys_by_tag[tag] = set()
+                self._tags.add(tag)
+            keys.add(key)
+    
+    def discard(self, key: str) -> None:
+        """Forget a key that is no longer cached."""
+        tag_set = self._tags_by_key.pop(key, None)
+        if not tag_set:
+            return
+        
+        for tag in tag_set:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+                    self._tags.discard(tag)
+    
+    def keys_for(self, tags: Any) -> Set[str]:
+        """Return all keys carrying any of the given tags."""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys.update(self._keys_by_tag.get(tag, ()))
+        return keys
+    
+    def tags_with_prefix(self, prefix: str) -> List[str]:
+        """Return all known tags starting with a prefix."""
+        return self._tags.with_prefix(prefix)
+    
+    def get_tags(self, key: str) -> frozenset:
+        """Return the tags of a key."""
+        return self._tags_by_key.get(key, frozenset())
+    
+    def clear(self) -> None:
+        """Forget all keys and tags."""
+        self._keys_by_tag.clear()
+        self._tags_by_key.clear()
+        self._tags.clear()
+
+
 class ICacheLevel(ABC):
     """Interface for cache levels."""
     
@@ -81,6 +302,10 @@ class ICacheLevel(ABC):
         """Clear all cache entries."""
         pass
     
+    def contains(self, key: str) -> bool:
+        """Check whether a key is cached; levels override this to skip hit/miss counting."""
+        return self.get(key) is not None
+    
     @abstractmethod
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
@@ -176,6 +401,12 @@ class LRUCache(ICacheLevel):
                 return True
             return False
     
+    def contains(self, key: str) -> bool:
+        """Check whether a key is cached."""
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and not entry.is_expired
+    
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
@@ -327,6 +558,10 @@ class FileCache(ICacheLevel):
                 return True
             return False
     
+    def contains(self, key: str) -> bool:
+        """Check whether a key has a cache file."""
+        return self._get_file_path(key).exists()
+    
     def clear(self) -> None:
         """Clear all cache files."""
         with self._lock:
@@ -403,9 +638,14 @@ class MultiLevelCacheManager:
         self._lock = threading.RLock()
         self._logger = logging.getLogger(f"{__name__}.MultiLevelCacheManager")
         
-        # Track promotion/demotion candidates
-        self._access_counts: Dict[str, int] = {}
+        # Track promotion candidates in a fixed-size frequency sketch
+        self._access_sketch = FrequencySketch(capacity=1024)
         self._promote_threshold = 3  # Promote to L1 after N accesses
+        
+        # Keys ever set, for wildcard invalidation; keys evicted by a level
+        # are pruned once the index doubles
+        self._keys = PrefixIndex()
+        self._prune_at = 1024
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache hierarchy."""
@@ -447,6 +687,10 @@ class MultiLevelCacheManager:
             
             if level == "l2" or (level == "auto" and self._l2_cache):
                 self._l2_cache.set(key, value, ttl)
+            
+            self._keys.add(key)
+            if len(self._keys) >= self._prune_at:
+                self._prune_keys()
     
     def delete(self, key: str) -> bool:
         """Delete value from all cache levels."""
@@ -459,34 +703,38 @@ class MultiLevelCacheManager:
             if self._l2_cache and self._l2_cache.delete(key):
                 deleted = True
             
-            # Clean up access tracking
-            self._access_counts.pop(key, None)
-            
+            self._keys.discard(key)
             return deleted
     
     def invalidate(self, pattern: str) -> int:
         """
         Invalidate cache entries matching pattern.
         
+        Only keys starting with the pattern's literal prefix (the part
+        before the first wildcard) are looked at, found by a binary
+        search of the key index, so ``"rule:42:*"`` costs the same with
+        ten keys as with a million.
+        
         Args:
-            pattern: Pattern to match (simple wildcard support)
+            pattern: Key, or shell-style wildcard pattern (``*``, ``?``, ``[...]``)
         
         Returns:
             Number of entries invalidated
         """
-        # This is a simplified implementation
-        # Real implementation would support proper pattern matching
-        invalidated = 0
-        
-        if "*" in pattern:
-            # Wildcard invalidation - would need to track all keys
-            self._logger.warning("Wildcard invalidation not fully implemented")
-        else:
-            # Exact match
-            if self.delete(pattern):
-                invalidated = 1
+        wildcard = next((i for i, char in enumerate(pattern) if char in "*?["), None)
+        if wildcard is None:
+            return 1 if self.delete(pattern) else 0
         
-        return invalidated
+        with self._lock:
+            candidates = self._keys.with_prefix(pattern[:wildcard])
+            if pattern[wildcard:] != "*":
+                candidates = [key for key in candidates if fnmatch.fnmatchcase(key, pattern)]
+            
+            invalidated = 0
+            for key in candidates:
+                if self.delete(key):
+                    invalidated += 1
+            return invalidated
     
     def clear(self, level: Optional[str] = None) -> None:
         """Clear cache levels."""
@@ -499,7 +747,8 @@ class MultiLevelCacheManager:
                     self._l2_cache.clear()
             
             if level is None:
-                self._access_counts.clear()
+                self._access_sketch.clear()
+                self._keys.clear()
     
     def get_stats(self) -> Dict[str, CacheStats]:
         """Get statistics for all cache levels."""
@@ -524,10 +773,16 @@ class MultiLevelCacheManager:
         
         return cleanup_results
     
+    def _prune_keys(self) -> None:
+        """Drop index keys that no level holds any more. Caller holds the lock."""
+        levels = [level for level in (self._l1_cache, self._l2_cache) if level is not None]
+        self._keys.retain(lambda key: any(level.contains(key) for level in levels))
+        self._prune_at = max(1024, 2 * len(self._keys))
+    
     def _track_access(self, key: str) -> None:
         """Track access for promotion/demotion decisions."""
-        self._access_counts[key] = self._access_counts.get(key, 0) + 1
+        self._access_sketch.increment(key)
     
     def _should_promote(self, key: str) -> bool:
         """Check if key should be promoted to L1."""
-        return self._access_counts.get(key, 0) >= self._promote_threshold
\ No newline at end of file
+        return self._access_sketch.estimate(key) >= self._promote_threshold
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+Secondary Indexes
+=================
+
+Field indexes for the file system and memory backends. Each index maps a
+field value to the ids of the entities holding it and keeps a sorted key
+list for range filters, so ``select`` can answer equality, ``$in`` and
+``$gt``/``$gte``/``$lt``/``$lte`` filters without reading every entity.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+RANGE_OPERATORS = ('$gt', '$gte', '$lt', '$lte')
+
+
+def matches_filters(data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """
+    Check if an entity matches filters.
+
+    A filter value is either a value to compare for equality or a dict of
+    operators: ``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$ne``, ``$in``, ``$nin``.
+    """
+    for key, value in filters.items():
+        if key not in data:
+            return False
+
+        data_value = data[key]
+
+        # Handle different filter types
+        if isinstance(value, dict):
+            # Range filters like {'$gte': 10, '$lt': 20}
+            for op, filter_value in value.items():
+                if op == '$gte' and not (data_value >= filter_value):
+                    return False
+                elif op == '$gt' and not (data_value > filter_value):
+                    return False
+                elif op == '$lte' and not (data_value <= filter_value):
+                    return False
+                elif op == '$lt' and not (data_value < filter_value):
+                    return False
+                elif op == '$ne' and data_value == filter_value:
+                    return False
+                elif op == '$in' and data_value not in filter_value:
+                    return False
+                elif op == '$nin' and data_value in filter_value:
+                    return False
+        else:
+            # Direct equality
+            if data_value != value:
+                return False
+
+    return True
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+class SecondaryIndex:
+    """
+    Hash index with a lazily sorted key list for one field.
+
+    Entities without the field, or whose value is unhashable, are not
+    indexed; such values can never equal a filter value that the index
+    answers, so lookups stay exact.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self._ids_by_value: Dict[Any, Set[Any]] = {}
+        self._value_by_id: Dict[Any, Any] = {}
+        self._sorted_keys: Optional[List[Any]] = None
+        self._sortable = True
+
+    def __len__(self) -> int:
+        return len(self._value_by_id)
+
+    def add(self, entity_id: Any, data: Dict[str, Any]) -> None:
+        """Index an entity, replacing any previous entry for its id."""
+        self.remove(entity_id)
+        if self.field not in data:
+            return
+        value = data[self.field]
+        if not _hashable(value):
+            return
+
+        ids = self._ids_by_value.get(value)
+        if ids is None:
+            ids = self._ids_by_value[value] = set()
+            self._sorted_keys = None
+        ids.add(entity_id)
+        self._value_by_id[entity_id] = value
+
+    def remove(self, entity_id: Any) -> None:
+        """Drop an entity from the index."""
+        if entity_id not in self._value_by_id:
+            return
+        value = self._value_by_id.pop(entity_id)
+        ids = self._ids_by_value[value]
+        ids.discard(entity_id)
+        if not ids:
+            del self._ids_by_value[value]
+            self._sorted_keys = None
+
+    def lookup(self, condition: Any) -> Optional[Set[Any]]:
+        """
+        Find ids matching a filter condition.
+
+        Returns:
+            Candidate ids, or None if the condition cannot be answered
+            from the index
+        """
+        if not isinstance(condition, dict):
+            if not _hashable(condition):
+                return None
+            return set(self._ids_by_value.get(condition, ()))
+
+        result: Optional[Set[Any]] = None
+        if '$in' in condition:
+            values = condition['$in']
+            if not all(_hashable(value) for value in values):
+                return None
+            result = set()
+            for value in values:
+                result |= self._ids_by_value.get(value, set())
+
+        bounds = {op: condition[op] for op in RANGE_OPERATORS if op in condition}
+        if bounds:
+            in_range = self._range(bounds)
+            if in_range is None:
+                return result
+            result = in_range if result is None else result & in_range
+
+        # Other operators ($ne, $nin) are applied by the caller's filter check
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for a sidecar file; values keep their JSON types."""
+        return {
+            'field': self.field,
+            'entries': [[value, sorted(ids, key=str)] for value, ids in self._ids_by_value.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SecondaryIndex":
+        index = cls(data['field'])
+        for value, ids in data.get('entries', []):
+            for entity_id in ids:
+                index._value_by_id[entity_id] = value
+            index._ids_by_value[value] = set(ids)
+        return index
+
+    @classmethod
+    def build(cls, field: str, entities: Iterable[Dict[str, Any]], key_field: str = 'id') -> "SecondaryIndex":
+        """Build an index from existing entities."""
+        index = cls(field)
+        for data in entities:
+            if key_field in data:
+                index.add(data[key_field], data)
+        return index
+
+    def _range(self, bounds: Dict[str, Any]) -> Optional[Set[Any]]:
+        keys = self._keys()
+        if keys is None:
+            return None
+
+        try:
+            start, end = 0, len(keys)
+            if '$gte' in bounds:
+                start = max(start, bisect_left(keys, bounds['$gte']))
+            if '$gt' in bounds:
+                start = max(start, bisect_right(keys, bounds['$gt']))
+            if '$lte' in bounds:
+                end = min(end, bisect_right(keys, bounds['$lte']))
+            if '$lt' in bounds:
+                end = min(end, bisect_left(keys, bounds['$lt']))
+        except TypeError:
+            # Bound is not comparable with the indexed values
+            return None
+
+        result: Set[Any] = set()
+        for value in keys[start:end]:
+            result |= self._ids_by_value[value]
+        return result
+
+    def _keys(self) -> Optional[List[Any]]:
+        if self._sorted_keys is None:
+            try:
+                self._sorted_keys = sorted(self._ids_by_value)
+                self._sortable = True
+            except TypeError:
+                # Mixed value types; range filters fall back to a scan
+                self._sorted_keys = []
+                self._sortable = False
+        return self._sorted_keys if self._sortable else None
+
+
+def plan_candidates(filters: Optional[Dict[str, Any]],
+                    indexes: Dict[str, SecondaryIndex],
+                    key_field: str = 'id') -> Optional[Set[Any]]:
+    """
+    Narrow a query to candidate ids using the primary key and indexes.
+
+    Returns:
+        Ids that may match (to be checked with ``matches_filters``), or None
+        if no filter can be answered without a full scan
+    """
+    if not filters:
+        return None
+
+    candidates: Optional[Set[Any]] = None
+
+    if key_field in filters:
+        condition = filters[key_field]
+        if not isinstance(condition, dict) and _hashable(condition):
+            candidates = {condition}
+        elif isinstance(condition, dict) and '$in' in condition and \
+                all(_hashable(value) for value in condition['$in']):
+            candidates = set(condition['$in'])
+
+    for field, condition in filters.items():
+        index = indexes.get(field)
+        if index is None:
+            continue
+        ids = index.lookup(condition)
+        if ids is None:
+            continue
+        candidates = ids if candidates is None else candidates & ids
+        if not candidates:
+            break
+
+    return candidates
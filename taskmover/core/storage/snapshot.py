@@ -0,0 +1,169 @@
+"""
+Startup Snapshots
+=================
+
+Binary snapshots of parsed repository files so that startup can skip
+YAML parsing. A snapshot stores the already-parsed data structure as a
+``marshal`` blob together with a fingerprint (mtime, size and content
+hash) of every source file it was built from. A snapshot whose sources
+changed is ignored and rebuilt from the source files on the next load.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+
+# libyaml-backed loader and emitter when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+SNAPSHOT_MAGIC = b"TMSNAP"
+SNAPSHOT_VERSION = 1
+
+# marshal's format is only stable within one interpreter version
+_HEADER = SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION, sys.version_info[0], sys.version_info[1]])
+
+Fingerprint = Tuple[str, int, int, str]
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+def dump_yaml(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Emit YAML with the fastest available safe dumper."""
+    return yaml.dump(data, stream, Dumper=YamlDumper, **kwargs)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StartupSnapshot:
+    """
+    Snapshot cache for data parsed from a fixed set of source files.
+
+    Validation first compares each source's mtime and size; a source
+    whose mtime moved but whose size did not is re-hashed, so touching a
+    file without changing it keeps the snapshot valid.
+    """
+
+    def __init__(self, snapshot_file: Path, sources: Sequence[Path]):
+        self.snapshot_file = Path(snapshot_file)
+        self.sources = [Path(source) for source in sources]
+
+    def fingerprint(self) -> Optional[List[Fingerprint]]:
+        """
+        Fingerprint the current state of all source files.
+
+        Take the fingerprint before reading the sources so that a
+        concurrent edit produces a snapshot that fails validation
+        rather than one that hides the edit.
+
+        Returns:
+            List of (name, mtime_ns, size, hash) tuples, or None if a
+            source is missing
+        """
+        result = []
+        for source in self.sources:
+            try:
+                stat = source.stat()
+                result.append((source.name, stat.st_mtime_ns, stat.st_size, _hash_file(source)))
+            except OSError:
+                return None
+        return result
+
+    def load(self) -> Optional[Any]:
+        """
+        Load the snapshot payload if it matches the source files.
+
+        Returns:
+            The payload, or None if the snapshot is missing, corrupt or stale
+        """
+        try:
+            blob = self.snapshot_file.read_bytes()
+        except OSError:
+            return None
+
+        if not blob.startswith(_HEADER):
+            return None
+
+        try:
+            fingerprints, payload = marshal.loads(blob[len(_HEADER):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+        if not self._is_current(fingerprints):
+            return None
+        return payload
+
+    def save(self, payload: Any, fingerprints: Optional[List[Fingerprint]] = None) -> bool:
+        """
+        Write a snapshot of ``payload``.
+
+        Args:
+            payload: Data built from builtin types only (dict, list, str, ...)
+            fingerprints: Fingerprint taken before the sources were read;
+                the current state of the sources is used when omitted
+
+        Returns:
+            True if the snapshot was written
+        """
+        if fingerprints is None:
+            fingerprints = self.fingerprint()
+        if fingerprints is None:
+            return False
+
+        try:
+            blob = _HEADER + marshal.dumps((fingerprints, payload))
+        except ValueError:
+            # Payload holds a type marshal cannot store
+            return False
+
+        temp_file = self.snapshot_file.with_suffix(self.snapshot_file.suffix + ".tmp")
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(blob)
+            os.replace(temp_file, self.snapshot_file)
+            return True
+        except OSError:
+            if temp_file.exists():
+                temp_file.unlink()
+            return False
+
+    def invalidate(self) -> None:
+        """Remove the snapshot file."""
+        try:
+            self.snapshot_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _is_current(self, fingerprints: Any) -> bool:
+        if not isinstance(fingerprints, list) or len(fingerprints) != len(self.sources):
+            return False
+
+        by_name: Dict[str, Path] = {source.name: source for source in self.sources}
+        for name, mtime_ns, size, digest in fingerprints:
+            source = by_name.get(name)
+            if source is None:
+                return False
+            try:
+                stat = source.stat()
+            except OSError:
+                return False
+            if stat.st_size != size:
+                return False
+            if stat.st_mtime_ns != mtime_ns and _hash_file(source) != digest:
+                return False
+        return True
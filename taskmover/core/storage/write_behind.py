@@ -0,0 +1,161 @@
+"""
+Write-Behind Helpers
+
+Debounced flushing and atomic file replacement shared by the rule
+storage components and the settings manager.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from weakref import WeakSet
+
+
+# Pending flushers run once more when the interpreter exits
+_active_flushers: "WeakSet[DebouncedFlush]" = WeakSet()
+
+
+def _flush_pending() -> None:
+    for flusher in list(_active_flushers):
+        try:
+            flusher.flush_now()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_pending)
+
+
+class DebouncedFlush:
+    """
+    Coalesces flush requests into one call per ``delay`` seconds.
+
+    The first ``schedule()`` after a flush starts a timer; further calls
+    before it fires are absorbed. With ``trailing`` every call pushes the
+    flush back, so it runs once ``delay`` seconds pass without a request,
+    but no later than ``max_wait`` seconds after the first one. A
+    ``delay`` of 0 flushes synchronously.
+
+    A timer-driven flush that raises is retried with exponential backoff,
+    up to ``MAX_RETRY_DELAY`` seconds apart, until one succeeds.
+    """
+
+    # Longest wait between retries of a failing flush
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, flush: Callable[[], None], delay: float, name: str = "WriteBehind",
+                 trailing: bool = False, max_wait: float | None = None):
+        self._flush = flush
+        self.delay = delay
+        self.trailing = trailing
+        self.max_wait = max_wait
+        self._name = name
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending = False
+        self._first_request = 0.0
+        self._due = 0.0
+        self._failures = 0
+        _active_flushers.add(self)
+
+    @property
+    def failures(self) -> int:
+        """Consecutive failed flushes since the last successful one"""
+        return self._failures
+
+    @property
+    def pending(self) -> bool:
+        """Whether a flush is scheduled but has not run yet"""
+        return self._pending
+
+    def schedule(self) -> None:
+        """Request a flush"""
+        if self.delay <= 0:
+            self._flush()
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if not self._pending:
+                self._pending = True
+                self._first_request = now
+                self._due = now + self.delay
+            elif self.trailing:
+                self._due = now + self.delay
+            if self.max_wait is not None:
+                self._due = min(self._due, self._first_request + self.max_wait)
+            if self._timer is None:
+                self._start_timer(self._due - now)
+
+    def flush_now(self) -> None:
+        """Run a pending flush immediately"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            pending, self._pending = self._pending, False
+        if timer is not None:
+            timer.cancel()
+        if pending:
+            self._flush()
+
+    def cancel(self) -> None:
+        """Drop a pending flush without running it"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            self._pending = False
+            self._failures = 0
+        if timer is not None:
+            timer.cancel()
+
+    def _start_timer(self, wait: float) -> None:
+        self._timer = threading.Timer(max(wait, 0.0), self._run)
+        self._timer.name = self._name
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._pending and self._due > time.monotonic():
+                # Pushed back by a later request; wait for the rest
+                self._start_timer(self._due - time.monotonic())
+                return
+            pending, self._pending = self._pending, False
+        if pending:
+            try:
+                self._flush()
+            except Exception:
+                # Flush callables log their own failures and stay dirty
+                self._retry()
+            else:
+                self._failures = 0
+
+    def _retry(self) -> None:
+        """Schedule another attempt after a failed flush"""
+        with self._lock:
+            self._failures += 1
+            backoff = min(self.MAX_RETRY_DELAY, max(self.delay, 0.05) * 2 ** min(self._failures, 16))
+            now = time.monotonic()
+            if not self._pending:
+                self._pending = True
+                self._first_request = now
+            self._due = max(self._due, now + backoff)
+            if self._timer is None:
+                self._start_timer(self._due - now)
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Write a file via a temporary file and rename so readers never see a partial write"""
+    temp_file = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(temp_file, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except Exception:
+        if temp_file.exists():
+            temp_file.unlink()
+        raise
@@ -0,0 +1,522 @@
+"""
+Data Display Components
+=======================
+
+Virtualized table for large data sets. Rows are requested from a data
+source only for the visible window, and sorting and filtering run on a
+background thread, so previews and histories with hundreds of thousands
+of rows scroll as smoothly as short ones.
+"""
+
+import logging
+import queue
+import threading
+import tkinter as tk
+from abc import ABC, abstractmethod
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .base_component import BaseComponent
+from .theme_manager import get_theme_manager
+
+logger = logging.getLogger(__name__)
+
+
+class TableDataSource(ABC):
+    """
+    Row provider for a VirtualTable.
+
+    Sources are treated as snapshots: to change the rows, hand the table
+    a new source instead of mutating one that a background sort may be
+    reading.
+    """
+
+    columns: Sequence[str] = ()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of rows."""
+
+    @abstractmethod
+    def item(self, index: int) -> Any:
+        """Underlying object of a row."""
+
+    @abstractmethod
+    def format_row(self, item: Any) -> Tuple[Any, ...]:
+        """Display values of a row, one per column."""
+
+    def row_id(self, index: int, item: Any) -> str:
+        """Stable identifier of a row."""
+        return str(index)
+
+    def sort_value(self, item: Any, column: str) -> Any:
+        """Value a column sorts by; defaults to the displayed value."""
+        return self.format_row(item)[list(self.columns).index(column)]
+
+
+class ListDataSource(TableDataSource):
+    """Data source over a list, formatting rows only when they are shown."""
+
+    def __init__(self, items: Sequence[Any], columns: Sequence[str],
+                 formatter: Callable[[Any], Tuple[Any, ...]],
+                 sort_keys: Optional[Dict[str, Callable[[Any], Any]]] = None,
+                 row_id: Optional[Callable[[Any], str]] = None):
+        self.items = items
+        self.columns = tuple(columns)
+        self._formatter = formatter
+        self._sort_keys = sort_keys or {}
+        self._row_id = row_id
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def item(self, index: int) -> Any:
+        return self.items[index]
+
+    def format_row(self, item: Any) -> Tuple[Any, ...]:
+        return self._formatter(item)
+
+    def row_id(self, index: int, item: Any) -> str:
+        return self._row_id(item) if self._row_id else str(index)
+
+    def sort_value(self, item: Any, column: str) -> Any:
+        key = self._sort_keys.get(column)
+        if key is not None:
+            return key(item)
+        return super().sort_value(item, column)
+
+
+class _EmptySource(TableDataSource):
+    def __len__(self) -> int:
+        return 0
+
+    def item(self, index: int) -> Any:
+        raise IndexError(index)
+
+    def format_row(self, item: Any) -> Tuple[Any, ...]:
+        return ()
+
+
+class QueryCancelled(Exception):
+    """Raised inside a view query that a newer query superseded."""
+
+
+class TableView:
+    """
+    Filtered and sorted view over a data source.
+
+    ``order`` maps view positions to source indexes; an unsorted,
+    unfiltered view uses a ``range`` so no index list is built.
+    """
+
+    CANCEL_CHECK_INTERVAL = 4096
+
+    def __init__(self, source: Optional[TableDataSource] = None,
+                 order: Optional[Sequence[int]] = None):
+        self.source = source if source is not None else _EmptySource()
+        self.order = order if order is not None else range(len(self.source))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def source_index(self, position: int) -> int:
+        return self.order[position]
+
+    def item(self, position: int) -> Any:
+        return self.source.item(self.order[position])
+
+    def position(self, source_index: int) -> Optional[int]:
+        """View position of a source row, or None if it is filtered out."""
+        if isinstance(self.order, range):
+            return source_index if source_index in self.order else None
+        try:
+            return self.order.index(source_index)
+        except ValueError:
+            return None
+
+    def rows(self, start: int, stop: int) -> List[Tuple[int, str, Tuple[Any, ...]]]:
+        """(source index, row id, display values) for positions ``start:stop``."""
+        result = []
+        source = self.source
+        for index in self.order[max(0, start):max(0, stop)]:
+            item = source.item(index)
+            result.append((index, source.row_id(index, item), source.format_row(item)))
+        return result
+
+    @classmethod
+    def query(cls, source: TableDataSource, predicate: Optional[Callable[[Any], bool]] = None,
+              sort_column: Optional[str] = None, reverse: bool = False,
+              cancelled: Optional[Callable[[], bool]] = None) -> "TableView":
+        """
+        Build a view; may run off the UI thread.
+
+        Raises:
+            QueryCancelled: If ``cancelled`` reports a newer query
+        """
+        count = len(source)
+        check = cls.CANCEL_CHECK_INTERVAL
+
+        def checkpoint():
+            if cancelled is not None and cancelled():
+                raise QueryCancelled()
+
+        order: Sequence[int] = range(count)
+        if predicate is not None:
+            kept = []
+            for index in range(count):
+                if index % check == 0:
+                    checkpoint()
+                if predicate(source.item(index)):
+                    kept.append(index)
+            order = kept
+
+        if sort_column is not None:
+            checkpoint()
+            keys = {}
+            for position, index in enumerate(order):
+                if position % check == 0:
+                    checkpoint()
+                value = source.sort_value(source.item(index), sort_column)
+                # None sorts last ascending, like an empty cell
+                keys[index] = (value is None, value)
+            checkpoint()
+            try:
+                order = sorted(order, key=keys.__getitem__, reverse=reverse)
+            except TypeError:
+                # Mixed value types in one column; compare as text
+                order = sorted(order, key=lambda i: (keys[i][0], str(keys[i][1])), reverse=reverse)
+
+        return cls(source, order)
+
+
+class VirtualTable(BaseComponent):
+    """
+    Table that only materializes its visible rows.
+
+    The Treeview holds one item per visible row; scrolling re-fills those
+    items from the data source instead of inserting every row. Views of
+    more than ``SYNC_QUERY_ROWS`` rows are sorted and filtered on a
+    worker thread and applied when ready.
+
+    Callbacks: ``row_selected`` (item or None), ``row_activated`` (item),
+    ``view_changed`` (number of rows in the view) and ``query_failed``
+    (exception raised by a background sort or filter).
+    """
+
+    POLL_MS = 15
+    SYNC_QUERY_ROWS = 5000
+    WHEEL_ROWS = 3
+
+    def __init__(self, parent: tk.Widget, columns: Sequence[Tuple[str, str, int, int]],
+                 height: int = 15, sortable: bool = True, **kwargs):
+        # (column id, heading, width, minwidth)
+        self.columns = list(columns)
+        self.height = height
+        self.sortable = sortable
+        self.tree: Optional[ttk.Treeview] = None
+        self.view = TableView()
+
+        self._offset = 0
+        self._visible_rows = height
+        self._row_iids: List[str] = []
+        self._rows_by_iid: Dict[str, int] = {}
+        self._selected: Optional[int] = None
+
+        self._predicate: Optional[Callable[[Any], bool]] = None
+        self._sort_column: Optional[str] = None
+        self._sort_reverse = False
+        self._generation = 0
+        self._results: "queue.Queue[Tuple[int, Optional[TableView], Optional[Exception]]]" = queue.Queue()
+        # Generation of the background query still to be applied, if any
+        self._pending_query: Optional[int] = None
+        self._poll_id = None
+
+        super().__init__(parent, **kwargs)
+
+    def _create_component(self):
+        """Create the table."""
+        theme = get_theme_manager()
+        tokens = theme.get_current_tokens()
+
+        self.configure(bg=tokens.colors["background"])
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[column[0] for column in self.columns],
+            show="headings",
+            height=self.height,
+            selectmode="browse",
+            style="Modern.Treeview"
+        )
+
+        for column_id, heading, width, minwidth in self.columns:
+            command = (lambda c=column_id: self._on_heading_click(c)) if self.sortable else ""
+            self.tree.heading(column_id, text=heading, command=command)
+            self.tree.column(column_id, width=width, minwidth=minwidth)
+
+        # The vertical scrollbar addresses the whole view, not the Treeview items
+        self.v_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        h_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Double-1>", self._on_activate)
+        self.tree.bind("<Return>", self._on_activate)
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-self.WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(self.WHEEL_ROWS))
+        for key, step in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda e, s=step: self._move_selection(s))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._visible_rows))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._visible_rows))
+        self.tree.bind("<Home>", lambda e: self._move_selection(-len(self.view)))
+        self.tree.bind("<End>", lambda e: self._move_selection(len(self.view)))
+
+        self._update_sort_headings()
+
+    # Public API
+
+    def set_source(self, source: TableDataSource):
+        """Show a new data source with the current sort and filter."""
+        self._run_query(source)
+
+    def set_filter(self, predicate: Optional[Callable[[Any], bool]]):
+        """Show only items for which ``predicate`` is true."""
+        self._predicate = predicate
+        self._run_query(self.view.source)
+
+    def sort_by(self, column: Optional[str], reverse: bool = False):
+        """Sort by a column, or restore source order with None."""
+        self._sort_column = column
+        self._sort_reverse = reverse
+        self._update_sort_headings()
+        self._run_query(self.view.source)
+
+    def refresh(self):
+        """Re-render the visible rows."""
+        self._render()
+
+    def row_count(self) -> int:
+        """Number of rows in the current view."""
+        return len(self.view)
+
+    def selected_item(self) -> Any:
+        """Item of the selected row, or None."""
+        if self._selected is None:
+            return None
+        return self.view.source.item(self._selected)
+
+    def scroll_to(self, position: int):
+        """Scroll so the row at ``position`` is visible."""
+        if position < self._offset:
+            self._set_offset(position)
+        elif position >= self._offset + self._visible_rows:
+            self._set_offset(position - self._visible_rows + 1)
+
+    def destroy(self):
+        """Stop polling for query results before the widget goes away."""
+        self._generation += 1
+        self._pending_query = None
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        super().destroy()
+
+    # Queries
+
+    def _run_query(self, source: TableDataSource):
+        self._generation += 1
+        generation = self._generation
+        predicate, column, reverse = self._predicate, self._sort_column, self._sort_reverse
+
+        if predicate is None and column is None:
+            self._pending_query = None
+            self._apply_view(TableView(source))
+            return
+        if len(source) <= self.SYNC_QUERY_ROWS:
+            self._pending_query = None
+            self._apply_view(TableView.query(source, predicate, column, reverse))
+            return
+
+        def work():
+            try:
+                view = TableView.query(source, predicate, column, reverse,
+                                       cancelled=lambda: generation != self._generation)
+            except QueryCancelled:
+                return
+            except Exception as e:
+                self._results.put((generation, None, e))
+                return
+            self._results.put((generation, view, None))
+
+        self._pending_query = generation
+        threading.Thread(target=work, name="virtual-table-query", daemon=True).start()
+        if self._poll_id is None:
+            self._poll_id = self.after(self.POLL_MS, self._poll_results)
+
+    def _poll_results(self):
+        """Apply the latest finished query on the Tk thread."""
+        self._poll_id = None
+        latest = None
+        while True:
+            try:
+                generation, view, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._pending_query:
+                latest = (view, error)
+
+        if latest is not None:
+            self._pending_query = None
+            view, error = latest
+            if error is not None:
+                logger.error(f"Table query failed: {error}")
+                self._trigger_callback('query_failed', error)
+            else:
+                self._apply_view(view)
+        elif self._pending_query is not None:
+            self._poll_id = self.after(self.POLL_MS, self._poll_results)
+
+    def _apply_view(self, view: TableView):
+        source_changed = view.source is not self.view.source
+        self.view = view
+        deselected = source_changed and self._selected is not None
+        if source_changed:
+            self._selected = None
+            self._offset = 0
+        self._offset = max(0, min(self._offset, len(view) - self._visible_rows))
+        self._render()
+        if deselected:
+            self._trigger_callback('row_selected', None)
+        self._trigger_callback('view_changed', len(view))
+
+    # Rendering
+
+    def _render(self):
+        if not self.tree:
+            return
+        rows = self.view.rows(self._offset, self._offset + self._visible_rows)
+
+        # Reuse the existing items; only the count of visible rows changes them
+        while len(self._row_iids) < len(rows):
+            self._row_iids.append(self.tree.insert("", "end"))
+        while len(self._row_iids) > len(rows):
+            self.tree.delete(self._row_iids.pop())
+
+        self._rows_by_iid = {}
+        selected_iid = None
+        for iid, (index, row_id, values) in zip(self._row_iids, rows):
+            self.tree.item(iid, values=values, tags=(row_id,))
+            self._rows_by_iid[iid] = index
+            if index == self._selected:
+                selected_iid = iid
+
+        current = self.tree.selection()
+        if selected_iid is not None and current != (selected_iid,):
+            self.tree.selection_set(selected_iid)
+        elif selected_iid is None and current:
+            self.tree.selection_remove(*current)
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self.view)
+        if total <= self._visible_rows:
+            self.v_scrollbar.set(0.0, 1.0)
+        else:
+            self.v_scrollbar.set(self._offset / total, (self._offset + self._visible_rows) / total)
+
+    def _set_offset(self, offset: int):
+        offset = max(0, min(offset, len(self.view) - self._visible_rows))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _scroll_by(self, rows: int):
+        self._set_offset(self._offset + rows)
+        return "break"
+
+    def _update_sort_headings(self):
+        if not self.tree:
+            return
+        for column_id, heading, _, _ in self.columns:
+            if column_id == self._sort_column:
+                heading = f"{heading} {'▼' if self._sort_reverse else '▲'}"
+            self.tree.heading(column_id, text=heading)
+
+    # Event handlers
+
+    def _on_scrollbar(self, action: str, value: str, unit: Optional[str] = None):
+        """Handle scrollbar drags and clicks."""
+        if action == "moveto":
+            self._set_offset(int(float(value) * len(self.view)))
+        elif action == "scroll":
+            step = 1 if unit == "units" else self._visible_rows
+            self._set_offset(self._offset + int(value) * step)
+
+    def _on_mouse_wheel(self, event):
+        """Handle mouse wheel scrolling (Windows and macOS)."""
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        delta = event.delta
+        notches = delta / 120 if abs(delta) >= 120 else (1 if delta > 0 else -1)
+        return self._scroll_by(-int(notches * self.WHEEL_ROWS))
+
+    def _on_resize(self, event):
+        """Fit the number of materialized rows to the table height."""
+        row_height, header_height = 20, 24
+        if self._row_iids:
+            bbox = self.tree.bbox(self._row_iids[0])
+            if bbox:
+                header_height, row_height = bbox[1], bbox[3]
+        visible = max(1, (event.height - header_height) // max(1, row_height))
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self._offset = max(0, min(self._offset, len(self.view) - visible))
+            self._render()
+
+    def _on_heading_click(self, column: str):
+        """Sort by a column; clicking again reverses the order."""
+        reverse = not self._sort_reverse if column == self._sort_column else False
+        self.sort_by(column, reverse)
+
+    def _on_select(self, event):
+        """Track the selected row across scrolling and re-sorting."""
+        selection = self.tree.selection()
+        if not selection:
+            # Cleared by _render when the selected row scrolled out of view
+            return
+        index = self._rows_by_iid.get(selection[0])
+        if index is None or index == self._selected:
+            return
+        self._selected = index
+        self._trigger_callback('row_selected', self.view.source.item(index))
+
+    def _on_activate(self, event):
+        """Handle double-click or Return on a row."""
+        item = self.selected_item()
+        if item is not None:
+            self._trigger_callback('row_activated', item)
+
+    def _move_selection(self, step: int):
+        """Move the selection by ``step`` rows, scrolling as needed."""
+        total = len(self.view)
+        if not total:
+            return "break"
+        position = self.view.position(self._selected) if self._selected is not None else None
+        if position is None:
+            position = self._offset if step > 0 else self._offset + self._visible_rows - 1
+            step = 0
+        position = max(0, min(total - 1, position + step))
+
+        self._selected = self.view.source_index(position)
+        self.scroll_to(position)
+        self._render()
+        self._trigger_callback('row_selected', self.view.source.item(self._selected))
+        return "break"
@@ -0,0 +1,175 @@
+"""
+UI Event Bus
+============
+
+Thread-safe hand-off of events from background workers to the Tk thread.
+Tk must only be touched from the thread running the main loop, so workers
+``post`` events from any thread and a single ``after()`` pump per Tk root
+delivers them to subscribers at a fixed frame rate. Events posted with a
+coalescing key replace the undelivered event with the same topic and key,
+so a worker reporting progress for every file costs one redraw per frame.
+"""
+
+import logging
+import threading
+import tkinter as tk
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class UIEventBus:
+    """
+    Queue of events drained on the Tk thread.
+
+    ``post`` and ``call`` may be used from any thread; everything else
+    belongs to the Tk thread.
+    """
+
+    # ~30 frames per second
+    FRAME_MS = 33
+
+    def __init__(self, root: Optional[tk.Misc] = None, frame_ms: Optional[int] = None):
+        """
+        Args:
+            root: Widget whose ``after()`` drives the pump; without one,
+                ``pump`` must be called directly
+            frame_ms: Pump interval in milliseconds
+        """
+        self.root = root
+        self.frame_ms = frame_ms or self.FRAME_MS
+
+        self._lock = threading.Lock()
+        # Entries are [topic, payload] lists, so a coalesced post can
+        # replace the payload in place and keep its position in the queue
+        self._queue: Deque[List[Any]] = deque()
+        self._latest: Dict[Tuple[str, Hashable], List[Any]] = {}
+        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._pump_id = None
+        self._closed = False
+
+    def subscribe(self, topic: str, handler: Callable[[Any], None]) -> Callable[[], None]:
+        """
+        Call handler on the Tk thread with the payload of each event on topic.
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers.setdefault(topic, []).append(handler)
+        return lambda: self.unsubscribe(topic, handler)
+
+    def unsubscribe(self, topic: str, handler: Callable[[Any], None]):
+        """Stop delivering topic to handler."""
+        handlers = self._subscribers.get(topic)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def post(self, topic: str, payload: Any = None, key: Optional[Hashable] = None):
+        """
+        Queue an event for the next frame. Safe to call from any thread.
+
+        Args:
+            topic: Event topic
+            payload: Value passed to the topic's handlers
+            key: Coalescing key; an undelivered event with the same topic
+                and key is replaced instead of queueing another one
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if key is None:
+                self._queue.append([topic, payload])
+                return
+
+            entry = self._latest.get((topic, key))
+            if entry is not None:
+                entry[1] = payload
+            else:
+                entry = [topic, payload]
+                self._latest[(topic, key)] = entry
+                self._queue.append(entry)
+
+    def call(self, func: Callable, *args):
+        """Run func(*args) on the Tk thread with the next frame."""
+        self.post(None, (func, args))
+
+    def pending(self) -> int:
+        """Number of queued events."""
+        with self._lock:
+            return len(self._queue)
+
+    def pump(self) -> int:
+        """
+        Deliver every queued event. Tk thread only.
+
+        Returns:
+            Number of events delivered
+        """
+        with self._lock:
+            if not self._queue:
+                return 0
+            events, self._queue = self._queue, deque()
+            self._latest.clear()
+
+        for topic, payload in events:
+            if topic is None:
+                func, args = payload
+                self._dispatch("call", func, args)
+                continue
+            # Copy, so handlers may unsubscribe while being called
+            for handler in list(self._subscribers.get(topic, ())):
+                self._dispatch(topic, handler, (payload,))
+
+        return len(events)
+
+    def start(self):
+        """Start the after() pump."""
+        if self.root is not None and self._pump_id is None and not self._closed:
+            self._pump_id = self.root.after(self.frame_ms, self._tick)
+
+    def close(self):
+        """Stop the pump and drop undelivered events."""
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            self._latest.clear()
+        if self._pump_id is not None:
+            try:
+                self.root.after_cancel(self._pump_id)
+            except tk.TclError:
+                pass
+            self._pump_id = None
+
+    def _tick(self):
+        self._pump_id = None
+        self.pump()
+        if self._closed:
+            return
+        try:
+            self._pump_id = self.root.after(self.frame_ms, self._tick)
+        except tk.TclError:
+            # Root window destroyed
+            self.close()
+
+    @staticmethod
+    def _dispatch(topic: str, handler: Callable, args: tuple):
+        try:
+            handler(*args)
+        except Exception as e:
+            logger.error(f"Error in event handler for {topic}: {e}")
+
+
+_buses: "weakref.WeakKeyDictionary[tk.Misc, UIEventBus]" = weakref.WeakKeyDictionary()
+
+
+def get_event_bus(widget: tk.Misc) -> UIEventBus:
+    """Get the event bus of widget's Tk root, starting its pump on first use."""
+    root = widget._root()
+    bus = _buses.get(root)
+    if bus is None or bus._closed:
+        bus = UIEventBus(root)
+        _buses[root] = bus
+        bus.start()
+    return bus
@@ -9,13 +9,30 @@ progress tracking, preview capabilities, and real-time status updates.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox 
 from typing import Dict, Optional, Any, List, Callable
+import asyncio
 import threading
 import time
+from collections import Counter
 from pathlib import Path
 from .base_component import BaseComponent, ModernButton, ModernCard
+from .data_display_components import ListDataSource, VirtualTable
+from .event_bus import UIEventBus, get_event_bus
 from .theme_manager import get_theme_manager
 from .dialog_components import ProgressDialog, ConfirmationDialog, ConflictResolutionDialog
 from .input_components import ModernEntry, ModernCombobox
+from ..core.file_operations import OperationProgress, OperationType
+
+
+# Event bus topics for execution runs
+EXECUTION_PROGRESS = "execution.progress"
+EXECUTION_FINISHED = "execution.finished"
+
+
+def progress_percentage(progress: OperationProgress) -> float:
+    """Overall percentage of a multi-file run, counting the current file's bytes."""
+    if not progress.total_files:
+        return 0.0
+    return (progress.files_processed + progress.progress_percentage / 100) / progress.total_files * 100
 
 
 class DirectorySelector(BaseComponent):
@@ -272,6 +289,7 @@ class FilePreview(BaseComponent):
     
     def __init__(self, parent: tk.Widget, **kwargs):
         self.preview_data: List[Dict[str, Any]] = []
+        self.table: Optional[VirtualTable] = None
         self.tree: Optional[ttk.Treeview] = None
         
         super().__init__(parent, **kwargs)
@@ -294,41 +312,19 @@ class FilePreview(BaseComponent):
         )
         title_label.pack(fill="x", pady=(0, tokens.spacing["lg"]))
         
-        # Tree frame with scrollbars
-        tree_frame = tk.Frame(self, bg=tokens.colors["background"])
-        tree_frame.pack(fill="both", expand=True)
-        
-        # Create treeview
-        columns = ("source", "target", "action", "status")
-        self.tree = ttk.Treeview(
-            tree_frame,
-            columns=columns,
-            show="headings",
-            height=12,
-            style="Modern.Treeview"
+        # Virtualized table: only the visible rows are materialized
+        self.table = VirtualTable(
+            self,
+            columns=[
+                ("source", "Source File", 200, 150),
+                ("target", "Target Location", 200, 150),
+                ("action", "Action", 80, 60),
+                ("status", "Status", 80, 60)
+            ],
+            height=12
         )
-        
-        # Configure columns
-        self.tree.heading("source", text="Source File")
-        self.tree.heading("target", text="Target Location")
-        self.tree.heading("action", text="Action")
-        self.tree.heading("status", text="Status")
-        
-        self.tree.column("source", width=200, minwidth=150)
-        self.tree.column("target", width=200, minwidth=150)
-        self.tree.column("action", width=80, minwidth=60)
-        self.tree.column("status", width=80, minwidth=60)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack tree and scrollbars
-        self.tree.pack(side="left", fill="both", expand=True)
-        v_scrollbar.pack(side="right", fill="y")
-        h_scrollbar.pack(side="bottom", fill="x")
+        self.table.pack(fill="both", expand=True)
+        self.tree = self.table.tree
         
         # Status summary
         self.summary_label = tk.Label(
@@ -344,30 +340,22 @@ class FilePreview(BaseComponent):
         """Update preview with operation data."""
         self.preview_data = preview_data
         
-        # Clear existing items
-        if self.tree:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-        
-        # Add new items
-        for item in preview_data:
-            source = item.get("source", "")
-            target = item.get("target", "")
-            action = item.get("action", "move")
-            status = item.get("status", "pending")
-            
-            # Insert into tree
-            self.tree.insert("", "end", values=(
-                Path(source).name if source else "",
-                str(Path(target).parent) if target else "",
-                action.title(),
-                status.title()
-            ))
+        # Rows are formatted on demand as they scroll into view
+        self.table.set_source(ListDataSource(
+            preview_data,
+            columns=("source", "target", "action", "status"),
+            formatter=self._format_row,
+            sort_keys={
+                "source": lambda item: Path(item.get("source", "")).name.lower(),
+                "target": lambda item: str(Path(item.get("target", "")).parent).lower()
+            }
+        ))
         
         # Update summary
+        actions = Counter(item.get("action") for item in preview_data)
         total = len(preview_data)
-        move_count = sum(1 for item in preview_data if item.get("action") == "move")
-        copy_count = sum(1 for item in preview_data if item.get("action") == "copy")
+        move_count = actions["move"]
+        copy_count = actions["copy"]
         
         summary = f"Total: {total} files"
         if move_count:
@@ -377,6 +365,18 @@ class FilePreview(BaseComponent):
         
         self.summary_label.config(text=summary)
     
+    @staticmethod
+    def _format_row(item: Dict[str, Any]) -> tuple:
+        """Format one operation as table values."""
+        source = item.get("source", "")
+        target = item.get("target", "")
+        return (
+            Path(source).name if source else "",
+            str(Path(target).parent) if target else "",
+            item.get("action", "move").title(),
+            item.get("status", "pending").title()
+        )
+    
     def get_preview_data(self) -> List[Dict[str, Any]]:
         """Get current preview data."""
         return self.preview_data
@@ -545,6 +545,10 @@ class ExecutionView(BaseComponent):
         self.file_preview: Optional[FilePreview] = None
         self.execution_controls: Optional[ExecutionControls] = None
         self.current_operation: Optional[threading.Thread] = None
+        self.progress_dialog: Optional[ProgressDialog] = None
+        self._cancel_event = threading.Event()
+        self._file_operations = None
+        self._subscriptions: List[Callable[[], None]] = []
         
         super().__init__(parent, **kwargs)
     
@@ -614,6 +618,14 @@ class ExecutionView(BaseComponent):
         if not self._validate_inputs():
             return
         
+        if not self._executable_operations():
+            messagebox.showinfo(
+                "Nothing to Execute",
+                "The preview has no file operations to run. Generate a preview of the "
+                "selected ruleset first."
+            )
+            return
+        
         # Confirm execution
         if not self._confirm_execution():
             return
@@ -624,9 +636,8 @@ class ExecutionView(BaseComponent):
     def _on_cancel_requested(self):
         """Handle cancel request."""
         if self.current_operation and self.current_operation.is_alive():
-            # Note: In a real implementation, you'd need a proper way to signal
-            # the thread to stop, as Python threads can't be forcibly killed
-            pass
+            # The worker stops before its next file
+            self._cancel_event.set()
         
         if self.execution_controls:
             self.execution_controls.set_execution_state(False)
@@ -683,78 +694,177 @@ class ExecutionView(BaseComponent):
     
     def _generate_preview_data(self) -> List[Dict[str, Any]]:
         """Generate preview data (placeholder implementation)."""
-        # This would be replaced with actual preview generation logic
+        # This would be replaced with actual preview generation logic.
+        # Rows are marked as placeholders so they are never executed.
         sample_data = [
             {
                 "source": "/path/to/file1.jpg",
                 "target": "/target/Photos/2023/file1.jpg",
                 "action": "move",
-                "status": "pending"
+                "status": "pending",
+                "placeholder": True
             },
             {
                 "source": "/path/to/document.pdf",
                 "target": "/target/Documents/PDFs/document.pdf",
                 "action": "move",
-                "status": "pending"
+                "status": "pending",
+                "placeholder": True
             },
             {
                 "source": "/path/to/music.mp3",
                 "target": "/target/Music/Various/music.mp3",
                 "action": "copy",
-                "status": "pending"
+                "status": "pending",
+                "placeholder": True
             }
         ]
         return sample_data
     
+    def _executable_operations(self) -> List[Dict[str, Any]]:
+        """Previewed operations that may be run; placeholder rows never are."""
+        preview = self.file_preview.get_preview_data() if self.file_preview else []
+        return [operation for operation in preview if not operation.get("placeholder")]
+    
     def _start_execution(self):
         """Start execution in background thread."""
+        operations = self._executable_operations()
+        if not operations:
+            return
+        
         if self.execution_controls:
             self.execution_controls.set_execution_state(True)
         
+        options = self.execution_controls.get_options() if self.execution_controls else {}
+        
+        if self._file_operations is None:
+            from ..core.file_operations.manager import FileOperationManager
+            self._file_operations = FileOperationManager()
+        
+        # Workers never touch Tk; progress and completion come back
+        # through the event bus
+        bus = get_event_bus(self)
+        if not self._subscriptions:
+            self._subscriptions = [
+                bus.subscribe(EXECUTION_PROGRESS, self._on_execution_progress),
+                bus.subscribe(EXECUTION_FINISHED, self._on_execution_finished)
+            ]
+        
+        self.progress_dialog = ProgressDialog(
+            self,
+            title="Organizing Files",
+            message="Processing files...",
+            cancelable=True
+        )
+        self._cancel_event = threading.Event()
+        
         # Create and start execution thread
-        self.current_operation = threading.Thread(target=self._execute_operations)
+        self.current_operation = threading.Thread(
+            target=self._execute_operations,
+            args=(bus, operations, options, self._cancel_event)
+        )
         self.current_operation.daemon = True
         self.current_operation.start()
     
-    def _execute_operations(self):
-        """Execute file organization operations."""
+    def _execute_operations(self, bus: UIEventBus, operations: List[Dict[str, Any]],
+                            options: Dict[str, bool], cancelled: threading.Event):
+        """Execute file organization operations on the worker thread."""
         try:
-            # Show progress dialog
-            progress_dialog = ProgressDialog(
-                self,
-                title="Organizing Files",
-                message="Processing files...",
-                cancelable=True
-            )
-            
-            # Simulate execution with progress updates
-            operations = self._generate_preview_data()
-            total_ops = len(operations)
+            summary = asyncio.run(self._run_file_operations(bus, operations, options, cancelled))
+        except Exception as e:
+            summary = {"error": str(e)}
+        bus.post(EXECUTION_FINISHED, summary)
+    
+    async def _run_file_operations(self, bus: UIEventBus, operations: List[Dict[str, Any]],
+                                   options: Dict[str, bool], cancelled: threading.Event) -> Dict[str, Any]:
+        """Run operations through the file operation manager, posting coalesced progress."""
+        total = len(operations)
+        summary = {"total": total, "completed": 0, "failed": 0, "errors": [], "cancelled": False}
+        
+        def report(index: int, source: Path, progress: Optional[OperationProgress] = None):
+            bus.post(EXECUTION_PROGRESS, OperationProgress(
+                operation_id="execution",
+                total_bytes=progress.total_bytes if progress else 0,
+                processed_bytes=progress.processed_bytes if progress else 0,
+                current_file=source,
+                files_processed=index,
+                total_files=total,
+                speed_bytes_per_second=progress.speed_bytes_per_second if progress else 0.0,
+                estimated_time_remaining=progress.estimated_time_remaining if progress else 0.0
+            ), key="execution")
+        
+        for index, operation in enumerate(operations):
+            if cancelled.is_set():
+                summary["cancelled"] = True
+                break
             
-            for i, operation in enumerate(operations):
-                if progress_dialog.is_cancelled():
-                    break
-                
-                # Simulate processing
-                time.sleep(0.5)  # Replace with actual file operation
-                
-                # Update progress
-                progress = ((i + 1) / total_ops) * 100
-                status = f"Processing {Path(operation['source']).name}..."
-                progress_dialog.update_progress(progress, status)
+            source = Path(operation["source"])
+            report(index, source)
             
-            # Close progress dialog
-            if hasattr(progress_dialog, 'dialog_window') and progress_dialog.dialog_window:
-                progress_dialog.dialog_window.destroy()
+            if options.get("dry_run"):
+                summary["completed"] += 1
+                continue
             
-            # Show completion message
-            if not progress_dialog.is_cancelled():
-                messagebox.showinfo("Complete", "File organization completed successfully!")
+            operation_id = await self._file_operations.execute_operation(
+                OperationType(operation.get("action", "move")),
+                source,
+                Path(operation["target"]),
+                {"create_backup": options.get("backup", False)}
+            )
+            async for progress in self._file_operations.subscribe_to_progress(operation_id):
+                report(index, source, progress)
             
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred during execution: {str(e)}")
+            result = await self._file_operations.get_operation_result(operation_id)
+            if result and result.success:
+                summary["completed"] += 1
+            else:
+                summary["failed"] += 1
+                summary["errors"].append(f"{source.name}: {result.error_message if result else 'unknown error'}")
+        
+        if not summary["cancelled"] and operations:
+            report(total, Path(operations[-1]["source"]))
+        
+        return summary
+    
+    def _on_execution_progress(self, progress: OperationProgress):
+        """Render the latest progress of the running execution."""
+        dialog = self.progress_dialog
+        if dialog is None:
+            return
+        if dialog.is_cancelled():
+            self._cancel_event.set()
+            return
+        
+        status = f"Processing {progress.current_file.name}..." if progress.current_file else None
+        dialog.update_progress(progress_percentage(progress), status)
+    
+    def _on_execution_finished(self, summary: Dict[str, Any]):
+        """Close the progress dialog and report the outcome."""
+        dialog, self.progress_dialog = self.progress_dialog, None
+        cancelled = summary.get("cancelled") or (dialog is not None and dialog.is_cancelled())
+        if dialog is not None and dialog.dialog_window and dialog.dialog_window.winfo_exists():
+            dialog.dialog_window.destroy()
         
-        finally:
-            # Reset execution state
-            if self.execution_controls:
-                self.execution_controls.set_execution_state(False)
+        # Reset execution state
+        if self.execution_controls:
+            self.execution_controls.set_execution_state(False)
+        
+        if "error" in summary:
+            messagebox.showerror("Error", f"An error occurred during execution: {summary['error']}")
+        elif summary["failed"]:
+            errors = "\n".join(summary["errors"][:10])
+            messagebox.showwarning(
+                "Completed with errors",
+                f"{summary['completed']} of {summary['total']} operations completed, "
+                f"{summary['failed']} failed:\n\n{errors}"
+            )
+        elif not cancelled:
+            messagebox.showinfo("Complete", "File organization completed successfully!")
+    
+    def destroy(self):
+        """Stop the running execution and drop event subscriptions."""
+        self._cancel_event.set()
+        for unsubscribe in self._subscriptions:
+            unsubscribe()
+        self._subscriptions = []
+        super().destroy()
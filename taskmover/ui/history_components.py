@@ -8,10 +8,11 @@ and analytics for the TaskMover application.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List
 from datetime import datetime, timedelta
 import json
 from .base_component import BaseComponent, ModernButton, ModernCard
+from .data_display_components import ListDataSource, VirtualTable
 from .theme_manager import get_theme_manager
 
 
@@ -117,6 +118,7 @@ class HistoryTable(BaseComponent):
     
     def __init__(self, parent: tk.Widget, **kwargs):
         self.history_entries: List[HistoryEntry] = []
+        self.table: Optional[VirtualTable] = None
         self.tree: Optional[ttk.Treeview] = None
         
         super().__init__(parent, **kwargs)
@@ -187,45 +189,24 @@ class HistoryTable(BaseComponent):
         status_combo.pack(side="left")
         status_combo.bind("<<ComboboxSelected>>", self._on_filter_changed)
         
-        # Tree frame
-        tree_frame = tk.Frame(self, bg=tokens.colors["background"])
-        tree_frame.pack(fill="both", expand=True)
-        
-        # Create treeview
-        columns = ("timestamp", "operation", "source", "target", "files", "status")
-        self.tree = ttk.Treeview(
-            tree_frame,
-            columns=columns,
-            show="headings",
-            height=15,
-            style="Modern.Treeview"
+        # Virtualized table: only the visible rows are materialized
+        self.table = VirtualTable(
+            self,
+            columns=[
+                ("timestamp", "Time", 120, 100),
+                ("operation", "Operation", 100, 80),
+                ("source", "Source", 200, 150),
+                ("target", "Target", 200, 150),
+                ("files", "Files", 60, 50),
+                ("status", "Status", 80, 60)
+            ],
+            height=15
         )
+        self.table.pack(fill="both", expand=True)
+        self.tree = self.table.tree
         
-        # Configure columns
-        self.tree.heading("timestamp", text="Time")
-        self.tree.heading("operation", text="Operation")
-        self.tree.heading("source", text="Source")
-        self.tree.heading("target", text="Target")
-        self.tree.heading("files", text="Files")
-        self.tree.heading("status", text="Status")
-        
-        self.tree.column("timestamp", width=120, minwidth=100)
-        self.tree.column("operation", width=100, minwidth=80)
-        self.tree.column("source", width=200, minwidth=150)
-        self.tree.column("target", width=200, minwidth=150)
-        self.tree.column("files", width=60, minwidth=50)
-        self.tree.column("status", width=80, minwidth=60)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack tree and scrollbars
-        self.tree.pack(side="left", fill="both", expand=True)
-        v_scrollbar.pack(side="right", fill="y")
-        h_scrollbar.pack(side="bottom", fill="x")
+        # Newest first
+        self.table.sort_by("timestamp", reverse=True)
         
         # Load sample history
         self._load_sample_history()
@@ -277,61 +258,78 @@ class HistoryTable(BaseComponent):
             )
         ]
         
-        self.history_entries = sample_entries
-        self._refresh_tree()
+        self._set_entries(sample_entries)
+    
+    def _set_entries(self, entries: List[HistoryEntry]):
+        """Replace the history shown in the table."""
+        self.history_entries = entries
+        if not self.table:
+            return
+        
+        # The table keeps its current sort and filter
+        self.table.set_source(ListDataSource(
+            entries,
+            columns=("timestamp", "operation", "source", "target", "files", "status"),
+            formatter=self._format_row,
+            sort_keys={
+                "timestamp": lambda e: e.timestamp,
+                "files": lambda e: e.files_count
+            }
+        ))
     
     def _refresh_tree(self):
         """Refresh tree with filtered history."""
-        if not self.tree:
+        if not self.table:
             return
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Apply filters
-        filtered_entries = self._apply_filters()
-        
-        # Add entries to tree
-        for entry in filtered_entries:
-            timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M")
-            status_icon = "✅" if entry.status == "Completed" else "❌" if entry.status == "Failed" else "⏸️"
-            
-            self.tree.insert("", "end", values=(
-                timestamp_str,
-                entry.operation,
-                entry.source,
-                entry.target,
-                entry.files_count,
-                f"{status_icon} {entry.status}"
-            ))
+        self.table.set_filter(self._filter_predicate())
     
-    def _apply_filters(self) -> List[HistoryEntry]:
-        """Apply current filters to history entries."""
-        filtered = self.history_entries.copy()
-        
-        # Time filter
+    @staticmethod
+    def _format_row(entry: HistoryEntry) -> tuple:
+        """Format one history entry as table values."""
+        status_icon = "✅" if entry.status == "Completed" else "❌" if entry.status == "Failed" else "⏸️"
+        return (
+            entry.timestamp.strftime("%Y-%m-%d %H:%M"),
+            entry.operation,
+            entry.source,
+            entry.target,
+            entry.files_count,
+            f"{status_icon} {entry.status}"
+        )
+    
+    def _filter_predicate(self) -> Optional[Callable[[HistoryEntry], bool]]:
+        """Build a predicate for the current time and status filters."""
         time_filter = self.time_filter.get()
         now = datetime.now()
         
+        start = None
         if time_filter == "Today":
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            filtered = [e for e in filtered if e.timestamp >= start_of_day]
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         elif time_filter == "This Week":
             start_of_week = now - timedelta(days=now.weekday())
-            start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-            filtered = [e for e in filtered if e.timestamp >= start_of_week]
+            start = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
         elif time_filter == "This Month":
-            start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            filtered = [e for e in filtered if e.timestamp >= start_of_month]
+            start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         elif time_filter == "Last 30 Days":
-            thirty_days_ago = now - timedelta(days=30)
-            filtered = [e for e in filtered if e.timestamp >= thirty_days_ago]
+            start = now - timedelta(days=30)
         
-        # Status filter
         status_filter = self.status_filter.get()
-        if status_filter != "All":
-            filtered = [e for e in filtered if e.status == status_filter]
+        status = None if status_filter == "All" else status_filter
+        
+        if start is None and status is None:
+            return None
+        
+        def predicate(entry: HistoryEntry) -> bool:
+            if start is not None and entry.timestamp < start:
+                return False
+            return status is None or entry.status == status
+        
+        return predicate
+    
+    def _apply_filters(self) -> List[HistoryEntry]:
+        """Apply current filters to history entries."""
+        predicate = self._filter_predicate()
+        filtered = [e for e in self.history_entries if predicate is None or predicate(e)]
         
         # Sort by timestamp (newest first)
         filtered.sort(key=lambda e: e.timestamp, reverse=True)
@@ -349,8 +347,8 @@ class HistoryTable(BaseComponent):
     
     def add_entry(self, entry: HistoryEntry):
         """Add new history entry."""
-        self.history_entries.insert(0, entry)  # Add to beginning
-        self._refresh_tree()
+        # A new list, since a background sort may still be reading the old one
+        self._set_entries([entry] + self.history_entries)
 
 
 class StatisticsDashboard(BaseComponent):
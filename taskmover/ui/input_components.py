@@ -11,6 +11,7 @@ from tkinter import ttk
 from typing import Dict, List, Optional, Callable, Any, Union
 import re
 import logging
+from pathlib import Path
 
 from .base_component import BaseComponent, ComponentState
 from .theme_manager import get_theme_manager
@@ -24,16 +25,27 @@ class SmartPatternInput(BaseComponent):
     Implements the enhanced pattern input from the UI specification.
     """
     
+    # Poll interval (ms) for estimates delivered by the estimator thread
+    ESTIMATE_POLL_MS = 15
+    
     def __init__(
         self,
         parent: tk.Widget,
         placeholder: str = "Enter pattern...",
+        estimator: Optional[Any] = None,
         **kwargs
     ):
         self.placeholder = placeholder
         self.current_value = ""
         self.suggestions = []
         self.validation_result = {"valid": False, "message": "", "matches": 0}
+        self.workspace: Optional[Path] = None
+        self._estimator = estimator
+        # Only an estimator created by this widget is closed with it
+        self._owns_estimator = False
+        self._estimate_generation = 0
+        self._latest_estimate = None
+        self._estimate_poll_id = None
         
         super().__init__(parent, **kwargs)
     
@@ -263,8 +275,9 @@ class SmartPatternInput(BaseComponent):
         })
     
     def _validate_pattern(self, pattern: str):
-        """Validate pattern syntax and estimate matches."""
+        """Validate pattern syntax and request a match estimate."""
         if not pattern.strip():
+            self._cancel_estimate()
             self.validation_result = {"valid": False, "message": "", "matches": 0}
             self.status_label.configure(text="", fg=get_theme_manager().get_current_tokens().colors["text_secondary"])
             return
@@ -273,7 +286,6 @@ class SmartPatternInput(BaseComponent):
             # Basic pattern validation
             valid = True
             message = "✓ Valid pattern"
-            matches = self._estimate_matches(pattern)
             
             # Check for basic syntax errors
             if pattern.count("(") != pattern.count(")"):
@@ -286,19 +298,21 @@ class SmartPatternInput(BaseComponent):
             self.validation_result = {
                 "valid": valid,
                 "message": message,
-                "matches": matches,
-                "performance": "Fast" if matches < 1000 else "Moderate"
+                "matches": None,
+                "performance": None
             }
             
-            # Update status display
             if valid:
-                status_text = f"{message} • 🎯 {matches} files match • Estimated performance: {self.validation_result['performance']}"
-                color = get_theme_manager().get_current_tokens().colors["success"]
+                # Counting runs on the estimator thread; the status is
+                # completed by _apply_estimate
+                self._estimate_matches(pattern)
+                self._show_validation_status()
             else:
-                status_text = message
-                color = get_theme_manager().get_current_tokens().colors["error"]
-            
-            self.status_label.configure(text=status_text, fg=color)
+                self._cancel_estimate()
+                self.status_label.configure(
+                    text=message,
+                    fg=get_theme_manager().get_current_tokens().colors["error"]
+                )
             
         except Exception as e:
             self.validation_result = {"valid": False, "message": f"✗ Validation error: {str(e)}", "matches": 0}
@@ -307,12 +321,116 @@ class SmartPatternInput(BaseComponent):
                 fg=get_theme_manager().get_current_tokens().colors["error"]
             )
     
-    def _estimate_matches(self, pattern: str) -> int:
-        """Estimate number of files that would match pattern."""
-        # This is a simplified estimation - in real implementation,
-        # this would query the actual file system or cache
-        import random
-        return random.randint(1, 100)  # Placeholder implementation
+    def _show_validation_status(self):
+        """Render the validation result and the latest match estimate."""
+        result = self.validation_result
+        status_text = result["message"]
+        
+        if self.workspace is None:
+            pass
+        elif result.get("matches") is None:
+            status_text += " • 🎯 Estimating matches…"
+        elif result.get("partial"):
+            # The walk is still running: counts cover only the files seen so far
+            status_text += (f" • 🎯 {result['match_range'][0]}+ files match so far"
+                            f" ({result['files_seen']:,} files scanned)")
+        elif result.get("approximate"):
+            low, high = result["match_range"]
+            status_text += (f" • 🎯 ~{result['matches']} files match ({low}–{high})"
+                            f" • Estimated performance: {result['performance']}")
+        else:
+            status_text += (f" • 🎯 {result['matches']} files match"
+                            f" • Estimated performance: {result['performance']}")
+        
+        self.status_label.configure(text=status_text, fg=get_theme_manager().get_current_tokens().colors["success"])
+    
+    def set_workspace(self, workspace: Optional[Path]):
+        """Set the folder whose files are sampled for match estimates."""
+        self.workspace = Path(workspace) if workspace else None
+        
+        if self.workspace is not None and self._estimator is None:
+            from ..core.patterns.matching.estimation import MatchEstimator
+            self._estimator = MatchEstimator()
+            self._owns_estimator = True
+        if self._estimator is not None:
+            options = self.get_options()
+            self._estimator.set_workspace(self.workspace,
+                                          include_hidden=options["include_hidden"],
+                                          recursive=options["recursive"])
+        
+        if self.current_value:
+            self._validate_pattern(self.current_value)
+    
+    def _estimate_matches(self, pattern: str):
+        """Request a match estimate for pattern from the background estimator."""
+        if self._estimator is None or self.workspace is None:
+            return
+        
+        self._estimate_generation = self._estimator.submit(pattern, self._on_estimate_ready)
+        if self._estimate_poll_id is None:
+            self._estimate_poll_id = self.after(self.ESTIMATE_POLL_MS, self._poll_estimate)
+    
+    def _on_estimate_ready(self, estimate):
+        """Receive an estimate on the estimator thread; Tk is not touched here."""
+        self._latest_estimate = estimate
+    
+    def _poll_estimate(self):
+        """Apply a delivered estimate on the Tk thread."""
+        self._estimate_poll_id = None
+        if self._estimator is None:
+            return
+        # Checked before taking the estimate, so one delivered in between
+        # is not left unapplied
+        idle = self._estimator.idle
+        estimate, self._latest_estimate = self._latest_estimate, None
+        
+        if estimate is not None and estimate.pattern == self.get_pattern():
+            self._apply_estimate(estimate)
+        
+        # Keep polling while the sample is still being collected (each
+        # update refines the estimate) or a request is outstanding
+        if not idle and self.workspace is not None:
+            self._estimate_poll_id = self.after(self.ESTIMATE_POLL_MS, self._poll_estimate)
+    
+    def _apply_estimate(self, estimate):
+        """Update validation state and status line from an estimate."""
+        if estimate.error:
+            self.validation_result.update({"valid": False, "message": f"✗ {estimate.error}", "matches": 0})
+            self.status_label.configure(
+                text=self.validation_result["message"],
+                fg=get_theme_manager().get_current_tokens().colors["error"]
+            )
+            return
+        
+        self.validation_result.update({
+            "matches": estimate.estimated,
+            "match_range": (estimate.lower, estimate.upper),
+            "approximate": not estimate.exact,
+            "partial": not estimate.complete,
+            "files_seen": estimate.population,
+            "performance": "Fast" if estimate.estimated < 1000 else "Moderate"
+        })
+        self._show_validation_status()
+        
+        self._trigger_callback('matches_estimated', {
+            'text': estimate.pattern,
+            'validation': self.validation_result
+        })
+    
+    def _cancel_estimate(self):
+        """Drop outstanding estimate requests."""
+        if self._estimator is not None:
+            self._estimator.cancel()
+        self._latest_estimate = None
+    
+    def destroy(self):
+        """Stop polling and close the estimator if this widget created it."""
+        if self._estimate_poll_id is not None:
+            self.after_cancel(self._estimate_poll_id)
+            self._estimate_poll_id = None
+        if self._owns_estimator:
+            self._estimator.close()
+        super().destroy()
     
     def _insert_suggestion(self, suggestion: str):
         """Insert suggestion into input."""
@@ -348,8 +466,11 @@ class SmartPatternInput(BaseComponent):
             'recursive': self.recursive_var.get()
         }
         
-        # Re-validate with new options
-        self._validate_pattern(self.current_value)
+        # Re-sample the workspace with the new options, then re-validate
+        if self.workspace is not None:
+            self.set_workspace(self.workspace)
+        else:
+            self._validate_pattern(self.current_value)
         
         # Trigger callback
         self._trigger_callback('options_changed', options)
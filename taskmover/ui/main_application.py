@@ -21,11 +21,7 @@ from .input_components import SmartPatternInput
 from .rule_management_components import RuleManagementView
 from .execution_components import ExecutionView
 from .history_components import HistoryAndStatsView
-
-# Import backend services
-from ..core.patterns import PatternSystem
-from ..core.rules.service import RuleService
-from ..core.conflict_resolution import ConflictManager
+from ..core.di import ServiceContainer, ServiceLifetime
 
 logger = logging.getLogger(__name__)
 
@@ -344,9 +340,11 @@ class TaskMoverApplication:
         self.content_area: Optional[MainContentArea] = None
         self.status_bar: Optional[StatusBar] = None
         
-        # Services
-        self.rule_service = None
-        self.pattern_service = None
+        # Backend services, built on first access
+        self.services: Optional[ServiceContainer] = None
+        self._service_types: Dict[str, type] = {}
+        # Services that failed to build, by kind; they are not retried
+        self._service_errors: Dict[str, Exception] = {}
         
         # Setup logging
         self._setup_logging()
@@ -382,32 +380,65 @@ class TaskMoverApplication:
             raise
     
     def _initialize_services(self):
-        """Initialize backend services."""
+        """Register backend services; each one is built when first requested."""
         try:
+            # Backend packages are imported here so loading the UI module stays cheap
+            from ..core.patterns import PatternSystem
+            from ..core.rules.service import RuleService
+            from ..core.conflict_resolution import ConflictManager
+            
             # Setup paths
             storage_path = Path.cwd() / "data"
             storage_path.mkdir(exist_ok=True)
             
-            # Initialize PatternSystem
-            self.pattern_service = PatternSystem(storage_path / "patterns")
-            
-            # Initialize ConflictManager 
-            conflict_manager = ConflictManager()
-            
-            # Initialize RuleService
-            self.rule_service = RuleService(
-                pattern_system=self.pattern_service,
-                conflict_manager=conflict_manager,
-                storage_path=storage_path / "rules"
+            container = ServiceContainer()
+            container.register(
+                PatternSystem,
+                factory=lambda: PatternSystem(storage_path / "patterns"),
+                lifetime=ServiceLifetime.SINGLETON
+            )
+            container.register(ConflictManager, factory=ConflictManager,
+                               lifetime=ServiceLifetime.SINGLETON)
+            container.register(
+                RuleService,
+                factory=lambda: RuleService(
+                    pattern_system=container.resolve(PatternSystem),
+                    conflict_manager=container.resolve(ConflictManager),
+                    storage_path=storage_path / "rules"
+                ),
+                lifetime=ServiceLifetime.SINGLETON
             )
             
-            logger.info("Backend services initialized successfully")
+            self.services = container
+            self._service_types = {'pattern': PatternSystem, 'rule': RuleService}
+            
+            logger.info("Backend services registered")
             
         except Exception as e:
             logger.error(f"Failed to initialize services: {e}")
-            # Create mock services for UI testing
-            self.pattern_service = None
-            self.rule_service = None
+            self.services = None
+    
+    def _get_service(self, kind: str):
+        """Resolve a backend service, or None so the UI can run without it."""
+        if self.services is None or kind in self._service_errors:
+            return None
+        try:
+            return self.services.resolve(self._service_types[kind])
+        except Exception as e:
+            logger.error(f"Failed to initialize {kind} service: {e}")
+            # Do not retry a failing service on every access; others stay available
+            self._service_errors[kind] = e
+            return None
+    
+    @property
+    def pattern_service(self):
+        """Pattern system, created on first access."""
+        return self._get_service('pattern')
+    
+    @property
+    def rule_service(self):
+        """Rule service, created on first access."""
+        return self._get_service('rule')
     
     def _create_main_window(self):
         """Create main application window."""
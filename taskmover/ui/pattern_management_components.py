@@ -12,13 +12,19 @@ from typing import Dict, List, Optional, Callable, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
+from pathlib import Path
 
 from .base_component import BaseComponent, ModernCard, ModernButton
+from .event_bus import get_event_bus
 from .input_components import SmartPatternInput, ModernEntry, ModernCombobox
 from .theme_manager import get_theme_manager
+from ..core.logging.utils import format_bytes
 
 logger = logging.getLogger(__name__)
 
+# Event bus topic for pattern test runs
+PATTERN_PREVIEW = "pattern.preview"
+
 
 @dataclass
 class Pattern:
@@ -741,7 +747,7 @@ class PatternLibrary(BaseComponent):
     def _on_new_pattern(self):
         """Handle new pattern creation."""
         # Open pattern builder dialog
-        dialog = PatternBuilderDialog(self.winfo_toplevel())
+        dialog = PatternBuilderDialog(self.winfo_toplevel(), pattern_service=self.pattern_service)
         dialog.add_callback('pattern_created', self._on_pattern_created)
         
         logger.debug("Opening pattern builder dialog")
@@ -771,7 +777,7 @@ class PatternLibrary(BaseComponent):
     def _edit_pattern(self, pattern: Pattern):
         """Edit pattern."""
         # Open pattern builder dialog with existing pattern
-        dialog = PatternBuilderDialog(self.winfo_toplevel(), pattern)
+        dialog = PatternBuilderDialog(self.winfo_toplevel(), pattern, pattern_service=self.pattern_service)
         dialog.add_callback('pattern_updated', self._on_pattern_updated)
     
     def _copy_pattern(self, pattern: Pattern):
@@ -839,12 +845,23 @@ Status: {'Enabled' if pattern.enabled else 'Disabled'}"""
 class PatternBuilderDialog(tk.Toplevel):
     """Pattern builder dialog with visual constructor and live preview."""
     
-    def __init__(self, parent: Union[tk.Tk, tk.Toplevel], pattern: Optional[Pattern] = None):
+    # Matching and non-matching files shown per test run
+    PREVIEW_LIMIT = 10
+    
+    def __init__(self, parent: Union[tk.Tk, tk.Toplevel], pattern: Optional[Pattern] = None,
+                 pattern_service=None):
         super().__init__(parent)
         
         self.pattern = pattern
+        self.pattern_service = pattern_service
         self.callbacks: Dict[str, List[Callable]] = {}
         
+        # Test runs execute on a worker thread; results arrive through the event bus
+        self._preview_runner = None
+        self._preview_generation = 0
+        self._preview_key = object()
+        self._unsubscribe_preview: Optional[Callable[[], None]] = None
+        
         self.title("Pattern Builder - Visual Pattern Constructor")
         self.geometry("800x600")
         if hasattr(parent, 'winfo_toplevel'):
@@ -977,8 +994,8 @@ class PatternBuilderDialog(tk.Toplevel):
         self.preview_frame = tk.Frame(preview_card.content_frame, bg="white")
         self.preview_frame.pack(fill="both", expand=True)
         
-        # Sample preview results
-        self._create_sample_preview()
+        # Test run results
+        self._create_preview_results()
         
         # Dialog buttons
         button_frame = tk.Frame(self, bg=tokens.colors["background"])
@@ -1022,66 +1039,104 @@ class PatternBuilderDialog(tk.Toplevel):
         if self.pattern:
             self._load_pattern()
     
-    def _create_sample_preview(self):
-        """Create sample preview results."""
+    def _create_preview_results(self):
+        """Create the test run result list and performance line."""
         theme = get_theme_manager()
         tokens = theme.get_current_tokens()
         
-        # Preview results list
-        results = [
-            ("✅", "presentation.pptx", "2.5MB, Today", "→ Documents/Large/"),
-            ("✅", "report.pdf", "1.2MB, Yesterday", "→ Documents/Large/"),
-            ("✅", "spreadsheet.xlsx", "1.8MB, Today", "→ Documents/Large/"),
-            ("❌", "small_doc.docx", "500KB, Today", "(too small)"),
-            ("❌", "image.jpg", "800KB, Today", "(wrong type)"),
-        ]
+        self.results_frame = tk.Frame(self.preview_frame, bg="white")
+        self.results_frame.pack(fill="both", expand=True)
         
-        for status, filename, details, action in results:
-            result_frame = tk.Frame(self.preview_frame, bg="white")
-            result_frame.pack(fill="x", pady=1)
-            
-            status_label = tk.Label(
-                result_frame,
-                text=status,
-                font=(tokens.fonts["family"], int(tokens.fonts["size_body"]), tokens.fonts["weight_normal"]),
-                bg="white",
-                fg=tokens.colors["success"] if status == "✅" else tokens.colors["error"],
-                width=3
-            )
-            status_label.pack(side="left")
-            
-            file_label = tk.Label(
-                result_frame,
-                text=f"{filename} ({details})",
-                font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
-                bg="white",
-                fg=tokens.colors["text"],
-                anchor="w"
-            )
-            file_label.pack(side="left", fill="x", expand=True, padx=tokens.spacing["sm"])
-            
-            action_label = tk.Label(
-                result_frame,
-                text=action,
-                font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
-                bg="white",
-                fg=tokens.colors["text_secondary"],
-                anchor="e"
-            )
-            action_label.pack(side="right")
+        self._add_preview_message("Choose a workspace and press Test Pattern to see matching files")
         
         # Performance info
         perf_frame = tk.Frame(self.preview_frame, bg=tokens.colors["surface"])
         perf_frame.pack(fill="x", pady=(tokens.spacing["sm"], 0))
         
-        perf_label = tk.Label(
+        self.perf_label = tk.Label(
             perf_frame,
-            text="Performance: ⚡ Fast (< 1s) • Cache: Fresh • Conflicts: None",
+            text="Performance: – • Cache: – • Files checked: 0",
             font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
             bg=tokens.colors["surface"],
             fg=tokens.colors["text_secondary"]
         )
-        perf_label.pack(padx=tokens.spacing["sm"], pady=tokens.spacing["xs"])
+        self.perf_label.pack(padx=tokens.spacing["sm"], pady=tokens.spacing["xs"])
+    
+    def _add_preview_message(self, text: str, error: bool = False):
+        """Show a single message in place of the result list."""
+        tokens = get_theme_manager().get_current_tokens()
+        tk.Label(
+            self.results_frame,
+            text=text,
+            font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
+            bg="white",
+            fg=tokens.colors["error"] if error else tokens.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", pady=1)
+    
+    def _add_preview_row(self, row):
+        """Add one file of a test run to the result list."""
+        tokens = get_theme_manager().get_current_tokens()
+        
+        result_frame = tk.Frame(self.results_frame, bg="white")
+        result_frame.pack(fill="x", pady=1)
+        
+        status_label = tk.Label(
+            result_frame,
+            text="✅" if row.matched else "❌",
+            font=(tokens.fonts["family"], int(tokens.fonts["size_body"]), tokens.fonts["weight_normal"]),
+            bg="white",
+            fg=tokens.colors["success"] if row.matched else tokens.colors["error"],
+            width=3
+        )
+        status_label.pack(side="left")
+        
+        details = format_bytes(row.size)
+        if row.modified is not None:
+            details += f", {row.modified:%Y-%m-%d %H:%M}"
+        file_label = tk.Label(
+            result_frame,
+            text=f"{row.path.name} ({details})",
+            font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
+            bg="white",
+            fg=tokens.colors["text"],
+            anchor="w"
+        )
+        file_label.pack(side="left", fill="x", expand=True, padx=tokens.spacing["sm"])
+        
+        action_label = tk.Label(
+            result_frame,
+            text="matches" if row.matched else f"({row.reason})",
+            font=(tokens.fonts["family"], int(tokens.fonts["size_caption"]), tokens.fonts["weight_normal"]),
+            bg="white",
+            fg=tokens.colors["text_secondary"],
+            anchor="e"
+        )
+        action_label.pack(side="right")
+    
+    def _render_preview(self, preview):
+        """Show a test run's progress or result."""
+        for child in self.results_frame.winfo_children():
+            child.destroy()
+        
+        if preview.error:
+            self._add_preview_message(f"Pattern error: {preview.error}", error=True)
+        elif not preview.matches and not preview.non_matches:
+            self._add_preview_message("No files found" if preview.done else "Testing pattern...")
+        for row in preview.matches + preview.non_matches:
+            self._add_preview_row(row)
+        
+        if preview.done:
+            speed = "⚡ Fast" if preview.elapsed_ms < 1000 else "🐢 Slow"
+            checked = f"{preview.files_checked:,}" + ("" if preview.complete else " (stopped early)")
+            performance = f"{speed} ({preview.elapsed_ms:.0f} ms)"
+        else:
+            checked = f"{preview.files_checked:,}"
+            performance = f"running ({preview.elapsed_ms:.0f} ms)"
+        self.perf_label.config(
+            text=f"Performance: {performance} • Cache: {preview.cache_status.capitalize()} • "
+                 f"Files checked: {checked} • Matches: {preview.match_count:,}"
+        )
     
     def _load_pattern(self):
         """Load existing pattern data."""
@@ -1092,18 +1147,60 @@ class PatternBuilderDialog(tk.Toplevel):
             self.group_combo.set_value(self.pattern.group)
     
     def _test_pattern(self):
-        """Test pattern against sample files."""
+        """Test pattern against the files in the chosen workspace."""
         pattern = self.pattern_input.get_value()
         if pattern:
-            # Simulate testing
             logger.debug(f"Testing pattern: {pattern}")
-            # Update preview with test results
             self._refresh_preview()
     
     def _refresh_preview(self):
-        """Refresh preview results."""
-        # Simulate refreshing preview
+        """Start a test run of the current pattern, superseding a running one."""
         logger.debug("Refreshing pattern preview")
+        
+        workspace = self.workspace_entry.get_value().strip()
+        if not workspace or not Path(workspace).is_dir():
+            return
+        
+        # Sample the chosen workspace for live match estimates
+        self.pattern_input.set_workspace(Path(workspace))
+        
+        pattern = self.pattern_input.get_value()
+        if not pattern:
+            return
+        
+        runner = self._get_preview_runner()
+        if runner is None:
+            return
+        
+        bus = get_event_bus(self)
+        if self._unsubscribe_preview is None:
+            self._unsubscribe_preview = bus.subscribe(PATTERN_PREVIEW, self._on_preview_update)
+        
+        key = self._preview_key
+        self._preview_generation = runner.submit(
+            pattern, Path(workspace),
+            lambda preview: bus.post(PATTERN_PREVIEW, (key, preview), key=key),
+            limit=self.PREVIEW_LIMIT
+        )
+    
+    def _get_preview_runner(self):
+        """Test run service; uses the pattern system's matcher and cache when available."""
+        if self._preview_runner is None:
+            try:
+                if hasattr(self.pattern_service, 'create_preview_runner'):
+                    self._preview_runner = self.pattern_service.create_preview_runner()
+                else:
+                    from ..core.patterns.matching.preview import PatternPreviewRunner
+                    self._preview_runner = PatternPreviewRunner()
+            except Exception as e:
+                logger.error(f"Pattern test runs unavailable: {e}")
+        return self._preview_runner
+    
+    def _on_preview_update(self, payload):
+        """Render test run progress delivered on the Tk thread."""
+        key, preview = payload
+        if key is self._preview_key and preview.generation == self._preview_generation:
+            self._render_preview(preview)
     
     def _save_template(self):
         """Save pattern as template."""
@@ -1147,6 +1244,15 @@ class PatternBuilderDialog(tk.Toplevel):
                 callback(data)
             except Exception as e:
                 logger.error(f"Error in callback for {event_name}: {e}")
+    
+    def destroy(self):
+        """Cancel a running test run and drop the event subscription."""
+        if self._preview_runner is not None:
+            self._preview_runner.close()
+        if self._unsubscribe_preview is not None:
+            self._unsubscribe_preview()
+            self._unsubscribe_preview = None
+        super().destroy()
 
 
 # Export main classes
@@ -9,12 +9,13 @@ for rule creation, editing, execution, and monitoring with real-time validation.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Optional, Any, List, Callable, Tuple
+from typing import Dict, Optional, Any, List, Callable, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 import asyncio
+import queue
 import threading
 import time
 
@@ -22,8 +23,12 @@ from .base_component import BaseComponent, ModernButton, ModernCard, ComponentSt
 from .theme_manager import get_theme_manager
 from .input_components import ModernEntry, ModernCombobox, SmartPatternInput
 from .dialog_components import ModernDialog, ConfirmationDialog, ProgressDialog
+from .data_display_components import ListDataSource, VirtualTable
+from .event_bus import UIEventBus, get_event_bus
+from .execution_components import progress_percentage
 
 # Import backend services
+from ..core.file_operations import OperationProgress
 from ..core.rules.models import Rule, RuleExecutionResult, ErrorHandlingBehavior
 from ..core.rules.service import RuleService
 from ..core.rules.exceptions import RuleSystemError, RuleValidationError
@@ -615,11 +620,24 @@ class RuleManagementView(BaseComponent):
     Integrates with Pattern System to show pattern-rule relationships.
     """
     
+    VALIDATION_POLL_MS = 50
+    
     def __init__(self, parent: tk.Widget, rule_service: RuleService, pattern_service, **kwargs):
         # Store custom parameters before calling super()
         self.rule_service = rule_service
         self.pattern_service = pattern_service
         self.rules_data: List[RuleDisplayInfo] = []
+        self._rules_by_id: Dict[UUID, RuleDisplayInfo] = {}
+        
+        # Validation results arrive from worker threads tagged with the
+        # refresh they belong to
+        self._validation_results: queue.SimpleQueue = queue.SimpleQueue()
+        self._validation_generation = 0
+        # Rules of the current refresh whose result has not arrived yet
+        self._validation_pending: Set[UUID] = set()
+        # Keeps other validate_rules_async callers from superseding this view
+        self._validation_token = object()
+        self._validation_poll_id = None
         self.selected_rule_id: Optional[UUID] = None
         self.filter_text = ""
         self.show_inactive = False
@@ -777,54 +795,28 @@ class RuleManagementView(BaseComponent):
         
         return toolbar_frame
     
-    def _create_rules_list(self, parent: tk.Widget) -> tk.Frame:
+    def _create_rules_list(self, parent: tk.Widget) -> VirtualTable:
         """Create rules list with tree view."""
-        theme = get_theme_manager()
-        tokens = theme.get_current_tokens()
-        
-        # Tree frame
-        tree_frame = tk.Frame(parent, bg=tokens.colors["background"])
-        
-        # Tree columns
-        columns = ("name", "status", "priority", "pattern", "validation", "last_execution")
-        self.tree = ttk.Treeview(
-            tree_frame,
-            columns=columns,
-            show="headings",
-            style="Modern.Treeview"
+        # Virtualized table: only the visible rows are materialized
+        self.table = VirtualTable(
+            parent,
+            columns=[
+                ("name", "Rule Name", 200, 150),
+                ("status", "Status", 80, 60),
+                ("priority", "Priority", 80, 60),
+                ("pattern", "Pattern", 120, 100),
+                ("validation", "Validation", 100, 80),
+                ("last_execution", "Last Execution", 150, 120)
+            ]
         )
-        
-        # Configure columns
-        self.tree.heading("name", text="Rule Name")
-        self.tree.heading("status", text="Status")
-        self.tree.heading("priority", text="Priority")
-        self.tree.heading("pattern", text="Pattern")
-        self.tree.heading("validation", text="Validation")
-        self.tree.heading("last_execution", text="Last Execution")
-        
-        self.tree.column("name", width=200, minwidth=150)
-        self.tree.column("status", width=80, minwidth=60)
-        self.tree.column("priority", width=80, minwidth=60)
-        self.tree.column("pattern", width=120, minwidth=100)
-        self.tree.column("validation", width=100, minwidth=80)
-        self.tree.column("last_execution", width=150, minwidth=120)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack tree and scrollbars
-        self.tree.pack(side="left", fill="both", expand=True)
-        v_scrollbar.pack(side="right", fill="y")
-        h_scrollbar.pack(side="bottom", fill="x")
+        self.tree = self.table.tree
         
         # Bind events
-        self.tree.bind("<<TreeviewSelect>>", self._on_rule_selected)
-        self.tree.bind("<Double-1>", self._on_rule_double_click)
+        self.table.add_callback('row_selected', self._on_rule_selected)
+        self.table.add_callback('row_activated', self._on_rule_double_click)
+        self.table.set_filter(self._rule_matches)
         
-        return tree_frame
+        return self.table
     
     def _refresh_rules(self):
         """Refresh rules list from backend."""
@@ -832,86 +824,132 @@ class RuleManagementView(BaseComponent):
             # Get rules from backend
             rules = self.rule_service.list_rules(active_only=False)
             
+            # Current results come back immediately; stale rules are
+            # revalidated in the background and streamed in by the poller
+            self._validation_generation += 1
+            generation = self._validation_generation
+            results = self._validation_results
+            cached = self.rule_service.validate_rules_async(
+                rules, lambda validation: results.put((generation, validation)),
+                token=self._validation_token
+            )
+            self._validation_pending = {rule.id for rule in rules if rule.id not in cached}
+            
             # Create display info for each rule
             self.rules_data = []
             for rule in rules:
-                # Get validation status
-                try:
-                    # Get rule to pass to validation
-                    rule_for_validation = self.rule_service.get_rule(rule.id)
-                    if rule_for_validation:
-                        validation = self.rule_service.validate_rule(rule_for_validation)
-                        status = "Valid" if validation.is_valid else "Invalid"
-                    else:
-                        status = "Not Found"
-                except Exception:
-                    status = "Unknown"
+                validation = cached.get(rule.id)
                 
                 self.rules_data.append(RuleDisplayInfo(
                     rule=rule,
                     pattern_name="",  # Will be populated when pattern integration is complete
-                    validation_status=status,
+                    validation_status=self._validation_status(validation) if validation else "Validating...",
                     last_execution=rule.last_executed,
                     execution_count=rule.execution_count
                 ))
+            self._rules_by_id = {info.rule.id: info for info in self.rules_data}
             
             self._update_tree()
             self._update_stats()
             
+            if self._validation_pending and self._validation_poll_id is None:
+                self._validation_poll_id = self.after(self.VALIDATION_POLL_MS, self._poll_validation)
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load rules:\n{e}")
     
+    @staticmethod
+    def _validation_status(validation) -> str:
+        """Status column text for a validation result."""
+        return "Valid" if validation.is_valid else "Invalid"
+    
+    def _poll_validation(self):
+        """Apply validation results delivered since the last poll."""
+        self._validation_poll_id = None
+        
+        updated = False
+        while True:
+            try:
+                generation, validation = self._validation_results.get_nowait()
+            except queue.Empty:
+                break
+            # Results of a superseded refresh
+            if generation != self._validation_generation:
+                continue
+            
+            rule_info = self._rules_by_id.get(validation.rule_id)
+            if rule_info is not None:
+                rule_info.validation_status = self._validation_status(validation)
+                updated = True
+            self._validation_pending.discard(validation.rule_id)
+        
+        if updated and hasattr(self, 'table'):
+            self.table.refresh()
+        
+        if self._validation_pending:
+            self._validation_poll_id = self.after(self.VALIDATION_POLL_MS, self._poll_validation)
+    
     def _update_tree(self):
         """Update tree view with current rules data."""
-        if not hasattr(self, 'tree'):
+        if not hasattr(self, 'table'):
             return
-            
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         
-        # Filter rules based on current filters
-        filtered_rules = self._filter_rules()
+        self.table.set_source(ListDataSource(
+            self.rules_data,
+            columns=("name", "status", "priority", "pattern", "validation", "last_execution"),
+            formatter=self._format_rule_row,
+            sort_keys={
+                "name": lambda info: info.rule.name.lower(),
+                "priority": lambda info: info.rule.priority,
+                "last_execution": lambda info: info.last_execution
+            },
+            row_id=lambda info: str(info.rule.id)
+        ))
+    
+    @staticmethod
+    def _format_rule_row(rule_info: RuleDisplayInfo) -> tuple:
+        """Format one rule as table values."""
+        rule = rule_info.rule
+        
+        # Format last execution
+        last_exec = ""
+        if rule_info.last_execution:
+            last_exec = rule_info.last_execution.strftime("%Y-%m-%d %H:%M")
+        
+        return (
+            rule.name,
+            "Enabled" if rule.is_enabled else "Disabled",
+            rule.priority,
+            f"Pattern {str(rule.pattern_id)[:8]}...",
+            rule_info.validation_status,
+            last_exec
+        )
+    
+    def _update_filter(self):
+        """Apply the current search text and inactive toggle to the table."""
+        if hasattr(self, 'table'):
+            self.table.set_filter(self._rule_matches)
+    
+    def _rule_matches(self, rule_info: RuleDisplayInfo) -> bool:
+        """Check a rule against the current filter settings."""
+        rule = rule_info.rule
+        
+        # Filter by active/inactive status
+        if not self.show_inactive and not rule.is_enabled:
+            return False
+        
+        # Filter by search text
+        if self.filter_text:
+            search_text = self.filter_text.lower()
+            if (search_text not in rule.name.lower() and 
+                search_text not in rule.description.lower()):
+                return False
         
-        # Add filtered rules to tree
-        for rule_info in filtered_rules:
-            rule = rule_info.rule
-            
-            # Format last execution
-            last_exec = ""
-            if rule_info.last_execution:
-                last_exec = rule_info.last_execution.strftime("%Y-%m-%d %H:%M")
-            
-            self.tree.insert("", "end", values=(
-                rule.name,
-                "Enabled" if rule.is_enabled else "Disabled",
-                rule.priority,
-                f"Pattern {str(rule.pattern_id)[:8]}...",
-                rule_info.validation_status,
-                last_exec
-            ), tags=(str(rule.id),))
+        return True
     
     def _filter_rules(self) -> List[RuleDisplayInfo]:
         """Filter rules based on current filter settings."""
-        filtered = []
-        
-        for rule_info in self.rules_data:
-            rule = rule_info.rule
-            
-            # Filter by active/inactive status
-            if not self.show_inactive and not rule.is_enabled:
-                continue
-            
-            # Filter by search text
-            if self.filter_text:
-                search_text = self.filter_text.lower()
-                if (search_text not in rule.name.lower() and 
-                    search_text not in rule.description.lower()):
-                    continue
-            
-            filtered.append(rule_info)
-        
-        return filtered
+        return [rule_info for rule_info in self.rules_data if self._rule_matches(rule_info)]
     
     def _update_stats(self):
         """Update statistics display."""
@@ -927,28 +965,23 @@ class RuleManagementView(BaseComponent):
     def _on_search_changed(self, *args):
         """Handle search text change."""
         self.filter_text = self.search_var.get()
-        self._update_tree()
+        self._update_filter()
     
     def _on_filter_changed(self, *args):
         """Handle filter settings change."""
         self.show_inactive = self.show_inactive_var.get()
-        self._update_tree()
+        self._update_filter()
     
-    def _on_rule_selected(self, event):
+    def _on_rule_selected(self, rule_info: Optional[RuleDisplayInfo]):
         """Handle rule selection."""
-        selection = self.tree.selection()
-        if selection:
-            item = selection[0]
-            tags = self.tree.item(item, "tags")
-            if tags:
-                rule_id = UUID(tags[0])
-                self.selected_rule_id = rule_id
-                
-                # Enable action buttons
-                self.edit_button.set_state(ComponentState.DEFAULT)
-                self.delete_button.set_state(ComponentState.DEFAULT)
-                self.validate_button.set_state(ComponentState.DEFAULT)
-                self.execute_button.set_state(ComponentState.DEFAULT)
+        if rule_info is not None:
+            self.selected_rule_id = rule_info.rule.id
+            
+            # Enable action buttons
+            self.edit_button.set_state(ComponentState.DEFAULT)
+            self.delete_button.set_state(ComponentState.DEFAULT)
+            self.validate_button.set_state(ComponentState.DEFAULT)
+            self.execute_button.set_state(ComponentState.DEFAULT)
         else:
             self.selected_rule_id = None
             
@@ -958,7 +991,7 @@ class RuleManagementView(BaseComponent):
             self.validate_button.set_state(ComponentState.DISABLED)
             self.execute_button.set_state(ComponentState.DISABLED)
     
-    def _on_rule_double_click(self, event):
+    def _on_rule_double_click(self, rule_info: RuleDisplayInfo):
         """Handle double-click on rule."""
         self._edit_rule()
     
@@ -1032,6 +1065,11 @@ class RuleManagementView(BaseComponent):
                 
             validation = self.rule_service.validate_rule(rule)
             
+            rule_info = self._rules_by_id.get(rule_id)
+            if rule_info is not None:
+                rule_info.validation_status = self._validation_status(validation)
+                self.table.refresh()
+            
             if validation.is_valid:
                 messagebox.showinfo("Validation", "Rule is valid and ready to execute.")
             else:
@@ -1056,6 +1094,16 @@ class RuleManagementView(BaseComponent):
         
         # Refresh to show updated execution statistics
         self._refresh_rules()
+    
+    def destroy(self):
+        """Stop streaming validation results before the view goes away."""
+        self._validation_generation += 1
+        if self._validation_poll_id is not None:
+            self.after_cancel(self._validation_poll_id)
+            self._validation_poll_id = None
+        self._validation_pending.clear()
+        self.rule_service.cancel_validation(self._validation_token)
+        super().destroy()
 
 
 class RuleEditor(ModernDialog):
@@ -1220,10 +1268,13 @@ class RuleEditor(ModernDialog):
 class RuleExecutionDialog(ModernDialog):
     """Dialog for executing rules with progress tracking."""
     
+    PROGRESS_TOPIC = "rule_execution.progress"
+    
     def __init__(self, parent: tk.Widget, rule_service: RuleService, rule_id: UUID, **kwargs):
         self.rule_service = rule_service
         self.rule_id = rule_id
         self.execution_result = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
         
         # Get rule info
         rule = rule_service.get_rule(rule_id)
@@ -1362,33 +1413,73 @@ class RuleExecutionDialog(ModernDialog):
         for widget in self.progress_frame.winfo_children():
             widget.destroy()
         
+        tokens = get_theme_manager().get_current_tokens()
+        
+        # Show progress
+        self.progress_label = tk.Label(
+            self.progress_frame,
+            text="Executing rule...",
+            font=(tokens.fonts["family"], int(tokens.fonts["size_body"]), tokens.fonts["weight_normal"]),
+            bg=tokens.colors["background"],
+            fg=tokens.colors["text"]
+        )
+        self.progress_label.pack(pady=tokens.spacing["md"])
+        
+        self.progress_var = tk.DoubleVar()
+        ttk.Progressbar(
+            self.progress_frame,
+            variable=self.progress_var,
+            maximum=100,
+            style="Modern.Horizontal.TProgressbar"
+        ).pack(fill="x")
+        
+        # Execute on a worker thread; progress and the result come back
+        # through the event bus
+        bus = get_event_bus(self.dialog_window)
+        if self._unsubscribe is None:
+            self._unsubscribe = bus.subscribe(self.PROGRESS_TOPIC, self._on_progress)
+        
+        threading.Thread(
+            target=self._run_rule,
+            args=(bus, Path(source_path), self.dry_run_var.get()),
+            daemon=True
+        ).start()
+    
+    def _run_rule(self, bus: UIEventBus, source_directory: Path, dry_run: bool):
+        """Execute the rule on the worker thread."""
         try:
-            # Show progress
-            progress_label = tk.Label(
-                self.progress_frame,
-                text="Executing rule...",
-                font=(get_theme_manager().get_current_tokens().fonts["family"], 
-                      int(get_theme_manager().get_current_tokens().fonts["size_body"]), 
-                      get_theme_manager().get_current_tokens().fonts["weight_normal"]),
-                bg=get_theme_manager().get_current_tokens().colors["background"],
-                fg=get_theme_manager().get_current_tokens().colors["text"]
-            )
-            progress_label.pack(pady=get_theme_manager().get_current_tokens().spacing["md"])
-            
-            # Execute rule
             result = self.rule_service.execute_rule(
                 rule_id=self.rule_id,
-                source_directory=Path(source_path),
-                dry_run=self.dry_run_var.get()
+                source_directory=source_directory,
+                dry_run=dry_run,
+                progress_callback=lambda progress: bus.post(
+                    self.PROGRESS_TOPIC, progress, key=progress.operation_id
+                )
             )
-            
-            self._show_execution_results(result)
-            
         except Exception as e:
-            self._show_execution_error(e)
+            bus.call(self._show_execution_error, e)
+        else:
+            bus.call(self._show_execution_results, result)
+    
+    def _is_open(self) -> bool:
+        """Check the dialog window still exists."""
+        return bool(self.dialog_window and self.dialog_window.winfo_exists())
+    
+    def _on_progress(self, progress: OperationProgress):
+        """Render the latest progress of this dialog's rule."""
+        if progress.operation_id != str(self.rule_id) or not self._is_open():
+            return
+        
+        self.progress_var.set(progress_percentage(progress))
+        self.progress_label.configure(
+            text=f"Processing {progress.current_file.name} ({progress.files_processed}/{progress.total_files})..."
+        )
     
     def _show_execution_results(self, result: RuleExecutionResult):
         """Show execution results."""
+        if not self._is_open():
+            return
+        
         theme = get_theme_manager()
         tokens = theme.get_current_tokens()
         
@@ -1428,7 +1519,8 @@ class RuleExecutionDialog(ModernDialog):
     
     def _show_execution_error(self, error: Exception):
         """Show execution error."""
-        # Stop progress - no actual progress bar to stop in this implementation
+        if not self._is_open():
+            return
         
         theme = get_theme_manager()
         tokens = theme.get_current_tokens()
@@ -1451,8 +1543,20 @@ class RuleExecutionDialog(ModernDialog):
         # Re-enable execute button
         self.execute_button.set_state(ComponentState.DEFAULT)
     
+    def _stop_progress(self):
+        """Stop receiving progress events."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+    
+    def _on_close(self):
+        """Handle window close."""
+        self._stop_progress()
+        super()._on_close()
+    
     def _on_cancel(self):
         """Handle cancel action."""
+        self._stop_progress()
         self.result = self.execution_result
         self.dialog_window.destroy()
 
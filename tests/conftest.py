@@ -17,6 +17,7 @@ from unittest.mock import Mock, patch
 
 def pytest_configure(config):
     """Configure pytest environment."""
+    config.addinivalue_line("markers", "performance: marks tests as performance benchmarks")
     # Only mock tkinter if it is genuinely unavailable (no ImportError above means it's present)
     if tk is None:
         # Provide real base classes so tkinter-dependent modules can be imported.
@@ -68,6 +69,16 @@ def pytest_configure(config):
         sys.modules['tkinter.ttk'] = ttk_mock
 
 
+def pytest_collection_modifyitems(config, items):
+    """Deselect performance benchmarks unless a marker expression is given (``-m performance``)."""
+    if config.getoption("markexpr"):
+        return
+    selected = [item for item in items if item.get_closest_marker("performance") is None]
+    if len(selected) < len(items):
+        config.hook.pytest_deselected(items=[item for item in items if item.get_closest_marker("performance")])
+        items[:] = selected
+
+
 @pytest.fixture(scope="function")
 def tk_root():
     """Provide a Tkinter root window for tests."""
@@ -0,0 +1,28 @@
+"""
+Performance benchmark configuration
+===================================
+
+Benchmarks are deselected by default; run them with
+``pytest -m performance tests/performance``. Timings recorded through
+the ``report`` fixture are listed in a summary section at the end.
+"""
+
+import pytest
+
+
+_results = []
+
+
+@pytest.fixture
+def report(request):
+    """Record a line of timings for the end-of-run summary."""
+    def add(line: str) -> None:
+        _results.append(f"{request.node.name}: {line}")
+    return add
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _results:
+        terminalreporter.section("performance")
+        for line in _results:
+            terminalreporter.write_line(line)
@@ -0,0 +1,80 @@
+"""
+Backend Index Benchmark
+=======================
+
+Query time for primary-key and indexed range filters against a full scan
+on the file system and memory backends. Run with
+``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.storage import StorageBackend, StorageConfig
+from taskmover.core.storage.backends import FileSystemBackend, MemoryBackend
+
+
+FILE_ROWS = 500
+MEMORY_ROWS = 20000
+RANGE = {'$gte': 100, '$lt': 110}
+
+
+def _elapsed_ms(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def _populate(backend, rows):
+    backend.create_table("files", {})
+    for i in range(rows):
+        backend.insert("files", {'id': f"file{i}", 'size': i, 'path': f"/data/file{i}.txt"})
+
+
+@pytest.mark.performance
+def test_file_system_indexed_queries(report):
+    """Compare primary-key and indexed lookups with full directory scans."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = FileSystemBackend()
+        backend.connect(StorageConfig(backend=StorageBackend.FILE_SYSTEM, connection_string=temp_dir))
+        _populate(backend, FILE_ROWS)
+
+        scan_ms, scanned = _elapsed_ms(lambda: backend.select("files", filters={'size': RANGE}))
+        backend.create_index("files", "size")
+        index_ms, indexed = _elapsed_ms(lambda: backend.select("files", filters={'size': RANGE}))
+        key_ms, by_key = _elapsed_ms(lambda: backend.select("files", filters={'id': 'file400'}))
+        backend.disconnect()
+
+    report(f"file system ({FILE_ROWS} rows): range scan {scan_ms:.1f} ms, "
+          f"indexed range {index_ms:.2f} ms, primary key {key_ms:.2f} ms")
+
+    assert len(scanned) == len(indexed) == 10
+    assert by_key[0]['size'] == 400
+
+
+@pytest.mark.performance
+def test_memory_indexed_queries(report):
+    """Compare primary-key and indexed lookups with full table scans."""
+    backend = MemoryBackend()
+    backend.connect(StorageConfig(backend=StorageBackend.MEMORY, connection_string=""))
+    _populate(backend, MEMORY_ROWS)
+
+    scan_ms, scanned = _elapsed_ms(lambda: backend.select("files", filters={'size': RANGE}))
+    backend.create_index("files", "size")
+    index_ms, indexed = _elapsed_ms(lambda: backend.select("files", filters={'size': RANGE}))
+    key_ms, by_key = _elapsed_ms(lambda: backend.select("files", filters={'id': 'file19999'}))
+    backend.disconnect()
+
+    report(f"memory ({MEMORY_ROWS} rows): range scan {scan_ms:.1f} ms, "
+          f"indexed range {index_ms:.2f} ms, primary key {key_ms:.3f} ms")
+
+    assert len(scanned) == len(indexed) == 10
+    assert by_key[0]['size'] == 19999
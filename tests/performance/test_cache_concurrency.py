@@ -0,0 +1,81 @@
+"""
+Concurrent Cache Benchmark
+==========================
+
+Multi-threaded get/set throughput of the pattern cache managers. Run with
+``pytest -m performance tests/performance`` to see the throughput report.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.storage.cache_manager import MultiLevelCacheManager
+from taskmover.core.patterns.storage.sharded_cache import ShardedCacheManager
+
+
+THREADS = 8
+OPERATIONS_PER_THREAD = 5000
+KEY_SPACE = 2000
+
+
+def _run_workload(cache) -> float:
+    """Run a mixed read-heavy workload on several threads; return ops/second."""
+    for i in range(KEY_SPACE):
+        cache.set(f"key_{i}", i)
+
+    barrier = threading.Barrier(THREADS + 1)
+    errors = []
+
+    def worker(seed: int) -> None:
+        try:
+            barrier.wait()
+            for n in range(OPERATIONS_PER_THREAD):
+                key = f"key_{(n * 7919 + seed) % KEY_SPACE}"
+                if n % 10 == 0:
+                    cache.set(key, n)
+                else:
+                    cache.get(key)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    assert not errors
+    return THREADS * OPERATIONS_PER_THREAD / elapsed
+
+
+@pytest.mark.performance
+def test_sharded_cache_concurrent_throughput(report):
+    """Compare single-lock and sharded cache throughput under thread contention."""
+    single = MultiLevelCacheManager(max_memory_entries=KEY_SPACE * 2,
+                                    cleanup_interval_seconds=3600)
+    sharded = ShardedCacheManager(shard_count=16, max_memory_entries=KEY_SPACE * 2,
+                                  cleanup_interval_seconds=3600)
+    try:
+        single_ops = _run_workload(single)
+        sharded_ops = _run_workload(sharded)
+    finally:
+        single.shutdown()
+        sharded.shutdown()
+
+    report(f"single-lock: {single_ops:,.0f} ops/s, sharded: {sharded_ops:,.0f} ops/s")
+
+    stats = sharded.get_stats()
+    assert stats['total_requests'] >= THREADS * OPERATIONS_PER_THREAD * 9 // 10
+    assert stats['hits'] > 0
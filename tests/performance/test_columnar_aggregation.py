@@ -0,0 +1,80 @@
+"""
+Columnar Aggregation Benchmark
+==============================
+
+Memory per file and aggregation time of the columnar workspace
+statistics against the previous one-dict-per-file representation.
+Run with ``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.suggestions.columns import NUMPY_AVAILABLE, FileColumns, aggregate
+
+
+FILES = 50_000
+FILES_PER_DIRECTORY = 1000
+DICT_FILES = 5_000
+EXTENSIONS = ["pdf", "txt", "jpg", "png", "docx", "py", "zip", "mp3"]
+
+
+def _file(rng, i):
+    name = f"file{i}.{EXTENSIONS[i % len(EXTENSIONS)]}"
+    size = rng.randrange(0, 50 * 1024 * 1024)
+    mtime = time.time() - rng.randrange(0, 2 * 365 * 86400)
+    return name, size, mtime
+
+
+@pytest.mark.performance
+def test_columnar_memory_and_speed(report):
+    """Columns use a small fraction of the memory of per-file dicts."""
+    rng = random.Random(7)
+
+    tracemalloc.start()
+    dicts = []
+    for i in range(DICT_FILES):
+        name, size, mtime = _file(rng, i)
+        path = Path("/workspace/dir") / name
+        dicts.append({
+            'path': path, 'name': name, 'extension': path.suffix.lower().lstrip('.'),
+            'directory': "dir", 'size': size,
+            'modified': datetime.fromtimestamp(mtime), 'created': datetime.fromtimestamp(mtime),
+            'is_hidden': False, 'is_empty': size == 0
+        })
+    dict_bytes = tracemalloc.get_traced_memory()[0] / DICT_FILES
+    tracemalloc.stop()
+    del dicts
+
+    tracemalloc.start()
+    columns = []
+    for i in range(FILES):
+        if i % FILES_PER_DIRECTORY == 0:
+            columns.append(FileColumns(f"dir{i // FILES_PER_DIRECTORY}"))
+        name, size, mtime = _file(rng, i)
+        columns[-1].append(name, size, int(mtime * 1e9))
+    column_bytes = tracemalloc.get_traced_memory()[0] / FILES
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    stats = aggregate(columns)
+    aggregate_ms = (time.perf_counter() - start) * 1000
+
+    report(f"per-file dicts: {dict_bytes:.0f} B/file, columns: {column_bytes:.1f} B/file, "
+          f"aggregate {FILES:,} files: {aggregate_ms:.0f} ms "
+          f"({'numpy' if NUMPY_AVAILABLE else 'single pass'})")
+
+    assert stats['files'] == FILES
+    assert sum(stats['size_buckets'].values()) + stats['empty'] == FILES
+    assert column_bytes < 32
+    assert column_bytes * 10 < dict_bytes
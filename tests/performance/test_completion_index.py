@@ -0,0 +1,81 @@
+"""
+Completion Index Benchmark
+==========================
+
+Completion latency of ``CompletionIndex`` with tens of thousands of saved
+patterns, and the cost of keeping it current as patterns change. Run
+with ``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.models import Pattern
+from taskmover.core.patterns.suggestions import CompletionIndex
+
+
+PATTERNS = 10000
+QUERIES = 1000
+WORDS = ["invoice", "report", "receipt", "photo", "scan", "draft", "backup", "budget",
+         "contract", "statement", "project", "archive", "export", "summary", "notes"]
+EXTENSIONS = ["pdf", "docx", "xlsx", "jpg", "png", "txt", "zip", "csv"]
+
+
+def _patterns(rng):
+    for i in range(PATTERNS):
+        word = rng.choice(WORDS)
+        pattern = Pattern(name=f"{word.title()} {i}",
+                          user_expression=f"{word}_{i}*.{rng.choice(EXTENSIONS)}"
+                                          f"{' AND $YEAR' if i % 7 == 0 else ''}")
+        pattern.usage_stats.usage_count = rng.randrange(0, 1000)
+        yield pattern
+
+
+@pytest.mark.performance
+def test_completion_latency_with_many_patterns(report):
+    """Completion latency with 10k saved patterns, and after usage updates."""
+    rng = random.Random(11)
+    patterns = list(_patterns(rng))
+    index = CompletionIndex()
+
+    start = time.perf_counter()
+    index.load_patterns(patterns)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    inputs = [rng.choice(WORDS)[:rng.randint(1, 4)] for _ in range(QUERIES // 2)]
+    inputs += ["*.pdf AND s", "$DA", "@doc", "*.pdf "] * (QUERIES // 8)
+
+    # Warm the per-node caches, as the first keystrokes of a session would
+    for text in set(inputs):
+        index.complete(text)
+
+    timings = []
+    for text in inputs:
+        start = time.perf_counter()
+        index.complete(text)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+
+    updates = []
+    for pattern in rng.sample(patterns, 200):
+        pattern.usage_stats.usage_count += 1
+        start = time.perf_counter()
+        index.update_usage(pattern)
+        index.complete(pattern.user_expression[:3])
+        updates.append((time.perf_counter() - start) * 1_000_000)
+
+    median = statistics.median(timings)
+    p99 = sorted(timings)[int(len(timings) * 0.99)]
+    update_median = statistics.median(updates)
+    report(f"indexed {PATTERNS:,} patterns in {load_ms:.0f} ms; completion median {median:.1f} us, "
+          f"p99 {p99:.1f} us; update + completion median {update_median:.1f} us")
+
+    assert index.complete("invoice_1")[0].startswith("invoice_1")
@@ -0,0 +1,64 @@
+"""
+UI Event Bus Benchmark
+======================
+
+Cost of reporting per-file progress from background workers. Workers
+post progress for every file; the pump renders only the latest value per
+operation each frame, so the Tk thread's work per frame stays constant
+however fast the workers go. Run with ``pytest -m performance tests/performance`` to
+see the timings.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.ui.event_bus import UIEventBus
+
+
+WORKERS = 4
+FILES_PER_WORKER = 20000
+FRAME_SECONDS = UIEventBus.FRAME_MS / 1000
+
+
+@pytest.mark.performance
+def test_progress_coalesced_per_frame(report):
+    """80k progress posts become a few renders per frame."""
+    bus = UIEventBus()
+    renders = []
+    bus.subscribe("progress", renders.append)
+
+    def worker(name):
+        for i in range(FILES_PER_WORKER):
+            bus.post("progress", (name, i), key=name)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(WORKERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    frames = []
+    while any(thread.is_alive() for thread in threads):
+        time.sleep(FRAME_SECONDS)
+        frame_start = time.perf_counter()
+        bus.pump()
+        frames.append((time.perf_counter() - frame_start) * 1000)
+    for thread in threads:
+        thread.join()
+    bus.pump()
+    total_ms = (time.perf_counter() - start) * 1000
+
+    posts = WORKERS * FILES_PER_WORKER
+    report(f"{posts:,} progress posts in {total_ms:.0f} ms: {len(renders)} renders over "
+          f"{len(frames)} frames, worst pump {max(frames, default=0):.3f} ms")
+
+    latest = dict(renders)
+    assert latest == {n: FILES_PER_WORKER - 1 for n in range(WORKERS)}
+    assert len(renders) <= WORKERS * (len(frames) + 1)
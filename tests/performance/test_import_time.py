@@ -0,0 +1,62 @@
+"""
+Import Time Budget
+==================
+
+Measures ``python -X importtime`` for the pattern system entry point and
+checks that heavy modules (tkinter, yaml, sqlite3, the repositories) are
+only imported once a component needs them. Run with
+``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+IMPORT_BUDGET_MS = 300
+
+DEFERRED_MODULES = [
+    "tkinter",
+    "yaml",
+    "sqlite3",
+    "taskmover.core.patterns.storage.repository",
+    "taskmover.core.patterns.suggestions.suggestion_engine",
+    "taskmover.core.conflict_resolution",
+]
+
+
+def _import_profile(module: str):
+    """Import ``module`` in a fresh interpreter; return cumulative times and loaded modules."""
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=project_root, capture_output=True, text=True, check=True
+    )
+
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_us[name.strip()] = int(cumulative)
+    return cumulative_us, result.stdout.split()
+
+
+@pytest.mark.performance
+def test_pattern_system_import_budget(report):
+    """Check importing the pattern system defers heavy modules."""
+    cumulative_us, loaded = _import_profile("taskmover.core.patterns")
+    import_ms = cumulative_us["taskmover.core.patterns"] / 1000
+
+    report(f"import taskmover.core.patterns: {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+    assert loaded == []
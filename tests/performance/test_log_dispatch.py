@@ -0,0 +1,66 @@
+"""
+Log Dispatch Benchmark
+======================
+
+Caller-thread cost of a log call with inline handler I/O versus the
+background dispatcher. Run with ``pytest -m performance tests/performance`` to see
+the per-call report.
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.logging.dispatch import LogDispatcher
+from taskmover.core.logging.handlers import RotatingFileHandler
+from taskmover.core.logging.interfaces import LogLevel, LogRecord
+
+
+CALLS = 5000
+
+
+def _caller_cost_us(publish, records) -> float:
+    """Average time spent on the calling thread per record, in microseconds."""
+    start = time.perf_counter()
+    for record in records:
+        publish(record)
+    return (time.perf_counter() - start) / len(records) * 1_000_000
+
+
+@pytest.mark.performance
+def test_dispatcher_reduces_caller_cost(report):
+    """Compare inline file handling with queue publication."""
+    records = [
+        LogRecord(timestamp=datetime.now(), level=LogLevel.INFO,
+                  component="benchmark", message=f"benchmark record {i}")
+        for i in range(CALLS)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        inline_handler = RotatingFileHandler(filename=str(Path(temp_dir) / "inline.log"),
+                                             compression=False)
+        queued_handler = RotatingFileHandler(filename=str(Path(temp_dir) / "queued.log"),
+                                             compression=False)
+        dispatcher = LogDispatcher(lambda: (queued_handler,), queue_size=CALLS * 2)
+        try:
+            inline_us = _caller_cost_us(inline_handler.handle, records)
+            queued_us = _caller_cost_us(dispatcher.publish, records)
+            assert dispatcher.flush(timeout=30.0)
+        finally:
+            dispatcher.close()
+            inline_handler.close()
+            queued_handler.close()
+
+        queued_lines = (Path(temp_dir) / "queued.log").read_text().count("benchmark record")
+
+    report(f"inline: {inline_us:.2f} us/call, dispatched: {queued_us:.2f} us/call")
+
+    assert queued_lines == CALLS
@@ -0,0 +1,62 @@
+"""
+Log Store Query Benchmark
+=========================
+
+Time to pull one operation's records out of an indexed log store versus
+scanning every line. Run with ``pytest -m performance tests/performance`` to see the
+timings.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.logging.interfaces import LogContext, LogLevel, LogRecord
+from taskmover.core.logging.log_store import IndexedLogHandler, LogStore
+
+
+RECORDS = 20000
+OPERATIONS = 400
+
+
+@pytest.mark.performance
+def test_operation_query_avoids_full_scan(report):
+    """Compare an indexed operation lookup with a full scan."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        handler = IndexedLogHandler(temp_dir, segment_size=1024 * 1024, level=LogLevel.DEBUG)
+        for i in range(RECORDS):
+            operation_id = f"op-{i % OPERATIONS}"
+            handler.handle(LogRecord(
+                timestamp=datetime.now(), level=LogLevel.INFO, component="file_operations",
+                message=f"moved file {i}",
+                context=LogContext(session_id="bench", component="file_operations",
+                                   operation_id=operation_id),
+            ))
+        handler.close()
+
+        start = time.perf_counter()
+        scanned = []
+        for path in sorted(Path(temp_dir).glob("*.jsonl")):
+            with open(path, "rb") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if entry.get("operation_id") == "op-7":
+                        scanned.append(entry)
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        indexed = LogStore(temp_dir).operation("op-7")
+        indexed_ms = (time.perf_counter() - start) * 1000
+
+    report(f"full scan: {scan_ms:.1f} ms, indexed: {indexed_ms:.1f} ms")
+
+    assert len(indexed) == len(scanned) == RECORDS // OPERATIONS
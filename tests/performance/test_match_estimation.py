@@ -0,0 +1,79 @@
+"""
+Live Match Estimation Benchmark
+===============================
+
+Latency of sampled match estimates for pattern drafts against matching
+every file of the workspace. Run with ``pytest -m performance tests/performance``
+to see the timings.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.matching import MatchEstimator, UnifiedPatternMatcher
+from taskmover.core.patterns.models import Pattern, PatternType
+
+
+FILES = 8000
+DRAFTS = ["*", "*.", "*.p", "*.pd", "*.pdf"]
+
+
+def _workspace(root: Path) -> None:
+    for i in range(FILES):
+        folder = root / f"dir{i % 200}"
+        if i < 200:
+            folder.mkdir()
+        (folder / f"file{i}.{'pdf' if i % 10 == 0 else 'txt'}").touch()
+
+
+@pytest.mark.performance
+def test_estimate_latency(report):
+    """Compare the latency of a sampled estimate with a full walk and match."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        _workspace(root)
+
+        start = time.perf_counter()
+        files = [path for path in root.rglob("*") if path.is_file()]
+        pattern = Pattern(name="full", user_expression="*.pdf", pattern_type=PatternType.SIMPLE_GLOB)
+        exact = len(UnifiedPatternMatcher().match(pattern, files).matched_files)
+        full_ms = (time.perf_counter() - start) * 1000
+
+        estimator = MatchEstimator()
+        start = time.perf_counter()
+        estimator.set_workspace(root)
+        assert estimator.sample.wait(timeout=5)
+        first_sample_ms = (time.perf_counter() - start) * 1000
+        estimator.sample.wait(timeout=30, complete=True)
+
+        delivered = []
+        done = threading.Event()
+
+        def on_estimate(estimate):
+            delivered.append(estimate)
+            if estimate.pattern == DRAFTS[-1]:
+                done.set()
+
+        start = time.perf_counter()
+        for draft in DRAFTS:
+            estimator.submit(draft, on_estimate)
+        assert done.wait(timeout=30)
+        typed_ms = (time.perf_counter() - start) * 1000
+        estimator.close()
+
+    estimate = delivered[-1]
+    report(f"full walk + match: {full_ms:.1f} ms, first sample: {first_sample_ms:.1f} ms, "
+          f"estimate after typing: {typed_ms:.1f} ms ({estimate.elapsed_ms:.2f} ms evaluating), "
+          f"~{estimate.estimated} [{estimate.lower}-{estimate.upper}] vs exact {exact}")
+
+    assert estimate.pattern == "*.pdf"
+    assert estimate.lower <= exact <= estimate.upper or abs(estimate.estimated - exact) < exact * 0.2
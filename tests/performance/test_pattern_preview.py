@@ -0,0 +1,64 @@
+"""
+Pattern Test Run Benchmark
+==========================
+
+Time until the pattern builder shows results for a draft tested against
+a folder with 4k files. The run stops once it has enough matches and
+non-matches to show, and a rerun of the same draft is served from the
+match cache. Run with ``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.matching import PatternPreviewRunner, UnifiedPatternMatcher
+from taskmover.core.patterns.storage import MultiLevelCacheManager
+
+
+FILES = 4000
+FOLDERS = 50
+EXTENSIONS = ["pdf", "jpg", "txt", "docx", "png"]
+
+
+@pytest.mark.performance
+def test_pattern_test_run_on_large_folder(report):
+    """First results for a large folder come from a partial walk, reruns from the cache."""
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        for folder in range(FOLDERS):
+            (root / f"dir{folder:02}").mkdir()
+        for i in range(FILES):
+            path = root / f"dir{i % FOLDERS:02}" / f"file{i:05}.{EXTENSIONS[i % len(EXTENSIONS)]}"
+            path.write_bytes(b"x" * (i % 7) * 1024)
+
+        runner = PatternPreviewRunner(matcher=UnifiedPatternMatcher(cache_manager=MultiLevelCacheManager()))
+        timings = {}
+        for pattern in ["*.pdf", "size > 5KB", "@media"]:
+            cold = runner.run(pattern, root)
+            warm = runner.run(pattern, root)
+            timings[pattern] = (cold, warm)
+
+        # Full evaluation of a pattern nothing matches, for comparison
+        start = time.perf_counter()
+        full = runner.run("*.nomatch", root)
+        full_ms = (time.perf_counter() - start) * 1000
+
+    for pattern, (cold, warm) in timings.items():
+        report(f"{pattern!r}: {cold.elapsed_ms:.1f} ms cold, {warm.elapsed_ms:.1f} ms {warm.cache_status} "
+               f"({cold.files_checked:,} of {FILES:,} files checked)")
+    report(f"no matches, full walk: {full_ms:.0f} ms over {full.files_checked:,} files")
+
+    for cold, warm in timings.values():
+        assert cold.error is None
+        assert len(cold.matches) == len(cold.non_matches) == 20
+        assert not cold.complete and cold.files_checked < FILES
+        assert warm.cache_status == "cached"
+    assert full.complete and full.files_checked == FILES
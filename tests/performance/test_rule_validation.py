@@ -0,0 +1,94 @@
+"""
+Rule Validation Benchmark
+=========================
+
+Cost of opening the rule list with 1k rules. The list is shown from
+memoized validation results; only stale rules are revalidated, on a
+worker pool, while the view is already up. Run with
+``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.rules.models import Rule
+from taskmover.core.rules.validation import RuleValidator, ValidationCache
+
+
+RULES = 1000
+PATTERNS = 50
+DESTINATIONS = 50
+
+
+@pytest.mark.performance
+def test_open_rule_list_with_memoized_validation(report):
+    """Submitting rules returns cached results only; the rest stream in behind it."""
+    with tempfile.TemporaryDirectory() as temp:
+        destinations = [Path(temp) / f"dest{i}" for i in range(DESTINATIONS)]
+        for destination in destinations:
+            destination.mkdir()
+
+        patterns = {}
+        for _ in range(PATTERNS):
+            pattern = Mock(version=1, modified_date=datetime(2024, 1, 1), is_valid=True)
+            pattern.name = "pattern"
+            patterns[uuid4()] = pattern
+        pattern_ids = list(patterns)
+
+        pattern_system = Mock()
+        pattern_system.get_pattern.side_effect = patterns.get
+        validator = RuleValidator(pattern_system)
+        cache = ValidationCache(validator.validate_rule, pattern_system.get_pattern)
+
+        rules = [Rule(name=f"Rule {i}", pattern_id=pattern_ids[i % PATTERNS],
+                      destination_path=destinations[i % DESTINATIONS]) for i in range(RULES)]
+
+        try:
+            # Previous behaviour: every rule validated on the UI thread
+            start = time.perf_counter()
+            for rule in rules[:100]:
+                validator.validate_rule(rule)
+            sync_ms = (time.perf_counter() - start) * 1000 * RULES / 100
+
+            received = []
+            finished = threading.Event()
+
+            def on_result(result):
+                received.append(result)
+                if len(received) == RULES:
+                    finished.set()
+
+            start = time.perf_counter()
+            cached = cache.submit(rules, on_result)
+            cold_ms = (time.perf_counter() - start) * 1000
+            assert finished.wait(60)
+            stream_ms = (time.perf_counter() - start) * 1000
+
+            # Reopen after editing one rule and one pattern
+            rules[0].modified_date = datetime(2100, 1, 1)
+            patterns[pattern_ids[1]].modified_date = datetime(2024, 6, 1)
+            stale = []
+            start = time.perf_counter()
+            warm = cache.submit(rules, stale.append)
+            warm_ms = (time.perf_counter() - start) * 1000
+        finally:
+            cache.close()
+
+    report(f"{RULES:,} rules: synchronous validation {sync_ms:.0f} ms (extrapolated), "
+          f"open cold {cold_ms:.1f} ms (all results after {stream_ms:.0f} ms), "
+          f"reopen {warm_ms:.1f} ms with {RULES - len(warm)} stale")
+
+    assert cached == {}
+    assert RULES - len(warm) == 1 + RULES // PATTERNS
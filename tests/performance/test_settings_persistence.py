@@ -0,0 +1,81 @@
+"""
+Settings Persistence Benchmark
+==============================
+
+Cost of persisting a burst of setting changes, such as dragging a
+slider in the settings view. Changes only mark their scope dirty; a
+debounced save writes the dirty scope once. Checking for settings files
+changed by another process only stats the files. Run with
+``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.settings import (
+    FileSettingStorage, SettingManager, SettingScope, SettingValidator, register_all_definitions
+)
+
+
+CHANGES = 200
+CHECKS = 1000
+
+
+@pytest.mark.performance
+def test_slider_drag_is_one_write(report):
+    """200 changes to one setting cost one scope write."""
+    with tempfile.TemporaryDirectory() as temp:
+        storage = FileSettingStorage(Path(temp))
+        manager = SettingManager(storage, SettingValidator(), autosave_delay=0.5,
+                                 history_file=Path(temp) / "history.jsonl")
+        register_all_definitions(manager)
+        manager.reload()
+
+        # Previous behaviour: every change followed by saving every scope
+        start = time.perf_counter()
+        for width in range(800, 850):
+            manager.set("window.width", width)
+            for scope in SettingScope:
+                storage.save(scope, manager.get_all(scope))
+        eager_ms = (time.perf_counter() - start) * 1000 * CHANGES / 50
+        manager.save()
+
+        with patch.object(storage, "save", wraps=storage.save) as save:
+            # A drag of about 0.4 s; every change pushes the autosave back
+            start = time.perf_counter()
+            for i in range(CHANGES):
+                manager.set("window.width", 800 + i)
+                if i % 5 == 0:
+                    time.sleep(0.01)
+            drag_ms = (time.perf_counter() - start) * 1000
+            writes_during_drag = save.call_count
+            
+            deadline = time.monotonic() + 5
+            while manager.dirty_scopes and time.monotonic() < deadline:
+                time.sleep(0.01)
+            writes = save.call_count
+        manager.close()
+
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            manager.reload_changed()
+        check_us = (time.perf_counter() - start) * 1e6 / CHECKS
+
+        history = len((Path(temp) / "history.jsonl").read_text(encoding="utf-8").splitlines())
+
+    report(f"{CHANGES} changes: saving every scope per change {eager_ms:.0f} ms (extrapolated), "
+          f"{drag_ms:.0f} ms drag with debounced autosave, {writes} write; "
+          f"change check {check_us:.1f} us; {history} history entries on disk")
+
+    assert writes_during_drag == 0
+    assert writes == 1
+    assert history <= 1000
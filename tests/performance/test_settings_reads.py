@@ -0,0 +1,93 @@
+"""
+Settings Read Benchmark
+=======================
+
+Cost of reading settings in tight loops (theme tokens, rule defaults).
+Reads are a lookup on the published snapshot and held accessors only
+redo the lookup after a write, so readers never contend with writers
+for the manager's lock. Run with ``pytest -m performance tests/performance`` to see
+the timings.
+"""
+
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.settings import (
+    MemorySettingStorage, SettingManager, SettingScope, SettingValidator, register_all_definitions
+)
+
+
+READS = 50000
+KEYS = ["ui.theme", "window.width", "rules.max_retries", "missing.key"]
+
+
+def locked_get(manager, key):
+    """Previous behaviour: lock, search three scopes, log every read."""
+    logger = logging.getLogger("settings.benchmark")
+    with manager._lock:
+        for scope in (SettingScope.USER, SettingScope.APPLICATION, SettingScope.SYSTEM):
+            if key in manager._settings[scope]:
+                value = manager._settings[scope][key]
+                logger.debug(f"Retrieved setting {key} = {value} from scope {scope.value}")
+                return value
+        definition = manager._definitions.get(key)
+        default = definition.default_value if definition else None
+        logger.debug(f"Setting {key} not found, returning default: {default}")
+        return default
+
+
+def timed(read) -> float:
+    """Microseconds per read over READS reads."""
+    start = time.perf_counter()
+    for i in range(READS):
+        read(KEYS[i & 3])
+    return (time.perf_counter() - start) * 1e6 / READS
+
+
+@pytest.mark.performance
+def test_settings_reads(report):
+    """Compare snapshot and locked reads, also while a writer runs."""
+    manager = SettingManager(MemorySettingStorage(), SettingValidator())
+    register_all_definitions(manager)
+    manager.set("ui.theme", "dark")
+
+    locked_us = timed(lambda key: locked_get(manager, key))
+    snapshot_us = timed(manager.get)
+
+    width = manager.accessor("window.width")
+    start = time.perf_counter()
+    for _ in range(READS):
+        width()
+    accessor_us = (time.perf_counter() - start) * 1e6 / READS
+
+    # Reads while another thread keeps writing
+    stop = threading.Event()
+
+    def writer():
+        value = 800
+        while not stop.is_set():
+            value = 800 + (value + 1) % 1000
+            manager.set("window.width", value)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        contended_us = timed(manager.get)
+    finally:
+        stop.set()
+        thread.join()
+
+    report(f"{READS:,} reads: locked {locked_us:.2f} us, snapshot {snapshot_us:.2f} us, "
+          f"accessor {accessor_us:.2f} us, snapshot with a writer {contended_us:.2f} us per read")
+
+    assert 800 <= width() < 1800
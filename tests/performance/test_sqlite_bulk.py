@@ -0,0 +1,65 @@
+"""
+SQLite Bulk Load Benchmark
+==========================
+
+Rows per second for ``SQLiteBackend.insert_many`` (one transaction,
+``executemany``) versus one ``insert`` call per row. Run with
+``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.storage import StorageBackend, StorageConfig
+from taskmover.core.storage.backends import SQLiteBackend
+
+
+BULK_ROWS = 20000
+SINGLE_ROWS = 500
+
+SCHEMA = {
+    'id': {'type': 'INTEGER', 'primary_key': True},
+    'path': {'type': 'TEXT'},
+    'size': {'type': 'INTEGER'},
+}
+
+
+def _backend(path: Path) -> SQLiteBackend:
+    backend = SQLiteBackend()
+    backend.connect(StorageConfig(backend=StorageBackend.SQLITE, connection_string=str(path)))
+    backend.create_table("files", SCHEMA)
+    return backend
+
+
+@pytest.mark.performance
+def test_insert_many_outpaces_row_inserts(report):
+    """Compare bulk and per-row insert throughput."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        single = _backend(Path(temp_dir) / "single.db")
+        start = time.perf_counter()
+        for i in range(SINGLE_ROWS):
+            single.insert("files", {'id': i, 'path': f"/data/file{i}.txt", 'size': i})
+        single_rate = SINGLE_ROWS / (time.perf_counter() - start)
+        single.disconnect()
+
+        bulk = _backend(Path(temp_dir) / "bulk.db")
+        rows = ({'id': i, 'path': f"/data/file{i}.txt", 'size': i} for i in range(BULK_ROWS))
+        start = time.perf_counter()
+        inserted = bulk.insert_many("files", rows)
+        bulk_seconds = time.perf_counter() - start
+        bulk_rate = BULK_ROWS / bulk_seconds
+        count = bulk.execute_sql("SELECT COUNT(*) AS n FROM files")[0]['n']
+        bulk.disconnect()
+
+    report(f"per-row insert: {single_rate:,.0f} rows/s, insert_many: {bulk_rate:,.0f} rows/s "
+          f"({BULK_ROWS:,} rows in {bulk_seconds:.2f} s)")
+
+    assert inserted == count == BULK_ROWS
@@ -0,0 +1,95 @@
+"""
+Startup Snapshot Benchmark
+==========================
+
+Time to open pattern and rule repositories from YAML with the pure-Python
+loader, from YAML with the libyaml loader, and from the startup snapshot.
+Run with ``pytest -m performance tests/performance`` to see the timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import yaml
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.models import Pattern
+from taskmover.core.patterns.storage import PatternRepository
+from taskmover.core.rules.models import Rule
+from taskmover.core.rules.storage import RuleRepository
+from taskmover.core.storage.snapshot import dump_yaml
+
+
+PATTERNS = 600
+RULES = 400
+
+
+def _elapsed_ms(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+@pytest.mark.performance
+def test_pattern_repository_startup(report):
+    """Compare pattern repository startup from YAML and from the snapshot."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = Path(temp_dir)
+        writer = PatternRepository(storage, use_snapshot=False)
+        records = [
+            writer._pattern_to_dict(Pattern(name=f"Pattern {i}", user_expression=f"*.ext{i}",
+                                            tags=["bench", f"tag{i % 50}"]))
+            for i in range(PATTERNS)
+        ]
+        with open(storage / "patterns.yaml", "w", encoding="utf-8") as f:
+            dump_yaml(records, f, default_flow_style=False, allow_unicode=True)
+
+        def pure_python_load():
+            with open(storage / "patterns.yaml", "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+            return [writer._dict_to_pattern(item) for item in data]
+
+        python_ms, patterns = _elapsed_ms(pure_python_load)
+        cold_ms, cold = _elapsed_ms(lambda: PatternRepository(storage))
+        warm_ms, warm = _elapsed_ms(lambda: PatternRepository(storage))
+
+    report(f"patterns: safe_load {python_ms:.1f} ms, libyaml + snapshot write {cold_ms:.1f} ms, "
+          f"snapshot {warm_ms:.1f} ms")
+
+    assert len(patterns) == len(cold._patterns_cache) == len(warm._patterns_cache) == PATTERNS
+
+
+@pytest.mark.performance
+def test_rule_repository_startup(report):
+    """Compare rule repository startup from YAML and from the snapshot."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = Path(temp_dir)
+        writer = RuleRepository(storage, flush_delay=60.0, use_snapshot=False)
+        for i in range(RULES):
+            writer._rules_cache[uuid4()] = Rule(name=f"Rule {i}", pattern_id=uuid4(),
+                                               destination_path=storage / f"dest{i % 20}")
+        writer._cache_dirty = True
+        writer.close()
+
+        def pure_python_load():
+            with open(storage / "rules.yaml", "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+            return [writer._deserialize_rule(item) for item in data['rules']]
+
+        python_ms, rules = _elapsed_ms(pure_python_load)
+        cold_ms, cold = _elapsed_ms(lambda: RuleRepository(storage, flush_delay=60.0))
+        warm_ms, warm = _elapsed_ms(lambda: RuleRepository(storage, flush_delay=60.0))
+        cold.close()
+        warm.close()
+
+    report(f"rules: safe_load {python_ms:.1f} ms, libyaml + snapshot write {cold_ms:.1f} ms, "
+          f"snapshot {warm_ms:.1f} ms")
+
+    assert len(rules) == len(cold.list_rules()) == len(warm.list_rules()) == RULES
@@ -0,0 +1,63 @@
+"""
+Workspace Analysis Benchmark
+============================
+
+Time for a cold workspace analysis, a cached one, an incremental refresh
+after a change and a budgeted (sampled) analysis, plus the latency of
+pattern suggestions. Run with ``pytest -m performance tests/performance`` to see the
+timings.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.suggestions import PatternSuggestionEngine, WorkspaceAnalyzer
+
+
+FILES = 5000
+
+
+def _elapsed_ms(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+@pytest.mark.performance
+def test_workspace_analysis_reuse(report):
+    """Compare cold, cached, incremental and sampled analysis."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for i in range(FILES):
+            folder = root / f"project{i % 20}" / f"dir{i % 300}"
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"file{i}.{'pdf' if i % 10 == 0 else 'txt'}").touch()
+
+        analyzer = WorkspaceAnalyzer(cache_ttl=60)
+        cold_ms, cold = _elapsed_ms(lambda: analyzer.analyze(root))
+        cached_ms, _ = _elapsed_ms(lambda: analyzer.analyze(root))
+
+        analyzer.cache_ttl = 0
+        (root / "project1" / "dir1" / "new.pdf").touch()
+        refresh_ms, refreshed = _elapsed_ms(lambda: analyzer.analyze(root))
+
+        sampled_ms, sampled = _elapsed_ms(
+            lambda: WorkspaceAnalyzer().analyze(root, file_budget=1000, time_budget=0.1))
+        suggest_ms, suggestions = _elapsed_ms(lambda: PatternSuggestionEngine().suggest_patterns(root))
+
+    report(f"cold {cold_ms:.1f} ms, cached {cached_ms:.2f} ms, incremental {refresh_ms:.1f} ms, "
+          f"sampled {sampled_ms:.1f} ms (~{sampled['total_files']} ± {sampled['total_files_margin']} "
+          f"files from {sampled['probes']} probes), suggestions {suggest_ms:.1f} ms")
+
+    assert cold['total_files'] == FILES
+    assert refreshed['total_files'] == FILES + 1
+    assert sampled['sampled']
+    assert suggestions
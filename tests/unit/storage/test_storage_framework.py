@@ -24,6 +24,7 @@ from taskmover.core.storage import (
     MigrationManager, CreateTableMigration,
     LRUCache, MultiLevelCacheManager,
 )
+from taskmover.core.storage.snapshot import StartupSnapshot
 from taskmover.core.exceptions import StorageException
 
 
@@ -313,6 +314,202 @@ def test_migration_manager():
     assert "001" in migration_manager.get_applied_migrations()
 
 
+def test_sqlite_backend_bulk_operations():
+    """Test bulk insert, upsert and delete run in single transactions."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = SQLiteBackend()
+        backend.connect(StorageConfig(
+            backend=StorageBackend.SQLITE,
+            connection_string=str(Path(temp_dir) / "bulk.db")
+        ))
+        backend.create_table("items", {
+            'id': {'type': 'TEXT', 'primary_key': True},
+            'name': {'type': 'TEXT'},
+            'size': {'type': 'INTEGER'}
+        })
+        
+        rows = ({'id': f"item{i}", 'name': f"Item {i}", 'size': i} for i in range(1000))
+        assert backend.insert_many("items", rows) == 1000
+        assert backend.execute_sql("PRAGMA journal_mode")[0]['journal_mode'] == 'wal'
+        
+        upserted = backend.upsert_many("items", [
+            {'id': "item1", 'name': "Renamed", 'size': 1},
+            {'id': "new", 'name': "New", 'size': 0},
+        ])
+        assert upserted == 2
+        assert backend.select("items", filters={'id': "item1"})[0]['name'] == "Renamed"
+        assert backend.delete_many("items", ["item2", "item3", "missing"]) == 2
+        assert len(backend.select("items")) == 999
+        
+        # A failing row rolls back the whole batch
+        try:
+            backend.insert_many("items", [{'id': "x1", 'name': "a", 'size': 1},
+                                          {'id': "item4", 'name': "dup", 'size': 1}])
+            assert False, "duplicate key should fail"
+        except Exception:
+            pass
+        assert backend.select("items", filters={'id': "x1"}) == []
+        
+        backend.disconnect()
+
+
+def test_sqlite_backend_connection_pool():
+    """Test threads share a bounded pool and nested calls reuse a connection."""
+    import threading
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = SQLiteBackend()
+        backend.connect(StorageConfig(
+            backend=StorageBackend.SQLITE,
+            connection_string=str(Path(temp_dir) / "pool.db"),
+            pool_size=2
+        ))
+        backend.create_table("counters", {
+            'id': {'type': 'INTEGER', 'primary_key': True},
+            'value': {'type': 'INTEGER'}
+        })
+        
+        def worker(offset):
+            for i in range(50):
+                backend.insert("counters", {'id': offset * 100 + i, 'value': i})
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(backend.select("counters")) == 300
+        assert backend.get_pool_stats()['open_connections'] <= 2
+        
+        # Statements inside a transaction see its uncommitted writes
+        with backend.transaction() as cursor:
+            cursor.execute("DELETE FROM counters")
+            assert backend.select("counters") == []
+        
+        backend.disconnect()
+
+
+def test_startup_snapshot():
+    """Test snapshots are reused until a source file changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "data.yaml"
+        source.write_text("- a\n- b\n")
+        snapshot = StartupSnapshot(Path(temp_dir) / "data.snapshot", [source])
+        
+        assert snapshot.load() is None
+        assert snapshot.save({'items': ['a', 'b']}) is True
+        assert snapshot.load() == {'items': ['a', 'b']}
+        
+        # Touching the file without changing it keeps the snapshot
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert snapshot.load() == {'items': ['a', 'b']}
+        
+        # Same size, different content
+        source.write_text("- a\n- c\n")
+        assert snapshot.load() is None
+        
+        # Corrupt and unsupported payloads are rejected
+        snapshot.snapshot_file.write_bytes(b"garbage")
+        assert snapshot.load() is None
+        assert snapshot.save({'when': datetime.now()}) is False
+        
+        snapshot.invalidate()
+        assert not snapshot.snapshot_file.exists()
+
+
+def _populate_indexed(backend):
+    backend.create_table("items", {})
+    for i in range(20):
+        backend.insert("items", {'id': f"item{i}", 'size': i, 'kind': "even" if i % 2 == 0 else "odd"})
+    backend.create_index("items", "size")
+    backend.create_index("items", "kind")
+
+
+def _check_indexed_queries(backend):
+    assert [r['id'] for r in backend.select("items", filters={'id': 'item3'})] == ['item3']
+    assert backend.select("items", filters={'id': 'missing'}) == []
+    
+    found = backend.select("items", filters={'size': {'$gte': 5, '$lt': 9}}, order_by=['size'])
+    assert [r['size'] for r in found] == [5, 6, 7, 8]
+    
+    found = backend.select("items", filters={'kind': {'$in': ['odd']}, 'size': {'$lt': 6}}, order_by=['size'])
+    assert [r['size'] for r in found] == [1, 3, 5]
+    
+    # Index kept current by writes
+    backend.update("items", 'item4', {'size': 100})
+    backend.delete("items", 'item5')
+    found = backend.select("items", filters={'size': {'$gte': 4, '$lte': 6}}, order_by=['size'])
+    assert [r['id'] for r in found] == ['item6']
+    assert [r['id'] for r in backend.select("items", filters={'size': 100})] == ['item4']
+
+
+def test_memory_backend_upsert_by_key():
+    """Test upserts matched on a field other than the primary key."""
+    backend = MemoryBackend()
+    backend.connect(StorageConfig(backend=StorageBackend.MEMORY, connection_string=""))
+    backend.create_table("items", {})
+    
+    backend.insert_many("items", [{'id': 'a', 'name': 'alpha', 'size': 1},
+                                  {'id': 'b', 'name': 'beta', 'size': 2}])
+    count = backend.upsert_many("items", [{'id': 'x', 'name': 'alpha', 'size': 10},
+                                          {'id': 'c', 'name': 'gamma', 'size': 3}], key="name")
+    assert count == 2
+    
+    rows = {row['name']: row for row in backend.select("items")}
+    assert len(rows) == 3
+    assert rows['alpha']['id'] == 'a'
+    assert rows['alpha']['size'] == 10
+    assert rows['gamma']['id'] == 'c'
+    
+    backend.disconnect()
+
+
+def test_memory_backend_indexes():
+    """Test primary-key lookups and secondary indexes in the memory backend."""
+    backend = MemoryBackend()
+    backend.connect(StorageConfig(backend=StorageBackend.MEMORY, connection_string=""))
+    
+    _populate_indexed(backend)
+    _check_indexed_queries(backend)
+    
+    # Operator filters also work on unindexed fields
+    assert len(backend.select("items", filters={'kind': {'$ne': 'odd'}})) == 10
+    
+    backend.disconnect()
+
+
+def test_file_system_backend_indexes():
+    """Test index sidecars are used, kept current and rebuilt when stale."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = StorageConfig(backend=StorageBackend.FILE_SYSTEM, connection_string=temp_dir)
+        backend = FileSystemBackend()
+        backend.connect(config)
+        
+        _populate_indexed(backend)
+        assert (Path(temp_dir) / "items" / "_indexes" / "size.json").exists()
+        _check_indexed_queries(backend)
+        backend.disconnect()
+        
+        # Sidecars flushed on disconnect are reused by a new backend
+        backend = FileSystemBackend()
+        backend.connect(config)
+        assert [r['id'] for r in backend.select("items", filters={'size': 100})] == ['item4']
+        backend.disconnect()
+        
+        # A file written behind the backend's back makes the sidecars stale
+        (Path(temp_dir) / "items" / "extra.json").write_text('{"id": "extra", "size": 100}')
+        backend = FileSystemBackend()
+        backend.connect(config)
+        found = backend.select("items", filters={'size': 100})
+        assert sorted(r['id'] for r in found) == ['extra', 'item4']
+        
+        # Ids that cannot name an entity file never match
+        assert backend.select("items", filters={'id': '../items/item1'}) == []
+        backend.disconnect()
+
+
 if __name__ == "__main__":
     # Run tests manually if not using pytest
     print("Running storage framework tests...")
@@ -339,6 +536,21 @@ if __name__ == "__main__":
         test_migration_manager()
         print("✅ Migration manager test passed")
         
+        test_sqlite_backend_bulk_operations()
+        print("✅ SQLite bulk operations test passed")
+        
+        test_sqlite_backend_connection_pool()
+        print("✅ SQLite connection pool test passed")
+        
+        test_startup_snapshot()
+        print("✅ Startup snapshot test passed")
+        
+        test_memory_backend_indexes()
+        print("✅ Memory backend index test passed")
+        
+        test_file_system_backend_indexes()
+        print("✅ File system backend index test passed")
+        
         print("\n🎉 All storage framework tests passed!")
         
     except Exception as e:
@@ -0,0 +1,157 @@
+"""
+Test cases for Data Display Components
+======================================
+
+Tests for the virtualized table and its data source and view model.
+"""
+
+import threading
+import time
+import tkinter as tk
+import unittest
+import sys
+from pathlib import Path
+
+# Skip this entire module when tkinter is not a real installation
+if getattr(tk, '_IS_MOCK', False):
+    import pytest
+    pytest.skip('Tkinter not available', allow_module_level=True)
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.ui.data_display_components import (
+    ListDataSource, QueryCancelled, TableView, VirtualTable
+)
+
+
+def _source(count):
+    items = [{'name': f"file{i:05d}", 'size': (i * 7919) % 1000} for i in range(count)]
+    return ListDataSource(items, columns=("name", "size"),
+                          formatter=lambda item: (item['name'], item['size']),
+                          row_id=lambda item: item['name'])
+
+
+class TestTableView(unittest.TestCase):
+    """Test the view model behind VirtualTable."""
+
+    def test_unfiltered_view_uses_source_order(self):
+        """Test an unsorted view needs no index list."""
+        view = TableView.query(_source(100))
+        self.assertIsInstance(view.order, range)
+        self.assertEqual(view.rows(98, 105), [(98, "file00098", ("file00098", 98 * 7919 % 1000)),
+                                              (99, "file00099", ("file00099", 99 * 7919 % 1000))])
+
+    def test_filter_and_sort(self):
+        """Test filtering and sorting by a column."""
+        source = _source(1000)
+        view = TableView.query(source, predicate=lambda item: item['size'] < 100,
+                               sort_column="size", reverse=True)
+        sizes = [values[1] for _, _, values in view.rows(0, len(view))]
+
+        self.assertEqual(len(view), sum(1 for item in source.items if item['size'] < 100))
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertEqual(view.position(view.source_index(5)), 5)
+        self.assertIsNone(view.position(next(i for i, item in enumerate(source.items)
+                                             if item['size'] >= 100)))
+
+    def test_rows_formatted_on_demand(self):
+        """Test only the requested window is formatted."""
+        formatted = []
+        source = ListDataSource(list(range(100000)), columns=("value",),
+                                formatter=lambda item: formatted.append(item) or (item,))
+        TableView.query(source).rows(500, 530)
+        self.assertEqual(formatted, list(range(500, 530)))
+
+    def test_mixed_types_sort_as_text(self):
+        """Test columns with incomparable values still sort."""
+        source = ListDataSource([3, "b", None, 1], columns=("value",), formatter=lambda item: (item,))
+        view = TableView.query(source, sort_column="value")
+        self.assertEqual([source.items[i] for i in view.order], [1, 3, "b", None])
+
+    def test_query_cancellation(self):
+        """Test a superseded query stops early."""
+        with self.assertRaises(QueryCancelled):
+            TableView.query(_source(10000), predicate=lambda item: True, cancelled=lambda: True)
+
+
+class TestVirtualTable(unittest.TestCase):
+    """Test VirtualTable widget behaviour."""
+
+    def setUp(self):
+        """Set up test environment."""
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()  # Hide window during tests
+        except Exception:
+            self.skipTest("Tkinter display not available")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        try:
+            if hasattr(self, 'root') and self.root:
+                self.root.destroy()
+        except Exception:
+            pass
+
+    def test_only_visible_rows_materialized(self):
+        """Test a large source creates one Treeview item per visible row."""
+        table = VirtualTable(self.root, columns=[("name", "Name", 100, 50), ("size", "Size", 60, 40)],
+                             height=10)
+        table.set_source(_source(200000))
+
+        self.assertEqual(table.row_count(), 200000)
+        self.assertLessEqual(len(table.tree.get_children()), 10)
+
+        table.scroll_to(150000)
+        names = [table.tree.item(iid, "values")[0] for iid in table.tree.get_children()]
+        self.assertIn("file150000", names)
+
+    def test_background_sort_applied(self):
+        """Test sorting a large source completes off the Tk thread."""
+        table = VirtualTable(self.root, columns=[("name", "Name", 100, 50), ("size", "Size", 60, 40)],
+                             height=10)
+        table.set_source(_source(20000))
+        changed = threading.Event()
+        table.add_callback('view_changed', lambda count: changed.set())
+
+        table.sort_by("size", reverse=True)
+        deadline = time.monotonic() + 5
+        while not changed.is_set() and time.monotonic() < deadline:
+            self.root.update()
+
+        self.assertTrue(changed.is_set())
+        first = table.tree.get_children()[0]
+        self.assertEqual(int(table.tree.item(first, "values")[1]), 999)
+
+    def test_polling_stops_when_query_superseded_or_failed(self):
+        """Test no poll stays scheduled after a sync query or a failed background query."""
+        table = VirtualTable(self.root, columns=[("name", "Name", 100, 50), ("size", "Size", 60, 40)],
+                             height=10)
+        table.set_source(_source(20000))
+        table.sort_by("size")
+        self.assertIsNotNone(table._poll_id)
+
+        # A synchronous query supersedes the background one
+        table.set_source(_source(100))
+        deadline = time.monotonic() + 5
+        while table._poll_id is not None and time.monotonic() < deadline:
+            self.root.update()
+        self.assertIsNone(table._poll_id)
+        self.assertEqual(table.row_count(), 100)
+
+        failures = []
+        table.add_callback('query_failed', failures.append)
+        table.set_source(_source(20000))
+        table.set_filter(lambda item: 1 / 0)
+        deadline = time.monotonic() + 5
+        while table._poll_id is not None and time.monotonic() < deadline:
+            self.root.update()
+        self.assertIsNone(table._poll_id)
+        self.assertEqual(len(failures), 1)
+        self.assertIsInstance(failures[0], ZeroDivisionError)
+
+
+if __name__ == '__main__':
+    unittest.main()
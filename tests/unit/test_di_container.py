@@ -87,6 +87,16 @@ class TestServiceContainer:
 
         assert instance1 is instance2
 
+    def test_has_instance(self, container):
+        """Test singletons are reported only once created"""
+        container.register(
+            ITestRepository, TestRepository, lifetime=ServiceLifetime.SINGLETON
+        )
+
+        assert not container.has_instance(ITestRepository)
+        container.resolve(ITestRepository)
+        assert container.has_instance(ITestRepository)
+
     def test_transient_lifetime(self, container):
         """Test transient services return different instances"""
         container.register(
@@ -299,3 +309,38 @@ class TestGlobalContainer:
         container2 = get_container()
 
         assert container1 is not container2
+
+
+class TestApplicationServices:
+    """Test the application's lazily built backend services"""
+
+    def test_failing_service_does_not_disable_others(self):
+        """Test a service that fails to build is not retried and leaves others available"""
+        from taskmover.ui.main_application import TaskMoverApplication
+
+        class PatternSystem:
+            pass
+
+        class RuleService:
+            pass
+
+        attempts = []
+
+        def broken():
+            attempts.append("pattern")
+            raise RuntimeError("pattern storage unavailable")
+
+        container = ServiceContainer()
+        container.register(PatternSystem, factory=broken, lifetime=ServiceLifetime.SINGLETON)
+        container.register(RuleService, factory=RuleService, lifetime=ServiceLifetime.SINGLETON)
+
+        app = TaskMoverApplication()
+        app.services = container
+        app._service_types = {'pattern': PatternSystem, 'rule': RuleService}
+
+        assert app.pattern_service is None
+        assert app.pattern_service is None
+        assert attempts == ["pattern"]
+        assert isinstance(app._service_errors['pattern'], RuntimeError)
+        assert isinstance(app.rule_service, RuleService)
+        assert app.services is container
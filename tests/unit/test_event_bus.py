@@ -0,0 +1,170 @@
+"""
+Test cases for the UI Event Bus
+===============================
+
+Tests for handing events from worker threads to the Tk thread.
+"""
+
+import threading
+import tkinter as tk
+import unittest
+import sys
+from pathlib import Path
+
+# Skip this entire module when tkinter is not a real installation
+if getattr(tk, '_IS_MOCK', False):
+    import pytest
+    pytest.skip('Tkinter not available', allow_module_level=True)
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.file_operations import OperationProgress
+from taskmover.ui.event_bus import UIEventBus, get_event_bus
+from taskmover.ui.execution_components import ExecutionView, progress_percentage
+
+
+class TestUIEventBus(unittest.TestCase):
+    """Test event delivery without a Tk root; pump is called directly."""
+
+    def setUp(self):
+        self.bus = UIEventBus()
+        self.received = []
+
+    def test_events_delivered_in_order_on_pump(self):
+        """Test nothing is delivered until the pump runs."""
+        self.bus.subscribe("status", lambda payload: self.received.append(("status", payload)))
+        self.bus.post("status", 1)
+        self.bus.call(self.received.append, "call")
+        self.bus.post("status", 2)
+        self.bus.post("unsubscribed", 3)
+
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.bus.pump(), 4)
+        self.assertEqual(self.received, [("status", 1), "call", ("status", 2)])
+        self.assertEqual(self.bus.pump(), 0)
+
+    def test_progress_coalesced_per_key(self):
+        """Test only the latest progress per key is rendered, in first-post position."""
+        self.bus.subscribe("progress", self.received.append)
+        self.bus.subscribe("done", lambda payload: self.received.append("done"))
+
+        for i in range(1000):
+            self.bus.post("progress", ("a", i), key="a")
+            self.bus.post("progress", ("b", i), key="b")
+        self.bus.post("done")
+
+        self.assertEqual(self.bus.pump(), 3)
+        self.assertEqual(self.received, [("a", 999), ("b", 999), "done"])
+
+        # A new frame starts a new coalescing window
+        self.bus.post("progress", ("a", 1000), key="a")
+        self.bus.pump()
+        self.assertEqual(self.received[-1], ("a", 1000))
+
+    def test_handler_errors_and_unsubscribe(self):
+        """Test a failing handler does not stop delivery to others."""
+        def failing(payload):
+            raise RuntimeError("boom")
+
+        unsubscribe = self.bus.subscribe("event", failing)
+        self.bus.subscribe("event", self.received.append)
+        self.bus.post("event", 1)
+        self.bus.pump()
+        self.assertEqual(self.received, [1])
+
+        unsubscribe()
+        self.bus.post("event", 2)
+        self.bus.pump()
+        self.assertEqual(self.received, [1, 2])
+
+        self.bus.close()
+        self.bus.post("event", 3)
+        self.assertEqual(self.bus.pump(), 0)
+
+    def test_posts_from_worker_threads(self):
+        """Test concurrent posts are all delivered and coalesced correctly."""
+        self.bus.subscribe("log", self.received.append)
+        latest = {}
+        self.bus.subscribe("progress", lambda payload: latest.__setitem__(*payload))
+
+        def worker(name):
+            for i in range(2000):
+                self.bus.post("log", name)
+                self.bus.post("progress", (name, i), key=name)
+
+        threads = [threading.Thread(target=worker, args=(f"w{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            self.bus.pump()
+        for thread in threads:
+            thread.join()
+        self.bus.pump()
+
+        self.assertEqual(len(self.received), 8000)
+        self.assertEqual(latest, {f"w{n}": 1999 for n in range(4)})
+
+    def test_progress_percentage(self):
+        """Test overall progress counts the current file's bytes."""
+        progress = OperationProgress(operation_id="run", total_bytes=200, processed_bytes=100,
+                                     current_file=Path("a.txt"), files_processed=1, total_files=4,
+                                     speed_bytes_per_second=0.0, estimated_time_remaining=0.0)
+        self.assertAlmostEqual(progress_percentage(progress), 37.5)
+    
+    def test_placeholder_preview_is_never_executed(self):
+        """Test only real previewed operations reach the file operation manager."""
+        from types import SimpleNamespace
+        real = {"source": "/data/a.txt", "target": "/sorted/a.txt", "action": "move"}
+        view = SimpleNamespace(file_preview=SimpleNamespace(get_preview_data=lambda: preview))
+        
+        preview = ExecutionView._generate_preview_data(view)
+        self.assertEqual(ExecutionView._executable_operations(view), [])
+        preview = preview + [real]
+        self.assertEqual(ExecutionView._executable_operations(view), [real])
+        
+        # Nothing is started without executable operations
+        preview = []
+        view.execution_controls = None
+        view._executable_operations = lambda: ExecutionView._executable_operations(view)
+        ExecutionView._start_execution(view)
+        self.assertFalse(hasattr(view, "current_operation"))
+
+
+class TestEventBusPump(unittest.TestCase):
+    """Test the after() pump of a Tk root."""
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()
+        except tk.TclError:
+            self.skipTest("No display available")
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_worker_events_reach_tk_thread(self):
+        """Test events posted by a worker are delivered on the Tk thread."""
+        bus = get_event_bus(self.root)
+        self.assertIs(get_event_bus(self.root), bus)
+        threads = []
+        bus.subscribe("progress", lambda payload: threads.append(threading.current_thread()))
+
+        worker = threading.Thread(target=lambda: [bus.post("progress", i, key="run") for i in range(500)])
+        worker.start()
+        worker.join()
+        bus.post("progress", "last", key="run")
+
+        deadline = self.root.after(1000, self.root.quit)
+        bus.call(self.root.quit)
+        self.root.mainloop()
+        self.root.after_cancel(deadline)
+
+        self.assertEqual(threads, [threading.main_thread()])
+        bus.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Test cases for Input Components
+===============================
+
+Tests for the smart pattern input and its match estimator.
+"""
+
+import tkinter as tk
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Skip this entire module when tkinter is not a real installation
+if getattr(tk, '_IS_MOCK', False):
+    import pytest
+    pytest.skip('Tkinter not available', allow_module_level=True)
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.ui.input_components import SmartPatternInput
+
+
+class TestSmartPatternInputEstimator(unittest.TestCase):
+    """Test which match estimators the pattern input closes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()  # Hide window during tests
+        except Exception:
+            self.skipTest("Tkinter display not available")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        try:
+            if hasattr(self, 'root') and self.root:
+                self.root.destroy()
+        except Exception:
+            pass
+
+    def test_shared_estimator_left_open(self):
+        """Test an estimator passed in by the caller is not closed with the widget."""
+        estimator = Mock()
+        first = SmartPatternInput(self.root, estimator=estimator)
+        second = SmartPatternInput(self.root, estimator=estimator)
+        first.set_workspace(Path.cwd())
+
+        first.destroy()
+        estimator.close.assert_not_called()
+        self.assertIs(second._estimator, estimator)
+        second.destroy()
+        estimator.close.assert_not_called()
+
+    def test_own_estimator_closed(self):
+        """Test an estimator created by the widget is closed with it."""
+        created = Mock()
+        with patch("taskmover.core.patterns.matching.estimation.MatchEstimator", return_value=created):
+            widget = SmartPatternInput(self.root)
+            widget.set_workspace(Path.cwd())
+
+        widget.destroy()
+        created.close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
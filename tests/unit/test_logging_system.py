@@ -7,6 +7,7 @@ Tests all components: interfaces, manager, formatters, handlers, config, utils,
 import json
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -38,6 +39,10 @@ from taskmover.core.logging.handlers import (
 )
 from taskmover.core.logging.interfaces import LogContext, LogLevel, LogRecord
 from taskmover.core.logging.manager import ComponentLogger, LoggerManager, get_logger
+from taskmover.core.logging.metrics import MetricsRegistry
+from taskmover.core.logging.dispatch import BackpressurePolicy, LogDispatcher
+from taskmover.core.logging.log_store import IndexedLogHandler, LogStore
+from taskmover.core.logging.tracing import Tracer
 from taskmover.core.logging.utils import (
     LoggingContext,
     PerformanceTimer,
@@ -210,6 +215,23 @@ class TestComponentLogger:
         # Should only have 2 calls (warning and error)
         assert self.manager._handle_record.call_count == 2
 
+    def test_lazy_message_built_only_when_enabled(self):
+        """Test callable messages are not evaluated below the threshold"""
+        self.manager._get_component_level.return_value = LogLevel.INFO
+        built = []
+
+        def message():
+            built.append(True)
+            return "Expensive message"
+
+        self.logger.debug(message)
+        assert built == []
+
+        self.logger.info(message)
+        record = self.manager._handle_record.call_args[0][0]
+        assert record.message == "Expensive message"
+        assert built == [True]
+
 
 class TestLoggerManager:
     """Test LoggerManager singleton and functionality"""
@@ -413,6 +435,53 @@ class TestHandlers:
 
             handler.close()
 
+    def test_buffered_file_handler_flush_triggers(self):
+        """Test buffered lines reach disk on size, level and close"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "buffered.log"
+            handler = RotatingFileHandler(
+                filename=str(log_file), buffer_size=4096, flush_interval=60.0
+            )
+
+            handler.handle(self.record)
+            assert log_file.read_bytes() == b""
+
+            error_record = LogRecord(
+                timestamp=datetime.now(),
+                level=LogLevel.ERROR,
+                component="test",
+                message="Error message",
+            )
+            handler.handle(error_record)
+            content = log_file.read_text()
+            assert "Test message" in content
+            assert "Error message" in content
+            assert handler._current_size == log_file.stat().st_size
+
+            handler.handle(self.record)
+            handler.close()
+            assert log_file.read_text().count("Test message") == 2
+
+    def test_rotation_compresses_in_background(self):
+        """Test rotated files end up gzipped without losing lines"""
+        import gzip
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "rotate.log"
+            handler = RotatingFileHandler(
+                filename=str(log_file), max_size=512, backup_count=3, buffer_size=256
+            )
+
+            for _ in range(20):
+                handler.handle(self.record)
+            handler.close()
+
+            backup = Path(temp_dir) / "rotate.log.1.gz"
+            assert backup.exists()
+            assert not (Path(temp_dir) / "rotate.log.1").exists()
+            with gzip.open(backup, "rt", encoding="utf-8") as f:
+                assert "Test message" in f.read()
+
     def test_multi_handler(self):
         """Test multi-handler forwarding"""
         handler1 = Mock()
@@ -572,6 +641,319 @@ class TestUtils:
         assert limiter.should_log("other_key") is True
 
 
+class TestMetrics:
+    """Test hot-path metrics registry"""
+
+    def test_counter_and_histogram(self):
+        """Test counters accumulate and histograms summarise"""
+        registry = MetricsRegistry()
+        registry.counter("files").inc()
+        registry.counter("files").inc(4)
+        for value in (1.0, 2.0, 3.0, 400.0):
+            registry.histogram("latency").observe(value)
+
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["files"] == 5
+        summary = snapshot["histograms"]["latency"]
+        assert summary["count"] == 4
+        assert summary["min"] == 1.0
+        assert summary["max"] == 400.0
+        assert summary["p50"] <= 2.5
+        assert summary["p99"] == 400.0
+
+    def test_span_records_and_samples(self):
+        """Test spans always record but only sampled spans are logged"""
+        registry = MetricsRegistry(sample_every=10)
+        logger = Mock()
+        logger.is_enabled_for.return_value = True
+
+        for _ in range(25):
+            with registry.span("match", logger=logger, files=3):
+                pass
+
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["match.calls"] == 25
+        assert snapshot["histograms"]["match.duration_ms"]["count"] == 25
+        assert logger.log.call_count == 3
+
+        message = logger.log.call_args[0][1]
+        assert callable(message)
+        assert "files=3" in message()
+
+    def test_span_counts_errors(self):
+        """Test failing spans increment the error counter"""
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            with registry.span("parse"):
+                raise ValueError("bad")
+
+        assert registry.snapshot()["counters"]["parse.errors"] == 1
+
+    def test_disabled_logger_skips_formatting(self):
+        """Test nothing is logged when the level is disabled"""
+        registry = MetricsRegistry(sample_every=1)
+        logger = Mock()
+        logger.is_enabled_for.return_value = False
+
+        registry.emit(logger, LogLevel.DEBUG, "op", 1.0, {"a": 1})
+        logger.log.assert_not_called()
+
+
+class TestLogDispatcher:
+    """Test the background log dispatch pipeline"""
+
+    def _record(self, level=LogLevel.INFO, message="queued"):
+        return LogRecord(
+            timestamp=datetime.now(), level=level, component="test", message=message
+        )
+
+    def test_records_delivered_in_order_in_batches(self):
+        """Test records reach batch-capable handlers in publish order"""
+        handler = Mock()
+        dispatcher = LogDispatcher(lambda: (handler,), batch_size=16)
+        try:
+            for i in range(100):
+                dispatcher.publish(self._record(message=str(i)))
+            assert dispatcher.flush()
+        finally:
+            dispatcher.close()
+
+        delivered = [
+            record.message
+            for call in handler.handle_batch.call_args_list
+            for record in call[0][0]
+        ]
+        assert delivered == [str(i) for i in range(100)]
+        assert all(len(call[0][0]) <= 16 for call in handler.handle_batch.call_args_list)
+
+    def test_drop_debug_policy_keeps_warnings(self):
+        """Test a full queue drops DEBUG records but not warnings"""
+        release = threading.Event()
+        delivered = []
+
+        class SlowHandler:
+            def handle(self, record):
+                release.wait(5)
+                delivered.append(record)
+
+        dispatcher = LogDispatcher(
+            lambda: (SlowHandler(),),
+            queue_size=4,
+            policy=BackpressurePolicy.DROP_DEBUG,
+            batch_size=1,
+        )
+        try:
+            dispatcher.publish(self._record())
+            time.sleep(0.05)  # Dispatcher is now blocked in the handler
+            for _ in range(4):
+                dispatcher.publish(self._record(LogLevel.INFO))
+            for _ in range(10):
+                dispatcher.publish(self._record(LogLevel.DEBUG))
+            assert dispatcher.dropped == 10
+
+            release.set()
+            dispatcher.publish(self._record(LogLevel.WARNING, "kept"))
+            assert dispatcher.flush()
+        finally:
+            release.set()
+            dispatcher.close()
+
+        messages = [record.message for record in delivered]
+        assert "kept" in messages
+        assert any("Dropped 10 log records" in m for m in messages)
+
+    def test_manager_publishes_without_handler_io(self):
+        """Test logging returns before a slow handler finishes"""
+        manager = LoggerManager()
+        config = LoggingConfig(
+            level=LogLevel.DEBUG,
+            console=Mock(enabled=False),
+            file=Mock(enabled=False),
+        )
+        manager.configure(config)
+        release = threading.Event()
+        handler = Mock()
+        handler.handle_batch.side_effect = lambda records: release.wait(5)
+        manager.add_handler(handler)
+        try:
+            start = time.perf_counter()
+            manager.get_logger("dispatch.test").info("not blocked")
+            assert time.perf_counter() - start < 1.0
+            release.set()
+            manager.flush()
+            handler.handle_batch.assert_called()
+        finally:
+            release.set()
+            manager.remove_handler(handler)
+
+
+class TestTracer:
+    """Test span tracing and trace export"""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test spans are shared no-ops while tracing is off"""
+        tracer = Tracer()
+        with tracer.span("outer") as span:
+            span.set_attribute("files", 3)
+        assert tracer.span("a") is tracer.span("b")
+        assert tracer.events() == []
+
+    def test_nested_spans_record_depth(self):
+        """Test nested spans are recorded with their depth and attributes"""
+        tracer = Tracer(enabled=True)
+        with tracer.span("rule.execute", rule="docs") as span:
+            with tracer.span("rule.scan"):
+                pass
+            span.set_attribute("files", 2)
+
+        events = {event.name: event for event in tracer.events()}
+        assert events["rule.execute"].depth == 0
+        assert events["rule.scan"].depth == 1
+        assert events["rule.execute"].attributes == {"rule": "docs", "files": 2}
+        assert events["rule.execute"].start_ns <= events["rule.scan"].start_ns
+        assert events["rule.scan"].end_ns <= events["rule.execute"].end_ns
+
+    def test_ring_buffer_keeps_latest_spans(self):
+        """Test each thread buffer keeps only the most recent spans"""
+        tracer = Tracer(buffer_size=3, enabled=True)
+        for i in range(5):
+            with tracer.span(f"span.{i}"):
+                pass
+        assert [event.name for event in tracer.events()] == ["span.2", "span.3", "span.4"]
+
+    def test_chrome_trace_export(self):
+        """Test the Chrome trace document contains complete events"""
+        tracer = Tracer(enabled=True)
+        with tracer.span("patterns.match", pattern=Path("x")):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = tracer.export_chrome_trace(Path(temp_dir) / "trace.json")
+            document = json.loads(path.read_text())
+
+        complete = [e for e in document["traceEvents"] if e["ph"] == "X"]
+        assert len(complete) == 1
+        assert complete[0]["name"] == "patterns.match"
+        assert complete[0]["cat"] == "patterns"
+        assert complete[0]["dur"] >= 0
+        assert complete[0]["args"] == {"pattern": "x"}
+        assert any(e["ph"] == "M" for e in document["traceEvents"])
+
+    def test_speedscope_export_balances_events(self):
+        """Test speedscope events open and close in stack order"""
+        tracer = Tracer(enabled=True)
+        with tracer.span("outer"):
+            with tracer.span("inner"):
+                pass
+
+        document = tracer.to_speedscope()
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        events = document["profiles"][0]["events"]
+        sequence = [(event["type"], frames[event["frame"]]) for event in events]
+        assert sequence == [("O", "outer"), ("O", "inner"), ("C", "inner"), ("C", "outer")]
+
+    def test_exited_thread_buffers_are_released(self):
+        """Test buffers of finished threads fold into one bounded ring"""
+        import gc
+        tracer = Tracer(buffer_size=4, enabled=True)
+
+        def work(n):
+            for i in range(3):
+                with tracer.span(f"worker{n}.{i}"):
+                    pass
+
+        for n in range(20):
+            thread = threading.Thread(target=work, args=(n,), name=f"worker-{n}")
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert tracer._buffers == {}
+        names = [event.name for event in tracer.events()]
+        assert names == ["worker18.2", "worker19.0", "worker19.1", "worker19.2"]
+        thread_names = {e["args"]["name"] for e in tracer.to_chrome_trace()["traceEvents"] if e["ph"] == "M"}
+        assert "worker-19" in thread_names
+
+
+class TestLogStore:
+    """Test the indexed JSON-lines log store"""
+
+    def _record(self, message, level=LogLevel.INFO, component="rules.service",
+                operation_id=None, timestamp=None):
+        context = None
+        if operation_id:
+            context = LogContext(session_id="s", component=component, operation_id=operation_id)
+        return LogRecord(timestamp=timestamp or datetime.now(), level=level,
+                         component=component, message=message, context=context)
+
+    def test_query_by_operation_uses_index(self):
+        """Test an operation's lines are found across segments"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            handler = IndexedLogHandler(temp_dir, segment_size=2048, level=LogLevel.DEBUG)
+            for i in range(200):
+                handler.handle(self._record(f"line {i}", operation_id=f"op-{i % 10}"))
+            handler.close()
+
+            store = LogStore(temp_dir)
+            segments = store.segments()
+            assert len(segments) > 1
+            assert all(index.sealed for _, index in segments)
+
+            entries = store.operation("op-3")
+            assert [e["message"] for e in entries] == [f"line {i}" for i in range(3, 200, 10)]
+
+    def test_segments_pruned_by_index(self):
+        """Test time, level and component filters skip non-matching segments"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            handler = IndexedLogHandler(temp_dir, segment_size=512, level=LogLevel.DEBUG)
+            base = datetime(2025, 1, 1, 12, 0, 0).timestamp()
+            for i in range(60):
+                handler.handle(self._record(
+                    f"line {i}",
+                    level=LogLevel.ERROR if i == 42 else LogLevel.INFO,
+                    component="patterns.matcher" if i % 2 else "ui.main",
+                    timestamp=datetime.fromtimestamp(base + i * 60),
+                ))
+            handler.close()
+
+            store = LogStore(temp_dir)
+            errors = list(store.query(min_level=LogLevel.ERROR))
+            assert [e["message"] for e in errors] == ["line 42"]
+
+            window = list(store.query(start=base + 10 * 60, end=base + 12 * 60))
+            assert [e["message"] for e in window] == ["line 10", "line 11", "line 12"]
+
+            patterns = list(store.query(component="patterns", limit=3))
+            assert [e["message"] for e in patterns] == ["line 1", "line 3", "line 5"]
+
+    def test_unindexed_tail_is_scanned(self):
+        """Test lines written after the last sidecar are still returned"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            handler = IndexedLogHandler(temp_dir, buffer_size=0, level=LogLevel.DEBUG)
+            handler.handle(self._record("indexed", operation_id="op"))
+            handler.flush()
+            handler.handle(self._record("tail", operation_id="op"))
+
+            entries = LogStore(temp_dir).operation("op")
+            handler.close()
+
+        assert [e["message"] for e in entries] == ["indexed", "tail"]
+
+    def test_retention_limits_segments(self):
+        """Test the oldest segments are deleted beyond max_segments"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            handler = IndexedLogHandler(temp_dir, segment_size=256, max_segments=3,
+                                        level=LogLevel.DEBUG)
+            for i in range(100):
+                handler.handle(self._record(f"line {i}"))
+            handler.close()
+
+            store = LogStore(temp_dir)
+            assert len(store.segments()) == 3
+            assert list(Path(temp_dir).glob("*.jsonl"))[0].with_suffix(".idx").exists()
+            assert list(store.query())[-1]["message"] == "line 99"
+
+
 class TestExceptions:
     """Test logging exceptions"""
 
@@ -0,0 +1,446 @@
+"""
+Test cases for Pattern Cache Management
+=======================================
+
+Tests for cache sizing, eviction and the matcher's use of the cache.
+"""
+
+import unittest
+import unittest.mock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.patterns.models import Pattern, MatchResult, CompactMatchResult
+from taskmover.core.patterns.storage.cache_manager import MultiLevelCacheManager
+from taskmover.core.patterns.storage.sharded_cache import ShardedCacheManager
+from taskmover.core.patterns.storage.tinylfu_cache import WTinyLfuCacheManager
+from taskmover.core.storage.cache import FrequencySketch, LRUCache, PrefixIndex
+from taskmover.core.storage.cache import MultiLevelCacheManager as StorageCacheManager
+from taskmover.core.patterns.storage.sizing import CacheSizer, estimate_deep_size
+from taskmover.core.patterns.storage.cache_tags import directory_tag, rule_tag
+from taskmover.core.patterns.matching.unified_matcher import UnifiedPatternMatcher
+
+
+class TestCacheSizing(unittest.TestCase):
+    """Test deep and pluggable value sizing."""
+    
+    def test_deep_size_counts_referenced_paths(self):
+        """Test that nested Path objects contribute to the estimate."""
+        paths = [Path(f"/data/folder/file_{i:06d}.txt") for i in range(10000)]
+        shallow = sys.getsizeof(paths)
+        deep = estimate_deep_size(paths)
+        
+        # Each Path retains well over 100 bytes on its own
+        self.assertGreater(deep, shallow + 10000 * 100)
+    
+    def test_match_result_reports_deep_size(self):
+        """Test MatchResult implements the size protocol."""
+        paths = [Path(f"/data/file_{i}.txt") for i in range(5000)]
+        result = MatchResult(matched_files=paths, total_files_checked=5000)
+        
+        self.assertGreater(result.estimate_cache_size(), 5000 * 100)
+    
+    def test_registered_sizer_takes_precedence(self):
+        """Test custom sizers registered per type."""
+        class Blob:
+            pass
+        
+        sizer = CacheSizer()
+        sizer.register(Blob, lambda value: 12345)
+        
+        self.assertEqual(sizer.size_of(Blob()), 12345)
+
+
+class TestCompactMatchResult(unittest.TestCase):
+    """Test compact cache representation of match results."""
+    
+    def test_round_trip(self):
+        """Test compacting and expanding against the same input."""
+        files = [Path(f"file_{i}.txt") for i in range(10)]
+        result = MatchResult(matched_files=[files[1], files[4], files[9]],
+                             total_files_checked=len(files))
+        
+        compact = result.to_compact(files)
+        expanded = compact.expand(files)
+        
+        self.assertEqual(list(compact.matched_indices), [1, 4, 9])
+        self.assertEqual(expanded.matched_files, [files[1], files[4], files[9]])
+        self.assertTrue(expanded.cache_hit)
+    
+    def test_expand_rejects_mismatched_input(self):
+        """Test that a different input list is treated as a miss."""
+        files = [Path("a.txt"), Path("b.txt")]
+        compact = MatchResult(matched_files=[files[0]], total_files_checked=2).to_compact(files)
+        
+        self.assertIsNone(compact.expand(files[:1]))
+    
+    def test_compact_is_much_smaller(self):
+        """Test compact form size is a few bytes per match."""
+        files = [Path(f"/data/file_{i}.txt") for i in range(20000)]
+        result = MatchResult(matched_files=files, total_files_checked=len(files))
+        compact = result.to_compact(files)
+        
+        self.assertLess(compact.estimate_cache_size(), 20000 * 8)
+        self.assertGreater(result.estimate_cache_size(), compact.estimate_cache_size() * 10)
+
+
+class TestMemoryBoundedCache(unittest.TestCase):
+    """Test that the memory limit bounds deep value sizes."""
+    
+    def setUp(self):
+        self.cache = MultiLevelCacheManager(max_memory_entries=100, max_memory_mb=1.0,
+                                            cleanup_interval_seconds=3600)
+    
+    def tearDown(self):
+        self.cache.shutdown()
+    
+    def test_memory_limit_respected(self):
+        """Test that large path lists cannot exceed the byte budget."""
+        for i in range(10):
+            paths = [Path(f"/data/{i}/file_{j}.txt") for j in range(2000)]
+            self.cache.set(f"key_{i}", paths)
+        
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats['memory_usage_bytes'], 1024 * 1024)
+        self.assertGreater(stats['evictions'], 0)
+    
+    def test_oversized_value_rejected(self):
+        """Test that a value larger than the budget is not cached."""
+        self.cache.set("small", "value")
+        self.cache.set("huge", [Path(f"/x/{i}") for i in range(50000)])
+        
+        self.assertIsNone(self.cache.get("huge"))
+        self.assertEqual(self.cache.get("small"), "value")
+        self.assertEqual(self.cache.get_stats()['rejected'], 1)
+
+
+class TestShardedCacheManager(unittest.TestCase):
+    """Test the sharded low-contention cache."""
+    
+    def setUp(self):
+        self.cache = ShardedCacheManager(shard_count=6, max_memory_entries=64,
+                                         cleanup_interval_seconds=3600)
+    
+    def tearDown(self):
+        self.cache.shutdown()
+    
+    def test_shard_count_rounded_to_power_of_two(self):
+        """Test shard count normalisation."""
+        self.assertEqual(self.cache.get_stats()['shard_count'], 8)
+    
+    def test_basic_operations(self):
+        """Test get, set, invalidate and clear."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.assertEqual(self.cache.get("a"), 1)
+        
+        self.cache.invalidate("a")
+        self.assertIsNone(self.cache.get("a"))
+        
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("b"))
+    
+    def test_ttl_expiry(self):
+        """Test that expired entries are not returned."""
+        self.cache.set("short", "value", ttl=1)
+        shard = self.cache._shard_for("short")
+        shard.entries["short"].expires_at = 0.5
+        
+        self.assertIsNone(self.cache.get("short"))
+        self.assertEqual(self.cache.get_stats()['expired'], 1)
+    
+    def test_stats_merged_across_shards(self):
+        """Test per-shard counters are merged on read."""
+        for i in range(20):
+            self.cache.set(f"key_{i}", i)
+        for i in range(30):
+            self.cache.get(f"key_{i}")
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['hits'], 20)
+        self.assertEqual(stats['misses'], 10)
+        self.assertEqual(stats['total_entries'], 20)
+    
+    def test_entry_limit_bounded(self):
+        """Test eviction keeps the total within the per-shard limits."""
+        for i in range(500):
+            self.cache.set(f"key_{i}", i)
+        
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats['total_entries'], 64)
+        self.assertGreater(stats['evictions'], 0)
+    
+    def test_shards_share_the_budget(self):
+        """Test one shard may use more than an even share and gives it back when others need it."""
+        cache = ShardedCacheManager(shard_count=4, max_memory_entries=100, max_memory_mb=1.0,
+                                    cleanup_interval_seconds=3600)
+        self.addCleanup(cache.shutdown)
+        
+        # An entry larger than a quarter of the budget is accepted
+        cache.set("large", _CostedValue(600 * 1024, 1.0))
+        self.assertIsNotNone(cache.get("large"))
+        
+        # Keys that all land in one shard can fill the whole entry budget
+        busy = cache._shard_for("large")
+        keys = [f"key_{i}" for i in range(2000) if cache._shard_for(f"key_{i}") is busy]
+        for key in keys[:99]:
+            cache.set(key, 1)
+        self.assertEqual(cache.get_stats()['total_entries'], 100)
+        
+        # Other shards reclaim their share from it
+        others = []
+        for shard in cache._shards:
+            if shard is not busy:
+                others += [f"other_{i}" for i in range(2000) if cache._shard_for(f"other_{i}") is shard][:20]
+        for key in others:
+            cache.set(key, 1)
+        stats = cache.get_stats()
+        self.assertEqual(stats['total_entries'], 100)
+        self.assertTrue(all(cache.get(key) == 1 for key in others))
+        self.assertEqual(len(busy.entries), 40)
+        self.assertEqual(stats['rejected'], 0)
+        
+        cache.set("huge", _CostedValue(2 * 1024 * 1024, 1.0))
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.get_stats()['rejected'], 1)
+
+
+class _CostedValue:
+    """Cache value with explicit size and recomputation cost."""
+    
+    def __init__(self, size_bytes, execution_time_ms):
+        self.size_bytes = size_bytes
+        self.execution_time_ms = execution_time_ms
+    
+    def estimate_cache_size(self):
+        return self.size_bytes
+
+
+class TestFrequencySketch(unittest.TestCase):
+    """Test the count-min frequency sketch."""
+    
+    def test_estimates_and_caps(self):
+        """Test counts are tracked and capped at 15."""
+        sketch = FrequencySketch(capacity=64)
+        for _ in range(5):
+            sketch.increment("hot")
+        for _ in range(40):
+            sketch.increment("capped")
+        
+        self.assertGreaterEqual(sketch.estimate("hot"), 5)
+        self.assertEqual(sketch.estimate("capped"), 15)
+        self.assertEqual(sketch.estimate("never"), 0)
+    
+    def test_aging_halves_counts(self):
+        """Test periodic reset decays old popularity."""
+        sketch = FrequencySketch(capacity=16)
+        for _ in range(8):
+            sketch.increment("old")
+        sketch._age()
+        
+        self.assertEqual(sketch.estimate("old"), 4)
+
+
+class TestWTinyLfuCacheManager(unittest.TestCase):
+    """Test cost-aware W-TinyLFU admission."""
+    
+    def setUp(self):
+        self.cache = WTinyLfuCacheManager(max_memory_entries=100, max_memory_mb=1.0,
+                                          cleanup_interval_seconds=3600)
+    
+    def tearDown(self):
+        self.cache.shutdown()
+    
+    def test_basic_operations(self):
+        """Test get, set, invalidate and clear."""
+        self.cache.set("a", "value")
+        self.assertEqual(self.cache.get("a"), "value")
+        self.cache.invalidate("a")
+        self.assertIsNone(self.cache.get("a"))
+    
+    def test_one_off_large_entry_does_not_flush_hot_entries(self):
+        """Test a big one-off result cannot evict frequently used entries."""
+        for round_number in range(5):
+            for i in range(80):
+                key = f"hot_{i}"
+                if self.cache.get(key) is None:
+                    self.cache.set(key, _CostedValue(10 * 1024, 20.0))
+        
+        self.cache.set("full_share_preview", _CostedValue(900 * 1024, 500.0))
+        self.cache.set("filler", _CostedValue(100, 1.0))
+        
+        self.assertIsNone(self.cache.get("full_share_preview"))
+        hot_hits = sum(1 for i in range(80) if self.cache.get(f"hot_{i}") is not None)
+        self.assertGreaterEqual(hot_hits, 75)
+        self.assertLessEqual(self.cache.get_stats()['memory_usage_bytes'], 1024 * 1024)
+    
+    def test_expensive_candidate_admitted_over_cheap_victim(self):
+        """Test recomputation cost weighs into admission."""
+        cache = WTinyLfuCacheManager(max_memory_entries=4, cleanup_interval_seconds=3600)
+        try:
+            for i in range(3):
+                cache.set(f"cheap_{i}", _CostedValue(100, 1.0))
+            cache.set("expensive", _CostedValue(100, 5000.0))
+            cache.set("pusher", _CostedValue(100, 1.0))
+            
+            self.assertIsNotNone(cache.get("expensive"))
+        finally:
+            cache.shutdown()
+
+
+class TestMatcherCaching(unittest.TestCase):
+    """Test that the matcher stores compact results."""
+    
+    def setUp(self):
+        self.cache = MultiLevelCacheManager(cleanup_interval_seconds=3600)
+        self.matcher = UnifiedPatternMatcher(cache_manager=self.cache)
+    
+    def tearDown(self):
+        self.cache.shutdown()
+    
+    def test_cache_hit_returns_equal_matches(self):
+        """Test repeated matches are served from the compact cache."""
+        files = [Path(f"doc_{i}.txt") if i % 2 else Path(f"img_{i}.jpg") for i in range(100)]
+        pattern = Pattern(user_expression="*.txt")
+        
+        first = self.matcher.match(pattern, files)
+        second = self.matcher.match(pattern, files)
+        
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(first.matched_files, second.matched_files)
+        
+        cached = next(iter(self.cache._memory_cache.values())).value
+        self.assertIsInstance(cached, CompactMatchResult)
+
+
+class TestTagInvalidation(unittest.TestCase):
+    """Test targeted invalidation by pattern, rule and directory tags."""
+    
+    def _caches(self):
+        return [
+            MultiLevelCacheManager(cleanup_interval_seconds=3600),
+            ShardedCacheManager(shard_count=4, cleanup_interval_seconds=3600),
+            WTinyLfuCacheManager(cleanup_interval_seconds=3600),
+        ]
+    
+    def test_invalidate_tags_on_every_cache(self):
+        """Test only entries carrying the tag are removed."""
+        for cache in self._caches():
+            with self.subTest(cache=type(cache).__name__):
+                try:
+                    cache.set("a", "1", tags=["pattern:a", "rule:r"])
+                    cache.set("b", "2", tags=["pattern:b"])
+                    cache.set("c", "3")
+                    
+                    self.assertEqual(cache.invalidate_tags(["rule:r"]), 1)
+                    self.assertIsNone(cache.get("a"))
+                    self.assertEqual(cache.get("b"), "2")
+                    self.assertEqual(cache.get("c"), "3")
+                    self.assertEqual(cache.invalidate_tags(["pattern:a"]), 0)
+                finally:
+                    cache.shutdown()
+    
+    def test_invalidate_tag_prefix_on_every_cache(self):
+        """Test a directory prefix drops results rooted below it."""
+        for cache in self._caches():
+            with self.subTest(cache=type(cache).__name__):
+                try:
+                    cache.set("sub", "1", tags=[directory_tag("/data/a/sub")])
+                    cache.set("sibling", "2", tags=[directory_tag("/data/ab")])
+                    
+                    self.assertEqual(cache.invalidate_tag_prefix(directory_tag("/data/a")), 1)
+                    self.assertIsNone(cache.get("sub"))
+                    self.assertEqual(cache.get("sibling"), "2")
+                finally:
+                    cache.shutdown()
+    
+    def test_pattern_edit_keeps_other_patterns_warm(self):
+        """Test invalidating one pattern leaves other cached results intact."""
+        cache = MultiLevelCacheManager(cleanup_interval_seconds=3600)
+        matcher = UnifiedPatternMatcher(cache_manager=cache)
+        try:
+            files = [Path(f"/data/in/file_{i}.txt") for i in range(20)]
+            edited = Pattern(user_expression="*.txt")
+            other = Pattern(user_expression="file_1*")
+            matcher.match(edited, files)
+            matcher.match(other, files)
+            
+            self.assertEqual(matcher.invalidate_pattern(edited.id), 1)
+            self.assertFalse(matcher.match(edited, files).cache_hit)
+            self.assertTrue(matcher.match(other, files).cache_hit)
+        finally:
+            cache.shutdown()
+    
+    def test_directory_change_invalidates_enclosing_results(self):
+        """Test a change below a result's root directory invalidates it."""
+        cache = MultiLevelCacheManager(cleanup_interval_seconds=3600)
+        matcher = UnifiedPatternMatcher(cache_manager=cache)
+        try:
+            pattern = Pattern(user_expression="*.txt")
+            inside = [Path(f"/data/in/{i}/file.txt") for i in range(5)]
+            outside = [Path(f"/data/out/file_{i}.txt") for i in range(5)]
+            matcher.match(pattern, inside)
+            matcher.match(pattern, outside, cache_tags=[rule_tag("r1")])
+            
+            self.assertEqual(matcher.invalidate_directory(Path("/data/in/3")), 1)
+            self.assertFalse(matcher.match(pattern, inside).cache_hit)
+            self.assertTrue(matcher.match(pattern, outside).cache_hit)
+            self.assertEqual(matcher.invalidate_rule("r1"), 1)
+        finally:
+            cache.shutdown()
+
+
+
+class TestPrefixInvalidation(unittest.TestCase):
+    """Test prefix lookups and wildcard invalidation without key scans."""
+    
+    def test_prefix_index(self):
+        """Test prefix queries return only the matching run of strings."""
+        index = PrefixIndex()
+        for item in ["dir:/data/ab", "dir:/data/a/sub", "dir:/data/a", "rule:1", "dir:/data/a"]:
+            index.add(item)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.with_prefix("dir:/data/a"), ["dir:/data/a", "dir:/data/a/sub", "dir:/data/ab"])
+        self.assertEqual(index.with_prefix("dir:/data/a/"), ["dir:/data/a/sub"])
+        index.discard("dir:/data/a")
+        self.assertNotIn("dir:/data/a", index)
+        self.assertEqual(index.with_prefix("x"), [])
+        
+        # Changes between queries are merged into the sorted order once
+        index.discard("rule:1")
+        index.add("rule:1")
+        index.add("dir:/data/0")
+        index.discard("dir:/data/ab")
+        index.add("dir:/data/ab")
+        index.discard("dir:/data/a/sub")
+        self.assertEqual(list(index), ["dir:/data/0", "dir:/data/ab", "rule:1"])
+        index.retain(lambda item: item.startswith("dir:"))
+        self.assertEqual(index.with_prefix(""), ["dir:/data/0", "dir:/data/ab"])
+    
+    def test_wildcard_invalidation_only_checks_prefix_bucket(self):
+        """Test a wildcard only looks at keys sharing its literal prefix."""
+        cache = StorageCacheManager(l1_cache=LRUCache(max_size=5000))
+        for i in range(2000):
+            cache.set(f"rule:{i % 20}:{i}", i)
+        cache.set("pattern:7", "p")
+        
+        with unittest.mock.patch("fnmatch.fnmatchcase", wraps=__import__("fnmatch").fnmatchcase) as match:
+            self.assertEqual(cache.invalidate("rule:7:1?7"), 5)
+        self.assertLessEqual(match.call_count, 100)
+        self.assertIsNone(cache.get("rule:7:107"))
+        
+        self.assertEqual(cache.invalidate("rule:7:*"), 95)
+        self.assertIsNone(cache.get("rule:7:1987"))
+        self.assertEqual(cache.get("rule:8:1988"), 1988)
+        self.assertEqual(cache.get("pattern:7"), "p")
+        self.assertEqual(cache.invalidate("pattern:7"), 1)
+        self.assertEqual(cache.invalidate("pattern:*"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
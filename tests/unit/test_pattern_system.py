@@ -19,6 +19,8 @@ sys.path.insert(0, str(project_root))
 from taskmover.core.patterns import PatternSystem
 from taskmover.core.patterns.models import Pattern, PatternGroup, MatchResult
 from taskmover.core.patterns.exceptions import PatternSystemError, PatternNotFoundError
+from taskmover.core.patterns.models import PatternStatus
+from taskmover.core.patterns.storage import PatternRepository, SQLitePatternRepository
 
 
 class TestPatternModel(unittest.TestCase):
@@ -183,6 +185,26 @@ class TestPatternSystem(unittest.TestCase):
         
         # Should return match results
         self.assertIsInstance(matches, list)
+    
+    def test_components_built_on_first_use(self):
+        """Test initialize() opens storage only and other components are built lazily."""
+        self.pattern_system.initialize()
+        status = self.pattern_system.get_system_status()
+        self.assertEqual(status['loaded_components'], ['repository'])
+        self.assertTrue(status['components']['repository'])
+        self.assertFalse(status['components']['validator'])
+        
+        self.pattern_system.validate_expression("*.txt")
+        status = self.pattern_system.get_system_status()
+        loaded = status['loaded_components']
+        self.assertIn('validator', loaded)
+        self.assertNotIn('cache_manager', loaded)
+        self.assertTrue(status['components']['validator'])
+        self.assertFalse(status['components']['cache_manager'])
+        self.assertIs(self.pattern_system._validator, self.pattern_system._validator)
+        
+        self.pattern_system.shutdown()
+        self.assertEqual(self.pattern_system.get_system_status()['loaded_components'], [])
 
 
 class TestPatternSystemIntegration(unittest.TestCase):
@@ -295,6 +317,523 @@ class TestPatternSystemErrors(unittest.TestCase):
             self.assertIsInstance(e, Exception)
 
 
+class TestSQLitePatternRepository(unittest.TestCase):
+    """Test the SQLite pattern repository against the file-backed one."""
+    
+    def setUp(self):
+        import tempfile
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _populate(self, repository):
+        group_id = uuid4()
+        patterns = [
+            Pattern(name="Images", description="Photo files", user_expression="*.jpg",
+                    tags=["media", "photos"]),
+            Pattern(name="Reports", description="Quarterly reports", user_expression="*.pdf",
+                    tags=["work"], group_id=group_id),
+            Pattern(name="Archive", description="Old stuff", user_expression="*.zip",
+                    status=PatternStatus.INACTIVE, group_id=group_id),
+        ]
+        for pattern in patterns:
+            repository.save(pattern)
+        return patterns, group_id
+    
+    def test_queries_match_file_repository(self):
+        """Test name, filter, tag and search queries return the same patterns."""
+        file_repo = PatternRepository(self.temp_dir / "yaml")
+        sqlite_repo = SQLitePatternRepository(self.temp_dir / "sqlite")
+        for pattern in self._populate(file_repo)[0]:
+            sqlite_repo.save(pattern)
+        
+        def names(patterns):
+            return [p.name for p in patterns]
+        
+        self.assertEqual(sqlite_repo.get_by_name("Reports").id, file_repo.get_by_name("Reports").id)
+        self.assertIsNone(sqlite_repo.get_by_name("Missing"))
+        for filters in ({}, {'status': 'inactive'}, {'tags': ['media', 'work']},
+                        {'status': 'active', 'tags': ['work']}):
+            self.assertEqual(names(sqlite_repo.list_patterns(filters)),
+                             names(file_repo.list_patterns(filters)))
+        for query in ("rep", "PDF", "photos", "o", "", "nothing"):
+            self.assertEqual(names(sqlite_repo.search_patterns(query)),
+                             names(file_repo.search_patterns(query)))
+        sqlite_repo.close()
+    
+    def test_persists_and_deletes_rows(self):
+        """Test saved patterns survive reopening and deletes remove them."""
+        repository = SQLitePatternRepository(self.temp_dir)
+        patterns, _ = self._populate(repository)
+        self.assertTrue(repository.delete(patterns[0].id))
+        self.assertFalse(repository.delete(patterns[0].id))
+        patterns[1].description = "Yearly summaries"
+        repository.save(patterns[1])
+        self.assertEqual(repository.search_patterns("quarterly"), [])
+        self.assertEqual([p.name for p in repository.search_patterns("yearly")], ["Reports"])
+        repository.close()
+        
+        reopened = SQLitePatternRepository(self.temp_dir)
+        self.assertIsNone(reopened.get(patterns[0].id))
+        self.assertEqual(reopened.get(patterns[1].id).tags, ["work"])
+        self.assertIs(reopened.get(patterns[1].id), reopened.get_by_name("Reports"))
+        self.assertEqual(reopened.get_statistics()['total_patterns'], 2)
+        self.assertEqual(reopened.search_patterns("photos"), [])
+        reopened.close()
+    
+    def test_yaml_import_and_export(self):
+        """Test existing YAML files are imported and backups round-trip."""
+        file_repo = PatternRepository(self.temp_dir)
+        patterns, _ = self._populate(file_repo)
+        
+        repository = SQLitePatternRepository(self.temp_dir)
+        self.assertEqual(repository.get_statistics()['total_patterns'], 3)
+        backup_file = repository.backup()
+        repository.delete(patterns[1].id)
+        
+        repository.restore(backup_file)
+        self.assertEqual(repository.get_by_name("Reports").id, patterns[1].id)
+        self.assertEqual([p.name for p in repository.list_patterns({'tags': ['work']})], ["Reports"])
+        repository.close()
+
+
+class TestPatternRepositorySnapshot(unittest.TestCase):
+    """Test startup snapshots of the file-backed pattern repository."""
+    
+    def setUp(self):
+        import tempfile
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_reload_uses_snapshot(self):
+        """Test a reopened repository loads from the snapshot written on save."""
+        repository = PatternRepository(self.temp_dir)
+        pattern = Pattern(name="Images", user_expression="*.jpg", tags=["media"])
+        repository.save(pattern)
+        self.assertTrue((self.temp_dir / "patterns.snapshot").exists())
+        
+        with patch('taskmover.core.patterns.storage.repository.load_yaml') as load_yaml:
+            reopened = PatternRepository(self.temp_dir)
+            load_yaml.assert_not_called()
+        self.assertEqual(reopened.get(pattern.id).tags, ["media"])
+        self.assertEqual(reopened.get(pattern.id).created_date, pattern.created_date)
+    
+    def test_edited_file_invalidates_snapshot(self):
+        """Test edits made outside the repository are picked up."""
+        repository = PatternRepository(self.temp_dir)
+        repository.save(Pattern(name="Images", user_expression="*.jpg"))
+        
+        patterns_file = self.temp_dir / "patterns.yaml"
+        patterns_file.write_text(patterns_file.read_text().replace("Images", "Photos"))
+        
+        reopened = PatternRepository(self.temp_dir)
+        self.assertIsNotNone(reopened.get_by_name("Photos"))
+        self.assertIsNone(reopened.get_by_name("Images"))
+
+
+class TestMatchEstimator(unittest.TestCase):
+    """Test sampled match estimation for pattern drafts."""
+    
+    def setUp(self):
+        import tempfile
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for i in range(300):
+            folder = self.temp_dir / f"dir{i % 5}"
+            folder.mkdir(exist_ok=True)
+            (folder / f"file{i}.{'pdf' if i % 3 == 0 else 'txt'}").touch()
+        (self.temp_dir / ".hidden.pdf").touch()
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _estimator(self, capacity):
+        from taskmover.core.patterns.matching import MatchEstimator
+        estimator = MatchEstimator(sample_capacity=capacity, debounce_delay=0.01)
+        estimator.set_workspace(self.temp_dir)
+        estimator.sample.wait(timeout=5, complete=True)
+        self.addCleanup(estimator.close)
+        return estimator
+    
+    def test_exact_count_when_sample_covers_workspace(self):
+        """Test a sample holding every file gives the exact count."""
+        estimate = self._estimator(capacity=1000).estimate("*.pdf")
+        self.assertTrue(estimate.exact)
+        self.assertEqual(estimate.population, 300)
+        self.assertEqual(estimate.estimated, 100)
+        self.assertEqual((estimate.lower, estimate.upper), (100, 100))
+    
+    def test_extrapolated_count_has_bounds(self):
+        """Test a partial sample extrapolates the sampled ratio with bounds."""
+        estimate = self._estimator(capacity=60).estimate("*.pdf")
+        self.assertFalse(estimate.exact)
+        self.assertEqual(estimate.sample_size, 60)
+        self.assertLessEqual(estimate.lower, estimate.estimated)
+        self.assertLessEqual(estimate.estimated, estimate.upper)
+        self.assertLess(estimate.lower, estimate.upper)
+        self.assertEqual(estimate.estimated, estimate.sample_matches * 5)
+    
+    def test_invalid_draft_reports_error(self):
+        """Test drafts the parser rejects produce an error, not a count."""
+        estimate = self._estimator(capacity=1000).estimate("(*.pdf")
+        self.assertIsNotNone(estimate.error)
+        self.assertEqual(estimate.estimated, 0)
+    
+    def test_only_latest_request_is_delivered(self):
+        """Test rapid submissions are debounced down to the newest draft."""
+        import threading
+        estimator = self._estimator(capacity=1000)
+        delivered = []
+        done = threading.Event()
+        
+        def on_estimate(estimate):
+            delivered.append(estimate.pattern)
+            done.set()
+        
+        for draft in ["*", "*.", "*.p", "*.pd", "*.pdf"]:
+            estimator.submit(draft, on_estimate)
+        
+        self.assertTrue(done.wait(5))
+        self.assertEqual(delivered, ["*.pdf"])
+    
+    def test_idle_after_final_estimate(self):
+        """Test the estimator reports idle only once nothing more will be delivered."""
+        import threading
+        import time
+        estimator = self._estimator(capacity=1000)
+        self.assertTrue(estimator.idle)
+        
+        delivered = threading.Event()
+        estimator.submit("*.pdf", lambda estimate: delivered.set())
+        self.assertFalse(estimator.idle)
+        self.assertTrue(delivered.wait(5))
+        deadline = time.monotonic() + 5
+        while not estimator.idle and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(estimator.idle)
+
+
+class TestWorkspaceAnalyzerCache(unittest.TestCase):
+    """Test cached, incremental and sampled workspace analysis."""
+    
+    def setUp(self):
+        import tempfile
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for i in range(200):
+            folder = self.temp_dir / f"group{i % 4}" / f"set{i % 20}"
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"file{i}.{'pdf' if i % 4 == 0 else 'txt'}").write_bytes(b"x" * i)
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_results_cached_within_ttl(self):
+        """Test repeated analysis within the TTL does not walk again."""
+        from taskmover.core.patterns.suggestions import WorkspaceAnalyzer
+        analyzer = WorkspaceAnalyzer(cache_ttl=60)
+        self.assertEqual(analyzer.analyze(self.temp_dir)['total_files'], 200)
+        
+        (self.temp_dir / "extra.txt").touch()
+        with patch('os.scandir') as scandir:
+            self.assertEqual(analyzer.analyze(self.temp_dir)['total_files'], 200)
+            scandir.assert_not_called()
+        
+        analyzer.invalidate(self.temp_dir)
+        self.assertEqual(analyzer.analyze(self.temp_dir)['total_files'], 201)
+    
+    def test_refresh_rescans_only_changed_directories(self):
+        """Test an expired result is refreshed from unchanged directory listings."""
+        import os
+        from taskmover.core.patterns.suggestions import WorkspaceAnalyzer
+        analyzer = WorkspaceAnalyzer(cache_ttl=0)
+        analyzer.analyze(self.temp_dir)
+        
+        changed = self.temp_dir / "group1" / "set1"
+        (changed / "new.pdf").touch()
+        
+        with patch('os.scandir', wraps=os.scandir) as scandir:
+            analysis = analyzer.analyze(self.temp_dir)
+        
+        self.assertEqual(analysis['total_files'], 201)
+        self.assertEqual([call.args[0] for call in scandir.call_args_list], [str(changed)])
+        self.assertIn(('pdf', 51), analysis['common_extensions'])
+    
+    def test_budgeted_analysis_is_sampled(self):
+        """Test a file budget too small for the tree yields a sampled estimate."""
+        from taskmover.core.patterns.suggestions import WorkspaceAnalyzer
+        analysis = WorkspaceAnalyzer().analyze(self.temp_dir, file_budget=20)
+        
+        self.assertTrue(analysis['sampled'])
+        self.assertGreaterEqual(analysis['probes'], WorkspaceAnalyzer.MIN_PROBES)
+        # Every leaf directory holds 10 files, so every probe is exact
+        self.assertEqual(analysis['total_files'], 200)
+        self.assertEqual(analysis['total_files_margin'], 0)
+        
+        self.assertFalse(WorkspaceAnalyzer().analyze(self.temp_dir, file_budget=1000)['sampled'])
+    
+    def test_budget_larger_than_unlisted_files_finishes(self):
+        """Test probing stops once only cached directories are left."""
+        import threading
+        from taskmover.core.patterns.suggestions import WorkspaceAnalyzer
+        results = []
+        for budget in (250, 300, 399):
+            worker = threading.Thread(
+                target=lambda: results.append(WorkspaceAnalyzer().analyze(self.temp_dir, file_budget=budget)),
+                daemon=True)
+            worker.start()
+            worker.join(10)
+            self.assertFalse(worker.is_alive(), f"analysis with file_budget={budget} did not finish")
+        
+        for analysis in results:
+            self.assertFalse(analysis['sampled'])
+            self.assertEqual(analysis['total_files'], 200)
+
+
+class TestFileColumns(unittest.TestCase):
+    """Test columnar file statistics."""
+
+    def test_extensions_follow_path_suffix(self):
+        """Test extensions and hidden files are recorded like Path.suffix."""
+        from taskmover.core.patterns.suggestions.columns import FileColumns
+        columns = FileColumns("docs")
+        for name in ["report.PDF", "archive.tar.gz", ".bashrc", "notes.", "README"]:
+            columns.append(name, 10, 0)
+
+        self.assertEqual(len(columns), 5)
+        self.assertEqual(dict(columns.extensions), {'pdf': 1, 'gz': 1})
+        self.assertEqual(columns.hidden, 1)
+
+    def test_aggregate_buckets(self):
+        """Test size and recency buckets across directories."""
+        from taskmover.core.patterns.suggestions.columns import FileColumns, aggregate
+        now = 1_700_000_000
+        day_ns = 86400 * 10**9
+        first, second = FileColumns("a"), FileColumns("b")
+        first.append("empty.txt", 0, (now - 1) * 10**9)
+        first.append("tiny.txt", 100, (now - 2) * 10**9)
+        second.append("small.pdf", 2048, now * 10**9 - 10 * day_ns)
+        second.append("medium.pdf", 2 * 1024 * 1024, now * 10**9 - 100 * day_ns)
+        second.append("large.iso", 200 * 1024 * 1024, now * 10**9 - 400 * day_ns)
+
+        stats = aggregate([first, second, FileColumns("c")], now=now, ignore_directories={"a"})
+
+        self.assertEqual(stats['files'], 5)
+        self.assertEqual(stats['empty'], 1)
+        self.assertEqual(stats['size_buckets'], {'tiny': 1, 'small': 1, 'medium': 1, 'large': 1})
+        self.assertEqual(stats['recency'], {'last_week': 2, 'last_month': 3, 'last_year': 4})
+        self.assertEqual(stats['newest'], (now - 1) * 10**6)
+        self.assertEqual(dict(stats['directories']), {'b': 3})
+        self.assertEqual(stats['extensions']['pdf'], 2)
+        self.assertLessEqual(stats['percentiles']['p50'], stats['percentiles']['p99'])
+
+    def test_aggregate_empty(self):
+        """Test aggregating no files."""
+        from taskmover.core.patterns.suggestions.columns import aggregate
+        stats = aggregate([])
+        self.assertEqual(stats['files'], 0)
+        self.assertIsNone(stats['newest'])
+        self.assertEqual(stats['percentiles'], {})
+
+
+class TestCompletionIndex(unittest.TestCase):
+    """Test the trie-backed completion index."""
+
+    def test_trie_matches_brute_force(self):
+        """Test prefix lookups stay exact through inserts, splits and removals."""
+        import random
+        from taskmover.core.patterns.suggestions import Completion, CompletionTrie
+        rng = random.Random(3)
+        trie = CompletionTrie(cache_size=8)
+        entries = {}
+        for i in range(400):
+            key = "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+            entries[i] = (key, Completion(key, 'test', rng.random()))
+            trie.insert(key, i, entries[i][1])
+        for i in rng.sample(sorted(entries), 200):
+            key, _ = entries.pop(i)
+            self.assertTrue(trie.remove(key, i))
+        self.assertFalse(trie.remove("abc", -1))
+        self.assertEqual(len(trie), len(entries))
+
+        for prefix in ["", "a", "ab", "cab", "bbbb", "abcabc"]:
+            expected = sorted((c for key, c in entries.values() if key.startswith(prefix)),
+                              key=lambda c: (-c.weight, c.text))
+            self.assertEqual(trie.complete(prefix, 5), expected[:5])
+            self.assertEqual(trie.complete(prefix, 50), expected[:50])
+
+    def test_context_completions(self):
+        """Test tokens, groups, extensions and keywords complete the trailing word."""
+        from taskmover.core.patterns.suggestions import CompletionIndex
+        index = CompletionIndex()
+        index.set_extensions([('pdf', 40), ('png', 90), ('txt', 5)])
+
+        self.assertEqual(index.complete("$DA"), ["$DATE", "$DATETIME", "$DAY"])
+        self.assertEqual(index.complete("*.txt OR @doc"), ["*.txt OR @documents"])
+        self.assertEqual(index.complete("*.p"), ["*.png", "*.pdf"])
+        self.assertEqual(index.complete("*.pdf AND si"), ["*.pdf AND size < ", "*.pdf AND size > "])
+        self.assertEqual(index.complete('contains('), ['contains("'])
+
+    def test_usage_weighted_and_incremental(self):
+        """Test saved patterns rank by usage and follow edits and deletions."""
+        from taskmover.core.patterns.suggestions import CompletionIndex
+        index = CompletionIndex()
+        rare = Pattern(name="Reports", user_expression="report*.pdf")
+        popular = Pattern(name="Receipts", user_expression="receipt*.pdf AND $YEAR")
+        popular.usage_stats.usage_count = 50
+        index.load_patterns([rare, popular])
+
+        self.assertEqual(index.complete("re"), [popular.user_expression, rare.user_expression])
+        # Tokens used by popular patterns rank first
+        self.assertEqual(index.complete("$")[0], "$YEAR")
+
+        rare.usage_stats.usage_count = 500
+        index.update_usage(rare)
+        self.assertEqual(index.complete("re")[0], rare.user_expression)
+
+        popular.user_expression = "invoice*.pdf"
+        index.add_pattern(popular)
+        self.assertEqual(index.complete("$")[0], "$DATE")
+        self.assertEqual(index.complete("inv"), ["invoice*.pdf"])
+        # Still found by name
+        self.assertEqual(index.complete("rece"), ["invoice*.pdf"])
+
+        index.remove_pattern(popular.id)
+        self.assertEqual(index.complete("inv"), [])
+        self.assertEqual(index.complete("rece"), [])
+
+    def test_pattern_system_keeps_index_current(self):
+        """Test saved patterns and custom tokens reach completions."""
+        import tempfile
+        system = PatternSystem(Path(tempfile.mkdtemp()))
+        system.initialize()
+        existing = system.create_pattern("*.psd", name="Photoshop")
+
+        self.assertEqual(system.get_completions("photo"), ["*.psd"])
+
+        created = system.create_pattern("draft_*.docx", name="Drafts")
+        self.assertEqual(system.get_completions("dra"), ["draft_*.docx"])
+        system.delete_pattern(existing.id)
+        self.assertEqual(system.get_completions("photo"), [])
+        self.assertEqual(system.get_completions("draft"), [created.user_expression])
+
+        system._token_resolver.add_custom_token("client", "acme")
+        self.assertEqual(system.get_completions("$CLI"), ["$CLIENT"])
+        system._token_resolver.remove_custom_token("client")
+        self.assertEqual(system.get_completions("$CLI"), [])
+
+
+class TestPatternPreviewRunner(unittest.TestCase):
+    """Test streamed, cancellable test runs of pattern drafts."""
+    
+    def setUp(self):
+        import tempfile
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for i in range(40):
+            (self.temp_dir / f"report{i:02}.pdf").write_bytes(b"x" * (i * 100 * 1024))
+            (self.temp_dir / f"photo{i:02}.jpg").touch()
+        (self.temp_dir / ".hidden.pdf").touch()
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _runner(self, chunk_size=16):
+        from taskmover.core.patterns.matching import PatternPreviewRunner, UnifiedPatternMatcher
+        from taskmover.core.patterns.storage import MultiLevelCacheManager
+        runner = PatternPreviewRunner(matcher=UnifiedPatternMatcher(cache_manager=MultiLevelCacheManager()),
+                                      chunk_size=chunk_size)
+        self.addCleanup(runner.close)
+        return runner
+    
+    def test_reasons_come_from_the_evaluator(self):
+        """Test non-matches carry the condition they failed."""
+        runner = self._runner(chunk_size=1000)
+        preview = runner.run("*.pdf", self.temp_dir, limit=3)
+        self.assertTrue(preview.complete)
+        self.assertEqual(preview.files_checked, 80)
+        self.assertEqual(preview.match_count, 40)
+        self.assertEqual([row.path.name for row in preview.matches],
+                         ["report00.pdf", "report01.pdf", "report02.pdf"])
+        self.assertEqual({row.reason for row in preview.non_matches}, {"wrong type (.jpg)"})
+        
+        preview = runner.run("size > 1MB", self.temp_dir, limit=3)
+        self.assertEqual(preview.match_count, 29)
+        self.assertEqual({row.reason for row in preview.non_matches}, {"too small (0 B)"})
+        
+        preview = runner.run("(*.pdf", self.temp_dir)
+        self.assertTrue(preview.done)
+        self.assertIsNotNone(preview.error)
+    
+    def test_stops_once_both_lists_are_full(self):
+        """Test a run walks only as many chunks as it needs and streams each one."""
+        runner = self._runner(chunk_size=16)
+        updates = []
+        preview = runner.run("*.jpg", self.temp_dir, limit=5, on_update=updates.append)
+        
+        self.assertFalse(preview.complete)
+        self.assertEqual(preview.files_checked, 48)
+        self.assertEqual((len(preview.matches), len(preview.non_matches)), (5, 5))
+        self.assertEqual([update.files_checked for update in updates], [16, 32, 48])
+        self.assertIs(updates[-1], preview)
+        self.assertTrue(preview.done)
+    
+    def test_repeated_run_is_served_from_cache(self):
+        """Test rerunning an unchanged draft hits the match cache."""
+        runner = self._runner()
+        self.assertEqual(runner.run("*.pdf", self.temp_dir).cache_status, "fresh")
+        self.assertEqual(runner.run("*.pdf", self.temp_dir).cache_status, "cached")
+    
+    def test_newer_submission_cancels_older(self):
+        """Test a superseded run stops and delivers nothing more."""
+        import threading
+        runner = self._runner(chunk_size=1)
+        started = threading.Event()
+        release = threading.Event()
+        first = []
+        
+        def on_first(preview):
+            first.append(preview)
+            started.set()
+            release.wait(5)
+        
+        runner.submit("*.pdf", self.temp_dir, on_first, limit=100)
+        self.assertTrue(started.wait(5))
+        
+        done = threading.Event()
+        second = []
+        
+        def on_second(preview):
+            second.append(preview)
+            if preview.done:
+                done.set()
+        
+        generation = runner.submit("*.jpg", self.temp_dir, on_second)
+        release.set()
+        self.assertTrue(done.wait(5))
+        
+        self.assertEqual(len(first), 1)
+        self.assertTrue(all(preview.generation == generation for preview in second))
+        self.assertEqual(second[-1].match_count, 40)
+        
+        runner.cancel()
+        self.assertFalse(runner.is_current(generation))
+    
+    def test_pattern_system_runner_shares_matcher(self):
+        """Test the pattern system hands out runners using its own matcher."""
+        import tempfile
+        system = PatternSystem(Path(tempfile.mkdtemp()))
+        system.initialize()
+        runner = system.create_preview_runner()
+        self.assertIs(runner._matcher, system._matcher)
+        self.assertEqual(runner.run("@documents", self.temp_dir).match_count, 40)
+
+
 class TestPatternSystemMocking(unittest.TestCase):
     """Test PatternSystem with mocked dependencies."""
     
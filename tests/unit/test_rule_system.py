@@ -11,8 +11,10 @@ from pathlib import Path
 from uuid import UUID, uuid4
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
+import json
 import tempfile
 import shutil
+import threading
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -23,6 +25,8 @@ from taskmover.core.rules import (
     Rule, RuleStatus, ErrorHandlingBehavior, RuleValidationResult, RuleService
 )
 from taskmover.core.rules.exceptions import RuleValidationError
+from taskmover.core.rules.storage import RuleRepository, SQLiteRuleRepository
+from taskmover.core.rules.validation import ValidationCache
 
 
 class TestRuleModel(unittest.TestCase):
@@ -144,6 +148,7 @@ class TestRuleService(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
+        self.rule_service.close()
         if self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
     
@@ -216,6 +221,406 @@ class TestRuleService(unittest.TestCase):
         rule_names = [r.name for r in rules]
         self.assertIn("Rule 1", rule_names)
         self.assertIn("Rule 2", rule_names)
+    
+    def test_execute_rule_reports_progress(self):
+        """Test execution reports progress after each matched file."""
+        source = self.temp_dir / "source"
+        destination = self.temp_dir / "dest"
+        source.mkdir()
+        destination.mkdir()
+        files = []
+        for i in range(3):
+            path = source / f"file{i}.txt"
+            path.write_text("x")
+            files.append(path)
+        
+        self.mock_pattern_system.match_pattern.return_value = Mock(matched_files=files)
+        rule = self.rule_service.create_rule(name="Progress", pattern_id=uuid4(), destination_path=destination)
+        
+        progress = []
+        result = self.rule_service.execute_rule(rule.id, source, dry_run=True, progress_callback=progress.append)
+        
+        self.assertEqual(result.files_moved, 3)
+        self.assertEqual([p.files_processed for p in progress], [1, 2, 3])
+        self.assertTrue(all(p.total_files == 3 and p.operation_id == str(rule.id) for p in progress))
+        self.assertEqual(progress[-1].current_file, files[-1])
+    
+    def test_execute_rule_traces_stages(self):
+        """Test rule execution records a span per stage."""
+        from taskmover.core.logging.tracing import Tracer
+        source = self.temp_dir / "source"
+        (source / "sub").mkdir(parents=True)
+        (source / "sub" / "a.txt").write_text("x")
+        self.mock_pattern_system.match_pattern.return_value = Mock(matched_files=[source / "sub" / "a.txt"])
+        rule = self.rule_service.create_rule(name="Traced", pattern_id=uuid4(), destination_path=self.temp_dir)
+        
+        tracer = Tracer(enabled=True)
+        with patch.object(self.rule_service, "_tracer", tracer):
+            self.rule_service.execute_rule(rule.id, source, dry_run=True)
+        
+        events = {event.name: event for event in tracer.events()}
+        self.assertLessEqual({"rule.execute", "rule.scan", "rule.stat", "rule.match", "rule.move"}, set(events))
+        self.assertEqual(events["rule.scan"].attributes["entries"], 2)
+        self.assertEqual(events["rule.stat"].attributes["files"], 1)
+
+
+class TestValidationCache(unittest.TestCase):
+    """Test memoized background rule validation."""
+    
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pattern = Mock(version=1, modified_date=datetime(2024, 1, 1), is_valid=True)
+        self.calls = []
+        self.cache = ValidationCache(self._validate, lambda pattern_id: self.pattern, max_workers=2)
+    
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def _validate(self, rule):
+        self.calls.append(rule.id)
+        return RuleValidationResult(rule_id=rule.id, is_valid=True)
+    
+    def _rules(self, count):
+        return [Rule(name=f"Rule {i}", pattern_id=uuid4(), destination_path=self.temp_dir)
+                for i in range(count)]
+    
+    def _submit(self, rules):
+        """Submit rules and wait for every revalidated result."""
+        results = []
+        delivered = threading.Semaphore(0)
+        
+        def on_result(result):
+            results.append(result)
+            delivered.release()
+        
+        cached = self.cache.submit(rules, on_result)
+        for _ in range(len(rules) - len(cached)):
+            self.assertTrue(delivered.acquire(timeout=5))
+        return results
+    
+    def test_results_are_reused_until_rule_or_pattern_changes(self):
+        rules = self._rules(200)
+        self.assertEqual(len(self._submit(rules)), 200)
+        self.assertEqual(len(self.calls), 200)
+        
+        # Nothing changed: served from the cache
+        self.assertEqual(len(self.cache.submit(rules, self.fail)), 200)
+        self.assertIsNotNone(self.cache.get(rules[0]))
+        
+        # Only the edited rule is revalidated
+        rules[3].modified_date = datetime.utcnow().replace(year=2100)
+        self.assertEqual([r.rule_id for r in self._submit(rules)], [rules[3].id])
+        
+        # A pattern edit makes every rule stale
+        self.pattern.modified_date = datetime(2024, 6, 1)
+        self.assertIsNone(self.cache.get(rules[0]))
+        self.assertEqual(len(self._submit(rules)), 200)
+        self.assertEqual(len(self.calls), 401)
+    
+    def test_superseded_submission_is_not_delivered(self):
+        gate = threading.Event()
+        
+        def slow_validate(rule):
+            gate.wait(5)
+            return RuleValidationResult(rule_id=rule.id, is_valid=True)
+        
+        cache = ValidationCache(slow_validate, lambda pattern_id: None, max_workers=1)
+        try:
+            delivered = []
+            cache.submit(self._rules(300), delivered.append)
+            cache.cancel()
+            gate.set()
+            cache.close()
+            # The rule already being validated finishes but is not delivered
+            self.assertEqual(delivered, [])
+        finally:
+            cache.close()
+    
+    def test_callers_do_not_supersede_each_other(self):
+        gate = threading.Event()
+        
+        def slow_validate(rule):
+            gate.wait(5)
+            return RuleValidationResult(rule_id=rule.id, is_valid=True)
+        
+        cache = ValidationCache(slow_validate, lambda pattern_id: None, max_workers=2)
+        try:
+            view_rules, other_rules = self._rules(20), self._rules(5)
+            delivered = threading.Semaphore(0)
+            view_results = []
+            
+            def on_view_result(result):
+                view_results.append(result.rule_id)
+                delivered.release()
+            
+            cache.submit(view_rules, on_view_result, token="view")
+            # Another caller, with and without its own token
+            cache.submit(other_rules, lambda result: None, token="other")
+            cache.submit(other_rules, lambda result: None)
+            cache.cancel()
+            gate.set()
+            for _ in view_rules:
+                self.assertTrue(delivered.acquire(timeout=5))
+            self.assertEqual(set(view_results), {rule.id for rule in view_rules})
+        finally:
+            cache.close()
+    
+    def test_service_streams_validation(self):
+        service = RuleService(pattern_system=Mock(get_pattern=Mock(return_value=None)),
+                              conflict_manager=Mock(), storage_path=self.temp_dir / "rules")
+        try:
+            rules = self._rules(10)
+            results = []
+            delivered = threading.Semaphore(0)
+            
+            def on_result(result):
+                results.append(result)
+                delivered.release()
+            
+            self.assertEqual(service.validate_rules_async(rules, on_result), {})
+            for _ in rules:
+                self.assertTrue(delivered.acquire(timeout=5))
+            # Missing pattern is reported per rule
+            self.assertTrue(all(not r.is_valid for r in results))
+            self.assertEqual(service.get_cached_validation(rules[0]).rule_id, rules[0].id)
+        finally:
+            service.close()
+
+
+class TestRuleRepositoryWriteBehind(unittest.TestCase):
+    """Test coalesced rule persistence and the statistics store."""
+    
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.rules_file = self.temp_dir / "rules.yaml"
+    
+    def tearDown(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+    
+    def _rule(self, name="Rule"):
+        return Rule(name=name, pattern_id=uuid4(), destination_path=self.temp_dir / "dest")
+    
+    def test_saves_are_coalesced(self):
+        """Test many saves produce one write and at most one backup."""
+        repository = RuleRepository(self.temp_dir, flush_delay=60.0)
+        for i in range(50):
+            repository.save(self._rule(f"Rule {i}"))
+        
+        self.assertNotIn("Rule 0", self.rules_file.read_text())
+        self.assertEqual(repository.get_statistics()['pending_writes'], 50)
+        
+        repository.close()
+        
+        reloaded = RuleRepository(self.temp_dir)
+        self.assertEqual(len(reloaded.list_rules()), 50)
+        self.assertLessEqual(len(list((self.temp_dir / "backups").glob("*.yaml"))), 1)
+        self.assertFalse(list(self.temp_dir.glob("*.tmp")))
+    
+    def test_debounced_flush_runs_in_background(self):
+        """Test pending changes reach disk after the flush delay."""
+        repository = RuleRepository(self.temp_dir, flush_delay=0.05)
+        repository.save(self._rule("Background"))
+        
+        deadline = datetime.now().timestamp() + 5
+        while "Background" not in self.rules_file.read_text():
+            self.assertLess(datetime.now().timestamp(), deadline)
+            threading.Event().wait(0.01)
+        self.assertFalse(repository.get_statistics()['cache_dirty'])
+        repository.close()
+    
+    def test_failed_background_flush_is_retried(self):
+        """Test a flush that fails on the timer is retried with backoff."""
+        repository = RuleRepository(self.temp_dir, flush_delay=0.01)
+        persist = repository._persist_rules
+        attempts = []
+        
+        def flaky_persist(rules_data):
+            attempts.append(datetime.now().timestamp())
+            if len(attempts) < 3:
+                raise OSError("disk busy")
+            persist(rules_data)
+        
+        with patch.object(repository, "_persist_rules", side_effect=flaky_persist):
+            repository.save(self._rule("Retried"))
+            deadline = datetime.now().timestamp() + 5
+            while "Retried" not in self.rules_file.read_text():
+                self.assertLess(datetime.now().timestamp(), deadline)
+                threading.Event().wait(0.01)
+        
+        self.assertEqual(len(attempts), 3)
+        # Backoff doubles the wait between attempts
+        self.assertGreater(attempts[2] - attempts[1], attempts[1] - attempts[0])
+        self.assertEqual(repository._flusher.failures, 0)
+        self.assertFalse(repository.get_statistics()['cache_dirty'])
+        repository.close()
+    
+    def test_execution_stats_do_not_rewrite_rules(self):
+        """Test execution statistics go to the stats store only."""
+        repository = RuleRepository(self.temp_dir, flush_delay=0)
+        rule = self._rule()
+        repository.save(rule)
+        rules_text = self.rules_file.read_text()
+        
+        rule.update_execution_stats(files_processed=3)
+        repository.record_execution(rule)
+        repository.close()
+        
+        self.assertEqual(self.rules_file.read_text(), rules_text)
+        self.assertNotIn("execution_count", rules_text)
+        
+        reloaded = RuleRepository(self.temp_dir).get(rule.id)
+        self.assertEqual(reloaded.execution_count, 1)
+        self.assertEqual(reloaded.files_processed, 3)
+        self.assertIsNotNone(reloaded.last_executed)
+    
+    def test_statistics_migrated_from_rules_file(self):
+        """Test statistics in an older rules file move to the stats store."""
+        rule = self._rule("Legacy")
+        self.rules_file.write_text(
+            "rules:\n"
+            f"- id: {rule.id}\n"
+            "  name: Legacy\n"
+            f"  pattern_id: {rule.pattern_id}\n"
+            f"  destination_path: {rule.destination_path}\n"
+            f"  created_date: '{rule.created_date.isoformat()}'\n"
+            f"  modified_date: '{rule.modified_date.isoformat()}'\n"
+            "  execution_count: 7\n"
+            "  files_processed: 12\n",
+            encoding='utf-8'
+        )
+        
+        RuleRepository(self.temp_dir, flush_delay=0).close()
+        
+        stats = json.loads((self.temp_dir / "rule_stats.json").read_text())
+        self.assertEqual(stats['rules'][str(rule.id)]['execution_count'], 7)
+    
+    def test_startup_snapshot_tracks_rules_file(self):
+        """Test rules reload from the snapshot and external edits invalidate it."""
+        repository = RuleRepository(self.temp_dir, flush_delay=0)
+        rule = self._rule("Snapshot")
+        repository.save(rule)
+        repository.close()
+        self.assertTrue((self.temp_dir / "rules.snapshot").exists())
+        
+        reloaded = RuleRepository(self.temp_dir)
+        self.assertEqual(reloaded.get(rule.id).name, "Snapshot")
+        reloaded.close()
+        
+        self.rules_file.write_text(self.rules_file.read_text().replace("Snapshot", "Edited"))
+        edited = RuleRepository(self.temp_dir)
+        self.assertEqual(edited.get(rule.id).name, "Edited")
+        edited.close()
+
+
+class TestSQLiteRuleRepository(unittest.TestCase):
+    """Test the SQLite rule repository against the YAML one."""
+    
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+    
+    def _rules(self, pattern_id):
+        return [
+            Rule(name="Photos", description="Move camera images", pattern_id=pattern_id,
+                 destination_path=self.temp_dir / "photos", priority=5),
+            Rule(name="Archive", description="Old downloads", pattern_id=uuid4(),
+                 destination_path=self.temp_dir / "archive", is_enabled=False),
+            Rule(name="Documents", description="Office files", pattern_id=pattern_id,
+                 destination_path=self.temp_dir / "docs", priority=5),
+        ]
+    
+    def test_queries_match_yaml_repository(self):
+        """Test listing, search and pattern lookups return the same rules."""
+        pattern_id = uuid4()
+        yaml_repo = RuleRepository(self.temp_dir / "yaml", flush_delay=0)
+        sqlite_repo = SQLiteRuleRepository(self.temp_dir / "sqlite", flush_delay=0)
+        for rule in self._rules(pattern_id):
+            yaml_repo.save(rule)
+            sqlite_repo.save(rule)
+        
+        def names(rules):
+            return [r.name for r in rules]
+        
+        for active_only in (False, True):
+            self.assertEqual(names(sqlite_repo.list_rules(active_only)),
+                             names(yaml_repo.list_rules(active_only)))
+        for query in ("camera", "OFF", "o", "", "missing"):
+            self.assertEqual(names(sqlite_repo.search_rules(query)),
+                             names(yaml_repo.search_rules(query)))
+        self.assertEqual(names(sqlite_repo.get_rules_by_pattern(pattern_id)),
+                         names(yaml_repo.get_rules_by_pattern(pattern_id)))
+        yaml_repo.close()
+        sqlite_repo.close()
+    
+    def test_rows_persist_with_statistics(self):
+        """Test rules and their statistics survive reopening the database."""
+        repository = SQLiteRuleRepository(self.temp_dir, flush_delay=0)
+        rule = self._rules(uuid4())[0]
+        repository.save(rule)
+        rule.update_execution_stats(files_processed=2)
+        repository.record_execution(rule)
+        repository.close()
+        
+        reopened = SQLiteRuleRepository(self.temp_dir, flush_delay=0)
+        loaded = reopened.get(rule.id)
+        self.assertEqual(loaded.name, "Photos")
+        self.assertEqual(loaded.files_processed, 2)
+        self.assertTrue(reopened.delete(rule.id))
+        self.assertIsNone(reopened.get(rule.id))
+        reopened.close()
+    
+    def test_search_index_follows_saves_and_deletes(self):
+        """Test the search index is keyed by rowid and rebuilt from the old layout."""
+        repository = SQLiteRuleRepository(self.temp_dir, flush_delay=0)
+        if not repository._fts_enabled:
+            repository.close()
+            self.skipTest("SQLite has no trigram FTS")
+        photos, archive, _ = rules = self._rules(uuid4())
+        for rule in rules:
+            repository.save(rule)
+        photos.description = "Move scanned receipts"
+        repository.save(photos)
+        self.assertTrue(repository.delete(archive.id))
+        self.assertFalse(repository.delete(archive.id))
+        self.assertEqual(repository.search_rules("camera"), [])
+        self.assertEqual([r.name for r in repository.search_rules("receipts")], ["Photos"])
+        self.assertEqual(repository.search_rules("downloads"), [])
+        
+        # A database indexed by an UNINDEXED rule_id column is rebuilt on open
+        with repository._backend.transaction() as cursor:
+            cursor.execute("DROP TABLE rules_fts")
+            cursor.execute("CREATE VIRTUAL TABLE rules_fts USING fts5("
+                           "rule_id UNINDEXED, search_text, tokenize='trigram')")
+        repository.close()
+        
+        reopened = SQLiteRuleRepository(self.temp_dir, flush_delay=0)
+        columns = [row['name'] for row in reopened._backend.execute_sql("PRAGMA table_info(rules_fts)")]
+        self.assertEqual(columns, ['search_text'])
+        self.assertEqual([r.name for r in reopened.search_rules("office")], ["Documents"])
+        reopened.close()
+    
+    def test_yaml_import_and_export(self):
+        """Test an existing rules.yaml is imported and exports reload in the YAML repository."""
+        yaml_repo = RuleRepository(self.temp_dir, flush_delay=0)
+        rules = self._rules(uuid4())
+        for rule in rules:
+            yaml_repo.save(rule)
+        yaml_repo.close()
+        
+        repository = SQLiteRuleRepository(self.temp_dir, flush_delay=0)
+        self.assertEqual(repository.get_statistics()['total_rules'], 3)
+        export_file = repository.export_yaml(self.temp_dir / "export" / "rules.yaml")
+        repository.close()
+        
+        exported = RuleRepository(export_file.parent, flush_delay=0)
+        self.assertEqual(sorted(r.name for r in exported.list_rules()),
+                         sorted(r.name for r in rules))
+        exported.close()
 
 
 if __name__ == '__main__':
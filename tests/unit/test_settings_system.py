@@ -0,0 +1,273 @@
+"""
+Test cases for Settings System
+==============================
+
+Tests for settings resolution, snapshots, accessors and persistence.
+"""
+
+import datetime
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from taskmover.core.settings import (
+    FileSettingStorage, MemorySettingStorage, SettingAccessor, SettingManager, SettingScope,
+    SettingValidator, register_all_definitions
+)
+
+
+class TestSettingSnapshot(unittest.TestCase):
+    """Test the copy-on-write settings snapshot."""
+
+    def setUp(self):
+        self.storage = MemorySettingStorage()
+        self.manager = SettingManager(self.storage, SettingValidator())
+        register_all_definitions(self.manager)
+
+    def test_scope_precedence_and_defaults(self):
+        """Test user > application > system values over definition defaults."""
+        self.assertEqual(self.manager.get("window.width"), 1200)
+        self.assertIsNone(self.manager.get("unknown"))
+        self.assertEqual(self.manager.get("unknown", 5), 5)
+
+        self.manager.set("custom", "system", SettingScope.SYSTEM)
+        self.manager.set("custom", "application", SettingScope.APPLICATION)
+        self.assertEqual(self.manager.get("custom"), "application")
+        self.manager.set("custom", "user", SettingScope.USER)
+        self.assertEqual(self.manager.get("custom"), "user")
+        self.assertEqual(self.manager.get("custom", scope=SettingScope.SYSTEM), "system")
+
+        # An explicit default wins over the definition default, not over a value
+        self.assertEqual(self.manager.get("window.height", 640), 640)
+        self.manager.set("window.height", 900)
+        self.assertEqual(self.manager.get("window.height", 640), 900)
+        self.assertEqual(self.manager.get("window.height", scope=SettingScope.USER), 800)
+
+    def test_values_in_definition_scope_are_visible(self):
+        """Test a setting stored in its definition's scope is read back."""
+        self.assertTrue(self.manager.set("window.width", 1500))
+        self.assertEqual(self.manager.get("window.width"), 1500)
+        self.assertEqual(self.manager.get_all()["window.width"], 1500)
+
+    def test_snapshots_are_immutable_and_replaced_on_write(self):
+        """Test writes publish a new snapshot and leave held ones untouched."""
+        before = self.manager.snapshot()
+        self.manager.set("ui.theme", "dark")
+        after = self.manager.snapshot()
+
+        self.assertIsNot(before, after)
+        self.assertGreater(after.version, before.version)
+        self.assertEqual(before.get("ui.theme"), "auto")
+        self.assertEqual(after.get("ui.theme"), "dark")
+        with self.assertRaises(TypeError):
+            after.values["ui.theme"] = "light"
+        # Unchanged scopes are shared
+        self.assertIs(before.scopes[SettingScope.SYSTEM], after.scopes[SettingScope.SYSTEM])
+
+        self.manager.delete("ui.theme")
+        self.assertEqual(self.manager.get("ui.theme"), "auto")
+        self.assertFalse(self.manager.exists("ui.theme"))
+
+        self.storage.save(SettingScope.USER, {"ui.theme": "light"})
+        self.manager.reload()
+        self.assertEqual(self.manager.get("ui.theme"), "light")
+
+        self.manager.set("ui.theme", "dark")
+        self.assertTrue(self.manager.reset("ui.theme"))
+        self.assertEqual(self.manager.get("ui.theme"), "auto")
+
+    def test_accessor_is_typed_and_cached(self):
+        """Test accessors convert once per snapshot."""
+        calls = []
+
+        def convert(value):
+            calls.append(value)
+            return int(value)
+
+        width = self.manager.accessor("window.width", convert=convert)
+        self.assertIsInstance(width, SettingAccessor)
+        self.assertEqual([width.get() for _ in range(100)], [1200] * 100)
+        self.assertEqual(calls, [1200])
+
+        self.manager.set("window.width", 1600)
+        self.assertEqual(width(), 1600)
+        self.assertEqual(calls, [1200, 1600])
+
+        # Conversion follows the definition type
+        maximized = self.manager.accessor("window.maximized")
+        self.manager.set("window.maximized", "true", SettingScope.SYSTEM)
+        self.assertIs(maximized(), True)
+
+        # Unconvertible values fall back to the default
+        count = self.manager.accessor("custom.count", default=3, convert=int)
+        self.manager.set("custom.count", "many")
+        self.assertEqual(count(), 3)
+
+    def test_reads_during_writes(self):
+        """Test readers only ever see complete snapshots while writers publish."""
+        stop = threading.Event()
+        seen = set()
+
+        def reader():
+            accessor = self.manager.accessor("custom.b", default=-1, convert=int)
+            while not stop.is_set():
+                snapshot = self.manager.snapshot()
+                seen.add((snapshot.get("custom.a", -1), snapshot.get("custom.b", -1)))
+                accessor()
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(300):
+            self.manager.set("custom.a", i)
+            self.manager.set("custom.b", i)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        # b is always written after a, so no snapshot has b ahead of a
+        for a, b in seen:
+            self.assertLessEqual(b, a)
+        self.assertEqual(self.manager.accessor("custom.b", convert=int)(), 299)
+
+
+class TestSettingPersistence(unittest.TestCase):
+    """Test dirty tracking, debounced saves, history and external changes."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.storage = FileSettingStorage(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _manager(self, **kwargs):
+        manager = SettingManager(self.storage, SettingValidator(), **kwargs)
+        register_all_definitions(manager)
+        manager.reload()
+        self.addCleanup(manager.close)
+        return manager
+
+    def test_save_writes_only_dirty_scopes(self):
+        """Test saving without a scope skips unchanged scopes."""
+        manager = self._manager()
+        manager.set("window.width", 1300)
+        self.assertEqual(manager.dirty_scopes, {SettingScope.UI})
+
+        with patch.object(self.storage, "save", wraps=self.storage.save) as save:
+            manager.save()
+            manager.save()
+        self.assertEqual([call.args[0] for call in save.call_args_list], [SettingScope.UI])
+        self.assertEqual(manager.dirty_scopes, frozenset())
+        self.assertEqual(self.storage.load(SettingScope.UI), {"window.width": 1300})
+
+    def test_burst_of_changes_is_one_write(self):
+        """Test debounced autosave coalesces a slider drag into one write."""
+        manager = self._manager(autosave_delay=0.1)
+        with patch.object(self.storage, "save", wraps=self.storage.save) as save:
+            # A 1 s drag with a change every 10 ms keeps pushing the save back
+            end = time.monotonic() + 1.0
+            width = 800
+            while time.monotonic() < end:
+                width += 1
+                manager.set("window.width", width)
+                time.sleep(0.01)
+            self.assertEqual(save.call_count, 0)
+            
+            deadline = time.monotonic() + 5
+            while manager.dirty_scopes and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.2)
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self.storage.load(SettingScope.UI), {"window.width": width})
+    
+    def test_autosave_max_wait(self):
+        """Test continuous changes are still saved every max_wait seconds."""
+        manager = self._manager(autosave_delay=0.1, autosave_max_wait=0.3)
+        with patch.object(self.storage, "save", wraps=self.storage.save) as save:
+            end = time.monotonic() + 1.0
+            width = 800
+            while time.monotonic() < end:
+                width += 1
+                manager.set("window.width", width)
+                time.sleep(0.01)
+            self.assertGreaterEqual(save.call_count, 2)
+            self.assertLessEqual(save.call_count, 4)
+    
+    def test_changes_do_not_wait_for_autosave(self):
+        """Test a change made while the autosave writes does not block on the disk."""
+        manager = self._manager(autosave_delay=0.01)
+        writing = threading.Event()
+        release = threading.Event()
+        save = self.storage.save
+        
+        def slow_save(scope, settings):
+            writing.set()
+            release.wait(5)
+            save(scope, settings)
+        
+        with patch.object(self.storage, "save", side_effect=slow_save):
+            manager.set("window.width", 1000)
+            self.assertTrue(writing.wait(5))
+            start = time.monotonic()
+            manager.set("window.width", 1100)
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(manager.dirty_scopes, {SettingScope.UI})
+            release.set()
+            manager.close()
+        self.assertEqual(self.storage.load(SettingScope.UI), {"window.width": 1100})
+    
+    def test_history_is_bounded_and_persisted(self):
+        """Test the history keeps the newest changes and survives restarts."""
+        history_file = self.temp_dir / "history.jsonl"
+        manager = self._manager(history_limit=5, history_file=history_file)
+        for width in range(800, 810):
+            manager.set("window.width", width, source="slider")
+        manager.set("custom.since", datetime.date(2024, 1, 2))
+
+        history = manager.get_change_history()
+        self.assertEqual(len(history), 5)
+        self.assertEqual([change.new_value for change in history[1:]], [809, 808, 807, 806])
+        manager.close()
+
+        restarted = self._manager(history_limit=5, history_file=history_file)
+        reloaded = restarted.get_change_history(key="window.width")
+        self.assertEqual([change.new_value for change in reloaded], [809, 808, 807, 806])
+        self.assertEqual(reloaded[0].source, "slider")
+        self.assertEqual(restarted.get_change_history(key="custom.since")[0].new_value, "2024-01-02")
+
+    def test_reload_changed_scopes_only(self):
+        """Test external edits reload their scope; own saves are not changes."""
+        manager = self._manager()
+        manager.set("ui.theme", "dark")
+        manager.save()
+        self.assertEqual(manager.reload_changed(), [])
+
+        other = FileSettingStorage(self.temp_dir)
+        other.save(SettingScope.USER, {"ui.theme": "light", "ui.language": "de"})
+        with patch.object(self.storage, "load", wraps=self.storage.load) as load:
+            self.assertEqual(manager.reload_changed(), [SettingScope.USER])
+        self.assertEqual([call.args[0] for call in load.call_args_list], [SettingScope.USER])
+        self.assertEqual(manager.get("ui.theme"), "light")
+        self.assertEqual(manager.reload_changed(), [])
+
+        # Unsaved changes are not overwritten by an external edit
+        manager.set("ui.theme", "dark")
+        other.save(SettingScope.USER, {"ui.theme": "auto", "ui.language": "fr"})
+        self.assertEqual(manager.reload_changed(), [])
+        self.assertEqual(manager.get("ui.theme"), "dark")
+        manager.save()
+        self.assertEqual(other.load(SettingScope.USER)["ui.theme"], "dark")
+
+
+if __name__ == '__main__':
+    unittest.main()